@@ -0,0 +1,117 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+// Benchmark of dense N-qubit matrix application on a QubitVector comparing
+// the indexed matrix multiplication path to the tiled BLAS ZGEMM path.
+//
+// Build from the repository root with:
+//   g++ -std=c++14 -O3 -fopenmp -Isrc -Isrc/third-party/headers contrib/benchmarks/apply_matrix.cpp -o apply_matrix -lblas -llapack
+//
+// Usage:
+//   apply_matrix [num_qubits] [min_matrix_qubits] [max_matrix_qubits] [repeats]
+
+#include <chrono>
+#include <cstdlib>
+#include <iomanip>
+#include <iostream>
+#include <random>
+#include <set>
+
+#include "simulators/qubitvector/qubitvector.hpp"
+
+using QV::uint_t;
+using QV::complex_t;
+using QV::cvector_t;
+
+/*******************************************************************************
+ *
+ * Helper functions
+ *
+ ******************************************************************************/
+
+cvector_t random_vector(uint_t size, std::mt19937_64 &rng) {
+  std::normal_distribution<double> dist;
+  cvector_t vec(size);
+  for (auto &val : vec)
+    val = complex_t(dist(rng), dist(rng));
+  return vec;
+}
+
+// Return the average time in seconds for applying mat to qv
+double time_apply_matrix(QV::QubitVector<> &qv,
+                         const std::vector<uint_t> &qubits,
+                         const cvector_t &mat,
+                         uint_t repeats) {
+  const auto start = std::chrono::steady_clock::now();
+  for (uint_t j = 0; j < repeats; j++)
+    qv.apply_matrix(qubits, mat);
+  const auto stop = std::chrono::steady_clock::now();
+  return std::chrono::duration<double>(stop - start).count() / repeats;
+}
+
+/*******************************************************************************
+ *
+ * Main
+ *
+ ******************************************************************************/
+
+int main(int argc, char **argv) {
+
+  const uint_t num_qubits = (argc > 1) ? std::atoi(argv[1]) : 20;
+  const uint_t min_mat_qubits = (argc > 2) ? std::atoi(argv[2]) : 4;
+  const uint_t max_mat_qubits = (argc > 3) ? std::atoi(argv[3]) : 12;
+  const uint_t repeats = (argc > 4) ? std::atoi(argv[4]) : 3;
+  const std::vector<int> tile_kbs = {64, 256, 1024, 4096};
+
+  std::mt19937_64 rng(42);
+  const cvector_t init = random_vector(1ULL << num_qubits, rng);
+
+  std::cout << "num_qubits = " << num_qubits
+            << ", repeats = " << repeats << std::endl;
+  std::cout << std::setw(6) << "N" << std::setw(14) << "indexed (s)";
+  for (const auto kb : tile_kbs)
+    std::cout << std::setw(12) << "blas " << std::setw(4) << kb << "KB";
+  std::cout << std::setw(12) << "max diff" << std::endl;
+
+  for (uint_t n = min_mat_qubits; n <= max_mat_qubits && n <= num_qubits; n++) {
+    const uint_t dim = 1ULL << n;
+    const cvector_t mat = random_vector(dim * dim, rng);
+    // Apply the matrix to qubits in a shuffled order
+    std::vector<uint_t> qubits(n);
+    for (uint_t q = 0; q < n; q++)
+      qubits[q] = (3 * q + 1) % num_qubits;
+    if (std::set<uint_t>(qubits.begin(), qubits.end()).size() != n) {
+      for (uint_t q = 0; q < n; q++)
+        qubits[q] = n - 1 - q;
+    }
+
+    // Reference indexed implementation
+    QV::QubitVector<> qv_ref(num_qubits);
+    qv_ref.initialize(init);
+    qv_ref.set_blas_threshold(0);
+    const double t_ref = time_apply_matrix(qv_ref, qubits, mat, repeats);
+    std::cout << std::setw(6) << n << std::setw(14) << std::scientific
+              << std::setprecision(3) << t_ref;
+
+    // BLAS implementation
+    double max_diff = 0.;
+    for (const auto kb : tile_kbs) {
+      QV::QubitVector<> qv(num_qubits);
+      qv.initialize(init);
+      qv.set_blas_threshold(1);
+      qv.set_blas_tile_kb(kb);
+      const double t_blas = time_apply_matrix(qv, qubits, mat, repeats);
+      std::cout << std::setw(18) << t_blas;
+      // Compare against the reference, relative to the vector norm
+      const double scale = std::sqrt(qv_ref.norm());
+      for (uint_t k = 0; k < qv.size(); k++)
+        max_diff = std::max(max_diff, std::abs(qv[k] - qv_ref[k]) / scale);
+    }
+    std::cout << std::setw(12) << max_diff << std::endl;
+  }
+  return 0;
+}
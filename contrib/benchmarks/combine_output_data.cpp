@@ -0,0 +1,108 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+// Benchmark of combining per-thread OutputData from parallel shot execution
+// comparing a serial combination to the parallel tree reduction.
+//
+// Build from the repository root with:
+//   g++ -std=c++14 -O3 -fopenmp -Isrc -Isrc/third-party/headers contrib/benchmarks/combine_output_data.cpp -o combine_output_data -lblas -llapack
+//
+// Usage:
+//   combine_output_data [num_threads] [shots_per_thread] [snapshot_qubits]
+
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <random>
+
+#include "framework/data.hpp"
+
+using namespace AER;
+
+/*******************************************************************************
+ *
+ * Helper functions
+ *
+ ******************************************************************************/
+
+// Generate output data for one thread with a statevector snapshot, an
+// averaged probabilities snapshot conditional on 4 memory bits, and
+// measurement counts and memory for each shot
+OutputData generate_data(uint_t shots, uint_t snapshot_qubits, uint_t seed) {
+  std::mt19937_64 rng(seed);
+  std::uniform_real_distribution<double> dist;
+  const uint_t dim = 1ULL << snapshot_qubits;
+
+  OutputData data;
+  data.set_config(json_t({{"memory", true}}));
+  ClassicalRegister creg;
+  for (uint_t shot = 0; shot < shots; shot++) {
+    cvector_t vec(dim);
+    rvector_t probs(dim);
+    for (uint_t k = 0; k < dim; k++) {
+      vec[k] = complex_t(dist(rng), dist(rng));
+      probs[k] = std::norm(vec[k]);
+    }
+    const uint_t memory = rng() % 16;
+    creg.initialize(4, 0, Utils::int2hex(memory), "");
+    data.add_singleshot_snapshot("statevector", "final", vec);
+    data.add_average_snapshot("probabilities", "final", creg.memory_hex(),
+                              probs, true);
+    data.add_memory(creg);
+  }
+  return data;
+}
+
+std::vector<OutputData> generate_all(int num_threads, uint_t shots,
+                                     uint_t snapshot_qubits) {
+  std::vector<OutputData> data(num_threads);
+  #pragma omp parallel for num_threads(num_threads)
+  for (int j = 0; j < num_threads; j++)
+    data[j] = generate_data(shots, snapshot_qubits, j);
+  return data;
+}
+
+/*******************************************************************************
+ *
+ * Main
+ *
+ ******************************************************************************/
+
+int main(int argc, char **argv) {
+
+  const int num_threads = (argc > 1) ? std::atoi(argv[1]) : 64;
+  const uint_t shots = (argc > 2) ? std::atoi(argv[2]) : 16;
+  const uint_t snapshot_qubits = (argc > 3) ? std::atoi(argv[3]) : 14;
+
+  std::cout << "threads = " << num_threads << ", shots per thread = " << shots
+            << ", snapshot qubits = " << snapshot_qubits << std::endl;
+
+  // Serial combination
+  auto data = generate_all(num_threads, shots, snapshot_qubits);
+  auto start = std::chrono::steady_clock::now();
+  for (int j = 1; j < num_threads; j++)
+    data[0].combine(data[j]);
+  auto stop = std::chrono::steady_clock::now();
+  const double t_serial = std::chrono::duration<double>(stop - start).count();
+  const json_t serial = data[0].json();
+
+  // Parallel tree reduction
+  data = generate_all(num_threads, shots, snapshot_qubits);
+  start = std::chrono::steady_clock::now();
+  OutputData::combine(data, num_threads);
+  stop = std::chrono::steady_clock::now();
+  const double t_tree = std::chrono::duration<double>(stop - start).count();
+  const json_t tree = data[0].json();
+
+  std::cout << "serial combine (s): " << t_serial << std::endl;
+  std::cout << "tree combine (s):   " << t_tree << std::endl;
+  std::cout << "outputs equal:      " << std::boolalpha
+            << (serial["memory"] == tree["memory"] &&
+                serial["snapshots"]["statevector"] == tree["snapshots"]["statevector"])
+            << std::endl;
+  return 0;
+}
@@ -0,0 +1,408 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+// Microbenchmark of the QubitVector and QubitMatrix kernels reporting the
+// memory bandwidth achieved by each kernel against the measured memory
+// bandwidth of the machine.
+//
+// Each kernel is timed for every combination of number of qubits, position
+// of the target qubits (low, spread across the register, or high), number
+// of OpenMP threads, OpenMP qubit threshold, and for the dense matrix kernels
+// the gate_opt setting. QubitMatrix kernels are run on unitaries with half
+// the number of qubits so that they have the same number of amplitudes as
+// the statevector.
+//
+// The achieved bandwidth of a kernel is the minimum number of bytes of the
+// state the kernel must read and write divided by the best time over the
+// repeats. Kernels that only touch a subset of the amplitudes may move
+// more memory than this for low target qubits since whole cache lines are
+// loaded. The peak bandwidth is measured by an in-place scaling of a
+// complex vector, which has the same access pattern as a full state update,
+// for each thread count. States small enough to fit in cache can exceed
+// the peak bandwidth.
+//
+// Build from the repository root with:
+//   g++ -std=c++14 -O3 -fopenmp -Isrc -Isrc/third-party/headers contrib/benchmarks/kernels.cpp -o kernels -lblas -llapack
+//
+// Usage:
+//   kernels [min_qubits] [max_qubits] [max_threads] [repeats] [kernel_filter]
+//
+// Thread counts are swept in powers of 2 up to max_threads. If a kernel
+// filter is given only kernels whose name contains it are run.
+
+#include <algorithm>
+#include <chrono>
+#include <cstdlib>
+#include <functional>
+#include <iomanip>
+#include <iostream>
+#include <random>
+#include <string>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+#include "simulators/qubitvector/qubitvector.hpp"
+#include "simulators/qubitunitary/qubitmatrix.hpp"
+
+using QV::uint_t;
+using QV::complex_t;
+using QV::int_t;
+using QV::cvector_t;
+using QM::cmatrix_t;
+using reg_t = std::vector<uint_t>;
+
+/*******************************************************************************
+ *
+ * Kernel definitions
+ *
+ ******************************************************************************/
+
+// A kernel is a function applied to a state on a set of target qubits.
+// bytes_per_amp is the number of bytes of the state read and written by
+// one application of the kernel per amplitude of the state.
+template <class state_t>
+struct Kernel {
+  std::string name;
+  uint_t num_targets;
+  double bytes_per_amp;
+  bool gate_opt;  // kernel is affected by the gate_opt setting
+  std::function<void(state_t&, const reg_t&)> func;
+};
+
+using QVKernel = Kernel<QV::QubitVector<>>;
+using QMKernel = Kernel<QM::QubitMatrix<>>;
+
+// Dense unitary discrete Fourier transform matrix on N-qubits
+cvector_t dft_matrix(uint_t N) {
+  const uint_t dim = 1ULL << N;
+  const double norm = 1. / std::sqrt(dim);
+  cvector_t mat(dim * dim);
+  for (uint_t i = 0; i < dim; i++)
+    for (uint_t j = 0; j < dim; j++)
+      mat[i + dim * j] = std::polar(norm, 2 * M_PI * i * j / dim);
+  return mat;
+}
+
+// Unitary diagonal phase matrix on N-qubits
+cvector_t phase_diagonal(uint_t N) {
+  const uint_t dim = 1ULL << N;
+  cvector_t diag(dim);
+  for (uint_t i = 0; i < dim; i++)
+    diag[i] = std::polar(1., 2 * M_PI * i / dim);
+  return diag;
+}
+
+// Convert a column-major vectorized matrix to a matrix
+cmatrix_t to_matrix(const cvector_t &vec, uint_t rows, uint_t cols) {
+  cmatrix_t mat(rows, cols);
+  for (uint_t j = 0; j < cols; j++)
+    for (uint_t i = 0; i < rows; i++)
+      mat(i, j) = vec[i + rows * j];
+  return mat;
+}
+
+std::vector<QVKernel> qubitvector_kernels() {
+  using qv_t = QV::QubitVector<>;
+  std::vector<QVKernel> kernels;
+  // Dense matrices, the 2 to 5 qubit cases depend on gate_opt
+  for (uint_t N = 1; N <= 5; N++) {
+    const cvector_t mat = dft_matrix(N);
+    kernels.push_back({"matrix" + std::to_string(N), N, 32., N > 1,
+                       [mat](qv_t &qv, const reg_t &qs) {qv.apply_matrix(qs, mat);}});
+  }
+  for (uint_t N = 1; N <= 2; N++) {
+    const cvector_t diag = phase_diagonal(N);
+    kernels.push_back({"diagonal" + std::to_string(N), N, 32., false,
+                       [diag](qv_t &qv, const reg_t &qs) {qv.apply_diagonal_matrix(qs, diag);}});
+  }
+  // Specialized gates only update the amplitudes they permute or rephase
+  kernels.push_back({"x", 1, 32., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_x(qs[0]);}});
+  kernels.push_back({"y", 1, 32., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_y(qs[0]);}});
+  kernels.push_back({"z", 1, 16., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_z(qs[0]);}});
+  kernels.push_back({"cnot", 2, 16., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_cnot(qs[0], qs[1]);}});
+  kernels.push_back({"cz", 2, 8., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_cz(qs[0], qs[1]);}});
+  kernels.push_back({"swap", 2, 16., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_swap(qs[0], qs[1]);}});
+  kernels.push_back({"toffoli", 3, 8., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_toffoli(qs[0], qs[1], qs[2]);}});
+  // Reductions only read the state
+  const cvector_t mat1 = dft_matrix(1);
+  const cvector_t diag1 = phase_diagonal(1);
+  const std::vector<cvector_t> kraus = {{1., 0., 0., 0.5}, {0., 0., std::sqrt(0.75), 0.}};
+  kernels.push_back({"norm1", 1, 16., false,
+                     [mat1](qv_t &qv, const reg_t &qs) {qv.norm(qs, mat1);}});
+  kernels.push_back({"norm_diagonal1", 1, 16., false,
+                     [diag1](qv_t &qv, const reg_t &qs) {qv.norm_diagonal(qs, diag1);}});
+  kernels.push_back({"norms1", 1, 16., false,
+                     [kraus](qv_t &qv, const reg_t &qs) {qv.norms(qs, kraus);}});
+  kernels.push_back({"probabilities1", 1, 16., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.probabilities(qs);}});
+  kernels.push_back({"probabilities3", 3, 16., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.probabilities(qs);}});
+  kernels.push_back({"probability1", 1, 8., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.probability(qs, 1);}});
+  std::vector<double> rnds(1000);
+  std::mt19937_64 rng(42);
+  std::uniform_real_distribution<double> dist(0., 1.);
+  for (auto &r : rnds)
+    r = dist(rng);
+  kernels.push_back({"sample_measure", 0, 16., false,
+                     [rnds](qv_t &qv, const reg_t &) {qv.sample_measure(rnds);}});
+  // Reset reads the outcome amplitudes and writes every amplitude
+  kernels.push_back({"reset1", 1, 24., false,
+                     [](qv_t &qv, const reg_t &qs) {qv.apply_reset(qs, 0, 1.);}});
+  return kernels;
+}
+
+std::vector<QMKernel> qubitmatrix_kernels() {
+  using qm_t = QM::QubitMatrix<>;
+  std::vector<QMKernel> kernels;
+  for (uint_t N = 1; N <= 3; N++) {
+    const uint_t dim = 1ULL << N;
+    const cmatrix_t mat = to_matrix(dft_matrix(N), dim, dim);
+    kernels.push_back({"matrix" + std::to_string(N), N, 32., false,
+                       [mat](qm_t &qm, const reg_t &qs) {qm.apply_matrix(qs, mat);}});
+  }
+  for (uint_t N = 1; N <= 2; N++) {
+    const uint_t dim = 1ULL << N;
+    const cmatrix_t diag = to_matrix(phase_diagonal(N), 1, dim);
+    kernels.push_back({"diagonal" + std::to_string(N), N, 32., false,
+                       [diag](qm_t &qm, const reg_t &qs) {qm.apply_diagonal_matrix(qs, diag);}});
+  }
+  kernels.push_back({"x", 1, 32., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_x(qs[0]);}});
+  kernels.push_back({"y", 1, 32., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_y(qs[0]);}});
+  kernels.push_back({"z", 1, 16., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_z(qs[0]);}});
+  kernels.push_back({"cnot", 2, 16., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_cnot(qs[0], qs[1]);}});
+  kernels.push_back({"cz", 2, 8., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_cz(qs[0], qs[1]);}});
+  kernels.push_back({"swap", 2, 16., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_swap(qs[0], qs[1]);}});
+  kernels.push_back({"toffoli", 3, 8., false,
+                     [](qm_t &qm, const reg_t &qs) {qm.apply_toffoli(qs[0], qs[1], qs[2]);}});
+  return kernels;
+}
+
+/*******************************************************************************
+ *
+ * Helper functions
+ *
+ ******************************************************************************/
+
+// Return the target qubits for a kernel on N-qubits out of num_qubits.
+// Position 0 is the lowest qubits, 1 spreads the qubits across the
+// register, and 2 is the highest qubits.
+reg_t target_qubits(uint_t N, uint_t num_qubits, uint_t position) {
+  reg_t qubits(N);
+  for (uint_t j = 0; j < N; j++) {
+    switch (position) {
+      case 0:
+        qubits[j] = j;
+        break;
+      case 1:
+        qubits[j] = (N == 1) ? num_qubits / 2 : j * (num_qubits - 1) / (N - 1);
+        break;
+      default:
+        qubits[j] = num_qubits - N + j;
+    }
+  }
+  return qubits;
+}
+
+std::string qubits_string(const reg_t &qubits) {
+  std::string str;
+  for (const auto q : qubits)
+    str += (str.empty() ? "" : ",") + std::to_string(q);
+  return str.empty() ? "-" : str;
+}
+
+// Return the best time in seconds of repeats applications of a kernel after
+// one warm up application
+template <class state_t>
+double time_kernel(const Kernel<state_t> &kernel, state_t &state,
+                   const reg_t &qubits, uint_t repeats) {
+  kernel.func(state, qubits);
+  double best = std::numeric_limits<double>::max();
+  for (uint_t j = 0; j < repeats; j++) {
+    const auto start = std::chrono::steady_clock::now();
+    kernel.func(state, qubits);
+    const auto stop = std::chrono::steady_clock::now();
+    best = std::min(best, std::chrono::duration<double>(stop - start).count());
+  }
+  return best;
+}
+
+// Return the measured memory bandwidth in GB/s of an in-place update of a
+// complex vector using the given number of threads
+double measure_bandwidth(cvector_t &vec, int threads, uint_t repeats) {
+  const int_t size = vec.size();
+  const complex_t phase = std::polar(1., 0.1);
+  double best = std::numeric_limits<double>::max();
+  for (uint_t j = 0; j <= repeats; j++) {
+    const auto start = std::chrono::steady_clock::now();
+    #pragma omp parallel for num_threads(threads)
+    for (int_t k = 0; k < size; k++)
+      vec[k] *= phase;
+    const auto stop = std::chrono::steady_clock::now();
+    // The first iteration is a warm up
+    if (j > 0)
+      best = std::min(best, std::chrono::duration<double>(stop - start).count());
+  }
+  return 32. * size / best * 1e-9;
+}
+
+void print_header() {
+  std::cout << std::setw(6) << "class" << std::setw(16) << "kernel"
+            << std::setw(8) << "qubits" << std::setw(10) << "targets"
+            << std::setw(9) << "threads" << std::setw(9) << "omp_thr"
+            << std::setw(10) << "gate_opt" << std::setw(12) << "time (s)"
+            << std::setw(10) << "GB/s" << std::setw(9) << "% peak" << std::endl;
+}
+
+void print_row(const std::string &cls, const std::string &kernel,
+               uint_t num_qubits, const reg_t &qubits, int threads,
+               int threshold, const std::string &gate_opt, double time,
+               double bytes, double peak) {
+  const double gbs = bytes / time * 1e-9;
+  std::cout << std::setw(6) << cls << std::setw(16) << kernel
+            << std::setw(8) << num_qubits << std::setw(10) << qubits_string(qubits)
+            << std::setw(9) << threads << std::setw(9) << threshold
+            << std::setw(10) << gate_opt
+            << std::setw(12) << std::scientific << std::setprecision(3) << time
+            << std::setw(10) << std::fixed << std::setprecision(2) << gbs
+            << std::setw(9) << std::setprecision(1) << 100. * gbs / peak
+            << std::endl;
+}
+
+/*******************************************************************************
+ *
+ * Main
+ *
+ ******************************************************************************/
+
+int main(int argc, char **argv) {
+
+  const uint_t min_qubits = (argc > 1) ? std::atoi(argv[1]) : 16;
+  const uint_t max_qubits = (argc > 2) ? std::atoi(argv[2]) : 24;
+#ifdef _OPENMP
+  const int max_threads = (argc > 3) ? std::atoi(argv[3]) : omp_get_max_threads();
+#else
+  const int max_threads = 1;
+#endif
+  const uint_t repeats = (argc > 4) ? std::atoi(argv[4]) : 5;
+  const std::string filter = (argc > 5) ? argv[5] : "";
+
+  // Thread counts in powers of 2 up to the maximum
+  std::vector<int> threads = {1};
+  while (2 * threads.back() <= max_threads)
+    threads.push_back(2 * threads.back());
+  if (threads.back() != max_threads)
+    threads.push_back(max_threads);
+
+  // Qubit thresholds for activating OpenMP: the default of each class and
+  // always on. These only differ for multi-threaded runs.
+  const int qv_default_threshold = QV::QubitVector<>().get_omp_threshold();
+  const int qm_default_threshold = QM::QubitMatrix<>().get_omp_threshold();
+
+  // Measure the peak bandwidth on a vector at least as large as the largest
+  // state and large enough not to fit in cache (64 MB)
+  std::vector<double> peak(max_threads + 1);
+  {
+    cvector_t vec(std::max(1ULL << max_qubits, 1ULL << 22), complex_t(1., 0.));
+    std::cout << "Measured memory bandwidth (" << vec.size() * sizeof(complex_t) / (1 << 20)
+              << " MB in-place update)" << std::endl;
+    for (const auto t : threads) {
+      peak[t] = measure_bandwidth(vec, t, repeats);
+      std::cout << "  threads = " << std::setw(3) << t << ": "
+                << std::fixed << std::setprecision(2) << peak[t] << " GB/s" << std::endl;
+    }
+  }
+  std::cout << "qubits = " << min_qubits << "-" << max_qubits
+            << ", repeats = " << repeats << std::endl << std::endl;
+
+  std::mt19937_64 rng(42);
+  std::normal_distribution<double> dist;
+  print_header();
+
+  // QubitVector kernels
+  const auto qv_kernels = qubitvector_kernels();
+  for (uint_t n = min_qubits; n <= max_qubits; n++) {
+    cvector_t init(1ULL << n);
+    for (auto &val : init)
+      val = complex_t(dist(rng), dist(rng));
+    const double bytes = double(init.size());
+    for (const auto &kernel : qv_kernels) {
+      if (kernel.name.find(filter) == std::string::npos || kernel.num_targets > n)
+        continue;
+      for (uint_t pos = 0; pos < 3; pos++) {
+        // Kernels without target qubits only have one position
+        if (kernel.num_targets == 0 && pos > 0)
+          break;
+        const reg_t qubits = target_qubits(kernel.num_targets, n, pos);
+        for (const auto t : threads) {
+          for (const int thr : {qv_default_threshold, 0}) {
+            if (t == 1 && thr == 0)
+              continue;
+            for (const bool opt : {false, true}) {
+              if (opt && !kernel.gate_opt)
+                continue;
+              QV::QubitVector<> qv(n);
+              qv.initialize(init);
+              qv.set_omp_threads(t);
+              qv.set_omp_threshold(thr);
+              if (opt)
+                qv.enable_gate_opt();
+              const double time = time_kernel(kernel, qv, qubits, repeats);
+              print_row("QV", kernel.name, n, qubits, t, thr,
+                        kernel.gate_opt ? (opt ? "on" : "off") : "-",
+                        time, kernel.bytes_per_amp * bytes, peak[t]);
+            }
+          }
+        }
+      }
+    }
+  }
+
+  // QubitMatrix kernels on unitaries with the same number of amplitudes
+  const auto qm_kernels = qubitmatrix_kernels();
+  for (uint_t n = std::max<uint_t>(min_qubits / 2, 1); n <= max_qubits / 2; n++) {
+    const uint_t dim = 1ULL << n;
+    const double bytes = double(dim * dim);
+    for (const auto &kernel : qm_kernels) {
+      if (kernel.name.find(filter) == std::string::npos || kernel.num_targets > n)
+        continue;
+      for (uint_t pos = 0; pos < 3; pos++) {
+        const reg_t qubits = target_qubits(kernel.num_targets, n, pos);
+        for (const auto t : threads) {
+          for (const int thr : {qm_default_threshold, 0}) {
+            if (t == 1 && thr == 0)
+              continue;
+            QM::QubitMatrix<> qm(n);
+            // QubitMatrix requires a unitary initial state
+            qm.initialize();
+            qm.set_omp_threads(t);
+            qm.set_omp_threshold(thr);
+            const double time = time_kernel(kernel, qm, qubits, repeats);
+            print_row("QM", kernel.name, n, qubits, t, thr, "-",
+                      time, kernel.bytes_per_amp * bytes, peak[t]);
+          }
+        }
+      }
+    }
+  }
+  return 0;
+}
@@ -10,6 +10,10 @@
 #include <iostream>
 #include <string>
 
+#ifdef AER_MPI
+#include <mpi.h>
+#endif
+
 // Simulator
 #include "simulators/qasm/qasm_controller.hpp"
 
@@ -27,9 +31,26 @@ inline void failed(const std::string &msg, std::ostream &o = std::cout,
   o << ret.dump(indent) << std::endl;
 }
 
+// Finalize MPI before returning the exit status from main
+inline int finalize(int status) {
+#ifdef AER_MPI
+  MPI_Finalize();
+#endif
+  return status;
+}
+
 int main(int argc, char **argv) {
 
+#ifdef AER_MPI
+  // All MPI processes execute the qobj but only rank 0 writes the result
+  MPI_Init(&argc, &argv);
+  int rank;
+  MPI_Comm_rank(MPI_COMM_WORLD, &rank);
+  std::ostream null_out(nullptr);
+  std::ostream &out = (rank == 0) ? std::cout : null_out; // output stream
+#else
   std::ostream &out = std::cout; // output stream
+#endif
   int indent = 4;
   json_t qobj;
 
@@ -41,7 +62,7 @@ int main(int argc, char **argv) {
       std::stringstream msg;
       msg << "Invalid input (" << e.what() << ")";
       failed(msg.str(), out, indent);
-      return 1;
+      return finalize(1);
     }
   } else {
     failed("Invalid command line", out);
@@ -50,7 +71,7 @@ int main(int argc, char **argv) {
     std::cerr << "qsikit_simulator file" << std::endl;
     std::cerr << std::endl;
     std::cerr << "  file : qobj file\n" << std::endl;
-    return 1;
+    return finalize(1);
   }
 
   // Execute simulation
@@ -60,12 +81,12 @@ int main(int argc, char **argv) {
     AER::Simulator::QasmController sim;
     out << sim.execute(qobj).dump(4) << std::endl;
 
-    return 0;
+    return finalize(0);
   } catch (std::exception &e) {
     std::stringstream msg;
     msg << "Failed to execute qobj (" << e.what() << ")";
     failed(msg.str(), out, indent);
-    return 1;
+    return finalize(1);
   }
 
 } // end main
@@ -12,6 +12,7 @@ Qiskit Aer qasm simulator backend.
 import json
 import logging
 import datetime
+import hashlib
 import time
 import uuid
 from numpy import ndarray
@@ -23,10 +24,18 @@ from qiskit.result import Result
 
 from ..aerjob import AerJob
 from ..aererror import AerError
+from ..noise.noise_model import NoiseModel
 
 # Logger
 logger = logging.getLogger(__name__)
 
+# Handles of noise models loaded into the controller noise model cache of
+# this process. Jobs may run in a process pool where each worker process has
+# its own controller cache, so handles are stored per-process and never
+# pickled with a backend.
+# Type: dict(str: str)
+_NOISE_MODEL_HANDLES = {}
+
 
 class AerJSONEncoder(json.JSONEncoder):
     """
@@ -52,7 +61,8 @@ class AerJSONEncoder(json.JSONEncoder):
 class AerBackend(BaseBackend):
     """Qiskit Aer Backend class."""
 
-    def __init__(self, controller, configuration, provider=None):
+    def __init__(self, controller, configuration, provider=None,
+                 noise_model_cache=None):
         """Aer class for backends.
 
         This method should initialize the module and its configuration, and
@@ -63,6 +73,10 @@ class AerBackend(BaseBackend):
             controller (function): Aer cython controller to be executed
             configuration (BackendConfiguration): backend configuration
             provider (BaseProvider): provider responsible for this backend
+            noise_model_cache (tuple): pair of Aer cython functions
+                (contains, insert) for the controller noise model cache,
+                or None if the controller does not have a noise model
+                cache (Default: None).
 
         Raises:
             FileNotFoundError if backend executable is not available.
@@ -70,6 +84,21 @@ class AerBackend(BaseBackend):
         """
         super().__init__(configuration, provider=provider)
         self._controller = controller
+        self._noise_model_cache = noise_model_cache
+        # Type: dict(str: str) of noise model version to cache handle
+        self._noise_model_handles = _NOISE_MODEL_HANDLES
+
+    def __getstate__(self):
+        # The noise model handles are only valid for the controller cache of
+        # the current process so are not pickled when a job is submitted to
+        # a process pool
+        state = self.__dict__.copy()
+        del state['_noise_model_handles']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._noise_model_handles = _NOISE_MODEL_HANDLES
 
     def run(self, qobj, backend_options=None, noise_model=None):
         """Run a qobj on the backend."""
@@ -97,11 +126,19 @@ class AerBackend(BaseBackend):
         self._validate(qobj)
         qobj_str = self._format_qobj_str(qobj, backend_options, noise_model)
         output = json.loads(self._controller(qobj_str).decode('UTF-8'))
+        if not output.get("success", False) and self._noise_model_evicted(noise_model):
+            # The cached noise model was evicted by a concurrent job before
+            # it was loaded by the controller so run again with the noise
+            # model passed inline
+            qobj_str = self._format_qobj_str(qobj, backend_options, noise_model,
+                                             use_cache=False)
+            output = json.loads(self._controller(qobj_str).decode('UTF-8'))
         self._validate_controller_output(output)
         end = time.time()
         return self._format_results(job_id, output, end - start)
 
-    def _format_qobj_str(self, qobj, backend_options, noise_model):
+    def _format_qobj_str(self, qobj, backend_options, noise_model,
+                         use_cache=True):
         """Format qobj string for qiskit aer controller"""
         # Save original qobj config so we can revert our modification
         # after execution
@@ -114,7 +151,11 @@ class AerBackend(BaseBackend):
                 config[key] = val
         # Add noise model
         if noise_model is not None:
-            config["noise_model"] = noise_model
+            handle = self._noise_model_handle(noise_model) if use_cache else None
+            if handle is None:
+                config["noise_model"] = noise_model
+            else:
+                config["noise_model_handle"] = handle
         qobj.config = QobjConfig.from_dict(config)
         # Get the JSON serialized string
         output = json.dumps(qobj, cls=AerJSONEncoder).encode('UTF-8')
@@ -123,6 +164,43 @@ class AerBackend(BaseBackend):
         # Return output
         return output
 
+    def _noise_model_handle(self, noise_model):
+        """Return the controller noise model cache handle for a noise model.
+
+        The noise model is serialized and loaded into the cache only if it
+        has been modified since it was last loaded, or if it was removed
+        from the cache. The handle is a hash of the serialized noise model.
+
+        Returns:
+            str: the handle, or None if the noise model cannot be cached.
+        """
+        # pylint: disable=protected-access
+        if self._noise_model_cache is None or not isinstance(noise_model, NoiseModel):
+            return None
+        contains, insert = self._noise_model_cache
+        handle = self._noise_model_handles.get(noise_model._version)
+        if handle is not None and contains(handle):
+            return handle
+        noise_model_str = json.dumps(noise_model, cls=AerJSONEncoder).encode('UTF-8')
+        handle = hashlib.sha1(noise_model_str).hexdigest()
+        insert(handle, noise_model_str)
+        # Remove the handles of noise models that have been evicted from
+        # the controller cache so that modified models do not accumulate
+        for version in [key for key, val in self._noise_model_handles.items()
+                        if not contains(val)]:
+            del self._noise_model_handles[version]
+        self._noise_model_handles[noise_model._version] = handle
+        return handle
+
+    def _noise_model_evicted(self, noise_model):
+        """Return True if a noise model was evicted from the controller cache."""
+        # pylint: disable=protected-access
+        if self._noise_model_cache is None or not isinstance(noise_model, NoiseModel):
+            return False
+        contains, _ = self._noise_model_cache
+        handle = self._noise_model_handles.get(noise_model._version)
+        return handle is not None and not contains(handle)
+
     def _format_results(self, job_id, output, time_taken):
         """Construct Result object from simulator output."""
         # Add result metadata
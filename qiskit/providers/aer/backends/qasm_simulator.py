@@ -14,6 +14,8 @@ from qiskit._util import local_hardware_info
 from qiskit.providers.models import BackendConfiguration
 from .aerbackend import AerBackend
 from qasm_controller_wrapper import qasm_controller_execute
+from qasm_controller_wrapper import qasm_noise_model_cache_contains
+from qasm_controller_wrapper import qasm_noise_model_cache_insert
 from ..version import __version__
 
 
@@ -26,6 +28,28 @@ class QasmSimulator(AerBackend):
         `backend_options` kwarg diction for `QasmSimulator.run` or
         `qiskit.execute`
 
+        * "method" (str): Sets the simulation method. "statevector"
+            samples a noisy statevector for each shot. "density_matrix"
+            evolves the density matrix once with each quantum error applied
+            as its average channel, and samples all shots from the final
+            state. "stabilizer" uses a Clifford stabilizer tableau and
+            supports circuits and noise models containing only Clifford
+            gates, Pauli matrices, measure and reset on hundreds of qubits.
+            "automatic" uses the stabilizer for Clifford circuits on more
+            than "stabilizer_qubit_threshold" qubits, and otherwise the
+            density matrix for noisy circuits when the number of shots is
+            greater than 2^num_qubits, the number of qubits is at most
+            "density_matrix_max_qubits", and the measurements can be
+            sampled from the final state (Default: "automatic").
+
+        * "density_matrix_max_qubits" (int): Sets the maximum number of
+            qubits for the automatic method to use the density matrix
+            (Default: 12).
+
+        * "stabilizer_qubit_threshold" (int): Sets the threshold that the
+            number of qubits of a Clifford circuit must be greater than for
+            the automatic method to use the stabilizer (Default: 20).
+
         * "initial_statevector" (vector_like): Sets a custom initial
             statevector for the simulation instead of the all zero
             initial state (Default: None).
@@ -64,11 +88,44 @@ class QasmSimulator(AerBackend):
             qubit optimized implementation of measurement sampling. Note
             that setting this two low can reduce performance (Default: 10)
 
+        * "statevector_sample_measure_marginal" (int): Sets the maximum
+            number of measured qubits for which measurement sampling draws
+            from the marginal distribution of the measured qubits instead
+            of sampling all qubits (Default: 15).
+
         * "statevector_hpc_gate_opt" (bool): If set to True this enables
             a different optimzied gate application routine that can
             increase performance on systems with a large number of CPU
             cores. For systems with a small number of cores it enabling
             can reduce performance (Default: False).
+
+        * "statevector_blas_threshold" (int): Sets the threshold that the
+            number of qubits of a matrix must be greater than or equal to
+            for it to be applied using BLAS matrix multiplication. If set
+            to 0 BLAS matrix multiplication is disabled (Default: 6).
+
+        * "statevector_blas_tile_kb" (int): Sets the size in kilobytes of
+            the blocks of amplitudes multiplied by the matrix in each BLAS
+            call. This should be tuned to the CPU cache size (Default: 1024).
+
+        * "statevector_storage_directory" (str): If set the statevector is
+            stored in a memory-mapped file in this directory instead of in
+            main memory. This allows simulating statevectors larger than
+            the available RAM and should be a directory on fast local
+            storage (Default: None).
+
+        * "statevector_chunk_qubits" (int): Sets the number of qubits for
+            the chunks of an out-of-core statevector. Consecutive gates on
+            qubits below this value are applied one chunk at a time to
+            reduce reads and writes to storage. Higher qubits acted on by
+            many gates are temporarily swapped into the chunk (Default: 22).
+
+        * "statevector_distributed" (bool): If True the statevector is
+            distributed over all MPI processes running the simulator, so
+            that each process stores 2^(n-k) amplitudes for 2^k processes.
+            Gates on the k highest qubits exchange amplitudes between pairs
+            of processes. This requires the simulator to be built with MPI
+            support (Default: False).
     """
 
     MAX_QUBIT_MEMORY = int(log2(local_hardware_info()['memory'] * (1024 ** 3) / 16))
@@ -114,7 +171,9 @@ class QasmSimulator(AerBackend):
     def __init__(self, configuration=None, provider=None):
         super().__init__(qasm_controller_execute,
                          BackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION),
-                         provider=provider)
+                         provider=provider,
+                         noise_model_cache=(qasm_noise_model_cache_contains,
+                                            qasm_noise_model_cache_insert))
 
     def _validate(self, qobj):
         # TODO
@@ -9,6 +9,7 @@
 Cython wrapper for Aer QasmController.
 """
 
+from libcpp cimport bool
 from libcpp.string cimport string
 
 cdef extern from "simulators/qasm/qasm_controller.hpp" namespace "AER::Simulator":
@@ -17,8 +18,20 @@ cdef extern from "simulators/qasm/qasm_controller.hpp" namespace "AER::Simulator
 
 cdef extern from "base/controller.hpp" namespace "AER":
     cdef string controller_execute[QasmController](string &qobj) except +
+    cdef void noise_model_cache_insert(string &handle, string &noise_model) except +
+    cdef bool noise_model_cache_contains(string &handle) except +
 
 
 def qasm_controller_execute(qobj):
     """Execute qobj on Aer C++ QasmController"""
     return controller_execute[QasmController](qobj)
+
+
+def qasm_noise_model_cache_insert(handle, noise_model):
+    """Load a serialized noise model into the Aer C++ noise model cache"""
+    noise_model_cache_insert(handle.encode('UTF-8'), noise_model)
+
+
+def qasm_noise_model_cache_contains(handle):
+    """Return True if the Aer C++ noise model cache contains a handle"""
+    return noise_model_cache_contains(handle.encode('UTF-8'))
@@ -28,7 +28,10 @@ device properties using the functions from the `device` submodule.
    errors on measurement outcomes. The error parameters are tuned for each
    individual qubit based on the T_1, T_2, frequency and readout error
    parameters for each qubit, and the gate error and gate time parameters
-   for each gate obtained from the device backend properties.
+   for each gate obtained from the device backend properties. The noise
+   model can be updated for new device properties using
+   `NoiseModel.update_from_properties`, which only replaces the errors
+   whose parameters changed.
 
 Custom Noise Models
 -------------------
@@ -61,8 +64,16 @@ canonical types of quantum errors:
    Amplitude damping error
    Phase damping error
    Combined phase and amplitude damping error
+
+Noise Model Approximations
+--------------------------
+Functions in the `noise.utils` module approximate the quantum errors of a
+noise model by Pauli errors, which can be sampled and applied as standard
+Pauli gates instead of Kraus channels, and report the trace distance of
+the approximation.
 """
 
 from .noise_model import NoiseModel
 from . import errors
 from . import device
+from . import utils
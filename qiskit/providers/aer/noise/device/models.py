@@ -9,6 +9,7 @@
 Simplified noise models for devices backends.
 """
 
+import numpy as np
 from numpy import inf, exp
 
 from .parameters import readout_error_values
@@ -18,8 +19,8 @@ from .parameters import thermal_relaxation_values
 from ..noiseerror import NoiseError
 from ..noise_model import NoiseModel
 from ..errors.readout_error import ReadoutError
+from ..errors.quantum_error import QuantumError
 from ..errors.standard_errors import depolarizing_error
-from ..errors.standard_errors import thermal_relaxation_error
 
 
 def basic_device_noise_model(properties,
@@ -89,22 +90,18 @@ def basic_device_noise_model(properties,
         If non-default values are used gate_times should be a list
     """
 
-    noise_model = NoiseModel()
-
-    # Add single-qubit readout errors
-    if readout_error:
-        for qubits, error in basic_device_readout_errors(properties):
-            noise_model.add_readout_error(error, qubits)
-
-    # Add gate errors
-    gate_errors = basic_device_gate_errors(properties,
-                                           thermal_relaxation=thermal_relaxation,
-                                           gate_times=gate_times,
-                                           temperature=temperature,
-                                           standard_gates=standard_gates)
-    for name, qubits, error in gate_errors:
-        noise_model.add_quantum_error(error, name, qubits)
+    options = {'readout_error': readout_error,
+               'thermal_relaxation': thermal_relaxation,
+               'temperature': temperature,
+               'gate_times': gate_times,
+               'standard_gates': standard_gates}
+    keys = _device_error_keys(properties, **options)
 
+    noise_model = NoiseModel()
+    _add_device_errors(noise_model, keys)
+    # Store the error parameters so that the noise model can be updated
+    # from new properties using `NoiseModel.update_from_properties`
+    noise_model._device_model = (options, keys)
     return noise_model
 
 
@@ -149,13 +146,72 @@ def basic_device_gate_errors(properties, thermal_relaxation=True,
         qubits is a list of qubits or None to apply gate time to this
         gate one any set of qubits, and value is the gate time in
         nanoseconds.
+
+        Errors are cached by their T1, T2, gate time, excited state
+        population and gate error values, so errors for repeated values
+        are only constructed once, including across calls for updated
+        backend properties.
     """
+    gate_keys = _device_gate_keys(properties,
+                                  thermal_relaxation=thermal_relaxation,
+                                  gate_times=gate_times,
+                                  temperature=temperature,
+                                  standard_gates=standard_gates)
+    errors = _device_errors([key for _, _, key in gate_keys])
+    return [(name, qubits, error)
+            for (name, qubits, _), error in zip(gate_keys, errors)]
+
+
+def _device_error_keys(properties, readout_error=True,
+                       thermal_relaxation=True, temperature=0,
+                       gate_times=None, standard_gates=True):
+    """Return the error keys of a basic device noise model.
+
+    Returns:
+        dict: A dictionary of pairs (name, qubits): key for each
+        instruction with a non-ideal error, where name is "measure"
+        for readout errors and qubits is a tuple of qubits.
+    """
+    keys = {}
+    if readout_error:
+        for qubit, value in enumerate(readout_error_values(properties)):
+            if value is not None and value > 0:
+                keys[('measure', (qubit,))] = ('readout', value)
+    gate_keys = _device_gate_keys(properties,
+                                  thermal_relaxation=thermal_relaxation,
+                                  gate_times=gate_times,
+                                  temperature=temperature,
+                                  standard_gates=standard_gates)
+    for name, qubits, key in gate_keys:
+        keys[(name, tuple(qubits))] = key
+    return keys
+
+
+def _add_device_errors(noise_model, keys):
+    """Construct and add the errors for device error keys to a noise model"""
+    instructions = list(keys.keys())
+    for (name, qubits), error in zip(instructions,
+                                     _device_errors(keys.values())):
+        if name == 'measure':
+            noise_model.add_readout_error(error, list(qubits))
+        else:
+            noise_model.add_quantum_error(error, name, list(qubits))
+
+
+def _device_gate_keys(properties, thermal_relaxation=True,
+                      gate_times=None, temperature=0,
+                      standard_gates=True):
+    """Return a list of (name, qubits, key) for device gates with errors"""
     # Generate custom gate time dict
     custom_times = {}
+    relax_params = None
+    populations = None
     if thermal_relaxation:
         # If including thermal relaxation errors load
         # T1, T2, and frequency values from properties
         relax_params = thermal_relaxation_values(properties)
+        populations = [_excited_population(freq, temperature)
+                       for _, _, freq in relax_params]
         # If we are specifying custom gate times include
         # them in the custom times dict
         if gate_times:
@@ -167,8 +223,8 @@ def basic_device_gate_errors(properties, thermal_relaxation=True,
     # Get the device gate parameters from properties
     device_gate_params = gate_param_values(properties)
 
-    # Construct quantum errors
-    errors = []
+    # Get the error parameters for each gate
+    gate_keys = []
     for name, qubits, gate_time, gate_error in device_gate_params:
         # Check for custom gate time
         relax_time = gate_time
@@ -179,41 +235,172 @@ def basic_device_gate_errors(properties, thermal_relaxation=True,
             if filtered:
                 # get first value
                 relax_time = filtered[0]
-        # Get depolarizing error channel
-        depol_error = _device_depolarizing_error(qubits, gate_error,
-                                                 relax_time,
-                                                 relax_params,
-                                                 temperature,
-                                                 thermal_relaxation,
-                                                 standard_gates)
-        # Get relaxation error
-        relax_error = _device_thermal_relaxation_error(qubits, relax_time,
-                                                       relax_params,
-                                                       temperature,
-                                                       thermal_relaxation)
-        # Combine errors
-        if depol_error is None and relax_error is None:
+        # Get depolarizing error parameters
+        depol_key = _device_depolarizing_key(qubits, gate_error,
+                                             relax_time,
+                                             relax_params,
+                                             thermal_relaxation,
+                                             standard_gates)
+        # Get relaxation error parameters
+        relax_key = _device_thermal_relaxation_key(qubits, relax_time,
+                                                   relax_params,
+                                                   populations,
+                                                   thermal_relaxation)
+        if depol_key is None and relax_key is None:
             # No error for this gate
-            pass
-        elif depol_error is not None and relax_error is None:
-            # Append only the depolarizing error
-            errors.append((name, qubits, depol_error))
-            # Append only the relaxation error
-        elif relax_error is not None and depol_error is None:
-            errors.append((name, qubits, relax_error))
+            continue
+        gate_keys.append((name, qubits, ('gate', depol_key, relax_key)))
+    return gate_keys
+
+
+def _device_errors(keys):
+    """Return the errors for a list of device error keys"""
+    keys = list(keys)
+    # Construct the relaxation errors for all qubits and gate times
+    # that are not already cached in a single batch
+    relax_keys = [key[2] for key in keys
+                  if key[0] == 'gate' and key[2] is not None]
+    _cached_errors([key for relax_key in relax_keys for key in relax_key],
+                   _thermal_relaxation_errors)
+    errors = []
+    for key in keys:
+        if key[0] == 'readout':
+            error, = _cached_errors([key], _readout_errors)
+        else:
+            error, = _cached_errors([key], _device_gate_errors)
+        errors.append(error)
+    return errors
+
+
+# Cache of the quantum errors constructed for device noise models indexed
+# by their error parameters. Calibration values often repeat across qubits
+# and gates, and between updates of the backend properties, so the errors
+# for each set of parameters are only constructed once.
+_ERROR_CACHE = {}
+_ERROR_CACHE_SIZE = 10000
+
+
+def _cached_errors(keys, construct):
+    """Return the cached errors for a list of error parameter keys.
+
+    Errors that are not in the cache are constructed in a single batch
+    by calling `construct(missing_keys)` and added to the cache.
+    """
+    missing = [key for key in dict.fromkeys(keys) if key not in _ERROR_CACHE]
+    if missing:
+        if len(_ERROR_CACHE) + len(missing) > _ERROR_CACHE_SIZE:
+            _ERROR_CACHE.clear()
+        for key, error in zip(missing, construct(missing)):
+            _ERROR_CACHE[key] = error
+    return [_ERROR_CACHE[key] for key in keys]
+
+
+def _device_gate_errors(keys):
+    """Construct combined gate errors for device gate error keys"""
+    errors = []
+    for _, depol_key, relax_key in keys:
+        depol_error = None
+        relax_error = None
+        if depol_key is not None:
+            depol_error, = _cached_errors([depol_key], _depolarizing_errors)
+        if relax_key is not None:
+            # Construct a tensor product of single qubit relaxation errors
+            # for any multi qubit gates
+            for single in _cached_errors(relax_key, _thermal_relaxation_errors):
+                if relax_error is None:
+                    relax_error = single
+                else:
+                    relax_error = relax_error.kron(single)
+        # Combine errors
+        if relax_error is None:
+            # Only the depolarizing error
+            errors.append(depol_error)
+        elif depol_error is None:
+            # Only the relaxation error
+            errors.append(relax_error.simplify())
         else:
-            # Append a combined error of depolarizing error
-            # followed by a relaxation error
-            combined_error = depol_error.compose(relax_error)
-            errors.append((name, qubits, combined_error))
+            # Combined error of depolarizing error followed by a
+            # relaxation error. Simplifying merges the equivalent
+            # circuits of the composed error.
+            errors.append(depol_error.compose(relax_error).simplify())
+    return errors
+
+
+def _depolarizing_errors(keys):
+    """Construct depolarizing errors for depolarizing error keys"""
+    return [depolarizing_error(prob, num_qubits, standard_gates=standard_gates)
+            for _, prob, num_qubits, standard_gates in keys]
+
+
+def _readout_errors(keys):
+    """Construct single-qubit readout errors for readout error keys"""
+    return [ReadoutError([[1 - value, value], [value, 1 - value]])
+            for _, value in keys]
+
+
+def _thermal_relaxation_errors(keys, threshold=1e-10):
+    """Construct thermal relaxation errors for thermal relaxation error keys.
+
+    This constructs the same errors as `thermal_relaxation_error` for
+    arrays of parameter values at once.
+    """
+    t1, t2, time, population = np.array([key[1:] for key in keys],
+                                        dtype=float).T
+    # Check parameters
+    if np.any(population < 0) or np.any(population > 1):
+        raise NoiseError("Invalid excited state population.")
+    if np.any(time < 0):
+        raise NoiseError("Invalid gate_time (< 0)")
+    if np.any(t1 <= 0):
+        raise NoiseError("Invalid T_1 relaxation time parameter: T_1 <= 0.")
+    if np.any(t2 <= 0):
+        raise NoiseError("Invalid T_2 relaxation time parameter: T_2 <= 0.")
+    if np.any(t2 - 2 * t1 > 0):
+        raise NoiseError("Invalid T_2 relaxation time parameter: T_2 greater than 2 * T_1.")
+    # Relaxation and dephasing rates are zero for infinite T1 and T2
+    rate1 = 1 / t1
+    rate2 = 1 / t2
+    p_reset = 1 - np.exp(-time * rate1)
+    exp_t2 = np.exp(-time * rate2)
+    p0 = 1 - population
+    p1 = population
+
+    errors = [None] * len(keys)
+    # If T_2 > T_1 the error is a Kraus channel given by the eigenvectors of
+    # the Choi-matrix, computed for all errors at once
+    kraus_pos = np.flatnonzero(t2 > t1)
+    if kraus_pos.size:
+        choi = np.zeros((kraus_pos.size, 4, 4))
+        choi[:, 0, 0] = 1 - (p1 * p_reset)[kraus_pos]
+        choi[:, 1, 1] = (p1 * p_reset)[kraus_pos]
+        choi[:, 2, 2] = (p0 * p_reset)[kraus_pos]
+        choi[:, 3, 3] = 1 - (p0 * p_reset)[kraus_pos]
+        choi[:, 0, 3] = choi[:, 3, 0] = exp_t2[kraus_pos]
+        vals, vecs = np.linalg.eigh(choi)
+        for pos, val, vec in zip(kraus_pos, vals, vecs):
+            kraus = [np.sqrt(v) * vec[:, k].reshape((2, 2), order='F')
+                     for k, v in enumerate(val) if v > threshold]
+            errors[pos] = QuantumError(kraus)
+    # If T_2 <= T_1 the error is a mixture of reset and unitary errors
+    circuits = [
+        [{'name': 'id', 'qubits': [0]}],
+        [{'name': 'z', 'qubits': [0]}],
+        [{'name': 'reset', 'qubits': [0]}],
+        [{'name': 'reset', 'qubits': [0]}, {'name': 'x', 'qubits': [0]}]]
+    p_reset0 = p_reset * p0
+    p_reset1 = p_reset * p1
+    p_z = (1 - p_reset) * (1 - np.exp(-time * (rate2 - rate1))) / 2
+    p_identity = 1 - p_z - p_reset0 - p_reset1
+    for pos in np.flatnonzero(t2 <= t1):
+        probabilities = [p_identity[pos], p_z[pos], p_reset0[pos], p_reset1[pos]]
+        errors[pos] = QuantumError(zip(circuits, probabilities))
     return errors
 
 
-def _device_depolarizing_error(qubits, gate_error, gate_time, relax_params,
-                               temperature, thermal_relaxation=True,
-                               standard_gates=True):
-    """Construct a depolarizing_error for device"""
-    error = None
+def _device_depolarizing_key(qubits, gate_error, gate_time, relax_params,
+                             thermal_relaxation=True, standard_gates=True):
+    """Return the depolarizing error key for a device gate, or None if
+    the gate has no depolarizing error"""
     if not thermal_relaxation:
         # Model gate error entirely as depolarizing error
         p_depol = _depol_error_value_one_qubit(gate_error)
@@ -239,36 +426,25 @@ def _device_depolarizing_error(qubits, gate_error, gate_time, relax_params,
             raise NoiseError("Device noise model only supports" +
                              "1 and 2-qubit gates when using "
                              "thermal_relaxation=True.")
-    if p_depol > 0:
-        error = depolarizing_error(p_depol, len(qubits),
-                                   standard_gates=standard_gates)
-    return error
+    if p_depol is None or p_depol <= 0:
+        return None
+    return ('depolarizing', p_depol, len(qubits), standard_gates)
 
 
-def _device_thermal_relaxation_error(qubits, gate_time, relax_params,
-                                     temperature, thermal_relaxation=True):
-    """Construct a thermal_relaxation_error for device"""
+def _device_thermal_relaxation_key(qubits, gate_time, relax_params,
+                                   populations, thermal_relaxation=True):
+    """Return the thermal relaxation error keys of each gate qubit in
+    reverse order, or None if the gate has no relaxation error"""
     # Check trivial case
     if not thermal_relaxation or gate_time is None or gate_time == 0:
         return None
     # convert gate time to same units as T1 and T2 (microseconds)
     gate_time = gate_time / 1000
-    # Construct a tensor product of single qubit relaxation errors
-    # for any multi qubit gates
-    first = True
-    error = None
+    keys = []
     for qubit in reversed(qubits):
-        t1, t2, freq = relax_params[qubit]
-        population = _excited_population(freq, temperature)
-        if first:
-            error = thermal_relaxation_error(t1, t2, gate_time,
-                                             population)
-            first = False
-        else:
-            single = thermal_relaxation_error(t1, t2, gate_time,
-                                              population)
-            error = error.kron(single)
-    return error
+        t1, t2, _ = relax_params[qubit]
+        keys.append(('relaxation', t1, t2, gate_time, populations[qubit]))
+    return tuple(keys)
 
 
 def _excited_population(freq, temperature):
@@ -233,6 +233,59 @@ class QuantumError:
                         combined_noise_probabilities)
         return QuantumError(noise_ops)
 
+    def simplify(self, threshold=None):
+        """
+        Return a simplified quantum error with fewer error circuits.
+
+        Args:
+            threshold (double or None): If specified, error circuits with
+                                        probability below the threshold are
+                                        removed and the remaining
+                                        probabilities renormalized
+                                        (Default: None).
+
+        Returns:
+            QuantumError: the simplified quantum error.
+
+        Additional Information:
+            Each error circuit is converted to a canonical form by removing
+            identity gates, folding adjacent Pauli gates and Pauli unitary
+            matrices on the same qubit into a single Pauli gate, removing
+            Pauli gates immediately before a reset of the same qubit, and
+            combining adjacent unitary matrix instructions on the same
+            qubits. Global phases of unitary matrices are removed. Error
+            circuits that are then equal are merged into a single circuit by
+            summing their probabilities.
+
+            Unless a threshold is specified the simplified error is
+            equivalent to the current error.
+        """
+        circuits = []
+        probabilities = []
+        positions = {}
+        for circuit, prob in zip(self._noise_circuits, self._noise_probabilities):
+            circuit = self._simplify_circuit(circuit)
+            key = self._circuit_key(circuit)
+            if key in positions:
+                probabilities[positions[key]] += prob
+            else:
+                positions[key] = len(circuits)
+                circuits.append(circuit)
+                probabilities.append(prob)
+        # Truncate small probability terms
+        if threshold is not None and threshold > 0:
+            # Keep the most likely term so the error is not empty
+            pmax = max(probabilities)
+            terms = [(circ, prob) for circ, prob in zip(circuits, probabilities)
+                     if prob >= threshold or prob == pmax]
+            circuits = [circ for circ, _ in terms]
+            probabilities = [prob for _, prob in terms]
+        # Renormalize probabilities
+        total = np.sum(probabilities)
+        probabilities = [prob / total for prob in probabilities]
+        return QuantumError(zip(circuits, probabilities),
+                            number_of_qubits=self.number_of_qubits)
+
     def kron(self, error):
         """
         Kronecker product current error with another quantum error.
@@ -302,6 +355,122 @@ class QuantumError:
                         combined_noise_probabilities)
         return QuantumError(noise_ops)
 
+    @staticmethod
+    def _simplify_circuit(circuit):
+        """
+        Helper function to return the canonical form of an error circuit.
+        """
+        # Pauli gates are stored as (x, z) bits for each qubit until an
+        # instruction on that qubit is reached. Paulis on other qubits
+        # commute with the instruction.
+        pauli_bits = {'x': (1, 0), 'y': (1, 1), 'z': (0, 1)}
+        pauli_names = {(1, 0): 'x', (1, 1): 'y', (0, 1): 'z'}
+        paulis = {}
+        simplified = []
+
+        def flush(qubits):
+            for qubit in sorted(qubits):
+                bits = paulis.pop(qubit, (0, 0))
+                if bits != (0, 0):
+                    simplified.append({'name': pauli_names[bits],
+                                       'qubits': [qubit]})
+
+        for op in circuit:
+            name = op['name']
+            qubits = op['qubits']
+            if name == 'id':
+                continue
+            if name in pauli_bits:
+                bits0 = paulis.get(qubits[0], (0, 0))
+                bits1 = pauli_bits[name]
+                paulis[qubits[0]] = (bits0[0] ^ bits1[0], bits0[1] ^ bits1[1])
+            elif name == 'reset':
+                # Pauli gates before a reset have no effect
+                for qubit in qubits:
+                    paulis.pop(qubit, None)
+                simplified.append(op)
+            elif name == 'unitary':
+                bits = QuantumError._unitary_paulis(op['params'])
+                if bits is not None:
+                    for qubit, bits1 in zip(qubits, bits):
+                        bits0 = paulis.get(qubit, (0, 0))
+                        paulis[qubit] = (bits0[0] ^ bits1[0], bits0[1] ^ bits1[1])
+                    continue
+                flush(qubits)
+                last_op = simplified[-1] if simplified else {}
+                if (last_op.get('name') == 'unitary' and
+                        last_op['qubits'] == qubits):
+                    op = QuantumError._compose_unitary(last_op, op)
+                    simplified.pop()
+                op = QuantumError._remove_phase_unitary(op)
+                # Remove identity matrices
+                mat = op['params']
+                if not np.allclose(mat, np.eye(len(mat))):
+                    simplified.append(op)
+            else:
+                flush(qubits)
+                simplified.append(op)
+        flush(list(paulis.keys()))
+        # Check if circuit is empty and add identity
+        if not simplified:
+            simplified.append({'name': 'id', 'qubits': [0]})
+        return simplified
+
+    @staticmethod
+    def _unitary_paulis(mat, atol=1e-10):
+        """
+        Helper function to return the (x, z) bits of each qubit if a unitary
+        matrix is a tensor product of Pauli matrices up to a global phase.
+        Otherwise return None.
+        """
+        mat = np.array(mat, dtype=complex)
+        dim = len(mat)
+        num_qubits = int(np.log2(dim))
+        # A Pauli matrix X^x Z^z maps column j to (-1)^{z.j} |j ^ x>
+        x = int(np.argmax(np.abs(mat[:, 0])))
+        phase = mat[x, 0]
+        z = 0
+        for k in range(num_qubits):
+            if abs(mat[(1 << k) ^ x, 1 << k] + phase) < atol:
+                z |= 1 << k
+        cols = np.arange(dim)
+        signs = np.array([(-1) ** bin(col & z).count('1') for col in cols])
+        target = np.zeros((dim, dim), dtype=complex)
+        target[cols ^ x, cols] = phase * signs
+        if not np.allclose(mat, target, atol=atol):
+            return None
+        return [((x >> k) & 1, (z >> k) & 1) for k in range(num_qubits)]
+
+    @staticmethod
+    def _circuit_key(circuit, decimals=12):
+        """
+        Helper function to return a hashable key for an error circuit.
+        """
+        key = []
+        for op in circuit:
+            params = op.get('params', [])
+            if op['name'] == 'unitary':
+                params = [params]
+            if op['name'] in ['unitary', 'kraus']:
+                params = tuple(np.round(np.array(mat, dtype=complex),
+                                        decimals).tobytes()
+                               for mat in params)
+            else:
+                params = tuple(params)
+            key.append((op['name'], tuple(op['qubits']), params))
+        return tuple(key)
+
+    @staticmethod
+    def _remove_phase_unitary(unitary):
+        """
+        Helper function to remove the global phase of a unitary qobj instruction.
+        """
+        mat = np.array(unitary['params'], dtype=complex)
+        # Make the first non-zero entry of the matrix real and positive
+        val = mat.flat[np.argmax(np.abs(mat) > 1e-10)]
+        mat = mat * np.conj(val) / np.abs(val)
+        return {'name': 'unitary', 'qubits': unitary['qubits'], 'params': mat}
+
     @staticmethod
     def _kron_kraus(kraus1, kraus0):
         """
@@ -10,6 +10,7 @@ Noise model class for Qiskit Aer simulators.
 """
 
 import logging
+import uuid
 
 from .noiseerror import NoiseError
 from .errors.quantum_error import QuantumError
@@ -18,6 +19,17 @@ from .errors.readout_error import ReadoutError
 logger = logging.getLogger(__name__)
 
 
+def _new_version():
+    """Return a new version for a noise model.
+
+    The version of a noise model is updated each time it is modified. This
+    is used by simulator backends to check if a cached copy of the noise
+    model is still valid. Versions are random so that they are unique
+    across processes.
+    """
+    return uuid.uuid4().hex
+
+
 class NoiseModel:
 
     """
@@ -44,6 +56,11 @@ class NoiseModel:
         self._default_readout_error = None  # Type: ReadoutError
         self._local_readout_errors = {}     # Type: dict(str: ReadoutError)
         self._x90_gates = []
+        # Error parameters of a device noise model used for updating
+        # from new device properties
+        # Type: pair(dict, dict(tuple(str, tuple(int)): tuple))
+        self._device_model = None
+        self._version = _new_version()
 
     def reset(self):
         """Reset the noise model."""
@@ -64,6 +81,7 @@ class NoiseModel:
         Raises:
             NoiseError: if the input operations are not valid.
         """
+        self._version = _new_version()
 
         if isinstance(operations, str):
             operations = [operations]
@@ -88,6 +106,7 @@ class NoiseModel:
         Additional Information:
             If the error object is ideal it will not be added to the model.
         """
+        self._version = _new_version()
 
         # Convert single operation to list
         if isinstance(operations, str):
@@ -140,6 +159,7 @@ class NoiseModel:
         Additional Information:
             If the error object is ideal it will not be added to the model.
         """
+        self._version = _new_version()
 
         # Convert single operation to list
         if isinstance(operations, str):
@@ -211,6 +231,7 @@ class NoiseModel:
         Additional Information:
             If the error object is ideal it will not be added to the model.
         """
+        self._version = _new_version()
 
         # Convert single operation to list
         if isinstance(operations, str):
@@ -266,6 +287,7 @@ class NoiseModel:
         Additional Information:
             If the error object is ideal it will not be added to the model.
         """
+        self._version = _new_version()
 
         # Error checking
         if not isinstance(error, ReadoutError):
@@ -308,6 +330,7 @@ class NoiseModel:
         Additional Information:
             If the error object is ideal it will not be added to the model.
         """
+        self._version = _new_version()
 
         # Error checking
         if not isinstance(error, ReadoutError):
@@ -341,6 +364,57 @@ class NoiseModel:
                            "all-qubit readout error for these qubits.")
         self._noise_instructions.add("measure")
 
+    def update_from_properties(self, properties):
+        """
+        Update a device noise model from new device backend properties.
+
+        Only the errors whose error parameters changed from the previous
+        device properties are reconstructed and replaced in the noise
+        model.
+
+        Args:
+            properties (BackendProperties): new device backend properties.
+
+        Returns:
+            list: A list of pairs (operation, qubits) of the updated
+            errors, where operation is "measure" for readout errors.
+
+        Raises:
+            NoiseError: if the noise model was not generated from device
+            properties using `basic_device_noise_model`.
+
+        Additional Information:
+            The updated errors replace all errors for their operation and
+            qubits, including any errors added after generating the noise
+            model.
+        """
+        self._version = _new_version()
+        # pylint: disable=cyclic-import
+        from .device.models import _device_error_keys, _add_device_errors
+        if self._device_model is None:
+            raise NoiseError("Noise model was not generated from device properties.")
+        options, keys = self._device_model
+        new_keys = _device_error_keys(properties, **options)
+
+        # Remove errors that changed or no longer exist
+        changed = [instr for instr, key in keys.items()
+                   if new_keys.get(instr) != key]
+        for name, qubits in changed:
+            qubits_str = self._qubits2str(qubits)
+            if name == 'measure':
+                self._local_readout_errors.pop(qubits_str, None)
+            elif name in self._local_quantum_errors:
+                self._local_quantum_errors[name].pop(qubits_str, None)
+
+        # Add errors that changed or are new
+        added = {instr: key for instr, key in new_keys.items()
+                 if keys.get(instr) != key}
+        _add_device_errors(self, added)
+        self._device_model = (options, new_keys)
+        updated = list(added.keys())
+        updated += [instr for instr in changed if instr not in added]
+        return [(name, list(qubits)) for name, qubits in updated]
+
     def __repr__(self):
         """Display noise model"""
 
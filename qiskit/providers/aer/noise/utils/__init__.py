@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Noise utilities module for Qiskit Aer."""
+
+from .noise_transformation import pauli_approximate_error
+from .noise_transformation import pauli_approximate_noise_model
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Pauli approximation of quantum errors and noise models.
+"""
+
+import itertools
+import numpy as np
+
+from ..noiseerror import NoiseError
+from ..noise_model import NoiseModel
+from ..errors.errorutils import standard_gate_unitary
+from ..errors.standard_errors import pauli_error
+
+
+def pauli_approximate_error(error, standard_gates=True, threshold=1e-10):
+    """Return the Pauli twirl approximation of a quantum error.
+
+    Args:
+        error (QuantumError): the quantum error to approximate.
+        standard_gates (bool): if True return the Pauli error as standard
+                               qobj Pauli gate instructions. If False
+                               return as unitary matrix qobj instructions
+                               (Default: True).
+        threshold (double): Pauli probabilities below this value are
+                            removed from the approximate error
+                            (Default: 1e-10).
+
+    Returns:
+        tuple: A pair (pauli_error, distance) of the approximate Pauli
+        QuantumError and the trace distance between the normalized Choi
+        matrices of the approximate and original errors.
+
+    Raises:
+        NoiseError: if the error contains an instruction that cannot be
+        converted to a quantum channel.
+
+    Additional Information:
+        The Pauli twirl of a channel is the Pauli channel given by the
+        diagonal of the process matrix of the channel in the Pauli basis.
+        It has the same process fidelity with the identity as the original
+        error. Kraus errors such as amplitude damping and thermal
+        relaxation errors are approximated by a mixture of Pauli gates
+        which can be sampled and applied as standard gates.
+    """
+    num_qubits = error.number_of_qubits
+    chi = _pauli_chi_matrix(error)
+    probabilities = np.real(np.diag(chi)).copy()
+    # Trace distance of the Choi-matrices is the trace distance of the
+    # process matrices since they are related by a change of basis
+    distance = 0.5 * np.sum(np.abs(np.linalg.eigvalsh(chi - np.diag(np.diag(chi)))))
+
+    # Remove small probabilities and renormalize
+    probabilities[probabilities < threshold] = 0
+    probabilities /= np.sum(probabilities)
+    noise_ops = [(label, prob) for label, prob
+                 in zip(_pauli_labels(num_qubits), probabilities) if prob > 0]
+    approx_error = pauli_error(noise_ops, standard_gates=standard_gates)
+    return approx_error, distance
+
+
+def pauli_approximate_noise_model(noise_model, standard_gates=True,
+                                  threshold=1e-10):
+    """Return a noise model with all quantum errors approximated by Pauli errors.
+
+    Args:
+        noise_model (NoiseModel): the noise model to approximate.
+        standard_gates (bool): if True return the Pauli errors as standard
+                               qobj Pauli gate instructions. If False
+                               return as unitary matrix qobj instructions
+                               (Default: True).
+        threshold (double): Pauli probabilities below this value are
+                            removed from the approximate errors
+                            (Default: 1e-10).
+
+    Returns:
+        tuple: A pair (noise_model, distance) of the approximate noise
+        model and the maximum trace distance between the normalized Choi
+        matrices of the approximate and original quantum errors.
+
+    Raises:
+        NoiseError: if a quantum error contains an instruction that cannot
+        be converted to a quantum channel.
+
+    Additional Information:
+        Each quantum error is replaced by its Pauli twirl approximation
+        using `pauli_approximate_error`. Readout errors are unchanged.
+    """
+    # pylint: disable=protected-access
+    # Errors are often shared between operations and qubits
+    # so each error object is only approximated once
+    approx_errors = {}
+    distances = [0]
+
+    def approximate(error):
+        if id(error) not in approx_errors:
+            approx_error, distance = pauli_approximate_error(error,
+                                                             standard_gates,
+                                                             threshold)
+            approx_errors[id(error)] = approx_error
+            distances.append(distance)
+        return approx_errors[id(error)]
+
+    approx_model = NoiseModel()
+    approx_model._noise_instructions = set(noise_model._noise_instructions)
+    approx_model._x90_gates = list(noise_model._x90_gates)
+    approx_model._default_quantum_errors = {
+        operation: [approximate(error) for error in errors]
+        for operation, errors in noise_model._default_quantum_errors.items()}
+    approx_model._local_quantum_errors = {
+        operation: {qubits: [approximate(error) for error in errors]
+                    for qubits, errors in qubit_dict.items()}
+        for operation, qubit_dict in noise_model._local_quantum_errors.items()}
+    approx_model._nonlocal_quantum_errors = {
+        operation: {qubits: [(approximate(error), noise_qubits)
+                             for error, noise_qubits in errors]
+                    for qubits, errors in qubit_dict.items()}
+        for operation, qubit_dict in noise_model._nonlocal_quantum_errors.items()}
+    approx_model._default_readout_error = noise_model._default_readout_error
+    approx_model._local_readout_errors = dict(noise_model._local_readout_errors)
+    return approx_model, max(distances)
+
+
+def _pauli_labels(num_qubits):
+    """Return the Pauli strings for a number of qubits."""
+    return [''.join(label) for label
+            in itertools.product('IXYZ', repeat=num_qubits)]
+
+
+def _pauli_matrices(num_qubits):
+    """Return the Pauli matrices in the same order as `_pauli_labels`."""
+    single = [standard_gate_unitary(name) for name in ['id', 'x', 'y', 'z']]
+    mats = [np.array([[1]], dtype=complex)]
+    for _ in range(num_qubits):
+        mats = [np.kron(mat, pauli) for mat in mats for pauli in single]
+    return np.array(mats)
+
+
+def _pauli_chi_matrix(error):
+    """Return the normalized process matrix of an error in the Pauli basis."""
+    num_qubits = error.number_of_qubits
+    dim = 2 ** num_qubits
+    # Vectors of Pauli coefficients Tr[P.K] / dim for every Kraus matrix K
+    # of the error
+    paulis = _pauli_matrices(num_qubits)
+    coeffs = []
+    for circuit, prob in zip(error.circuits, error.probabilities):
+        kraus = np.array(_circuit_kraus(circuit, num_qubits))
+        coeffs.append(np.sqrt(prob) * np.einsum('pij,kji->kp', paulis, kraus) / dim)
+    coeffs = np.concatenate(coeffs)
+    return coeffs.T.dot(coeffs.conj())
+
+
+def _circuit_kraus(circuit, num_qubits):
+    """Return the Kraus matrices of an error circuit."""
+    kraus = [np.eye(2 ** num_qubits, dtype=complex)]
+    for op in circuit:
+        name = op['name']
+        qubits = op['qubits']
+        if name == 'reset':
+            # Reset each qubit to the |0> state
+            op_kraus = [np.array([[1, 0], [0, 0]], dtype=complex),
+                        np.array([[0, 1], [0, 0]], dtype=complex)]
+            for qubit in qubits:
+                kraus = [_embed_matrix(mat, [qubit], num_qubits).dot(k)
+                         for mat in op_kraus for k in kraus]
+            continue
+        if name == 'unitary':
+            op_kraus = [op['params']]
+        elif name == 'kraus':
+            op_kraus = op['params']
+        else:
+            mat = standard_gate_unitary(name)
+            if mat is None:
+                raise NoiseError("Cannot approximate error instruction " +
+                                 "\"{}\".".format(name))
+            op_kraus = [mat]
+        op_kraus = [_embed_matrix(mat, qubits, num_qubits) for mat in op_kraus]
+        kraus = [mat.dot(k) for mat in op_kraus for k in kraus]
+    return kraus
+
+
+def _embed_matrix(mat, qubits, num_qubits):
+    """Return the matrix on num_qubits for a matrix acting on qubits."""
+    mat = np.array(mat, dtype=complex)
+    if mat.ndim == 1:
+        # Diagonal matrix
+        mat = np.diag(mat)
+    rest = [qubit for qubit in range(num_qubits) if qubit not in qubits]
+    # Qubits ordered by the bits of the matrix index of the full matrix
+    order = list(qubits) + rest
+    full = np.kron(np.eye(2 ** len(rest)), mat)
+    # Reorder the tensor axes which go from the highest to lowest bit
+    axes = [num_qubits - 1 - order.index(qubit)
+            for qubit in reversed(range(num_qubits))]
+    axes += [num_qubits + axis for axis in axes]
+    full = full.reshape(2 * num_qubits * [2]).transpose(axes)
+    return full.reshape(2 ** num_qubits, 2 ** num_qubits)
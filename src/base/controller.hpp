@@ -27,6 +27,7 @@
 #include "framework/rng.hpp"
 #include "framework/creg.hpp"
 #include "noise/noise_model.hpp"
+#include "noise/noise_model_cache.hpp"
 
 
 namespace AER {
@@ -44,6 +45,18 @@ std::string controller_execute(const std::string &qobj_str) {
   return controller.execute(json_t::parse(qobj_str)).dump(-1);
 }
 
+// Load a noise model JSON string into the noise model cache so that it
+// may be used by later executions with the "noise_model_handle" config.
+inline void noise_model_cache_insert(const std::string &handle,
+                                     const std::string &noise_model_str) {
+  Noise::NoiseModelCache::instance().insert(handle, noise_model_str);
+}
+
+// Return true if a noise model is stored in the cache for a handle.
+inline bool noise_model_cache_contains(const std::string &handle) {
+  return Noise::NoiseModelCache::instance().contains(handle);
+}
+
 namespace Base {
 
 //=========================================================================
@@ -74,6 +87,9 @@ namespace Base {
  * Config settings:
  * 
  * - "noise_model" (json): A noise model to use for simulation [Default: null]
+ * - "noise_model_handle" (str): The handle of a noise model previously
+ *      loaded into the noise model cache to use for simulation instead of
+ *      the "noise_model" JSON [Default: null]
  * - "max_parallel_threads" (int): Set the maximum OpenMP threads that may
  *      be used across all levels of parallelization. Set to 0 for maximum
  *      available. [Default : 0]
@@ -183,8 +199,13 @@ void Controller::set_config(const json_t &config) {
   config_ = config;
 
   // Load noise model
-  if (JSON::check_key("noise_model", config))
+  if (JSON::check_key("noise_model_handle", config)) {
+    std::string handle;
+    JSON::get_value(handle, "noise_model_handle", config);
+    noise_model_ = Noise::NoiseModelCache::instance().get(handle);
+  } else if (JSON::check_key("noise_model", config)) {
     noise_model_ = Noise::NoiseModel(config["noise_model"]);
+  }
 
   // Load OpenMP maximum thread settings
   JSON::get_value(max_threads_total_, "max_parallel_threads", config);
@@ -379,12 +400,9 @@ json_t Controller::execute_circuit(Circuit &circ) {
         for (int j = 0; j < num_threads_shot; j++) {
           data[j] = run_circuit(circ, subshots[j], circ.seed + j, num_threads_state);
         }
-      // Accumulate results across shots 
-      for (size_t j=1; j<data.size(); j++) {
-        data[0].combine(data[j]);
-      }
+      // Accumulate results across shots
       // Update output
-      result["data"] = data[0];
+      result["data"] = OutputData::combine(data, num_threads_shot);
     }
     // Report success
     result["success"] = true;
@@ -55,6 +55,7 @@ public:
   // - `OpType::barrier` if barrier is supported
   // - `OpType::matrix` if arbitrary unitary matrices are supported
   // - `OpType::kraus` if general Kraus noise channels are supported
+  // - `OpType::superop` if superoperator matrices are supported
   // For the case of gates the specific allowed gates are checked
   // with the `allowed_gates` function.
   virtual std::unordered_set<Operations::OpType> allowed_ops() const = 0;
@@ -105,10 +106,12 @@ public:
   // Sample n-measurement outcomes without applying the measure operation
   // to the system state. Even though this method is not marked as const
   // at the end of sample the system should be left in the same state 
-  // as before sampling
-  virtual std::vector<reg_t> sample_measure(const reg_t &qubits,
-                                            uint_t shots,
-                                            RngEngine &rng);
+  // as before sampling.
+  // Each outcome is returned bit-packed as an integer where bit j is the
+  // measurement outcome of qubits[j].
+  virtual std::vector<uint_t> sample_measure(const reg_t &qubits,
+                                             uint_t shots,
+                                             RngEngine &rng);
 
   //=======================================================================
   // Standard Methods
@@ -211,12 +214,12 @@ void State<state_t>::set_config(const json_t &config) {
 
 
 template <class state_t>
-std::vector<reg_t> State<state_t>::sample_measure(const reg_t &qubits,
-                                                  uint_t shots,
-                                                  RngEngine &rng) {
+std::vector<uint_t> State<state_t>::sample_measure(const reg_t &qubits,
+                                                   uint_t shots,
+                                                   RngEngine &rng) {
   (ignore_argument)qubits;
   (ignore_argument)shots;
-  return std::vector<reg_t>();
+  return std::vector<uint_t>();
 }
 
 
@@ -288,15 +291,10 @@ void State<state_t>::snapshot_creg_register(const Operations::Op &op,
 
 template <class state_t>
 void State<state_t>::add_creg_to_data(OutputData &data) const {
-  if (creg_.memory_size() > 0) {
-    std::string memory_hex = creg_.memory_hex();
-    data.add_memory_count(memory_hex);
-    data.add_memory_singleshot(memory_hex);
-  }
+  // Memory bits value
+  data.add_memory(creg_);
   // Register bits value
-  if (creg_.register_size() > 0) {
-    data.add_register_singleshot(creg_.register_hex());
-  }
+  data.add_register(creg_);
 }
 
 
@@ -8,6 +8,9 @@
 #ifndef _aer_framework_creg_hpp_
 #define _aer_framework_creg_hpp_
 
+#include <iomanip>
+#include <sstream>
+
 #include "framework/operations.hpp"
 #include "framework/utils.hpp"
 #include "framework/rng.hpp"
@@ -19,35 +22,49 @@ namespace AER {
 //============================================================================
 
 // ClassicalRegister class
+// The memory and register bits are stored bit-packed in 64-bit words with
+// bit j of the memory in bit (j % 64) of word (j / 64).
 class ClassicalRegister {
 
 public:
 
   // Return the current value of the memory as little-endian hex-string
-  inline std::string memory_hex() const {return Utils::bin2hex(creg_memory_);}
+  inline std::string memory_hex() const {return words2hex(creg_memory_, memory_size_);}
 
   // Return the current value of the memory as little-endian bit-string
-  inline std::string memory_bin() const {return "0b" + creg_memory_;}
+  inline std::string memory_bin() const {return "0b" + words2bin(creg_memory_, memory_size_);}
 
   // Return the current value of the memory as little-endian hex-string
-  inline std::string register_hex() const {return Utils::bin2hex(creg_register_);}
+  inline std::string register_hex() const {return words2hex(creg_register_, register_size_);}
 
   // Return the current value of the memory as little-endian bit-string
-  inline std::string register_bin() const {return "0b" + creg_register_;}
+  inline std::string register_bin() const {return "0b" + words2bin(creg_register_, register_size_);}
 
   // Return the size of the memory bits
-  size_t memory_size() const {return creg_memory_.size();}
+  size_t memory_size() const {return memory_size_;}
 
   // Return the size of the register bits
-  size_t register_size() const {return creg_register_.size();}
+  size_t register_size() const {return register_size_;}
+
+  // Return the value of the first 64 memory bits as an integer
+  inline uint_t memory_int() const {return (creg_memory_.empty()) ? 0 : creg_memory_[0];}
+
+  // Return the value of the first 64 register bits as an integer
+  inline uint_t register_int() const {return (creg_register_.empty()) ? 0 : creg_register_[0];}
+
+  // Return a reference to the bit-packed words of the memory
+  inline const reg_t& creg_memory() const {return creg_memory_;}
 
-  // Return a reference to the current value of the memory
-  // this is a bit-string without the "0b" prefix.
-  inline auto& creg_memory() {return creg_memory_;}
+  // Return a reference to the bit-packed words of the register
+  inline const reg_t& creg_register() const {return creg_register_;}
 
-  // Return a reference to the current value of the memory
-  // this is a bit-string without the "0b" prefix.
-  inline auto& creg_register() {return creg_register_;}
+  // Return the value of a single memory or register bit
+  inline uint_t memory_bit(uint_t pos) const {return get_bit(creg_memory_, pos);}
+  inline uint_t register_bit(uint_t pos) const {return get_bit(creg_register_, pos);}
+
+  // Set the value of a single memory or register bit
+  inline void set_memory_bit(uint_t pos, uint_t val) {set_bit(creg_memory_, pos, val);}
+  inline void set_register_bit(uint_t pos, uint_t val) {set_bit(creg_register_, pos, val);}
 
   // Initialize the memory and register bits to default values (all 0)
   void initialize(size_t num_memory, size_t num_registers);
@@ -63,7 +80,8 @@ public:
   // If the op is not a conditional op this will return true.
   bool check_conditional(const Operations::Op &op) const;
 
-  // Apply a boolean function Op
+  // Apply a boolean function Op and store the result in the register
+  // bit and optional memory bit of the op
   bool apply_bfunc(const Operations::Op &op);
 
   // Apply readout error instruction to classical registers
@@ -72,11 +90,39 @@ public:
   // Store a measurement outcome in the specified memory and register bit locations
   void store_measure(const reg_t &outcome, const reg_t &memory, const reg_t &registers);
 
+  //-----------------------------------------------------------------------
+  // Bit-packed word helpers
+  //-----------------------------------------------------------------------
+
+  // Convert a hex-string to bit-packed words truncated to num_bits
+  static reg_t hex2words(const std::string &hex, size_t num_bits);
+
+  // Convert bit-packed words to a hex-string. Returns an empty string
+  // if num_bits is 0
+  static std::string words2hex(const reg_t &words, size_t num_bits);
+
+  // Convert bit-packed words to a bit-string of length num_bits
+  static std::string words2bin(const reg_t &words, size_t num_bits);
+
 protected:
 
+  static inline uint_t get_bit(const reg_t &words, uint_t pos) {
+    return (words[pos >> 6] >> (pos & 63)) & 1ULL;
+  }
+
+  static inline void set_bit(reg_t &words, uint_t pos, uint_t val) {
+    const uint_t mask = 1ULL << (pos & 63);
+    if (val)
+      words[pos >> 6] |= mask;
+    else
+      words[pos >> 6] &= ~mask;
+  }
+
   // Classical registers
-  std::string creg_memory_;   // standard classical bit memory
-  std::string creg_register_; // optional classical bit register
+  reg_t creg_memory_;   // standard classical bit memory
+  reg_t creg_register_; // optional classical bit register
+  size_t memory_size_ = 0;
+  size_t register_size_ = 0;
 
   // Measurement config settings
   bool return_hex_strings_ = true;       // Set to false for bit-string output
@@ -88,8 +134,10 @@ protected:
 
 void ClassicalRegister::initialize(size_t num_memory, size_t num_register) {
   // Set registers to the all 0 bit state
-  creg_memory_ = std::string(num_memory, '0');
-  creg_register_ = std::string(num_register, '0');
+  memory_size_ = num_memory;
+  register_size_ = num_register;
+  creg_memory_.assign((num_memory + 63) / 64, 0ULL);
+  creg_register_.assign((num_register + 63) / 64, 0ULL);
 }
 
 
@@ -97,12 +145,10 @@ void ClassicalRegister::initialize(size_t num_memory,
                                    size_t num_register,
                                    const std::string &memory_hex,
                                    const std::string &register_hex) {
-  // Convert to bit-string for internal storage
-  std::string memory_bin = Utils::hex2bin(memory_hex, false);
-  creg_memory_ = std::move(Utils::padleft_inplace(memory_bin, '0', num_memory));
-
-  std::string register_bin = Utils::hex2bin(register_hex, false);
-  creg_register_ = std::move(Utils::padleft_inplace(memory_bin, '0', num_register));
+  memory_size_ = num_memory;
+  register_size_ = num_register;
+  creg_memory_ = hex2words(memory_hex, num_memory);
+  creg_register_ = hex2words(register_hex, num_register);
 }
 
 
@@ -113,16 +159,10 @@ void ClassicalRegister::store_measure(const reg_t &outcome,
   bool use_mem = !memory.empty();
   bool use_reg = !registers.empty();
   for (size_t j=0; j < outcome.size(); j++) {
-    if (use_mem) {
-      // least significant bit first ordering
-      const size_t pos = creg_memory_.size() - memory[j] - 1; 
-      creg_memory_[pos] = std::to_string(outcome[j])[0]; // int->string->char
-    }
-    if (use_reg) {
-      // least significant bit first ordering
-      const size_t pos = creg_register_.size() - registers[j] - 1; 
-      creg_register_[pos] = std::to_string(outcome[j])[0];  // int->string->char
-    }
+    if (use_mem)
+      set_bit(creg_memory_, memory[j], outcome[j]);
+    if (use_reg)
+      set_bit(creg_register_, registers[j], outcome[j]);
   }
 }
 
@@ -130,20 +170,21 @@ void ClassicalRegister::store_measure(const reg_t &outcome,
 bool ClassicalRegister::check_conditional(const Operations::Op &op) const {
   // Check if op is conditional
   if (op.conditional)
-    return (creg_register_[creg_register_.size() - op.conditional_reg - 1] == '1');
+    return get_bit(creg_register_, op.conditional_reg);
   
   // DEPRECIATED: old style conditional
+  // The mask and value are precompiled so that the memory bits selected
+  // by the mask must equal the value bits at the same positions
   if (op.old_conditional) {
-    std::string current;
-    auto mask = Utils::padleft(Utils::hex2bin(op.old_conditional_mask, false),
-                               '0', creg_memory_.size());
-    for (size_t pos=0; pos < mask.size(); pos++) {
-      if (mask[pos] == '1')
-        current.push_back(creg_memory_[pos]);
+    const auto &mask = op.old_conditional_mask_words;
+    const auto &val = op.old_conditional_val_words;
+    for (size_t w = 0; w < val.size(); w++) {
+      const uint_t mem = (w < creg_memory_.size() && w < mask.size())
+                         ? creg_memory_[w] & mask[w] : 0;
+      if (mem != val[w])
+        return false;
     }
-    auto val = Utils::padleft(Utils::hex2bin(op.old_conditional_val, false),
-                              '0', current.size());
-    return (val == current);
+    return true;
   }
 
   // Op is not conditional
@@ -158,48 +199,53 @@ bool ClassicalRegister::apply_bfunc(const Operations::Op &op) {
     throw std::invalid_argument("ClassicalRegister::apply_bfunc: Input is not a bfunc op.");
   }
 
-  const std::string &mask = op.string_params[0];
-  const std::string &target_val = op.string_params[1];
-  int_t compared; // if equal this should be 0, if less than -1, if greater than +1
-
-  // Check if register size fits into a 64-bit integer
-  if (creg_register_.size() <= 64) {
-    uint_t reg_int = std::stoull(creg_register_, nullptr, 2); // stored as bitstring
-    uint_t mask_int = std::stoull(mask, nullptr, 16); // stored as hexstring
-    uint_t target_int = std::stoull(target_val, nullptr, 16); // stored as hexstring
-    compared = (reg_int & mask_int) - target_int;
-  } else {
-    // We need to use big ints so we implement the bit-mask via the binary string
-    // representation rather than using a big integer class
-    std::string mask_bin = Utils::hex2bin(mask); // has 0b prefix while creg_registers_ doesn't
-    size_t length = std::min(mask_bin.size() - 2, creg_register_.size()); // -2 to remove 0b
-    std::string masked_val = std::string(length, '0');
-    for (size_t rev_pos = 0; rev_pos < length; rev_pos++) {
-      masked_val[length - 1 - rev_pos] = (mask_bin[mask_bin.size() - 1 - rev_pos] 
-                                          & creg_register_[creg_register_.size() - 1 - rev_pos]);
+  // Compare the masked register words to the target words starting from
+  // the most significant word. The mask and target words are precompiled
+  // when the op is parsed.
+  const reg_t &mask = op.bfunc_mask_words;
+  const reg_t &target = op.bfunc_val_words;
+  const size_t num_words = std::max(creg_register_.size(), target.size());
+  int_t compared = 0; // if equal this should be 0, if less than -1, if greater than +1
+  for (size_t w = num_words; w-- > 0;) {
+    const uint_t val = (w < creg_register_.size() && w < mask.size())
+                       ? creg_register_[w] & mask[w] : 0;
+    const uint_t tgt = (w < target.size()) ? target[w] : 0;
+    if (val != tgt) {
+      compared = (val < tgt) ? -1 : 1;
+      break;
     }
-    masked_val = Utils::bin2hex(masked_val); // convert to hex string
-    // Using string comparison to compare to target value
-    compared = masked_val.compare(target_val);
   }
   // check value of compared integer for different comparison operations
+  bool outcome;
   switch (op.bfunc) {
     case Operations::RegComparison::Equal:
-      return (compared == 0);
+      outcome = (compared == 0);
+      break;
     case Operations::RegComparison::NotEqual:
-      return (compared != 0);
+      outcome = (compared != 0);
+      break;
     case Operations::RegComparison::Less:
-      return (compared < 0);
+      outcome = (compared < 0);
+      break;
     case Operations::RegComparison::LessEqual:
-      return (compared <= 0);
+      outcome = (compared <= 0);
+      break;
     case Operations::RegComparison::Greater:
-      return (compared > 0);
+      outcome = (compared > 0);
+      break;
     case Operations::RegComparison::GreaterEqual:
-      return (compared >= 0);
+      outcome = (compared >= 0);
+      break;
     default:
       // we shouldn't ever get here
       throw std::invalid_argument("Invalid boolean function relation.");
   }
+  // Store the outcome
+  if (!op.registers.empty())
+    set_bit(creg_register_, op.registers[0], outcome);
+  if (!op.memory.empty())
+    set_bit(creg_memory_, op.memory[0], outcome);
+  return outcome;
 }
 
 // Apply readout error instruction to classical registers
@@ -210,27 +256,67 @@ void ClassicalRegister::apply_roerror(const Operations::Op &op, RngEngine &rng)
     throw std::invalid_argument("ClassicalRegister::apply_roerror Input is not a readout error op.");
   }
   
-  // Get current classical bit (and optionally register bit) values
-  std::string mem_str;
-  
-  // Get values of bits as binary string
-  // We iterate from the end of the list of memory bits
-  for (auto it = op.memory.rbegin(); it < op.memory.rend(); ++it) {
-    auto bit = *it;
-    mem_str.push_back(creg_memory_[creg_memory_.size() - 1 - bit]);
-  }
-  auto mem_val = std::stoull(mem_str, nullptr, 2);
-  auto outcome = rng.rand_int(op.probs[mem_val]);
-  auto noise_str = Utils::int2string(outcome, 2, op.memory.size());
-  for (size_t pos = 0; pos < op.memory.size(); ++pos) {
-    auto bit = op.memory[pos];
-    creg_memory_[creg_memory_.size() - 1 - bit] = noise_str[noise_str.size() - 1 - pos];
+  // Get current classical bit values as an integer
+  uint_t mem_val = 0;
+  for (size_t pos = 0; pos < op.memory.size(); ++pos)
+    mem_val |= get_bit(creg_memory_, op.memory[pos]) << pos;
+
+  // Sample the assigned outcome by inverting the cumulative distribution of
+  // the assignment probability row. Rows are short (2^n for n memory bits)
+  // so this avoids constructing a discrete_distribution for each sample.
+  const auto &probs = op.probs[mem_val];
+  double total = 0.;
+  for (const auto &p : probs)
+    total += p;
+  double r = rng.rand(0., total);
+  uint_t outcome = 0;
+  while (outcome + 1 < probs.size() && r >= probs[outcome]) {
+    r -= probs[outcome];
+    ++outcome;
   }
+  for (size_t pos = 0; pos < op.memory.size(); ++pos)
+    set_bit(creg_memory_, op.memory[pos], (outcome >> pos) & 1ULL);
   // and the same error to register classical bits if they are used
-  for (size_t pos = 0; pos < op.registers.size(); ++pos) {
-    auto bit = op.registers[pos];
-    creg_register_[creg_register_.size() - 1 - bit] = noise_str[noise_str.size() - 1 - pos];
+  for (size_t pos = 0; pos < op.registers.size(); ++pos)
+    set_bit(creg_register_, op.registers[pos], (outcome >> pos) & 1ULL);
+}
+
+//----------------------------------------------------------------------------
+// Bit-packed word helpers
+//----------------------------------------------------------------------------
+
+reg_t ClassicalRegister::hex2words(const std::string &hex, size_t num_bits) {
+  reg_t words = Utils::hex2words(hex);
+  words.resize((num_bits + 63) / 64, 0ULL);
+  // Truncate to num_bits
+  if (num_bits % 64)
+    words.back() &= (1ULL << (num_bits % 64)) - 1;
+  return words;
+}
+
+
+std::string ClassicalRegister::words2hex(const reg_t &words, size_t num_bits) {
+  if (num_bits == 0)
+    return std::string();
+  // Find the most significant non-zero word
+  size_t top = words.size() - 1;
+  while (top > 0 && words[top] == 0)
+    top--;
+  std::stringstream ss;
+  ss << "0x" << std::hex << words[top];
+  for (size_t w = top; w-- > 0;)
+    ss << std::setw(16) << std::setfill('0') << words[w];
+  return ss.str();
+}
+
+
+std::string ClassicalRegister::words2bin(const reg_t &words, size_t num_bits) {
+  std::string bin(num_bits, '0');
+  for (size_t pos = 0; pos < num_bits; pos++) {
+    if (get_bit(words, pos))
+      bin[num_bits - 1 - pos] = '1';
   }
+  return bin;
 }
 
 //------------------------------------------------------------------------------
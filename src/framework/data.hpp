@@ -11,6 +11,7 @@
 #include "framework/json.hpp"
 #include "framework/snapshot.hpp"
 #include "framework/utils.hpp"
+#include "framework/creg.hpp"
 
 namespace AER {
 
@@ -42,6 +43,14 @@ public:
   // Add a single register value to the register vector
   void add_register_singleshot(const std::string &reg);
 
+  // Add the memory value of a classical register to the counts map and
+  // memory vector. Memory of up to 64 bits is stored as an integer and
+  // only converted to a hex-string on serialization
+  void add_memory(const ClassicalRegister &creg);
+
+  // Add the register value of a classical register to the register vector
+  void add_register(const ClassicalRegister &creg);
+
   //----------------------------------------------------------------
   // Snapshots
   //----------------------------------------------------------------
@@ -55,8 +64,8 @@ public:
                                const T &datum);
 
   // Add a new datum to the snapshot of the specified type and label
-  // This will use the json conversion method `to_json` for
-  // data type T
+  // Complex values, real and complex vectors and real maps are averaged
+  // directly, other data types T are converted with `to_json`.
   // if variance is true the variance of the averaged sample will also
   // be computed
   template <typename T>
@@ -111,6 +120,12 @@ public:
   // Note this operator is not defined to be const on the input argument
   inline OutputData& operator+=(OutputData &eng) {return combine(eng);}
 
+  // Combine a vector of output data into the first element using a
+  // pairwise tree reduction with up to num_threads parallel threads.
+  // The combined data is in the same order as a serial combination.
+  // Other elements of the vector should no longer be used after combining.
+  static OutputData& combine(std::vector<OutputData> &data, int num_threads = 1);
+
 protected:
 
   //----------------------------------------------------------------
@@ -122,6 +137,11 @@ protected:
   std::vector<std::string> memory_;      // memory state for each shot as hex string
   std::vector<std::string> register_;   // register state for each shot as hex string
 
+  // Measure outcomes for memory and registers of up to 64 bits
+  std::unordered_map<uint_t, uint_t> int_counts_; // histogram of memory counts over shots
+  std::vector<uint_t> int_memory_;               // memory state for each shot
+  std::vector<uint_t> int_register_;             // register state for each shot
+
   // Snapshots
   stringmap_t<SingleShotSnapshot> singleshot_snapshots_;
   stringmap_t<AverageSnapshot> average_snapshots_;
@@ -172,6 +192,31 @@ void OutputData::add_register_singleshot(const std::string &reg) {
   }
 }
 
+void OutputData::add_memory(const ClassicalRegister &creg) {
+  if (creg.memory_size() == 0)
+    return;
+  if (creg.memory_size() > 64) {
+    const std::string memory = creg.memory_hex();
+    add_memory_count(memory);
+    add_memory_singleshot(memory);
+    return;
+  }
+  const uint_t memory = creg.memory_int();
+  if (return_counts_)
+    int_counts_[memory] += 1;
+  if (return_memory_)
+    int_memory_.push_back(memory);
+}
+
+void OutputData::add_register(const ClassicalRegister &creg) {
+  if (!return_register_ || creg.register_size() == 0)
+    return;
+  if (creg.register_size() > 64)
+    register_.push_back(creg.register_hex());
+  else
+    int_register_.push_back(creg.register_int());
+}
+
 
 template <typename T>
 void OutputData::add_singleshot_snapshot(const std::string &type,
@@ -190,9 +235,8 @@ void OutputData::add_average_snapshot(const std::string &type,
                                       const std::string &memory,
                                       const T &datum,
                                       bool variance) {
-  if (return_snapshots_) {   
-    json_t js = datum; // use implicit to_json conversion function for T
-    average_snapshots_[type].add_data(label, memory, js, variance);
+  if (return_snapshots_) {
+    average_snapshots_[type].add_data(label, memory, datum, variance);
   }
 }
 
@@ -242,6 +286,9 @@ void OutputData::clear() {
   counts_.clear();
   memory_.clear();
   register_.clear();
+  int_counts_.clear();
+  int_memory_.clear();
+  int_register_.clear();
   // Clear snapshots
   singleshot_snapshots_.clear();
   average_snapshots_.clear();
@@ -252,13 +299,22 @@ void OutputData::clear() {
 
 OutputData& OutputData::combine(OutputData &data) {
   // Combine measure
-  std::move(data.memory_.begin(), data.memory_.end(),
-            std::back_inserter(memory_));
-  std::move(data.register_.begin(), data.register_.end(),
-            std::back_inserter(register_));
+  Utils::move_append(memory_, data.memory_);
+  Utils::move_append(register_, data.register_);
+  Utils::move_append(int_memory_, data.int_memory_);
+  Utils::move_append(int_register_, data.int_register_);
   // Combine counts
-  for (auto pair : data.counts_) {
-    counts_[pair.first] += pair.second;
+  if (counts_.empty()) {
+    counts_.swap(data.counts_);
+  } else {
+    for (const auto &pair : data.counts_)
+      counts_[pair.first] += pair.second;
+  }
+  if (int_counts_.empty()) {
+    int_counts_.swap(data.int_counts_);
+  } else {
+    for (const auto &pair : data.int_counts_)
+      int_counts_[pair.first] += pair.second;
   }
   // Combine snapshots
   for (auto &pair : data.singleshot_snapshots_) {
@@ -281,6 +337,23 @@ OutputData& OutputData::combine(OutputData &data) {
 }
 
 
+OutputData& OutputData::combine(std::vector<OutputData> &data, int num_threads) {
+  const int_t size = data.size();
+  if (size == 0)
+    throw std::invalid_argument("OutputData::combine: cannot combine an empty vector.");
+  // At each level combine pairs (j, j + stride) into j
+  for (int_t stride = 1; stride < size; stride *= 2) {
+    const int_t pairs = (size - stride + 2 * stride - 1) / (2 * stride);
+    #pragma omp parallel for if (num_threads > 1 && pairs > 1) num_threads(num_threads)
+    for (int_t k = 0; k < pairs; k++) {
+      const int_t j = 2 * stride * k;
+      data[j].combine(data[j + stride]);
+    }
+  }
+  return data[0];
+}
+
+
 json_t OutputData::json() const {
 
   // Initialize output as additional data JSON
@@ -291,12 +364,27 @@ json_t OutputData::json() const {
   // "counts", "memory", "register", "snapshots"
 
   // Measure data
-  if (return_counts_ && counts_.empty() == false)
-    tmp["counts"] = counts_;
-  if (return_memory_ && memory_.empty() == false)
-    tmp["memory"] = memory_;
-  if (return_register_ && register_.empty() == false)
-    tmp["register"] = register_;
+  // Integer outcomes are converted to hex-strings here
+  if (return_counts_ && (counts_.empty() == false || int_counts_.empty() == false)) {
+    // Merge into the string counts since an outcome may have been added as
+    // both a string and an integer
+    std::map<std::string, uint_t> counts = counts_;
+    for (const auto &pair : int_counts_)
+      counts[Utils::int2hex(pair.first)] += pair.second;
+    tmp["counts"] = counts;
+  }
+  if (return_memory_ && (memory_.empty() == false || int_memory_.empty() == false)) {
+    std::vector<std::string> memory = memory_;
+    for (const auto &val : int_memory_)
+      memory.push_back(Utils::int2hex(val));
+    tmp["memory"] = memory;
+  }
+  if (return_register_ && (register_.empty() == false || int_register_.empty() == false)) {
+    std::vector<std::string> registers = register_;
+    for (const auto &val : int_register_)
+      registers.push_back(Utils::int2hex(val));
+    tmp["register"] = registers;
+  }
   // Average snapshot data
   if (return_snapshots_) {
     for (auto &pair : average_snapshots_) {
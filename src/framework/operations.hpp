@@ -28,7 +28,7 @@ enum class RegComparison {Equal, NotEqual, Less, LessEqual, Greater, GreaterEqua
 // Enum class for operation types
 enum class OpType {
   gate, measure, reset, bfunc, barrier, snapshot,
-  matrix, kraus, roerror, noise_switch
+  matrix, kraus, superop, roerror, noise_switch
 };
 
 //------------------------------------------------------------------------------
@@ -48,11 +48,15 @@ struct Op {
   bool conditional = false; // is gate conditional gate
   uint_t conditional_reg;   // (opt) the (single) register location to look up for conditional
   RegComparison bfunc;      // (opt) boolean function relation
+  reg_t bfunc_mask_words;   // (opt) bit-packed boolean function mask
+  reg_t bfunc_val_words;    // (opt) bit-packed boolean function value
 
   // DEPRECIATED: old style conditionals (will be removed when Terra supports new style)
   bool old_conditional = false;     // is gate old style conditional gate
   std::string old_conditional_mask; // hex string for conditional mask
   std::string old_conditional_val;  // hex string for conditional value
+  reg_t old_conditional_mask_words; // bit-packed conditional mask
+  reg_t old_conditional_val_words;  // bit-packed value at the mask bit positions
 
   // Measurement
   reg_t memory;             // (opt) register operation it acts on (measure)
@@ -60,6 +64,7 @@ struct Op {
 
   // Mat and Kraus
   std::vector<cmatrix_t> mats;
+  std::vector<cvector_t> vmats; // (opt) vectorized or diagonal Kraus matrices (kraus)
 
   // Readout error
   std::vector<rvector_t> probs;
@@ -100,6 +105,37 @@ inline void check_duplicate_qubits(const Op &op) {
                                 "\" instruction (\"qubits\" are not unique)");
 }
 
+//------------------------------------------------------------------------------
+// Conditionals
+//------------------------------------------------------------------------------
+
+// DEPRECIATED: old style conditionals
+// Convert the hex-string mask and value of an old style conditional into
+// bit-packed words. The value bits are moved to the positions of the set
+// mask bits, so that the conditional is true if (memory & mask) == val.
+// Value bits beyond the number of set mask bits can never match and are
+// stored in an extra word past the end of the mask.
+inline void compile_old_conditional(Op &op) {
+  const reg_t mask = Utils::hex2words(op.old_conditional_mask);
+  const reg_t val = Utils::hex2words(op.old_conditional_val);
+  reg_t deposited(mask.size(), 0ULL);
+  uint_t pos = 0;
+  for (size_t w = 0; w < mask.size(); w++) {
+    for (uint_t bits = mask[w]; bits != 0; bits &= bits - 1, pos++) {
+      if ((pos >> 6) < val.size() && ((val[pos >> 6] >> (pos & 63)) & 1ULL))
+        deposited[w] |= bits & (~bits + 1); // lowest set bit
+    }
+  }
+  for (; pos < 64 * val.size(); pos++) {
+    if ((val[pos >> 6] >> (pos & 63)) & 1ULL) {
+      deposited.push_back(1ULL);
+      break;
+    }
+  }
+  op.old_conditional_mask_words = mask;
+  op.old_conditional_val_words = deposited;
+}
+
 //------------------------------------------------------------------------------
 // Generator functions
 //------------------------------------------------------------------------------
@@ -159,6 +195,17 @@ inline Op make_kraus(const reg_t &qubits, const std::vector<cmatrix_t> &mats) {
   op.name = "kraus";
   op.qubits = qubits;
   op.mats = mats;
+  for (const auto &mat : mats)
+    op.vmats.push_back(Utils::vectorize_matrix(mat));
+  return op;
+}
+
+inline Op make_superop(const reg_t &qubits, const cmatrix_t &mat) {
+  Op op;
+  op.type = OpType::superop;
+  op.name = "superop";
+  op.qubits = qubits;
+  op.mats = {mat};
   return op;
 }
 
@@ -262,6 +309,7 @@ Op json_to_op_gate(const json_t &js) {
       JSON::get_value(op.old_conditional_mask, "mask", js["conditional"]);
       JSON::get_value(op.old_conditional_val, "val", js["conditional"]);
       op.old_conditional = true;
+      compile_old_conditional(op);
     }
   }
 
@@ -335,6 +383,10 @@ Op json_to_op_bfunc(const json_t &js) {
   // Format hex strings
   Utils::format_hex_inplace(op.string_params[0]);
   Utils::format_hex_inplace(op.string_params[1]);
+  // Precompile the bit-packed mask and value so that they are not parsed
+  // each time the function is evaluated
+  op.bfunc_mask_words = Utils::hex2words(op.string_params[0]);
+  op.bfunc_val_words = Utils::hex2words(op.string_params[1]);
 
   const stringmap_t<RegComparison> comp_table({
     {"==", RegComparison::Equal},
@@ -405,6 +457,8 @@ Op json_to_op_kraus(const json_t &js) {
   op.name = "kraus";
   JSON::get_value(op.qubits, "qubits", js);
   JSON::get_value(op.mats, "params", js);
+  for (const auto &mat : op.mats)
+    op.vmats.push_back(Utils::vectorize_matrix(mat));
 
   // Validation
   check_empty_qubits(op);
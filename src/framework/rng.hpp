@@ -8,6 +8,7 @@
 #ifndef _aer_framework_rng_hpp_
 #define _aer_framework_rng_hpp_
 
+#include <algorithm>
 #include <cstdint>
 #include <random>
 
@@ -94,6 +95,44 @@ private:
   std::mt19937 rng; // Mersenne twister rng engine
 };
 
+/***************************************************************************/ /**
+  *
+  * AliasTable Class
+  *
+  * Walker alias table for repeatedly sampling integers from a fixed discrete
+  * distribution. The table is constructed once in O(n) from a vector of
+  * probabilities, and each sample then costs a single uniform random draw
+  * rather than constructing a new discrete_distribution.
+  *
+  ******************************************************************************/
+
+class AliasTable {
+public:
+  AliasTable() = default;
+
+  /**
+   * Construct an alias table for integers [0,..,n-1] from a vector of
+   * probabilities of length n. If the vector is not normalized it will
+   * be rescaled.
+   * @param probs the vector of probabilities
+   */
+  explicit AliasTable(const std::vector<double> &probs);
+
+  /**
+   * Generate a pseudo random integer from the distribution of the table
+   * @param rng the RngEngine to draw the random number from
+   * @return the generated integer
+   */
+  uint_t sample(RngEngine &rng) const;
+
+  // Return the number of outcomes of the distribution
+  inline uint_t size() const {return prob_.size();}
+
+private:
+  std::vector<double> prob_;  // probability of keeping each column
+  std::vector<uint_t> alias_; // alias outcome for each column
+};
+
 /*******************************************************************************
  *
  * RngEngine Methods
@@ -122,6 +161,63 @@ uint_t RngEngine::rand_int(const std::vector<double> &probs) {
   return n;
 }
 
+/*******************************************************************************
+ *
+ * AliasTable Methods
+ *
+ ******************************************************************************/
+
+AliasTable::AliasTable(const std::vector<double> &probs) {
+  const uint_t n = probs.size();
+  prob_.assign(n, 1.);
+  alias_.resize(n);
+  for (uint_t j = 0; j < n; j++)
+    alias_[j] = j;
+  double total = 0.;
+  for (const auto &p : probs)
+    total += p;
+  if (n == 0 || !(total > 0.))
+    return;
+
+  // Scale probabilities so that the average column has weight 1 and split
+  // the columns into those below and above average
+  std::vector<double> scaled(n);
+  std::vector<uint_t> small, large;
+  for (uint_t j = 0; j < n; j++) {
+    scaled[j] = probs[j] * n / total;
+    if (scaled[j] < 1.)
+      small.push_back(j);
+    else
+      large.push_back(j);
+  }
+  // Fill each small column with the remainder of a large column
+  while (!small.empty() && !large.empty()) {
+    const uint_t s = small.back();
+    small.pop_back();
+    const uint_t l = large.back();
+    prob_[s] = scaled[s];
+    alias_[s] = l;
+    scaled[l] -= (1. - scaled[s]);
+    if (scaled[l] < 1.) {
+      large.pop_back();
+      small.push_back(l);
+    }
+  }
+  // Remaining columns are full up to rounding error
+  for (const auto &j : large)
+    prob_[j] = 1.;
+  for (const auto &j : small)
+    prob_[j] = 1.;
+}
+
+uint_t AliasTable::sample(RngEngine &rng) const {
+  // A single uniform draw selects both the column and whether to keep
+  // the column outcome or its alias
+  const double r = rng.rand(0, prob_.size());
+  const uint_t col = std::min<uint_t>(static_cast<uint_t>(r), prob_.size() - 1);
+  return (r - col < prob_[col]) ? col : alias_[col];
+}
+
 //------------------------------------------------------------------------------
 } // End namespace QISKIT
 #endif
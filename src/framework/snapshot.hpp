@@ -9,6 +9,8 @@
 #define _aer_framework_snapshot_hpp_
 
 #include "framework/types.hpp"
+#include "framework/json.hpp"
+#include "framework/utils.hpp"
 
 namespace AER {
 
@@ -58,26 +60,41 @@ private:
 // AverageData class for storage of averaged quantities
 //------------------------------------------------------------------------------
 
-// Data class for storing snapshots that are averaged over each shot
-// 'accum' stores the data type as an accumualted sum of each recorded shots data type
-// 'count' keeps track of how many datum have been accumulated to return the average.
-// the 'average' function returns the average of the data as accum / counts.
+// Data class for storing snapshots that are averaged over each shot.
+// Complex scalars, real and complex vectors, and sparse real maps are
+// accumulated in typed storage as a running mean and sum of squared
+// deviations (Welford's algorithm) and only converted to JSON on output.
+// Other types are converted to JSON and accumulated as JSON sums of the
+// data and squared data.
+// For complex data the mean and variance are computed separately for the
+// real and imaginary parts.
 class AverageData {
 public:
 
-  // Return the mean of the accumulated data:
-  // mean = accum / count
-  inline json_t mean() const {return (count_ > 1) ? divide_helper(accum_, count_)
-                                                  : accum_;}
+  // Return the mean of the accumulated data
+  json_t mean() const;
 
   // Return the unbiased sample variance of the accumulated data:
-  // var = (1 / (n - 1)) * (sum_i (data[i]^2 / n) - mean^2) for n > 1
+  // var = (1 / (n - 1)) * sum_i (data[i] - mean)^2 for n > 1
+  // If variance was not recorded for all data this returns null
   json_t variance() const;
 
-  // Add another datum by adding to accum and incrementing count by 1.
-  // If variance is set to true the square of the datum will also be accumulated
-  // and can be used to compute the sample variance.
-  void add(json_t &datum, bool variance = false);
+  // Add another datum to the accumulated data.
+  // If variance is set to true the variance of the data will also be
+  // computed.
+  void add(const complex_t &datum, bool variance = false);
+  void add(const rvector_t &datum, bool variance = false);
+  void add(const cvector_t &datum, bool variance = false);
+  void add(const std::map<std::string, double> &datum, bool variance = false);
+  void add(const json_t &datum, bool variance = false);
+
+  // Add another datum of a type without typed accumulator by converting
+  // it to JSON using the `to_json` function for the type
+  template <typename T>
+  void add(const T &datum, bool variance = false) {
+    json_t js = datum;
+    add(js, variance);
+  }
 
   // Combine with another AverageData class by combining accum and count members
   // This clears the values of the combined rhs argument
@@ -85,14 +102,41 @@ public:
 
 protected:
 
+  // Type of the accumulated data
+  enum class DataType {
+    empty, complex_value, real_vector, complex_vector, real_map, json
+  };
+
+  DataType type_ = DataType::empty;
+  uint_t count_ = 0; // stores number of datum that have been accumulatede
+  bool variance_ = true; // true if variance was requested for all data
+
+  // Typed data is stored as a flat vector of real values
+  // complex values are stored as (real, imag) pairs
+  rvector_t mean_; // running mean of the data
+  rvector_t m2_;   // running sum of squared deviations from the mean
+
+  // Keys for the real map data type, in order of position in mean_
+  std::vector<std::string> keys_;
+  stringmap_t<size_t> key_index_;
+
+  // JSON data
   json_t accum_; // stores the accumulated data for multiple datum
   json_t accum_squared_; // store the square of accumulated data for computing sample variance.
-  uint_t count_ = 0; // stores number of datum that have been accumulatede
+
+  // Check the type of new data and set the type of empty data
+  void check_type(DataType type);
+
+  // Add a flattened real datum to the running mean and squared deviations
+  void add_values(const double *vals, size_t size, bool variance);
+
+  // Convert a flat real vector to JSON for the current data type
+  json_t values_to_json(const rvector_t &vals) const;
 
   // Recursively adds the rhs JSON to the lhs JSON.
   // if subtract is false: lhs = lhs + rhs
   // if subtract is true: lhs = lhs - rhs
-  static void accum_helper(json_t &lhs, json_t &rhs, bool subtract = false);
+  static void accum_helper(json_t &lhs, const json_t &rhs, bool subtract = false);
   
   // Recursively squares a json object
   static json_t square_helper(const json_t &data);
@@ -114,13 +158,12 @@ class AverageSnapshot {
 public:
 
   // Add a new datum to the snapshot at the specified key
-  // This uses the `to_json` function for convertion
+  // See AverageData::add for the supported types
   template <typename T>
   inline void add_data(const std::string &key,
                        const std::string &memory,
-                       T &datum,
+                       const T &datum,
                        bool variance = false) {
-    json_t tmp = datum;
     data_[key][memory].add(datum, variance);
   }
 
@@ -154,13 +197,12 @@ protected:
 //------------------------------------------------------------------------------
 
 void SingleShotSnapshot::combine(SingleShotSnapshot &snapshot) {
-  for (auto &data : snapshot.data_) {
-    auto &slot = data_[data.first];
-    auto &new_data = data.second;
-    slot.insert(slot.end(), std::make_move_iterator(new_data.begin()), 
-                            std::make_move_iterator(new_data.end()));
-    new_data.clear();
+  if (data_.empty()) {
+    data_.swap(snapshot.data_);
+    return;
   }
+  for (auto &data : snapshot.data_)
+    Utils::move_append(data_[data.first], data.second);
   snapshot.clear(); // clear added snapshot
 }
 
@@ -179,9 +221,18 @@ json_t SingleShotSnapshot::json() const {
 //------------------------------------------------------------------------------
 
 void AverageSnapshot::combine(AverageSnapshot &snapshot) {
+  if (data_.empty()) {
+    data_.swap(snapshot.data_);
+    return;
+  }
   for (auto &data : snapshot.data_) {
+    auto &slot = data_[data.first];
+    if (slot.empty()) {
+      slot.swap(data.second);
+      continue;
+    }
     for (auto &ave_data : data.second) {
-      data_[data.first][ave_data.first].combine(ave_data.second);
+      slot[ave_data.first].combine(ave_data.second);
     }
   }
   snapshot.clear(); // clear added snapshot
@@ -216,8 +267,71 @@ json_t AverageSnapshot::json() const {
 //------------------------------------------------------------------------------
 
 
-void AverageData::add(json_t &datum, bool variance) {
+void AverageData::check_type(DataType type) {
+  if (type_ == DataType::empty)
+    type_ = type;
+  else if (type_ != type)
+    throw std::invalid_argument("AverageData: cannot accumulate data of different types.");
+}
+
+
+void AverageData::add_values(const double *vals, size_t size, bool variance) {
+  count_ += 1;
+  variance_ &= variance;
+  if (mean_.size() < size) {
+    mean_.resize(size, 0.);
+    m2_.resize(size, 0.);
+  }
+  const double n = count_;
+  for (size_t j = 0; j < mean_.size(); j++) {
+    const double val = (j < size) ? vals[j] : 0.;
+    const double delta = val - mean_[j];
+    mean_[j] += delta / n;
+    m2_[j] += delta * (val - mean_[j]);
+  }
+}
+
+
+void AverageData::add(const complex_t &datum, bool variance) {
+  check_type(DataType::complex_value);
+  add_values(reinterpret_cast<const double*>(&datum), 2, variance);
+}
+
+
+void AverageData::add(const rvector_t &datum, bool variance) {
+  check_type(DataType::real_vector);
+  add_values(datum.data(), datum.size(), variance);
+}
+
+
+void AverageData::add(const cvector_t &datum, bool variance) {
+  check_type(DataType::complex_vector);
+  add_values(reinterpret_cast<const double*>(datum.data()), 2 * datum.size(), variance);
+}
+
+
+void AverageData::add(const std::map<std::string, double> &datum, bool variance) {
+  check_type(DataType::real_map);
+  // Keys not in the datum have value 0
+  rvector_t vals(keys_.size(), 0.);
+  for (const auto &pair : datum) {
+    auto it = key_index_.find(pair.first);
+    if (it == key_index_.end()) {
+      key_index_[pair.first] = keys_.size();
+      keys_.push_back(pair.first);
+      vals.push_back(pair.second);
+    } else {
+      vals[it->second] = pair.second;
+    }
+  }
+  add_values(vals.data(), vals.size(), variance);
+}
+
+
+void AverageData::add(const json_t &datum, bool variance) {
+  check_type(DataType::json);
   count_ += 1;
+  variance_ &= variance;
   accum_helper(accum_, datum);
   if (variance) {
     json_t squared = square_helper(datum);
@@ -227,28 +341,102 @@ void AverageData::add(json_t &datum, bool variance) {
 
 
 void AverageData::combine(AverageData &rhs) {
-  accum_helper(accum_, rhs.accum_);
-  accum_helper(accum_squared_, rhs.accum_squared_);
-  count_ += rhs.count_;
+  if (count_ == 0) {
+    *this = std::move(rhs);
+    rhs = AverageData();
+    return;
+  }
+  if (rhs.count_ > 0) {
+    check_type(rhs.type_);
+    if (type_ == DataType::json) {
+      accum_helper(accum_, rhs.accum_);
+      accum_helper(accum_squared_, rhs.accum_squared_);
+    } else {
+      // Map rhs keys onto the keys of this data
+      rvector_t rhs_mean = rhs.mean_, rhs_m2 = rhs.m2_;
+      if (type_ == DataType::real_map) {
+        rhs_mean.assign(keys_.size(), 0.);
+        rhs_m2.assign(keys_.size(), 0.);
+        for (size_t j = 0; j < rhs.keys_.size(); j++) {
+          auto it = key_index_.find(rhs.keys_[j]);
+          if (it == key_index_.end()) {
+            key_index_[rhs.keys_[j]] = keys_.size();
+            keys_.push_back(rhs.keys_[j]);
+            rhs_mean.push_back(rhs.mean_[j]);
+            rhs_m2.push_back(rhs.m2_[j]);
+          } else {
+            rhs_mean[it->second] = rhs.mean_[j];
+            rhs_m2[it->second] = rhs.m2_[j];
+          }
+        }
+      }
+      const size_t size = std::max(mean_.size(), rhs_mean.size());
+      mean_.resize(size, 0.);
+      m2_.resize(size, 0.);
+      rhs_mean.resize(size, 0.);
+      rhs_m2.resize(size, 0.);
+      // Parallel combination of means and squared deviations
+      const double n_a = count_, n_b = rhs.count_, n = n_a + n_b;
+      for (size_t j = 0; j < size; j++) {
+        const double delta = rhs_mean[j] - mean_[j];
+        mean_[j] += delta * n_b / n;
+        m2_[j] += rhs_m2[j] + delta * delta * n_a * n_b / n;
+      }
+    }
+    count_ += rhs.count_;
+    variance_ &= rhs.variance_;
+  }
   // zero rhs data
-  rhs.accum_ = json_t();
-  rhs.accum_squared_ = json_t();
-  rhs.count_ = 0;
+  rhs = AverageData();
+}
+
+
+json_t AverageData::values_to_json(const rvector_t &vals) const {
+  switch (type_) {
+    case DataType::complex_value:
+      return complex_t(vals[0], vals[1]);
+    case DataType::real_vector:
+      return vals;
+    case DataType::complex_vector: {
+      cvector_t cvals(vals.size() / 2);
+      for (size_t j = 0; j < cvals.size(); j++)
+        cvals[j] = complex_t(vals[2 * j], vals[2 * j + 1]);
+      return cvals;
+    }
+    case DataType::real_map: {
+      json_t js = json_t::object();
+      for (size_t j = 0; j < keys_.size(); j++)
+        js[keys_[j]] = vals[j];
+      return js;
+    }
+    default:
+      return json_t();
+  }
+}
+
+
+json_t AverageData::mean() const {
+  if (type_ == DataType::json)
+    return (count_ > 1) ? divide_helper(accum_, count_) : accum_;
+  return values_to_json(mean_);
 }
 
 
 json_t AverageData::variance() const {
-  if (count_ == 0 || count_ == 1 ||
-      accum_squared_.size() != accum_.size())
+  if (count_ < 2 || variance_ == false)
     return nullptr;
 
-  json_t mean_squared = square_helper(mean());
-  json_t result = divide_helper(accum_squared_, count_); // Squared mean
-  // subtract mean_squared from squared_mean / counts
-  accum_helper(result, mean_squared, true);
-  // Apply sample bias correction of 1 / (counts - 1)
-  return (count_ > 1) ? divide_helper(result, count_ - 1.0)
-                      : result;
+  if (type_ == DataType::json) {
+    // var = (n / (n - 1)) * (sum_i (data[i]^2 / n) - mean^2)
+    json_t mean_squared = square_helper(mean());
+    json_t result = divide_helper(accum_squared_, count_); // Squared mean
+    accum_helper(result, mean_squared, true);
+    return divide_helper(result, (count_ - 1.0) / count_);
+  }
+  rvector_t var(m2_.size());
+  for (size_t j = 0; j < m2_.size(); j++)
+    var[j] = m2_[j] / (count_ - 1.0);
+  return values_to_json(var);
 }
 
 
@@ -289,7 +477,7 @@ json_t AverageData::divide_helper(const json_t &data, double val) {
 }
 
 
-void AverageData::accum_helper(json_t &lhs, json_t &rhs, bool subtract) {
+void AverageData::accum_helper(json_t &lhs, const json_t &rhs, bool subtract) {
   if (lhs.is_null()) {
     lhs = rhs;
   } else if (lhs.is_number() && rhs.is_number()) {
@@ -189,6 +189,11 @@ std::vector<T> chop(const std::vector<T> &vec, double epsilon);
 template <class T>
 void combine(std::vector<T> &lhs, const std::vector<T> &rhs);
 
+// Append the elements of rhs to the end of lhs using move semantics.
+// If lhs is empty the vectors are swapped. rhs is empty afterwards.
+template <class T>
+void move_append(std::vector<T> &lhs, std::vector<T> &rhs);
+
 
 // Convert a dense vector into sparse ket form.
 // epsilon determins the threshold for which small values will be removed from
@@ -224,6 +229,10 @@ std::string bin2hex(const std::string bin, bool prefix = true);
 // if prefix is true "0b" will prepend the output string
 std::string hex2bin(const std::string bs, bool prefix = true);
 
+// Convert a hex-string to bit-packed 64-bit words with the least
+// significant word first
+reg_t hex2words(const std::string &hex);
+
 // Convert 64-bit unsigned integers to dit-string (dit base = 2 to 10)
 std::string int2string(uint_t n, uint_t base = 2);
 std::string int2string(uint_t n, uint_t base, uint_t length);
@@ -233,7 +242,11 @@ inline std::string int2bin(uint_t n) {return int2string(n, 2);}
 inline std::string int2bin(uint_t n, uint_t length) {return int2string(n, 2, length);}
 
 // Convert integers to hex-strings
-inline std::string int2hex(uint_t n) {return bin2hex(int2bin(n));}
+inline std::string int2hex(uint_t n) {
+  std::stringstream ss;
+  ss << "0x" << std::hex << n;
+  return ss.str();
+}
 
 //==============================================================================
 // Implementations: Static Matrices
@@ -761,6 +774,18 @@ void combine(std::vector<T> &lhs, const std::vector<T> &rhs) {
 }
 
 
+template <class T>
+void move_append(std::vector<T> &lhs, std::vector<T> &rhs) {
+  if (lhs.empty()) {
+    lhs.swap(rhs);
+  } else {
+    lhs.insert(lhs.end(), std::make_move_iterator(rhs.begin()),
+                          std::make_move_iterator(rhs.end()));
+  }
+  rhs.clear();
+}
+
+
 template <typename T>
 std::map<std::string, T> vec2ket(const std::vector<T> &vec, double epsilon, uint_t base) {
 
@@ -902,6 +927,22 @@ std::string hex2bin(std::string str, bool prefix) {
 }
 
 
+reg_t hex2words(const std::string &hex) {
+  // Skip 0x prefix
+  const size_t start = (hex.size() > 1 && (hex[1] == 'x' || hex[1] == 'X')) ? 2 : 0;
+  reg_t words;
+  words.reserve((hex.size() - start + 15) / 16);
+  // Process 16 hex digits (64 bits) at a time from the end of the string
+  size_t end = hex.size();
+  while (end > start) {
+    const size_t begin = (end - start > 16) ? end - 16 : start;
+    words.push_back(std::stoull(hex.substr(begin, end - begin), nullptr, 16));
+    end = begin;
+  }
+  return words;
+}
+
+
 std::string bin2hex(std::string str, bool prefix) {
   // empty case
   if (str.empty())
@@ -39,6 +39,33 @@ public:
 
   using NoiseOps = std::vector<Operations::Op>;
 
+  // A noise term resolved for a single operation of a circuit.
+  // Quantum error terms store the position of the error in the error vector
+  // and the qubits it acts on, and are sampled each shot. Readout error terms
+  // do not depend on the RNG so their noise ops are stored directly.
+  struct NoiseTerm {
+    bool readout = false;   // true for readout errors
+    bool after = true;      // apply the sampled error after the op
+    size_t error_pos = 0;   // position in the quantum error vector
+    reg_t qubits;           // qubits for the quantum error
+    NoiseOps ops;           // noise ops for readout errors
+  };
+
+  // An ideal operation along with its resolved noise terms in the order
+  // they are to be sampled
+  struct NoiseOp {
+    Operations::Op op;
+    std::vector<NoiseTerm> terms;
+  };
+
+  // A circuit with the noise model lookups resolved for each operation.
+  // This is computed once per circuit so that sampling a noisy realization
+  // for each shot only requires walking the ops and drawing random numbers.
+  struct CompiledCircuit {
+    Circuit circuit;  // input circuit without its ops
+    std::vector<NoiseOp> ops;
+  };
+
   NoiseModel() = default;
   NoiseModel(const json_t &js) {load_from_json(js);}
 
@@ -47,6 +74,25 @@ public:
   // can be done in a thread-safe manner
   Circuit sample_noise(const Circuit &circ, RngEngine &rng) const;
 
+  // Resolve the noise model lookup tables for each op in a circuit
+  CompiledCircuit compile_circuit(const Circuit &circ) const;
+
+  // Sample a noisy implementation of a compiled circuit
+  Circuit sample_noise(const CompiledCircuit &circ, RngEngine &rng) const;
+
+  // Return a circuit where each quantum error is replaced by a superop
+  // op for its average channel. The function superop(ops, num_qubits)
+  // must return the superoperator matrix of a single error circuit, and the
+  // averaged matrix is computed once for each error in the noise model.
+  // Readout errors are inserted as roerror ops as for sample_noise.
+  template <typename Lambda>
+  Circuit channel_circuit(const Circuit &circ, Lambda &&superop) const;
+
+  // Return a circuit containing every op that may be in a sampled noisy
+  // implementation of the input circuit. This can be used to check that
+  // a State supports all noise realizations of the circuit.
+  Circuit noise_ops_circuit(const Circuit &circ) const;
+
   // Load a noise model from JSON
   void load_from_json(const json_t &js);
 
@@ -55,16 +101,21 @@ public:
                          const stringset_t &op_labels,
                          const std::vector<reg_t> &op_qubits = {},
                          const std::vector<reg_t> &noise_qubits = {});
-  
+
   // Add a ReadoutError to the noise model
   void add_readout_error(const ReadoutError &error,
                          const std::vector<reg_t> &op_qubits = {});
-  
+
   // Return true if the noise model is ideal
   inline bool ideal() const {
     return !(local_quantum_errors_ || nonlocal_quantum_errors_) && readout_errors_.empty();
   }
 
+  // Return true if the noise model contains quantum errors
+  inline bool has_quantum_errors() const {
+    return local_quantum_errors_ || nonlocal_quantum_errors_;
+  }
+
   // Set which single qubit gates should use the X90 waltz error model
   inline void set_x90_gates(const stringset_t &x90_gates) {
     x90_gates_ = x90_gates;
@@ -78,36 +129,35 @@ public:
 
 private:
 
-  // Sample noise for the current operation
-  NoiseOps sample_noise(const Operations::Op &op, RngEngine &rng) const;
-
-  // Sample noise for the current operation
-  void sample_readout_noise(const Operations::Op &op,
-                            NoiseOps &noise_after,
-                            RngEngine &rng)  const;
-
-  void sample_local_quantum_noise(const Operations::Op &op,
-                                  NoiseOps &noise_before,
-                                  NoiseOps &noise_after,
-                                  RngEngine &rng)  const;
-
-  void sample_nonlocal_quantum_noise(const Operations::Op &op,
-                                     NoiseOps &noise_before,
-                                     NoiseOps &noise_after,
-                                     RngEngine &rng)  const;
-
-  // Sample noise for the current operation
-  NoiseOps sample_noise_helper(const Operations::Op &op,
-                               RngEngine &rng) const;
-
-  // Sample a noisy implementation of a two-X90 pulse u3 gate
-  NoiseOps sample_noise_x90_u3(uint_t qubit, complex_t theta,
-                               complex_t phi, complex_t lamba,
-                               RngEngine &rng) const;
-  
-  // Sample a noisy implementation of a single-X90 pulse u2 gate
-  NoiseOps sample_noise_x90_u2(uint_t qubit, complex_t phi, complex_t lambda,
-                               RngEngine &rng) const;
+  // Compile the noise terms for the current operation
+  void compile_op(const Operations::Op &op,
+                  std::vector<NoiseOp> &noise_ops) const;
+
+  // Compile the noise terms for the current operation
+  NoiseOp compile_op_helper(const Operations::Op &op) const;
+
+  void compile_readout_noise(const Operations::Op &op,
+                             std::vector<NoiseTerm> &terms) const;
+
+  void compile_local_quantum_noise(const Operations::Op &op,
+                                   std::vector<NoiseTerm> &terms) const;
+
+  void compile_nonlocal_quantum_noise(const Operations::Op &op,
+                                      std::vector<NoiseTerm> &terms) const;
+
+  // Compile a noisy implementation of a two-X90 pulse u3 gate
+  void compile_x90_u3(uint_t qubit, complex_t theta,
+                      complex_t phi, complex_t lamba,
+                      std::vector<NoiseOp> &noise_ops) const;
+
+  // Compile a noisy implementation of a single-X90 pulse u2 gate
+  void compile_x90_u2(uint_t qubit, complex_t phi, complex_t lambda,
+                      std::vector<NoiseOp> &noise_ops) const;
+
+  // Sample the noise terms of a compiled op and add the noisy
+  // implementation of the op to a list of ops
+  void sample_noise(const NoiseOp &noise_op, NoiseOps &ops,
+                    RngEngine &rng) const;
 
   // Add a local quantum error to the noise model for specific qubits
   void add_local_quantum_error(const QuantumError &error,
@@ -163,31 +213,182 @@ private:
 // Noise Model class
 //=========================================================================
 
-NoiseModel::NoiseOps NoiseModel::sample_noise(const Operations::Op &op,
-                                              RngEngine &rng) const {
+Circuit NoiseModel::sample_noise(const Circuit &circ, RngEngine &rng) const {
+  return sample_noise(compile_circuit(circ), rng);
+}
+
+
+NoiseModel::CompiledCircuit
+NoiseModel::compile_circuit(const Circuit &circ) const {
+  bool noise_active = true; // set noise active to on-state
+  CompiledCircuit compiled;
+  compiled.circuit = circ; // copy input circuit
+  compiled.circuit.ops.clear(); // delete ops
+  compiled.circuit.measure_sampling_flag = false; // disable measurement opt flag
+  compiled.ops.reserve(circ.ops.size());
+  // Resolve the noise terms for each op of the circuit
+  for (const auto &op: circ.ops) {
+    switch (op.type) {
+      // Operations that cannot have noise
+      case Operations::OpType::barrier:
+      case Operations::OpType::snapshot:
+      case Operations::OpType::kraus:
+      case Operations::OpType::superop:
+      case Operations::OpType::roerror:
+      case Operations::OpType::bfunc:
+        compiled.ops.push_back({op, {}});
+        break;
+      // Switch noise on or off during current circuit sample
+      case Operations::OpType::noise_switch:
+        noise_active = static_cast<int>(std::real(op.params[0]));
+        break;
+      default:
+        if (noise_active) {
+          compile_op(op, compiled.ops);
+        }
+        break;
+    }
+  }
+  return compiled;
+}
+
+
+Circuit NoiseModel::sample_noise(const CompiledCircuit &circ,
+                                 RngEngine &rng) const {
+  Circuit noisy_circ = circ.circuit; // copy circuit without ops
+  noisy_circ.ops.reserve(2 * circ.ops.size()); // just to be safe?
+  // Sample a noisy realization of the circuit
+  for (const auto &noise_op : circ.ops) {
+    sample_noise(noise_op, noisy_circ.ops, rng);
+  }
+  return noisy_circ;
+}
+
+
+template <typename Lambda>
+Circuit NoiseModel::channel_circuit(const Circuit &circ,
+                                    Lambda &&superop) const {
+  const auto compiled = compile_circuit(circ);
+  Circuit channel_circ = compiled.circuit; // copy circuit without ops
+  channel_circ.ops.reserve(2 * compiled.ops.size());
+  // Averaged superoperators indexed by position in the quantum error vector
+  std::unordered_map<size_t, cmatrix_t> superops;
+  for (const auto &noise_op : compiled.ops) {
+    NoiseOps noise_after;
+    for (const auto &term : noise_op.terms) {
+      if (term.readout) {
+        noise_after.insert(noise_after.end(), term.ops.begin(), term.ops.end());
+        continue;
+      }
+      const auto &error = quantum_errors_[term.error_pos];
+      const uint_t num_qubits = error.get_num_qubits();
+      if (num_qubits == 0)
+        continue;
+      auto it = superops.find(term.error_pos);
+      if (it == superops.end()) {
+        cmatrix_t mat = error.probability(0) * superop(error.circuit(0), num_qubits);
+        for (uint_t j = 1; j < error.num_circuits(); j++)
+          mat += error.probability(j) * superop(error.circuit(j), num_qubits);
+        it = superops.emplace(term.error_pos, std::move(mat)).first;
+      }
+      const reg_t qubits(term.qubits.begin(), term.qubits.begin() + num_qubits);
+      auto &target = (term.after) ? noise_after : channel_circ.ops;
+      target.push_back(Operations::make_superop(qubits, it->second));
+    }
+    channel_circ.ops.push_back(noise_op.op);
+    channel_circ.ops.insert(channel_circ.ops.end(),
+                            noise_after.begin(), noise_after.end());
+  }
+  return channel_circ;
+}
+
+
+Circuit NoiseModel::noise_ops_circuit(const Circuit &circ) const {
+  const auto compiled = compile_circuit(circ);
+  NoiseOps ops;
+  ops.reserve(compiled.ops.size());
+  // Each quantum error's circuits only need to be added once
+  std::unordered_set<size_t> errors;
+  for (const auto &noise_op : compiled.ops) {
+    ops.push_back(noise_op.op);
+    for (const auto &term : noise_op.terms) {
+      if (term.readout) {
+        ops.insert(ops.end(), term.ops.begin(), term.ops.end());
+      } else if (errors.insert(term.error_pos).second) {
+        const auto &error = quantum_errors_[term.error_pos];
+        for (uint_t j = 0; j < error.num_circuits(); j++) {
+          const auto &error_ops = error.circuit(j);
+          ops.insert(ops.end(), error_ops.begin(), error_ops.end());
+        }
+      }
+    }
+  }
+  return Circuit(ops);
+}
+
+
+void NoiseModel::sample_noise(const NoiseOp &noise_op, NoiseOps &ops,
+                              RngEngine &rng) const {
+  // Ideal ops can be added directly
+  if (noise_op.terms.empty()) {
+    ops.push_back(noise_op.op);
+    return;
+  }
+  // Sample each error in order, and add the errors before the op directly
+  // while holding the errors after the op until the op is added
+  NoiseOps noise_after;
+  for (const auto &term : noise_op.terms) {
+    if (term.readout) {
+      noise_after.insert(noise_after.end(), term.ops.begin(), term.ops.end());
+    } else {
+      // Add the sampled error circuit directly to the output ops
+      const auto &error = quantum_errors_[term.error_pos];
+      auto &target = (term.after) ? noise_after : ops;
+      for (const auto &op : error.circuit(error.sample_circuit(rng))) {
+        target.push_back(op);
+        // Update qubits based on position in term qubits list
+        for (auto &qubit : target.back().qubits)
+          qubit = term.qubits[qubit];
+      }
+    }
+  }
+  ops.push_back(noise_op.op);
+  ops.insert(ops.end(), noise_after.begin(), noise_after.end());
+}
+
+
+void NoiseModel::compile_op(const Operations::Op &op,
+                            std::vector<NoiseOp> &noise_ops) const {
   // Look to see if gate is a waltz gate for this error model
   auto it = x90_gates_.find(op.name);
   if (it == x90_gates_.end()) {
     // Non-X90 based gate, run according to base model
-    return sample_noise_helper(op, rng);
+    noise_ops.push_back(compile_op_helper(op));
+    return;
   }
   // Decompose ops in terms of their waltz implementation
   auto gate = waltz_gate_table_.find(op.name);
   if (gate != waltz_gate_table_.end()) {
     switch (gate->second) {
       case WaltzGate::u3:
-        return sample_noise_x90_u3(op.qubits[0], op.params[0], op.params[1], op.params[2], rng);
+        compile_x90_u3(op.qubits[0], op.params[0], op.params[1], op.params[2], noise_ops);
+        break;
       case WaltzGate::u2:
-        return sample_noise_x90_u2(op.qubits[0], op.params[0], op.params[1], rng);
+        compile_x90_u2(op.qubits[0], op.params[0], op.params[1], noise_ops);
+        break;
       case WaltzGate::x:
-        return sample_noise_x90_u3(op.qubits[0], M_PI, 0., M_PI, rng);
+        compile_x90_u3(op.qubits[0], M_PI, 0., M_PI, noise_ops);
+        break;
       case WaltzGate::y:
-        return sample_noise_x90_u3(op.qubits[0],  M_PI, 0.5 * M_PI, 0.5 * M_PI, rng);
+        compile_x90_u3(op.qubits[0],  M_PI, 0.5 * M_PI, 0.5 * M_PI, noise_ops);
+        break;
       case WaltzGate::h:
-        return sample_noise_x90_u2(op.qubits[0], 0., M_PI, rng);
+        compile_x90_u2(op.qubits[0], 0., M_PI, noise_ops);
+        break;
       default:
         // The rest of the Waltz operations are noise free (u1 only)
-        return {op};
+        noise_ops.push_back({op, {}});
+        break;
     }
   } else {
     // something went wrong if we end up here
@@ -196,47 +397,6 @@ NoiseModel::NoiseOps NoiseModel::sample_noise(const Operations::Op &op,
 }
 
 
-Circuit NoiseModel::sample_noise(const Circuit &circ, RngEngine &rng) const {
-    bool noise_active = true; // set noise active to on-state
-    Circuit noisy_circ = circ; // copy input circuit
-    noisy_circ.measure_sampling_flag = false; // disable measurement opt flag
-    noisy_circ.ops.clear(); // delete ops
-    noisy_circ.ops.reserve(2 * circ.ops.size()); // just to be safe?
-    // Sample a noisy realization of the circuit
-    for (const auto &op: circ.ops) {
-      switch (op.type) {
-        // Operations that cannot have noise
-        case Operations::OpType::barrier:
-          noisy_circ.ops.push_back(op);
-          break;
-        case Operations::OpType::snapshot:
-          noisy_circ.ops.push_back(op);
-          break;
-        case Operations::OpType::kraus:
-          noisy_circ.ops.push_back(op);
-          break;
-        case Operations::OpType::roerror:
-          noisy_circ.ops.push_back(op);
-          break;
-        case Operations::OpType::bfunc:
-          noisy_circ.ops.push_back(op);
-          break;
-        // Switch noise on or off during current circuit sample
-        case Operations::OpType::noise_switch:
-          noise_active = static_cast<int>(std::real(op.params[0]));
-          break;
-        default:
-          if (noise_active) {
-            NoiseOps noisy_op = sample_noise(op, rng);
-            noisy_circ.ops.insert(noisy_circ.ops.end(), noisy_op.begin(), noisy_op.end());
-          }
-          break;
-      }
-    }
-    return noisy_circ;
-}
-
-
 void NoiseModel::add_readout_error(const ReadoutError &error,
                                          const std::vector<reg_t> &op_qubits) {
   // Add error term as unique pointer
@@ -311,31 +471,23 @@ void NoiseModel::add_nonlocal_quantum_error(const QuantumError &error,
 }
 
 
-NoiseModel::NoiseOps NoiseModel::sample_noise_helper(const Operations::Op &op,
-                                                     RngEngine &rng) const {                                                
-  // Return operator set
-  NoiseOps noise_before;
-  NoiseOps noise_after;
+NoiseModel::NoiseOp NoiseModel::compile_op_helper(const Operations::Op &op) const {
+  NoiseOp noise_op;
+  noise_op.op = op;
   // Apply local errors first
-  sample_local_quantum_noise(op, noise_before, noise_after, rng);
+  compile_local_quantum_noise(op, noise_op.terms);
   // Apply nonlocal errors second
-  sample_nonlocal_quantum_noise(op, noise_before, noise_after, rng);
+  compile_nonlocal_quantum_noise(op, noise_op.terms);
   // Apply readout error to measure ops
   if (op.type == Operations::OpType::measure) {
-    sample_readout_noise(op, noise_after, rng);
+    compile_readout_noise(op, noise_op.terms);
   }
-
-  // combine the original op with the noise ops before and after
-  noise_before.reserve(noise_before.size() + noise_after.size() + 1);
-  noise_before.push_back(op);
-  noise_before.insert(noise_before.end(), noise_after.begin(), noise_after.end());
-  return noise_before;
+  return noise_op;
 }
 
 
-void NoiseModel::sample_readout_noise(const Operations::Op &op,
-                                      NoiseOps &noise_after,
-                                      RngEngine &rng) const {
+void NoiseModel::compile_readout_noise(const Operations::Op &op,
+                                       std::vector<NoiseTerm> &terms) const {
   // If no readout errors are defined pass
   if (readout_errors_.empty()) {
     return;
@@ -343,7 +495,7 @@ void NoiseModel::sample_readout_noise(const Operations::Op &op,
   // Check if measure op writes only to memory, or also to registers
   // We will use the same error model for both memory and registers
   bool has_registers = !op.registers.empty();
-  
+
   //
   std::string op_qubits = reg2string(op.qubits);
 
@@ -386,26 +538,27 @@ void NoiseModel::sample_readout_noise(const Operations::Op &op,
         ? iter_qubits->second
         : iter_default->second;
       for (auto &pos : error_positions) {
-        // Sample Readout error
-        auto noise_ops = readout_errors_[pos].sample_noise(memory_sets[qs], rng);
+        // Readout errors do not depend on the RNG so the noise ops
+        // can be resolved here
+        NoiseTerm term;
+        term.readout = true;
+        term.ops = {readout_errors_[pos].readout_op(memory_sets[qs])};
         if (has_registers) {
-          for (auto& noise_op: noise_ops) {
+          for (auto& noise_op: term.ops) {
             noise_op.registers = registers_sets[qs];
           }
         }
-        // Add noise after the error 
-        noise_after.insert(noise_after.end(), noise_ops.begin(), noise_ops.end());
+        // Add noise after the error
+        terms.push_back(std::move(term));
       }
     }
   }
 }
 
 
-void NoiseModel::sample_local_quantum_noise(const Operations::Op &op,
-                                            NoiseOps &noise_before,
-                                            NoiseOps &noise_after,
-                                            RngEngine &rng) const {
-  
+void NoiseModel::compile_local_quantum_noise(const Operations::Op &op,
+                                             std::vector<NoiseTerm> &terms) const {
+
   // If no errors are defined pass
   if (local_quantum_errors_ == false)
     return;
@@ -426,7 +579,7 @@ void NoiseModel::sample_local_quantum_noise(const Operations::Op &op,
   auto iter = local_quantum_error_table_.find(name);
   if (iter != local_quantum_error_table_.end()) {
     // Check if the qubits are listed in the inner model
-    const auto qubit_map = iter->second;
+    const auto &qubit_map = iter->second;
     // Get the default qubit model incase a specific qubit model is not found
     // The default model is stored under the empty key string ""
     auto iter_default = qubit_map.find(std::string());
@@ -452,12 +605,12 @@ void NoiseModel::sample_local_quantum_noise(const Operations::Op &op,
           ? iter_qubits->second
           : iter_default->second;
         for (auto &pos : error_positions) {
-          auto noise_ops = quantum_errors_[pos].sample_noise(string2reg(qubit_keys[qs]), rng);
-          // Duplicate same sampled error operations
-          if (quantum_errors_[pos].errors_after())
-            noise_after.insert(noise_after.end(), noise_ops.begin(), noise_ops.end());
-          else
-            noise_before.insert(noise_before.end(), noise_ops.begin(), noise_ops.end());
+          NoiseTerm term;
+          term.error_pos = pos;
+          term.after = quantum_errors_[pos].errors_after();
+          term.qubits = string2reg(qubit_keys[qs]);
+          quantum_errors_[pos].check_qubits(term.qubits);
+          terms.push_back(std::move(term));
         }
       }
     }
@@ -465,15 +618,13 @@ void NoiseModel::sample_local_quantum_noise(const Operations::Op &op,
 }
 
 
-void NoiseModel::sample_nonlocal_quantum_noise(const Operations::Op &op,
-                                               NoiseOps &noise_before,
-                                               NoiseOps &noise_after,
-                                               RngEngine &rng) const {
-  
+void NoiseModel::compile_nonlocal_quantum_noise(const Operations::Op &op,
+                                                std::vector<NoiseTerm> &terms) const {
+
   // If no errors are defined pass
   if (nonlocal_quantum_errors_ == false)
     return;
-  
+
   // Get op name, or label if it is a matrix
   std::string name = (op.type == Operations::OpType::matrix)
     ? op.string_params[0]
@@ -484,7 +635,7 @@ void NoiseModel::sample_nonlocal_quantum_noise(const Operations::Op &op,
   // Get the inner error map for  gate name
   auto iter = nonlocal_quantum_error_table_.find(name);
   if (iter != nonlocal_quantum_error_table_.end()) {
-    const auto qubit_map = iter->second;
+    const auto &qubit_map = iter->second;
     // Format qubit sets
     std::vector<std::string> qubit_keys;
 
@@ -508,11 +659,12 @@ void NoiseModel::sample_nonlocal_quantum_noise(const Operations::Op &op,
           auto &target_qubits = target_pair.first;
           auto &error_positions = target_pair.second;
           for (auto &pos : error_positions) {
-            auto ops = quantum_errors_[pos].sample_noise(string2reg(target_qubits), rng);
-            if (quantum_errors_[pos].errors_after())
-              noise_after.insert(noise_after.end(), ops.begin(), ops.end());
-            else
-              noise_before.insert(noise_before.end(), ops.begin(), ops.end());
+            NoiseTerm term;
+            term.error_pos = pos;
+            term.after = quantum_errors_[pos].errors_after();
+            term.qubits = string2reg(target_qubits);
+            quantum_errors_[pos].check_qubits(term.qubits);
+            terms.push_back(std::move(term));
           }
         }
       }
@@ -530,44 +682,37 @@ NoiseModel::waltz_gate_table_ = {
 };
 
 
-NoiseModel::NoiseOps NoiseModel::sample_noise_x90_u3(uint_t qubit,
-                                                       complex_t theta,
-                                                       complex_t phi,
-                                                       complex_t lambda,
-                                                       RngEngine &rng) const {
-  NoiseOps ret;
+void NoiseModel::compile_x90_u3(uint_t qubit,
+                                complex_t theta,
+                                complex_t phi,
+                                complex_t lambda,
+                                std::vector<NoiseOp> &noise_ops) const {
   const auto x90 = Operations::make_mat({qubit}, Utils::Matrix::X90, "x90");
   if (std::abs(lambda) > u1_threshold_
       && std::abs(lambda - 2 * M_PI) > u1_threshold_
       && std::abs(lambda + 2 * M_PI) > u1_threshold_)
-    ret.push_back(Operations::make_u1(qubit, lambda)); // add 1st U1
-  auto sample = sample_noise_helper(x90, rng); // sample noise for 1st X90
-  ret.insert(ret.end(), sample.begin(), sample.end()); // add 1st noisy X90
+    noise_ops.push_back({Operations::make_u1(qubit, lambda), {}}); // add 1st U1
+  noise_ops.push_back(compile_op_helper(x90)); // add 1st noisy X90
   if (std::abs(theta + M_PI) > u1_threshold_
       && std::abs(theta - M_PI) > u1_threshold_)
-    ret.push_back(Operations::make_u1(qubit, theta + M_PI)); // add 2nd U1
-  sample = sample_noise_helper(x90, rng); // sample noise for 2nd X90
-  ret.insert(ret.end(), sample.begin(), sample.end()); // add 2nd noisy X90
+    noise_ops.push_back({Operations::make_u1(qubit, theta + M_PI), {}}); // add 2nd U1
+  noise_ops.push_back(compile_op_helper(x90)); // add 2nd noisy X90
   if (std::abs(phi + M_PI) > u1_threshold_
       && std::abs(phi - M_PI) > u1_threshold_)
-    ret.push_back(Operations::make_u1(qubit, phi + M_PI)); // add 3rd U1
-  return ret;
+    noise_ops.push_back({Operations::make_u1(qubit, phi + M_PI), {}}); // add 3rd U1
 }
 
 
-NoiseModel::NoiseOps NoiseModel::sample_noise_x90_u2(uint_t qubit,
-                                                       complex_t phi,
-                                                       complex_t lambda,
-                                                       RngEngine &rng) const {
-  NoiseOps ret;
+void NoiseModel::compile_x90_u2(uint_t qubit,
+                                complex_t phi,
+                                complex_t lambda,
+                                std::vector<NoiseOp> &noise_ops) const {
   const auto x90 = Operations::make_mat({qubit}, Utils::Matrix::X90, "x90");
   if (std::abs(lambda - 0.5 * M_PI) > u1_threshold_)
-    ret.push_back(Operations::make_u1(qubit, lambda - 0.5 * M_PI)); // add 1st U1
-  auto sample = sample_noise_helper(x90, rng); // sample noise for 1st X90
-  ret.insert(ret.end(), sample.begin(), sample.end()); // add 1st noisy X90
+    noise_ops.push_back({Operations::make_u1(qubit, lambda - 0.5 * M_PI), {}}); // add 1st U1
+  noise_ops.push_back(compile_op_helper(x90)); // add 1st noisy X90
   if (std::abs(phi + 0.5 * M_PI) > u1_threshold_)
-    ret.push_back(Operations::make_u1(qubit, phi + 0.5 * M_PI)); // add 2nd U1
-  return ret;
+    noise_ops.push_back({Operations::make_u1(qubit, phi + 0.5 * M_PI), {}}); // add 2nd U1
 }
 
 
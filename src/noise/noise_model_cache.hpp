@@ -0,0 +1,157 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _aer_noise_model_cache_hpp_
+#define _aer_noise_model_cache_hpp_
+
+#include <list>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <utility>
+
+#include "noise/noise_model.hpp"
+
+namespace AER {
+namespace Noise {
+
+//=========================================================================
+// Noise Model Cache class
+//=========================================================================
+
+// Process wide cache of loaded noise models indexed by a handle string.
+// This allows a noise model to be parsed from JSON once and reused by later
+// executions that refer to it by its handle in the "noise_model_handle"
+// config setting instead of passing the full "noise_model" JSON.
+// The handle is chosen by the client and should be a hash of the noise
+// model contents. When the cache is full the least recently used noise
+// model is removed.
+
+class NoiseModelCache {
+public:
+
+  // Return the cache instance
+  static NoiseModelCache &instance() {
+    static NoiseModelCache cache;
+    return cache;
+  }
+
+  // Load a noise model from a JSON string and add it to the cache.
+  // If the handle is already in the cache it is marked as used and the
+  // noise model is not reloaded.
+  void insert(const std::string &handle, const std::string &noise_model);
+
+  // Return true if a noise model is stored for the handle
+  bool contains(const std::string &handle);
+
+  // Return a copy of the noise model stored for a handle
+  NoiseModel get(const std::string &handle);
+
+  // Remove all noise models from the cache
+  void clear();
+
+  // Set the maximum number of noise models stored. If the cache is
+  // larger than the new capacity the least recently used noise models
+  // are removed.
+  void set_capacity(size_t capacity);
+
+  size_t size() const {return entries_.size();}
+
+protected:
+
+  NoiseModelCache() = default;
+
+  // Move an entry to the front of the usage list
+  void touch(const std::string &handle);
+
+  // Remove least recently used entries above the capacity
+  void evict();
+
+  // Handles ordered from most to least recently used
+  std::list<std::string> usage_;
+
+  // Map from handle to noise model and its position in the usage list
+  using entry_t = std::pair<NoiseModel, std::list<std::string>::iterator>;
+  std::unordered_map<std::string, entry_t> entries_;
+
+  size_t capacity_ = 16;
+  std::mutex mutex_;
+};
+
+//=========================================================================
+// Implementation
+//=========================================================================
+
+void NoiseModelCache::insert(const std::string &handle,
+                             const std::string &noise_model) {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (entries_.find(handle) != entries_.end()) {
+      touch(handle);
+      return;
+    }
+  }
+  // Parse outside of the lock
+  NoiseModel model(json_t::parse(noise_model));
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (entries_.find(handle) != entries_.end()) {
+    touch(handle);
+    return;
+  }
+  usage_.push_front(handle);
+  entries_.emplace(handle, entry_t(std::move(model), usage_.begin()));
+  evict();
+}
+
+bool NoiseModelCache::contains(const std::string &handle) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return entries_.find(handle) != entries_.end();
+}
+
+NoiseModel NoiseModelCache::get(const std::string &handle) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  auto it = entries_.find(handle);
+  if (it == entries_.end()) {
+    throw std::invalid_argument("NoiseModelCache: no noise model for handle \"" +
+                                handle + "\".");
+  }
+  touch(handle);
+  return it->second.first;
+}
+
+void NoiseModelCache::clear() {
+  std::lock_guard<std::mutex> lock(mutex_);
+  entries_.clear();
+  usage_.clear();
+}
+
+void NoiseModelCache::set_capacity(size_t capacity) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  capacity_ = capacity;
+  evict();
+}
+
+void NoiseModelCache::touch(const std::string &handle) {
+  auto &pos = entries_.at(handle).second;
+  usage_.splice(usage_.begin(), usage_, pos);
+  pos = usage_.begin();
+}
+
+void NoiseModelCache::evict() {
+  while (entries_.size() > capacity_) {
+    entries_.erase(usage_.back());
+    usage_.pop_back();
+  }
+}
+
+//-------------------------------------------------------------------------
+} // end namespace Noise
+//-------------------------------------------------------------------------
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
@@ -50,16 +50,52 @@ public:
   // Set threshold for checking probabilities and matrices
   void set_threshold(double);
 
+  // Check the error can be applied to a list of qubits
+  void check_qubits(const reg_t &qubits) const;
+
+  // Sample the position of one of the noise circuits
+  uint_t sample_circuit(RngEngine &rng) const;
+
+  // Return a stored noise circuit. The qubits of its ops are positions
+  // in the list of qubits the error is applied to.
+  inline const NoiseOps& circuit(uint_t pos) const {return circuits_[pos];}
+
+  // Return the number of stored noise circuits
+  inline uint_t num_circuits() const {return circuits_.size();}
+
+  // Return the probability of a stored noise circuit
+  inline double probability(uint_t pos) const {return probabilities_[pos];}
+
 protected:
   // Probabilities, first entry is no-error (identity)
   rvector_t probabilities_;
-  //std::discrete_distribution<uint_t> probabilities_;
+
+  // Alias table for sampling from the probabilities
+  AliasTable sampler_;
 
   // List of unitary error matrices
   std::vector<NoiseOps> circuits_;
 
   // threshold for validating if matrices are unitary
   double threshold_ = 1e-10;
+
+  // Add a noise circuit with a given probability. Kraus ops with diagonal
+  // Kraus matrices that are an exact mixture of Z-type Pauli errors are
+  // replaced by mixed unitary circuits of Z gates. Other diagonal Kraus
+  // ops store their vectorized matrices as diagonals.
+  void add_circuit(NoiseOps circuit, double prob);
+
+  // Set the diagonals of a set of Kraus matrices. Returns false if any
+  // of the matrices is not diagonal.
+  bool kraus_diagonals(const std::vector<cmatrix_t> &mats,
+                       std::vector<cvector_t> &diags) const;
+
+  // Set the probabilities of the Z-type Pauli errors of a diagonal Kraus
+  // channel. The Pauli error with Z on the qubits for the set bits of
+  // an index z has probability zprobs[z]. Returns false if the channel
+  // is not a Z-type Pauli channel.
+  bool z_mixture(const std::vector<cvector_t> &diags,
+                 rvector_t &zprobs) const;
 };
 
 //-------------------------------------------------------------------------
@@ -68,21 +104,8 @@ protected:
 
 QuantumError::NoiseOps QuantumError::sample_noise(const reg_t &qubits,
                                                   RngEngine &rng) const {
-  if (qubits.size() < get_num_qubits()) {
-    std::stringstream msg;
-    msg << "QuantumError: qubits size (" << qubits.size() << ")";
-    msg << " < error qubits (" << get_num_qubits() << ").";
-    throw std::invalid_argument(msg.str());
-  }
-  auto r = rng.rand_int(probabilities_);
-  // Check for invalid arguments
-  if (r + 1 > circuits_.size()) {
-    std::stringstream msg;
-    msg << "QuantumError: probability outcome (" << r << ")";
-    msg << " is greater than number of circuits (" << circuits_.size() << ").";
-    throw std::invalid_argument(msg.str());
-  }
-  NoiseOps noise_ops = circuits_[r];
+  check_qubits(qubits);
+  NoiseOps noise_ops = circuits_[sample_circuit(rng)];
   // Add qubits to noise op commands;
   for (auto &op : noise_ops) {
     // Update qubits based on position in qubits list
@@ -93,6 +116,22 @@ QuantumError::NoiseOps QuantumError::sample_noise(const reg_t &qubits,
   return noise_ops;
 }
 
+void QuantumError::check_qubits(const reg_t &qubits) const {
+  if (qubits.size() < get_num_qubits()) {
+    std::stringstream msg;
+    msg << "QuantumError: qubits size (" << qubits.size() << ")";
+    msg << " < error qubits (" << get_num_qubits() << ").";
+    throw std::invalid_argument(msg.str());
+  }
+}
+
+uint_t QuantumError::sample_circuit(RngEngine &rng) const {
+  if (circuits_.empty()) {
+    throw std::invalid_argument("QuantumError: error has no circuits to sample.");
+  }
+  return sampler_.sample(rng);
+}
+
 void QuantumError::set_threshold(double threshold) {
   threshold_ = std::abs(threshold);
 }
@@ -121,8 +160,7 @@ void QuantumError::set_circuits(const std::vector<NoiseOps> &circuits,
   // Add elements with non-zero probability
   for (size_t j=0; j < probs.size(); j++ ) {
     if (probs[j] > threshold_) {
-      probabilities_.push_back(probs[j]);
-      circuits_.push_back(circuits[j]);
+      add_circuit(circuits[j], probs[j]);
       // Check max qubit size
       for (const auto &op: circuits[j]) {
         for (const auto &qubit : op.qubits) {
@@ -132,6 +170,111 @@ void QuantumError::set_circuits(const std::vector<NoiseOps> &circuits,
     }
   }
   set_num_qubits(num_qubits);
+  sampler_ = AliasTable(probabilities_);
+}
+
+
+void QuantumError::add_circuit(NoiseOps circuit, double prob) {
+  for (size_t pos=0; pos < circuit.size(); pos++) {
+    auto &op = circuit[pos];
+    std::vector<cvector_t> diags;
+    if (op.type != Operations::OpType::kraus ||
+        kraus_diagonals(op.mats, diags) == false)
+      continue;
+    rvector_t zprobs;
+    if (z_mixture(diags, zprobs)) {
+      // Replace the Kraus op by a branch for each Z-type Pauli error.
+      // Remaining Kraus ops in the circuit are handled when the
+      // branch circuits are added.
+      const reg_t qubits = op.qubits;
+      double total = 0.;
+      for (const auto &p : zprobs)
+        total += (p > threshold_) ? p : 0.;
+      for (size_t z=0; z < zprobs.size(); z++) {
+        if (zprobs[z] <= threshold_)
+          continue;
+        NoiseOps branch(circuit.begin(), circuit.begin() + pos);
+        for (size_t j=0; j < qubits.size(); j++) {
+          if ((z >> j) & 1ULL) {
+            Operations::Op zgate;
+            zgate.name = "z";
+            zgate.qubits = reg_t({qubits[j]});
+            zgate.type = Operations::OpType::gate;
+            branch.push_back(zgate);
+          }
+        }
+        branch.insert(branch.end(), circuit.begin() + pos + 1, circuit.end());
+        if (branch.empty()) {
+          Operations::Op iden;
+          iden.name = "id";
+          iden.qubits = reg_t({qubits[0]});
+          iden.type = Operations::OpType::gate;
+          branch.push_back(iden);
+        }
+        add_circuit(branch, prob * zprobs[z] / total);
+      }
+      return;
+    }
+    // Store diagonal Kraus matrices as vectorized diagonals so that they
+    // are applied as diagonal matrices by the simulator
+    op.vmats = diags;
+  }
+  probabilities_.push_back(prob);
+  circuits_.push_back(circuit);
+}
+
+
+bool QuantumError::kraus_diagonals(const std::vector<cmatrix_t> &mats,
+                                   std::vector<cvector_t> &diags) const {
+  diags.clear();
+  for (const auto &mat : mats) {
+    if (Utils::is_diagonal(mat, threshold_) == false)
+      return false;
+    cvector_t diag(mat.GetRows());
+    for (size_t i=0; i < diag.size(); i++)
+      diag[i] = mat(i, i);
+    diags.push_back(diag);
+  }
+  return !diags.empty();
+}
+
+
+bool QuantumError::z_mixture(const std::vector<cvector_t> &diags,
+                             rvector_t &zprobs) const {
+  // A diagonal channel multiplies the density matrix entrywise by
+  // M(i, j) = sum_k K_k(i) * conj(K_k(j)). It is a mixture of Z-type Pauli
+  // errors if and only if M(i, j) = f(i ^ j) for a real function f whose
+  // Walsh-Hadamard transform (the Pauli probabilities) is non-negative.
+  const size_t dim = diags[0].size();
+  rvector_t f(dim, 0.);
+  for (size_t i=0; i < dim; i++) {
+    for (size_t j=0; j < dim; j++) {
+      complex_t m = 0.;
+      for (const auto &diag : diags)
+        m += diag[i] * std::conj(diag[j]);
+      if (i == 0) {
+        if (std::abs(std::imag(m)) > threshold_)
+          return false;
+        f[j] = std::real(m);
+      } else if (std::abs(m - f[i ^ j]) > threshold_) {
+        return false;
+      }
+    }
+  }
+  zprobs.assign(dim, 0.);
+  for (size_t z=0; z < dim; z++) {
+    for (size_t x=0; x < dim; x++) {
+      // Parity of the bitwise product z.x
+      size_t parity = 0;
+      for (size_t bits = z & x; bits; bits >>= 1)
+        parity ^= (bits & 1ULL);
+      zprobs[z] += (parity) ? -f[x] : f[x];
+    }
+    zprobs[z] /= dim;
+    if (zprobs[z] < -threshold_)
+      return false;
+  }
+  return true;
 }
 
 
@@ -43,6 +43,10 @@ public:
   // identity matrix
   void set_probabilities(const std::vector<rvector_t> &probs);
 
+  // Return the readout error op for measurements stored in the memory
+  // bits. Readout errors are deterministic so no RNG is required.
+  Operations::Op readout_op(const reg_t &memory) const;
+
 protected:
   std::vector<rvector_t> assignment_probabilities_; 
 
@@ -57,11 +61,15 @@ protected:
 ReadoutError::NoiseOps ReadoutError::sample_noise(const reg_t &memory,
                                                   RngEngine &rng) const {
   (void)rng; // RNG is unused for readout error since it is handled by engine
+  return {readout_op(memory)};
+}
+
+
+Operations::Op ReadoutError::readout_op(const reg_t &memory) const {
   // Check assignment fidelity matrix is correct size
   if (memory.size() > get_num_qubits())
     throw std::invalid_argument("ReadoutError: number of qubits don't match assignment probability matrix.");
-  // Initialize return ops,
-  return {Operations::make_roerror(memory, assignment_probabilities_)};
+  return Operations::make_roerror(memory, assignment_probabilities_);
 }
 
 
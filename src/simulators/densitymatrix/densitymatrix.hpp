@@ -0,0 +1,463 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _qv_density_matrix_hpp_
+#define _qv_density_matrix_hpp_
+
+#include "framework/utils.hpp"
+#include "simulators/qubitvector/qubitvector.hpp"
+
+namespace QV {
+
+// Data types
+using reg_t = std::vector<uint_t>;
+using cmatrix_t = matrix<complex_t>;
+
+//============================================================================
+// DensityMatrix class
+//============================================================================
+
+// An N-qubit density matrix stored as its column-major vectorization in a
+// 2N-qubit QubitVector. Qubit j of the row index is qubit j of the vector,
+// and qubit j of the column index is qubit j + N of the vector, so the
+// matrix element rho(i, j) is stored at vector index i + 2^N * j.
+//
+// This allows the QubitVector kernels to be reused for density matrix
+// evolution: a unitary U on qubits qs is applied as U on qs and conj(U) on
+// the shifted qubits qs + N, and a general channel is applied as its
+// superoperator matrix on the qubits qs and qs + N.
+
+template <class statevector_t = complex_t*>
+class DensityMatrix : public QubitVector<statevector_t> {
+
+public:
+  using BaseVector = QubitVector<statevector_t>;
+
+  //-----------------------------------------------------------------------
+  // Constructors and Destructor
+  //-----------------------------------------------------------------------
+
+  DensityMatrix() : DensityMatrix(0) {}
+  explicit DensityMatrix(size_t num_qubits);
+
+  //-----------------------------------------------------------------------
+  // Utility functions
+  //-----------------------------------------------------------------------
+
+  // Set the number of qubits of the density matrix
+  void set_num_qubits(size_t num_qubits);
+
+  // Returns the number of qubits of the density matrix
+  inline uint_t num_qubits() const {return num_qubits_dm_;}
+
+  // Returns the number of rows of the density matrix
+  inline uint_t rows() const {return rows_;}
+
+  // Returns the qubits of the vectorized matrix for a superoperator acting
+  // on the input qubits: [qubits, qubits + N]
+  reg_t superop_qubits(const reg_t &qubits) const;
+
+  // Returns a copy of the density matrix
+  cmatrix_t matrix() const;
+
+  // Return JSON serialization of the density matrix
+  json_t json() const;
+
+  // Initializes the density matrix to the all |0> state
+  void initialize();
+
+  // Initializes the density matrix to the pure state |psi><psi|
+  // If the length of psi does not match the number of qubits an exception
+  // is raised.
+  void initialize_from_vector(const cvector_t &psi);
+
+  // Initializes the density matrix from a column-major vectorized matrix
+  // If the length of the vector does not match the number of qubits an
+  // exception is raised.
+  void initialize_from_matrix(const cvector_t &vec);
+
+  //-----------------------------------------------------------------------
+  // Apply Matrices
+  //-----------------------------------------------------------------------
+
+  // Apply a N-qubit unitary matrix U as rho -> U.rho.U^dagger
+  // The matrix is input as vector of the column-major vectorized N-qubit
+  // matrix, or as the diagonal of a diagonal matrix.
+  void apply_unitary_matrix(const reg_t &qubits, const cvector_t &mat);
+
+  // Apply a N-qubit diagonal unitary matrix as rho -> U.rho.U^dagger
+  // The matrix is input as vector of the matrix diagonal.
+  void apply_diagonal_unitary_matrix(const reg_t &qubits, const cvector_t &diag);
+
+  // Apply a N-qubit superoperator matrix to the vectorized density matrix.
+  // The matrix is input as vector of the column-major vectorized 2N-qubit
+  // superoperator matrix.
+  void apply_superop_matrix(const reg_t &qubits, const cvector_t &mat);
+
+  // Apply a N-qubit matrix M by left multiplication rho -> M.rho
+  // This is used for computing expectation values Tr[M.rho].
+  void apply_left_matrix(const reg_t &qubits, const cvector_t &mat);
+
+  // Apply the single qubit reset to |0> channel to each of the qubits
+  void apply_reset(const reg_t &qubits);
+
+  //-----------------------------------------------------------------------
+  // Apply Specialized Gates
+  //-----------------------------------------------------------------------
+
+  // Apply a 2-qubit Controlled-NOT gate to the density matrix
+  void apply_cnot(const uint_t qctrl, const uint_t qtrgt);
+
+  // Apply a 2-qubit Controlled-Z gate to the density matrix
+  void apply_cz(const uint_t q0, const uint_t q1);
+
+  // Apply a 2-qubit SWAP gate to the density matrix
+  void apply_swap(const uint_t q0, const uint_t q1);
+
+  // Apply a single-qubit Pauli-X gate to the density matrix
+  void apply_x(const uint_t qubit);
+
+  // Apply a single-qubit Pauli-Y gate to the density matrix
+  void apply_y(const uint_t qubit);
+
+  // Apply a single-qubit Pauli-Z gate to the density matrix
+  void apply_z(const uint_t qubit);
+
+  // Apply a 3-qubit toffoli gate to the density matrix
+  void apply_toffoli(const uint_t qctrl0, const uint_t qctrl1, const uint_t qtrgt);
+
+  //-----------------------------------------------------------------------
+  // Z-measurement outcome probabilities and expectation values
+  //-----------------------------------------------------------------------
+
+  // Return the trace of the density matrix
+  complex_t trace() const;
+
+  // Return the probabilities for all measurement outcomes, which are the
+  // diagonal of the density matrix.
+  rvector_t probabilities() const;
+
+  // Return the Z-basis measurement outcome probabilities [P(0), ..., P(2^N-1)]
+  // for measurement of N-qubits.
+  rvector_t probabilities(const reg_t &qubits) const;
+
+  // Return the expectation value Tr[P.rho] of a Pauli operator P on the
+  // input qubits. The Pauli string label is little-endian so that the
+  // last character is the Pauli for qubits[0].
+  double expval_pauli(const reg_t &qubits, const std::string &pauli) const;
+
+protected:
+
+  // Number of qubits and rows of the density matrix
+  uint_t num_qubits_dm_ = 0;
+  uint_t rows_ = 1;
+};
+
+//------------------------------------------------------------------------------
+// JSON Serialization
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+inline void to_json(json_t &js, const DensityMatrix<statevector_t> &rho) {
+  js = rho.json();
+}
+
+/*******************************************************************************
+ *
+ * Implementations
+ *
+ ******************************************************************************/
+
+//------------------------------------------------------------------------------
+// Utility
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+DensityMatrix<statevector_t>::DensityMatrix(size_t num_qubits) : BaseVector(0) {
+  set_num_qubits(num_qubits);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::set_num_qubits(size_t num_qubits) {
+  num_qubits_dm_ = num_qubits;
+  rows_ = 1ULL << num_qubits;
+  BaseVector::set_num_qubits(2 * num_qubits);
+}
+
+template <class statevector_t>
+reg_t DensityMatrix<statevector_t>::superop_qubits(const reg_t &qubits) const {
+  reg_t superop_qubits = qubits;
+  for (const auto &qubit : qubits)
+    superop_qubits.push_back(qubit + num_qubits_dm_);
+  return superop_qubits;
+}
+
+template <class statevector_t>
+cmatrix_t DensityMatrix<statevector_t>::matrix() const {
+  cmatrix_t ret(rows_, rows_);
+  for (uint_t j = 0; j < rows_; j++)
+    for (uint_t i = 0; i < rows_; i++)
+      ret(i, j) = BaseVector::statevector_[i + rows_ * j];
+  return ret;
+}
+
+template <class statevector_t>
+json_t DensityMatrix<statevector_t>::json() const {
+  const int_t end = rows_;
+  const json_t zero = complex_t(0.0, 0.0);
+  json_t js = json_t(rows_, json_t(rows_, zero));
+  for (int_t i = 0; i < end; i++)
+    for (int_t j = 0; j < end; j++) {
+      const auto val = BaseVector::statevector_[i + end * j];
+      if (BaseVector::json_chop_threshold_ <= 0 || std::abs(val.real()) > BaseVector::json_chop_threshold_)
+        js[i][j][0] = val.real();
+      if (BaseVector::json_chop_threshold_ <= 0 || std::abs(val.imag()) > BaseVector::json_chop_threshold_)
+        js[i][j][1] = val.imag();
+    }
+  return js;
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::initialize() {
+  BaseVector::initialize();
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::initialize_from_vector(const cvector_t &psi) {
+  if (psi.size() != rows_) {
+    std::stringstream msg;
+    msg << "DensityMatrix::initialize input vector is incorrect length (";
+    msg << rows_ << "!=" << psi.size() << ")";
+    throw std::runtime_error(msg.str());
+  }
+  const int_t end = rows_;
+  #pragma omp parallel for if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_)
+  for (int_t j = 0; j < end; j++)
+    for (int_t i = 0; i < end; i++)
+      BaseVector::statevector_[i + end * j] = psi[i] * std::conj(psi[j]);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::initialize_from_matrix(const cvector_t &vec) {
+  BaseVector::initialize(vec);
+}
+
+//------------------------------------------------------------------------------
+// Apply matrices
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_unitary_matrix(const reg_t &qubits, const cvector_t &mat) {
+  // Check if diagonal matrix
+  if (mat.size() == 1ULL << qubits.size()) {
+    apply_diagonal_unitary_matrix(qubits, mat);
+    return;
+  }
+  // Apply U to the row qubits and conj(U) to the column qubits
+  BaseVector::apply_matrix(qubits, mat);
+  cvector_t conj_mat(mat.size());
+  for (size_t j = 0; j < mat.size(); j++)
+    conj_mat[j] = std::conj(mat[j]);
+  reg_t col_qubits;
+  for (const auto &qubit : qubits)
+    col_qubits.push_back(qubit + num_qubits_dm_);
+  BaseVector::apply_matrix(col_qubits, conj_mat);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_diagonal_unitary_matrix(const reg_t &qubits,
+                                                  const cvector_t &diag) {
+  // The superoperator of a diagonal unitary is the diagonal matrix
+  // diag[r] * conj(diag[c]) so it can be applied in a single pass
+  const uint_t dim = diag.size();
+  cvector_t superop_diag(dim * dim);
+  for (uint_t c = 0; c < dim; c++)
+    for (uint_t r = 0; r < dim; r++)
+      superop_diag[r + dim * c] = diag[r] * std::conj(diag[c]);
+  BaseVector::apply_diagonal_matrix(superop_qubits(qubits), superop_diag);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_superop_matrix(const reg_t &qubits, const cvector_t &mat) {
+  BaseVector::apply_matrix(superop_qubits(qubits), mat);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_left_matrix(const reg_t &qubits, const cvector_t &mat) {
+  if (mat.size() == 1ULL << qubits.size())
+    BaseVector::apply_diagonal_matrix(qubits, mat);
+  else
+    BaseVector::apply_matrix(qubits, mat);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_reset(const reg_t &qubits) {
+  // Superoperator for reset to |0>: |0><0|.rho.|0><0| + |0><1|.rho.|1><0|
+  const cvector_t reset_superop = {1., 0., 0., 0.,
+                                   0., 0., 0., 0.,
+                                   0., 0., 0., 0.,
+                                   1., 0., 0., 0.};
+  for (const auto &qubit : qubits)
+    apply_superop_matrix({qubit}, reset_superop);
+}
+
+//------------------------------------------------------------------------------
+// Apply specialized gates
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_cnot(const uint_t qctrl, const uint_t qtrgt) {
+  BaseVector::apply_cnot(qctrl, qtrgt);
+  BaseVector::apply_cnot(qctrl + num_qubits_dm_, qtrgt + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_cz(const uint_t q0, const uint_t q1) {
+  BaseVector::apply_cz(q0, q1);
+  BaseVector::apply_cz(q0 + num_qubits_dm_, q1 + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_swap(const uint_t q0, const uint_t q1) {
+  BaseVector::apply_swap(q0, q1);
+  BaseVector::apply_swap(q0 + num_qubits_dm_, q1 + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_x(const uint_t qubit) {
+  BaseVector::apply_x(qubit);
+  BaseVector::apply_x(qubit + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_y(const uint_t qubit) {
+  // Y = -i.Z.X and conj(Y) = i.Z.X so Y (x) conj(Y) = Z.X (x) Z.X
+  BaseVector::apply_x(qubit);
+  BaseVector::apply_z(qubit);
+  BaseVector::apply_x(qubit + num_qubits_dm_);
+  BaseVector::apply_z(qubit + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_z(const uint_t qubit) {
+  BaseVector::apply_z(qubit);
+  BaseVector::apply_z(qubit + num_qubits_dm_);
+}
+
+template <class statevector_t>
+void DensityMatrix<statevector_t>::apply_toffoli(const uint_t qctrl0, const uint_t qctrl1,
+                                  const uint_t qtrgt) {
+  BaseVector::apply_toffoli(qctrl0, qctrl1, qtrgt);
+  BaseVector::apply_toffoli(qctrl0 + num_qubits_dm_, qctrl1 + num_qubits_dm_,
+                            qtrgt + num_qubits_dm_);
+}
+
+//------------------------------------------------------------------------------
+// Probabilities and expectation values
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+complex_t DensityMatrix<statevector_t>::trace() const {
+  const int_t end = rows_;
+  const int_t stride = rows_ + 1;
+  double val_re = 0.;
+  double val_im = 0.;
+  #pragma omp parallel for if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_) reduction(+:val_re, val_im)
+  for (int_t k = 0; k < end; k++) {
+    val_re += std::real(BaseVector::statevector_[k * stride]);
+    val_im += std::imag(BaseVector::statevector_[k * stride]);
+  }
+  return complex_t(val_re, val_im);
+}
+
+template <class statevector_t>
+rvector_t DensityMatrix<statevector_t>::probabilities() const {
+  const int_t end = rows_;
+  const int_t stride = rows_ + 1;
+  rvector_t probs(rows_);
+  #pragma omp parallel for if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_)
+  for (int_t k = 0; k < end; k++)
+    probs[k] = std::real(BaseVector::statevector_[k * stride]);
+  return probs;
+}
+
+template <class statevector_t>
+rvector_t DensityMatrix<statevector_t>::probabilities(const reg_t &qubits) const {
+  const rvector_t diag = probabilities();
+  // Check if all qubits are measured in order
+  bool all_qubits = (qubits.size() == num_qubits_dm_);
+  for (size_t j = 0; all_qubits && j < qubits.size(); j++)
+    all_qubits = (qubits[j] == j);
+  if (all_qubits)
+    return diag;
+  // Sum the diagonal into the marginal distribution of the qubits
+  rvector_t probs(1ULL << qubits.size(), 0.);
+  for (uint_t k = 0; k < rows_; k++) {
+    uint_t outcome = 0;
+    for (size_t j = 0; j < qubits.size(); j++)
+      outcome |= ((k >> qubits[j]) & 1ULL) << j;
+    probs[outcome] += diag[k];
+  }
+  return probs;
+}
+
+template <class statevector_t>
+double DensityMatrix<statevector_t>::expval_pauli(const reg_t &qubits,
+                                   const std::string &pauli) const {
+  // For a Pauli P the only non-zero element of row i is P(i, i ^ x_mask)
+  // with value (-i)^{num_y} * (-1)^{popcount(i & (z_mask | y_mask))}
+  // so Tr[P.rho] = sum_i P(i, i ^ x_mask) * rho(i ^ x_mask, i)
+  uint_t x_mask = 0;
+  uint_t z_mask = 0;
+  uint_t num_y = 0;
+  for (size_t pos = 0; pos < qubits.size(); ++pos) {
+    const uint_t bit = 1ULL << qubits[pos];
+    switch (pauli[pauli.size() - 1 - pos]) {
+      case 'I':
+        break;
+      case 'X':
+        x_mask |= bit;
+        break;
+      case 'Y':
+        x_mask |= bit;
+        z_mask |= bit;
+        num_y++;
+        break;
+      case 'Z':
+        z_mask |= bit;
+        break;
+      default: {
+        std::stringstream msg;
+        msg << "DensityMatrix::invalid Pauli string \'" << pauli[pos] << "\'.";
+        throw std::invalid_argument(msg.str());
+      }
+    }
+  }
+  // Phase (-i)^{num_y}
+  const complex_t phases[4] = {1., complex_t(0., -1.), -1., complex_t(0., 1.)};
+  const complex_t phase = phases[num_y % 4];
+
+  const int_t end = rows_;
+  double val = 0.;
+  #pragma omp parallel for if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_) reduction(+:val)
+  for (int_t i = 0; i < end; i++) {
+    uint_t parity = 0;
+    uint_t zbits = i & z_mask;
+    while (zbits) {
+      parity ^= 1;
+      zbits &= zbits - 1;
+    }
+    const complex_t elt = phase * BaseVector::statevector_[(i ^ x_mask) + rows_ * i];
+    val += (parity) ? -std::real(elt) : std::real(elt);
+  }
+  return val;
+}
+
+//------------------------------------------------------------------------------
+} // end namespace QV
+//------------------------------------------------------------------------------
+#endif
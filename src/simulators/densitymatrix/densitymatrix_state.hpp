@@ -0,0 +1,709 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _densitymatrix_state_hpp
+#define _densitymatrix_state_hpp
+
+#include <algorithm>
+#include <numeric>
+#define _USE_MATH_DEFINES
+#include <math.h>
+
+#include "framework/utils.hpp"
+#include "framework/json.hpp"
+#include "base/state.hpp"
+#include "densitymatrix.hpp"
+
+
+namespace AER {
+namespace DensityMatrix {
+
+// Allowed gates enum class
+enum class Gates {
+  u1, u2, u3, id, x, y, z, h, s, sdg, t, tdg, // single qubit
+  cx, cz, swap, // two qubit
+  ccx // three qubit
+};
+
+// Allowed snapshots enum class
+enum class Snapshots {
+  densitymatrix, cmemory, cregister,
+  probs, probs_var,
+  expval_pauli, expval_pauli_var,
+  expval_matrix, expval_matrix_var
+};
+
+//=========================================================================
+// DensityMatrix State subclass
+//=========================================================================
+
+// A State for simulating mixed states. Noise channels (Kraus ops, resets
+// and superoperators) are applied deterministically so that a noisy
+// circuit only needs to be simulated once, and the measurement outcomes
+// of all shots sampled from the final state.
+
+template <class statevec_t = complex_t*>
+class State : public Base::State<QV::DensityMatrix<statevec_t>> {
+public:
+  using BaseState = Base::State<QV::DensityMatrix<statevec_t>>;
+
+  State() = default;
+  virtual ~State() = default;
+
+  //-----------------------------------------------------------------------
+  // Base class overrides
+  //-----------------------------------------------------------------------
+
+  // Return the set of qobj instruction types supported by the State
+  inline virtual std::unordered_set<Operations::OpType> allowed_ops() const override {
+    return std::unordered_set<Operations::OpType>({
+      Operations::OpType::gate,
+      Operations::OpType::measure,
+      Operations::OpType::reset,
+      Operations::OpType::snapshot,
+      Operations::OpType::barrier,
+      Operations::OpType::bfunc,
+      Operations::OpType::roerror,
+      Operations::OpType::matrix,
+      Operations::OpType::kraus,
+      Operations::OpType::superop
+    });
+  }
+
+  // Return the set of qobj gate instruction names supported by the State
+  inline virtual stringset_t allowed_gates() const override {
+    return {"U", "CX", "u1", "u2", "u3", "cx", "cz", "swap",
+            "id", "x", "y", "z", "h", "s", "sdg", "t", "tdg", "ccx"};
+  }
+
+  // Return the set of qobj snapshot types supported by the State
+  inline virtual stringset_t allowed_snapshots() const override {
+    return {"density_matrix", "memory", "register",
+            "probabilities", "probabilities_with_variance",
+            "expectation_value_pauli", "expectation_value_pauli_with_variance",
+            "expectation_value_matrix", "expectation_value_matrix_with_variance"};
+  }
+
+  // Apply a sequence of operations by looping over list
+  // If the input is not in allowed_ops an exeption will be raised.
+  virtual void apply_ops(const std::vector<Operations::Op> &ops,
+                         OutputData &data,
+                         RngEngine &rng) override;
+
+  // Initializes an n-qubit state to the all |0> state
+  virtual void initialize_qreg(uint_t num_qubits) override;
+
+  // Initializes to a specific n-qubit state
+  virtual void initialize_qreg(uint_t num_qubits,
+                               const QV::DensityMatrix<statevec_t> &state) override;
+
+  // Returns the required memory for storing an n-qubit state in megabytes.
+  // For this state the memory is indepdentent of the number of ops
+  // and is approximately 16 * 1 << 2 * num_qubits bytes
+  virtual uint_t required_memory_mb(uint_t num_qubits,
+                                    const std::vector<Operations::Op> &ops) override;
+
+  // Load the threshold for applying OpenMP parallelization
+  // if the controller/engine allows threads for it
+  virtual void set_config(const json_t &config) override;
+
+  // Sample n-measurement outcomes without applying the measure operation
+  // to the system state. The samples are drawn from the marginal
+  // distribution of the measured qubits
+  virtual std::vector<uint_t> sample_measure(const reg_t& qubits,
+                                             uint_t shots,
+                                             RngEngine &rng) override;
+
+  //-----------------------------------------------------------------------
+  // Additional methods
+  //-----------------------------------------------------------------------
+
+  // Initializes to the pure state of an n-qubit complex std::vector
+  virtual void initialize_qreg(uint_t num_qubits, const cvector_t &state);
+
+  // Initialize OpenMP settings for the underlying DensityMatrix class
+  void initialize_omp();
+
+  // Return the superoperator matrix of the channel implemented by a list
+  // of ops on qubits [0, ..., num_qubits - 1]. The ops may not contain
+  // measurements or classical operations.
+  static cmatrix_t superoperator(const std::vector<Operations::Op> &ops,
+                                 uint_t num_qubits);
+
+protected:
+
+  //-----------------------------------------------------------------------
+  // Apply instructions
+  //-----------------------------------------------------------------------
+
+  // Applies a sypported Gate operation to the state class.
+  // If the input is not in allowed_gates an exeption will be raised.
+  void apply_gate(const Operations::Op &op);
+
+  // Measure qubits and return a list of outcomes [q0, q1, ...]
+  virtual void apply_measure(const reg_t &qubits,
+                             const reg_t &cmemory,
+                             const reg_t &cregister,
+                             RngEngine &rng);
+
+  // Apply a supported snapshot instruction
+  // If the input is not in allowed_snapshots an exeption will be raised.
+  virtual void apply_snapshot(const Operations::Op &op, OutputData &data);
+
+  // Apply a matrix to given qubits (identity on all other qubits)
+  void apply_matrix(const reg_t &qubits, const cmatrix_t & mat);
+
+  // Apply a Kraus channel as its superoperator
+  void apply_kraus(const reg_t &qubits,
+                   const std::vector<cmatrix_t> &krausops);
+
+  //-----------------------------------------------------------------------
+  // Special snapshot types
+  //
+  // IMPORTANT: These methods are not marked const to allow modifying state
+  // during snapshot, but after the snapshot is applied the simulator
+  // should be left in the pre-snapshot state.
+  //-----------------------------------------------------------------------
+
+  // Snapshot current qubit probabilities for a measurement (average)
+  void snapshot_probabilities(const Operations::Op &op,
+                              OutputData &data,
+                              bool variance);
+
+  // Snapshot the expectation value of a Pauli operator
+  void snapshot_pauli_expval(const Operations::Op &op,
+                             OutputData &data,
+                             bool variance);
+
+  // Snapshot the expectation value of a matrix operator
+  void snapshot_matrix_expval(const Operations::Op &op,
+                              OutputData &data,
+                              bool variance);
+
+  //-----------------------------------------------------------------------
+  // Single-qubit gate helpers
+  //-----------------------------------------------------------------------
+
+  // Apply a waltz gate specified by parameters u3(theta, phi, lambda)
+  void apply_gate_u3(const uint_t qubit, const double theta, const double phi,
+                     const double lambda);
+
+  // Optimize phase gate with diagonal [1, phase]
+  void apply_gate_phase(const uint_t qubit, const complex_t phase);
+
+  //-----------------------------------------------------------------------
+  // Config Settings
+  //-----------------------------------------------------------------------
+
+  // OpenMP qubit threshold
+  // NOTE: This is the number of qubits of the vectorized density matrix
+  // which is twice the number of qubits of the state
+  int omp_qubit_threshold_ = 14;
+
+  // Threshold for chopping small values to zero in JSON
+  double json_chop_threshold_ = 1e-15;
+
+  // Table of allowed gate names to gate enum class members
+  const static stringmap_t<Gates> gateset_;
+
+  // Table of allowed snapshot types to enum class members
+  const static stringmap_t<Snapshots> snapshotset_;
+
+};
+
+
+//=========================================================================
+// Implementation: Allowed ops and gateset
+//=========================================================================
+
+template <class statevec_t>
+const stringmap_t<Gates> State<statevec_t>::gateset_({
+  // Single qubit gates
+  {"id", Gates::id},     // Pauli-Identity gate
+  {"x", Gates::x},       // Pauli-X gate
+  {"y", Gates::y},       // Pauli-Y gate
+  {"z", Gates::z},       // Pauli-Z gate
+  {"s", Gates::s},       // Phase gate (aka sqrt(Z) gate)
+  {"sdg", Gates::sdg},   // Conjugate-transpose of Phase gate
+  {"h", Gates::h},       // Hadamard gate (X + Z / sqrt(2))
+  {"t", Gates::t},       // T-gate (sqrt(S))
+  {"tdg", Gates::tdg},   // Conjguate-transpose of T gate
+  // Waltz Gates
+  {"u1", Gates::u1},     // zero-X90 pulse waltz gate
+  {"u2", Gates::u2},     // single-X90 pulse waltz gate
+  {"u3", Gates::u3},     // two X90 pulse waltz gate
+  {"U", Gates::u3},      // two X90 pulse waltz gate
+  // Two-qubit gates
+  {"CX", Gates::cx},     // Controlled-X gate (CNOT)
+  {"cx", Gates::cx},     // Controlled-X gate (CNOT)
+  {"cz", Gates::cz},     // Controlled-Z gate
+  {"swap", Gates::swap}, // SWAP gate
+  // Three-qubit gates
+  {"ccx", Gates::ccx}    // Controlled-CX gate (Toffoli)
+});
+
+
+template <class statevec_t>
+const stringmap_t<Snapshots> State<statevec_t>::snapshotset_({
+  {"density_matrix", Snapshots::densitymatrix},
+  {"probabilities", Snapshots::probs},
+  {"expectation_value_pauli", Snapshots::expval_pauli},
+  {"expectation_value_matrix", Snapshots::expval_matrix},
+  {"probabilities_with_variance", Snapshots::probs_var},
+  {"expectation_value_pauli_with_variance", Snapshots::expval_pauli_var},
+  {"expectation_value_matrix_with_variance", Snapshots::expval_matrix_var},
+  {"memory", Snapshots::cmemory},
+  {"register", Snapshots::cregister}
+});
+
+
+//=========================================================================
+// Implementation: Base class method overrides
+//=========================================================================
+
+//-------------------------------------------------------------------------
+// Initialization
+//-------------------------------------------------------------------------
+
+template <class statevec_t>
+void State<statevec_t>::initialize_qreg(uint_t num_qubits) {
+  initialize_omp();
+  BaseState::qreg_.set_num_qubits(num_qubits);
+  BaseState::qreg_.initialize();
+}
+
+template <class statevec_t>
+void State<statevec_t>::initialize_qreg(uint_t num_qubits,
+                                        const QV::DensityMatrix<statevec_t> &state) {
+  // Check dimension of state
+  if (state.num_qubits() != num_qubits) {
+    throw std::invalid_argument("DensityMatrix::State::initialize: initial state does not match qubit number");
+  }
+  initialize_omp();
+  BaseState::qreg_.set_num_qubits(num_qubits);
+  BaseState::qreg_.initialize_from_matrix(state.vector());
+}
+
+template <class statevec_t>
+void State<statevec_t>::initialize_qreg(uint_t num_qubits,
+                                        const cvector_t &state) {
+  if (state.size() != 1ULL << num_qubits) {
+    throw std::invalid_argument("DensityMatrix::State::initialize: initial state does not match qubit number");
+  }
+  initialize_omp();
+  BaseState::qreg_.set_num_qubits(num_qubits);
+  BaseState::qreg_.initialize_from_vector(state);
+}
+
+template <class statevec_t>
+void State<statevec_t>::initialize_omp() {
+  BaseState::qreg_.set_omp_threshold(omp_qubit_threshold_);
+  if (BaseState::threads_ > 0)
+    BaseState::qreg_.set_omp_threads(BaseState::threads_); // set allowed OMP threads in qubitvector
+}
+
+//-------------------------------------------------------------------------
+// Utility
+//-------------------------------------------------------------------------
+
+template <class statevec_t>
+uint_t State<statevec_t>::required_memory_mb(uint_t num_qubits,
+                                             const std::vector<Operations::Op> &ops) {
+  // An n-qubit density matrix as 4^n complex doubles
+  // where each complex double is 16 bytes
+  (void)ops; // avoid unused variable compiler warning
+  uint_t shift_mb = std::max<int_t>(0, 2 * num_qubits + 4 - 20);
+  uint_t mem_mb = 1ULL << shift_mb;
+  return mem_mb;
+}
+
+template <class statevec_t>
+void State<statevec_t>::set_config(const json_t &config) {
+
+  // Set threshold for truncating snapshots
+  JSON::get_value(json_chop_threshold_, "chop_threshold", config);
+  BaseState::qreg_.set_json_chop_threshold(json_chop_threshold_);
+
+  // Set OMP threshold for state update functions
+  JSON::get_value(omp_qubit_threshold_, "statevector_parallel_threshold", config);
+}
+
+template <class statevec_t>
+cmatrix_t State<statevec_t>::superoperator(const std::vector<Operations::Op> &ops,
+                                           uint_t num_qubits) {
+  for (const auto &op : ops) {
+    switch (op.type) {
+      case Operations::OpType::measure:
+      case Operations::OpType::bfunc:
+      case Operations::OpType::roerror:
+      case Operations::OpType::snapshot:
+        throw std::invalid_argument("DensityMatrix::State::superoperator: invalid instruction \'" +
+                                    op.name + "\'.");
+      default:
+        break;
+    }
+  }
+  // Column j of the superoperator is the vectorized output of the channel
+  // for the input matrix unit with vectorized index j
+  const uint_t dim = 1ULL << (2 * num_qubits);
+  cmatrix_t superop(dim, dim);
+  State<statevec_t> state;
+  OutputData data;
+  RngEngine rng;
+  state.initialize_qreg(num_qubits);
+  for (uint_t j = 0; j < dim; j++) {
+    cvector_t unit(dim, 0.);
+    unit[j] = 1.;
+    state.qreg_.initialize_from_matrix(unit);
+    state.apply_ops(ops, data, rng);
+    for (uint_t i = 0; i < dim; i++)
+      superop(i, j) = state.qreg_[i];
+  }
+  return superop;
+}
+
+
+//=========================================================================
+// Implementation: apply operations
+//=========================================================================
+
+template <class statevec_t>
+void State<statevec_t>::apply_ops(const std::vector<Operations::Op> &ops,
+                                  OutputData &data,
+                                  RngEngine &rng) {
+  // Simple loop over vector of input operations
+  for (const auto &op : ops) {
+    switch (op.type) {
+      case Operations::OpType::barrier:
+        break;
+      case Operations::OpType::reset:
+        BaseState::qreg_.apply_reset(op.qubits);
+        break;
+      case Operations::OpType::measure:
+        apply_measure(op.qubits, op.memory, op.registers, rng);
+        break;
+      case Operations::OpType::bfunc:
+        BaseState::creg_.apply_bfunc(op);
+        break;
+      case Operations::OpType::roerror:
+        BaseState::creg_.apply_roerror(op, rng);
+        break;
+      case Operations::OpType::gate:
+        if (BaseState::creg_.check_conditional(op))
+          apply_gate(op);
+        break;
+      case Operations::OpType::snapshot:
+        apply_snapshot(op, data);
+        break;
+      case Operations::OpType::matrix:
+        apply_matrix(op.qubits, op.mats[0]);
+        break;
+      case Operations::OpType::kraus:
+        apply_kraus(op.qubits, op.mats);
+        break;
+      case Operations::OpType::superop:
+        BaseState::qreg_.apply_superop_matrix(op.qubits,
+                                              Utils::vectorize_matrix(op.mats[0]));
+        break;
+      default:
+        throw std::invalid_argument("DensityMatrix::State::invalid instruction \'" +
+                                    op.name + "\'.");
+    }
+  }
+}
+
+
+//=========================================================================
+// Implementation: Snapshots
+//=========================================================================
+
+template <class statevec_t>
+void State<statevec_t>::apply_snapshot(const Operations::Op &op,
+                                       OutputData &data) {
+
+  // Look for snapshot type in snapshotset
+  auto it = snapshotset_.find(op.name);
+  if (it == snapshotset_.end())
+    throw std::invalid_argument("DensityMatrixState::invalid snapshot instruction \'" +
+                                op.name + "\'.");
+  switch (it -> second) {
+    case Snapshots::densitymatrix:
+      BaseState::snapshot_state(op, data, "density_matrix");
+      break;
+    case Snapshots::cmemory:
+      BaseState::snapshot_creg_memory(op, data);
+      break;
+    case Snapshots::cregister:
+      BaseState::snapshot_creg_register(op, data);
+      break;
+    case Snapshots::probs: {
+      snapshot_probabilities(op, data, false);
+    } break;
+    case Snapshots::expval_pauli: {
+      snapshot_pauli_expval(op, data, false);
+    } break;
+    case Snapshots::expval_matrix: {
+      snapshot_matrix_expval(op, data, false);
+    }  break;
+    case Snapshots::probs_var: {
+      snapshot_probabilities(op, data, true);
+    } break;
+    case Snapshots::expval_pauli_var: {
+      snapshot_pauli_expval(op, data, true);
+    } break;
+    case Snapshots::expval_matrix_var: {
+      snapshot_matrix_expval(op, data, true);
+    }  break;
+    default:
+      // We shouldn't get here unless there is a bug in the snapshotset
+      throw std::invalid_argument("DensityMatrix::State::invalid snapshot instruction \'" +
+                                  op.name + "\'.");
+  }
+}
+
+template <class statevec_t>
+void State<statevec_t>::snapshot_probabilities(const Operations::Op &op,
+                                               OutputData &data,
+                                               bool variance) {
+  // get probs as hexadecimal
+  auto probs = Utils::vec2ket(BaseState::qreg_.probabilities(op.qubits),
+                              json_chop_threshold_, 16);
+  data.add_average_snapshot("probabilities", op.string_params[0],
+                            BaseState::creg_.memory_hex(), probs, variance);
+}
+
+
+template <class statevec_t>
+void State<statevec_t>::snapshot_pauli_expval(const Operations::Op &op,
+                                              OutputData &data,
+                                              bool variance) {
+  // Check empty edge case
+  if (op.params_expval_pauli.empty()) {
+    throw std::invalid_argument("Invalid expval snapshot (Pauli components are empty).");
+  }
+  // Pauli expectation values are computed directly from the matrix
+  // elements so the state does not need to be modified
+  complex_t expval(0., 0.);
+  for (const auto &param : op.params_expval_pauli) {
+    const auto& coeff = param.first;
+    const auto& pauli = param.second;
+    expval += coeff * BaseState::qreg_.expval_pauli(op.qubits, pauli);
+  }
+  // add to snapshot
+  Utils::chop_inplace(expval, json_chop_threshold_);
+  data.add_average_snapshot("expectation_value", op.string_params[0],
+                            BaseState::creg_.memory_hex(), expval, variance);
+}
+
+template <class statevec_t>
+void State<statevec_t>::snapshot_matrix_expval(const Operations::Op &op,
+                                               OutputData &data,
+                                               bool variance) {
+  // Check empty edge case
+  if (op.params_expval_matrix.empty()) {
+    throw std::invalid_argument("Invalid matrix snapshot (components are empty).");
+  }
+
+  // Cache the current quantum state
+  BaseState::qreg_.checkpoint();
+  bool first = true; // flag for first pass so we don't unnecessarily revert from checkpoint
+
+  // Compute expval components
+  complex_t expval(0., 0.);
+  for (const auto &param : op.params_expval_matrix) {
+    complex_t coeff = param.first;
+    // Revert the quantum state to cached checkpoint
+    if (first)
+      first = false;
+    else
+      BaseState::qreg_.revert(true);
+
+    // Apply each matrix component by left multiplication and take the trace
+    for (const auto &pair: param.second) {
+      const reg_t &qubits = pair.first;
+      const cmatrix_t &mat = pair.second;
+      cvector_t vmat = (mat.GetColumns() == 1)
+        ? Utils::vectorize_matrix(Utils::projector(Utils::vectorize_matrix(mat))) // projector case
+        : Utils::vectorize_matrix(mat); // diagonal or square matrix case
+      BaseState::qreg_.apply_left_matrix(qubits, vmat);
+    }
+    expval += coeff * BaseState::qreg_.trace();
+  }
+  // add to snapshot
+  Utils::chop_inplace(expval, json_chop_threshold_);
+  data.add_average_snapshot("expectation_value", op.string_params[0],
+                            BaseState::creg_.memory_hex(), expval, variance);
+  // Revert to original state
+  BaseState::qreg_.revert(false);
+}
+
+
+//=========================================================================
+// Implementation: Matrix multiplication
+//=========================================================================
+
+template <class statevec_t>
+void State<statevec_t>::apply_gate(const Operations::Op &op) {
+  // Look for gate name in gateset
+  auto it = gateset_.find(op.name);
+  if (it == gateset_.end())
+    throw std::invalid_argument("DensityMatrixState::invalid gate instruction \'" +
+                                op.name + "\'.");
+  switch (it -> second) {
+    case Gates::u3:
+      apply_gate_u3(op.qubits[0],
+                    std::real(op.params[0]),
+                    std::real(op.params[1]),
+                    std::real(op.params[2]));
+      break;
+    case Gates::u2:
+      apply_gate_u3(op.qubits[0],
+                    M_PI / 2.,
+                    std::real(op.params[0]),
+                    std::real(op.params[1]));
+      break;
+    case Gates::u1:
+      apply_gate_phase(op.qubits[0], std::exp(complex_t(0., 1.) * op.params[0]));
+      break;
+    case Gates::cx:
+      BaseState::qreg_.apply_cnot(op.qubits[0], op.qubits[1]);
+      break;
+    case Gates::cz:
+      BaseState::qreg_.apply_cz(op.qubits[0], op.qubits[1]);
+      break;
+    case Gates::id:
+      break;
+    case Gates::x:
+      BaseState::qreg_.apply_x(op.qubits[0]);
+      break;
+    case Gates::y:
+      BaseState::qreg_.apply_y(op.qubits[0]);
+      break;
+    case Gates::z:
+      BaseState::qreg_.apply_z(op.qubits[0]);
+      break;
+    case Gates::h:
+      apply_gate_u3(op.qubits[0], M_PI / 2., 0., M_PI);
+      break;
+    case Gates::s:
+      apply_gate_phase(op.qubits[0], complex_t(0., 1.));
+      break;
+    case Gates::sdg:
+      apply_gate_phase(op.qubits[0], complex_t(0., -1.));
+      break;
+    case Gates::t: {
+      const double isqrt2{1. / std::sqrt(2)};
+      apply_gate_phase(op.qubits[0], complex_t(isqrt2, isqrt2));
+    } break;
+    case Gates::tdg: {
+      const double isqrt2{1. / std::sqrt(2)};
+      apply_gate_phase(op.qubits[0], complex_t(isqrt2, -isqrt2));
+    } break;
+    case Gates::swap: {
+      BaseState::qreg_.apply_swap(op.qubits[0], op.qubits[1]);
+    } break;
+    case Gates::ccx:
+      BaseState::qreg_.apply_toffoli(op.qubits[0], op.qubits[1], op.qubits[2]);
+      break;
+    default:
+      // We shouldn't reach here unless there is a bug in gateset
+      throw std::invalid_argument("DensityMatrix::State::invalid gate instruction \'" +
+                                  op.name + "\'.");
+  }
+}
+
+
+template <class statevec_t>
+void State<statevec_t>::apply_matrix(const reg_t &qubits, const cmatrix_t &mat) {
+  if (qubits.empty() == false && mat.size() > 0) {
+    BaseState::qreg_.apply_unitary_matrix(qubits, Utils::vectorize_matrix(mat));
+  }
+}
+
+template <class statevec_t>
+void State<statevec_t>::apply_gate_u3(uint_t qubit, double theta, double phi, double lambda) {
+  BaseState::qreg_.apply_unitary_matrix(reg_t({qubit}),
+                                        Utils::vectorize_matrix(Utils::Matrix::U3(theta, phi, lambda)));
+}
+
+template <class statevec_t>
+void State<statevec_t>::apply_gate_phase(uint_t qubit, complex_t phase) {
+  cvector_t diag = {{1., phase}};
+  BaseState::qreg_.apply_diagonal_unitary_matrix(reg_t({qubit}), diag);
+}
+
+
+//=========================================================================
+// Implementation: Measurement Sampling
+//=========================================================================
+
+template <class statevec_t>
+void State<statevec_t>::apply_measure(const reg_t &qubits,
+                                      const reg_t &cmemory,
+                                      const reg_t &cregister,
+                                      RngEngine &rng) {
+  // Actual measurement outcome
+  rvector_t probs = BaseState::qreg_.probabilities(qubits);
+  const uint_t outcome = rng.rand_int(probs);
+  // Project onto the outcome and renormalize. The diagonal
+  // projector is applied to both the rows and columns so each is
+  // rescaled by 1 / sqrt(p)
+  cvector_t mdiag(1ULL << qubits.size(), 0.);
+  mdiag[outcome] = 1. / std::sqrt(probs[outcome]);
+  BaseState::qreg_.apply_diagonal_unitary_matrix(qubits, mdiag);
+  BaseState::creg_.store_measure(Utils::int2reg(outcome, 2, qubits.size()),
+                                 cmemory, cregister);
+}
+
+template <class statevec_t>
+std::vector<uint_t> State<statevec_t>::sample_measure(const reg_t &qubits,
+                                                      uint_t shots,
+                                                      RngEngine &rng) {
+  // Sample from the marginal distribution of the measured qubits
+  auto cdf = BaseState::qreg_.probabilities(qubits);
+  std::partial_sum(cdf.begin(), cdf.end(), cdf.begin());
+  const uint_t last = cdf.size() - 1;
+  std::vector<uint_t> samples;
+  samples.reserve(shots);
+  for (uint_t i = 0; i < shots; ++i) {
+    const uint_t outcome = std::upper_bound(cdf.begin(), cdf.end(), rng.rand(0, 1)) - cdf.begin();
+    samples.push_back(std::min(outcome, last));
+  }
+  return samples;
+}
+
+
+//=========================================================================
+// Implementation: Kraus Noise
+//=========================================================================
+
+template <class statevec_t>
+void State<statevec_t>::apply_kraus(const reg_t &qubits,
+                                    const std::vector<cmatrix_t> &kmats) {
+  // The superoperator of a Kraus channel is sum_k conj(K_k) (x) K_k
+  // with vectorized element [r' + d * c', r + d * c] = K[r', r] * conj(K[c', c])
+  if (kmats.empty())
+    return;
+  const uint_t dim = 1ULL << qubits.size();
+  const uint_t sdim = dim * dim;
+  cvector_t superop(sdim * sdim, 0.);
+  for (const auto &kmat : kmats)
+    for (uint_t c = 0; c < dim; c++)
+      for (uint_t r = 0; r < dim; r++)
+        for (uint_t cp = 0; cp < dim; cp++)
+          for (uint_t rp = 0; rp < dim; rp++)
+            superop[(rp + dim * cp) + sdim * (r + dim * c)]
+              += kmat(rp, r) * std::conj(kmat(cp, c));
+  BaseState::qreg_.apply_superop_matrix(qubits, superop);
+}
+
+//-------------------------------------------------------------------------
+} // end namespace DensityMatrix
+//-------------------------------------------------------------------------
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
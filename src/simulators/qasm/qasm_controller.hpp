@@ -10,6 +10,9 @@
 
 #include "base/controller.hpp"
 #include "simulators/qubitvector/qv_state.hpp"
+#include "simulators/qubitvector/distributed_qubitvector.hpp"
+#include "simulators/densitymatrix/densitymatrix_state.hpp"
+#include "simulators/stabilizer/stabilizer_state.hpp"
 
 namespace AER {
 namespace Simulator {
@@ -21,6 +24,22 @@ namespace Simulator {
 /**************************************************************************
  * Config settings:
  * 
+ * - "method" (str): Simulation method, one of "automatic", "statevector",
+ *      "density_matrix" or "stabilizer". The automatic method uses the
+ *      stabilizer for circuits on more than "stabilizer_qubit_threshold"
+ *      qubits with noise models containing only Clifford gates, Pauli
+ *      matrices, measure and reset. Otherwise it uses the density matrix
+ *      for circuits with quantum errors in the noise model when the number
+ *      of shots is greater than 2^num_qubits, the number of qubits is at
+ *      most "density_matrix_max_qubits", and the measurements can be
+ *      sampled from the final state. Otherwise it uses the
+ *      statevector [Default: "automatic"]
+ * - "density_matrix_max_qubits" (int): Maximum number of qubits for
+ *      the automatic method to use the density matrix [Default: 12]
+ * - "stabilizer_qubit_threshold" (int): Threshold that the number of qubits
+ *      of a Clifford circuit must be greater than for the automatic method
+ *      to use the stabilizer [Default: 20]
+ *
  * From QubitVector::State class
  * 
  * - "initial_statevector" (json complex vector): Use a custom initial
@@ -33,12 +52,33 @@ namespace Simulator {
  * - "statevector_sample_measure_opt" (int): Threshold that number of qubits
  *      must be greater than to enable indexing optimization during
  *      measure sampling [Default: 10]
+ * - "statevector_sample_measure_marginal" (int): Maximum number of
+ *      measured qubits for measure sampling from the marginal distribution
+ *      of the measured qubits instead of sampling all qubits [Default: 15]
  * - "statevector_hpc_gate_opt" (bool): Enable large qubit gate optimizations.
  *      [Default: False]
+ * - "statevector_blas_threshold" (int): Threshold that the number of qubits
+ *      of a matrix must be greater or equal to for it to be applied using
+ *      BLAS matrix multiplication. Set to 0 to disable [Default: 6]
+ * - "statevector_blas_tile_kb" (int): Size in KB of the amplitude tiles
+ *      multiplied in each BLAS call [Default: 1024]
+ * - "statevector_storage_directory" (str): Directory for storing the
+ *      statevector in a memory-mapped file instead of main memory. This
+ *      should be on fast local storage. If empty main memory is used
+ *      [Default: ""]
+ * - "statevector_chunk_qubits" (int): Number of qubits for the chunks of
+ *      an out-of-core statevector. Runs of gates on qubits below this
+ *      value are applied one chunk at a time. Higher qubits acted on by
+ *      many gates are temporarily swapped into the chunk [Default: 22]
+ * - "statevector_distributed" (bool): Distribute the statevector over all
+ *      MPI processes, each storing 2^(n-k) amplitudes for 2^k processes.
+ *      Requires building with AER_MPI [Default: False]
  * 
  * From BaseController Class
  *
  * - "noise_model" (json): A noise model to use for simulation [Default: null]
+ * - "noise_model_handle" (str): The handle of a cached noise model to use
+ *      for simulation instead of "noise_model" [Default: null]
  * - "max_parallel_threads" (int): Set the maximum OpenMP threads that may
  *      be used across all levels of parallelization. Set to 0 for maximum
  *      available. [Default : 0]
@@ -71,6 +111,17 @@ public:
   // Clear the current config
   void virtual clear_config() override;
 
+  // Set a transport for distributing the statevector over several
+  // processes. If the transport has more than one rank the statevector
+  // is distributed and all ranks must execute the same qobj.
+  void set_transport(const std::shared_ptr<QV::ChunkTransport> &transport);
+
+  // Simulation methods for the Qasm Controller
+  enum class Method {automatic, statevector, density_matrix, stabilizer};
+
+  // Return the simulation method to use for a circuit
+  Method simulation_method(const Circuit &circ, uint_t shots) const;
+
 private:
 
   //-----------------------------------------------------------------------
@@ -85,6 +136,27 @@ private:
                                  uint_t rng_seed,
                                  int num_threads_state) const override;
 
+  // Execute a circuit on the input State class
+  template <class State_t>
+  OutputData run_circuit_state(const Circuit &circ,
+                               uint_t shots,
+                               uint_t rng_seed,
+                               int num_threads_state,
+                               State_t &state) const;
+
+  // Execute a circuit on a density matrix State. Quantum errors in the
+  // noise model are applied as their average channel so the measurement
+  // outcomes of all shots can be sampled from a single simulation.
+  OutputData run_circuit_state(const Circuit &circ,
+                               uint_t shots,
+                               uint_t rng_seed,
+                               int num_threads_state,
+                               DensityMatrix::State<> &state) const;
+
+  // Return true if the circuit and all its noise realizations can be
+  // simulated with the stabilizer method
+  bool validate_stabilizer(const Circuit &circ) const;
+
   //----------------------------------------------------------------
   // Run circuit without optimization
   //----------------------------------------------------------------
@@ -102,17 +174,20 @@ private:
   //----------------------------------------------------------------
   
   // Execute n-shots of a circuit performing measurement sampling
-  // if the input circuit supports it
+  // if the input circuit supports it. If channels_deterministic is true
+  // the state applies resets and Kraus errors without sampling.
   template <class State_t>
   void run_circuit_measure_sampler(const Circuit &circ,
                                    uint_t shots,
                                    State_t &state,
                                    OutputData &data,
-                                   RngEngine &rng) const;
+                                   RngEngine &rng,
+                                   bool channels_deterministic = false) const;
 
 
   // Sample measurement outcomes for the input measure ops from the
-  // current state of the input State_t
+  // current state of the input State_t. Readout error ops in the input
+  // ops are applied to the sampled outcomes.
   template <class State_t>
   void measure_sampler(const std::vector<Operations::Op> &meas_ops,
                        uint_t shots,
@@ -120,15 +195,43 @@ private:
                        OutputData &data,
                        RngEngine &rng) const;
 
-  // Check if measure sampling optimization if valid for the input circuit
-  // if so return a pair {true, pos} where pos is the position of the
-  // first measurement operation in the input circuit
-  std::pair<bool, size_t> check_measure_sampling_opt(const Circuit &circ) const;
+  // Check if measure sampling optimization if valid for the input circuit.
+  // If so return true and split the circuit ops into the ops to be applied
+  // once to the state, and the measure and readout error ops to be sampled.
+  // Measurements that commute with all later ops are moved to the end of
+  // the circuit and barriers after a measurement are removed.
+  // Resets and Kraus errors prevent sampling unless channels_deterministic
+  // is true.
+  bool check_measure_sampling_opt(const Circuit &circ,
+                                  std::vector<Operations::Op> &state_ops,
+                                  std::vector<Operations::Op> &meas_ops,
+                                  bool channels_deterministic = false) const;
   
   //-----------------------------------------------------------------------
   // Custom initial state
   //-----------------------------------------------------------------------        
   cvector_t initial_state_;
+
+  //-----------------------------------------------------------------------
+  // Simulation method
+  //-----------------------------------------------------------------------
+  Method method_ = Method::automatic;
+
+  // Maximum number of qubits for automatic density matrix simulation
+  uint_t density_matrix_max_qubits_ = 12;
+
+  // Qubit threshold for automatic stabilizer simulation of Clifford circuits
+  uint_t stabilizer_qubit_threshold_ = 20;
+
+  //-----------------------------------------------------------------------
+  // Distributed statevector
+  //-----------------------------------------------------------------------
+  std::shared_ptr<QV::ChunkTransport> transport_;
+
+  // Return true if the statevector is distributed over several ranks
+  inline bool distributed() const {
+    return transport_ && transport_->num_ranks() > 1;
+  }
 };
 
 //=========================================================================
@@ -148,11 +251,52 @@ void QasmController::set_config(const json_t &config) {
     if (!Utils::is_unit_vector(initial_state_, 1e-10))
       throw std::runtime_error("QasmController: initial_statevector is not a unit vector");
   }
+  // Simulation method
+  std::string method;
+  if (JSON::get_value(method, "method", config)) {
+    if (method == "automatic") {
+      method_ = Method::automatic;
+    } else if (method == "statevector") {
+      method_ = Method::statevector;
+    } else if (method == "density_matrix") {
+      method_ = Method::density_matrix;
+    } else if (method == "stabilizer") {
+      method_ = Method::stabilizer;
+    } else {
+      throw std::invalid_argument("QasmController: invalid simulation method \"" +
+                                  method + "\".");
+    }
+  }
+  JSON::get_value(density_matrix_max_qubits_, "density_matrix_max_qubits", config);
+  JSON::get_value(stabilizer_qubit_threshold_, "stabilizer_qubit_threshold", config);
+  // Distributed statevector
+  bool dist = false;
+  JSON::get_value(dist, "statevector_distributed", config);
+  if (dist && !transport_) {
+#ifdef AER_MPI
+    set_transport(std::make_shared<QV::MPITransport>());
+#else
+    throw std::invalid_argument("QasmController: statevector_distributed requires"
+                                " building with MPI support (AER_MPI).");
+#endif
+  }
+  // Ranks execute circuits and shots in the same order
+  if (distributed()) {
+    Base::Controller::max_threads_circuit_ = 1;
+    Base::Controller::max_threads_shot_ = 1;
+  }
 }
 
 void QasmController::clear_config() {
   Base::Controller::clear_config();
   initial_state_ = cvector_t();
+  method_ = Method::automatic;
+  density_matrix_max_qubits_ = 12;
+  stabilizer_qubit_threshold_ = 20;
+}
+
+void QasmController::set_transport(const std::shared_ptr<QV::ChunkTransport> &transport) {
+  transport_ = transport;
 }
 
 //-------------------------------------------------------------------------
@@ -163,11 +307,31 @@ OutputData QasmController::run_circuit(const Circuit &circ,
                                       uint_t shots,
                                       uint_t rng_seed,
                                       int num_threads_state) const {  
+  const Method method = simulation_method(circ, shots);
+  if (method == Method::density_matrix) {
+    if (distributed()) {
+      throw std::invalid_argument("QasmController: the density_matrix method"
+                                  " cannot be distributed.");
+    }
+    DensityMatrix::State<> state;
+    state.validate_circuit_except(circ);
+  } else if (method == Method::stabilizer) {
+    if (distributed() || !initial_state_.empty()) {
+      throw std::invalid_argument("QasmController: the stabilizer method"
+                                  " cannot be distributed or use an"
+                                  " initial_statevector.");
+    }
+    if (validate_stabilizer(circ) == false) {
+      // throw exception listing the invalid instructions
+      Stabilizer::State<> state;
+      state.validate_circuit_except(circ);
+      state.validate_circuit_except(noise_model_.noise_ops_circuit(circ));
+    }
+  }
   // Check if circuit can run on a statevector simulator
   // TODO: Should we make validate circuit a static method of the class?
-  bool statevec_valid = QubitVector::State<>().validate_circuit(circ);  
-  // throw exception listing the invalid instructions
-  if (statevec_valid == false) {
+  else if (QubitVector::State<>().validate_circuit(circ) == false) {
+    // throw exception listing the invalid instructions
     QubitVector::State<>().validate_circuit_except(circ);
   }
 
@@ -182,8 +346,40 @@ OutputData QasmController::run_circuit(const Circuit &circ,
     }
   }
 
-  // Initialize statevector
+  // Stabilizer
+  if (method == Method::stabilizer) {
+    Stabilizer::State<> state;
+    return run_circuit_state(circ, shots, rng_seed, num_threads_state, state);
+  }
+
+  // Density matrix
+  if (method == Method::density_matrix) {
+    DensityMatrix::State<> state;
+    return run_circuit_state(circ, shots, rng_seed, num_threads_state, state);
+  }
+
+  // Distributed statevector
+  if (distributed()) {
+    // All ranks must sample the same random numbers so the seed of rank 0
+    // is used on all ranks
+    std::vector<double> seed = {(transport_->rank() == 0) ? double(rng_seed) : 0.};
+    transport_->allreduce_sum(seed);
+    QubitVector::State<QV::DistributedChunk> state;
+    state.set_transport(transport_);
+    return run_circuit_state(circ, shots, static_cast<uint_t>(seed[0]),
+                             num_threads_state, state);
+  }
   QubitVector::State<> state;
+  return run_circuit_state(circ, shots, rng_seed, num_threads_state, state);
+}
+
+template <class State_t>
+OutputData QasmController::run_circuit_state(const Circuit &circ,
+                                             uint_t shots,
+                                             uint_t rng_seed,
+                                             int num_threads_state,
+                                             State_t &state) const {
+  // Initialize statevector
   state.set_config(Base::Controller::config_);
   state.set_available_threads(num_threads_state);
   
@@ -199,16 +395,94 @@ OutputData QasmController::run_circuit(const Circuit &circ,
   if (noise_model_.ideal()) {
     // Implement without noise
     run_circuit_measure_sampler(circ, shots, state, data, rng);
+  } else if (!noise_model_.has_quantum_errors()) {
+    // Readout errors only add roerror ops after measurements so a single
+    // noisy circuit can still use measure sampling
+    Circuit noise_circ = noise_model_.sample_noise(circ, rng);
+    run_circuit_measure_sampler(noise_circ, shots, state, data, rng);
   } else {
-    // Sample noise for each shot
+    // Resolve the noise model for the circuit ops once, then sample
+    // noise for each shot
+    const auto noise_circ_compiled = noise_model_.compile_circuit(circ);
     while (shots-- > 0) {
-      Circuit noise_circ = noise_model_.sample_noise(circ, rng);
+      Circuit noise_circ = noise_model_.sample_noise(noise_circ_compiled, rng);
       run_circuit_default(noise_circ, 1, state, data, rng);
     }
   }
   return data;
 }
 
+OutputData QasmController::run_circuit_state(const Circuit &circ,
+                                             uint_t shots,
+                                             uint_t rng_seed,
+                                             int num_threads_state,
+                                             DensityMatrix::State<> &state) const {
+  // Initialize density matrix
+  state.set_config(Base::Controller::config_);
+  state.set_available_threads(num_threads_state);
+
+  // Rng engine
+  RngEngine rng;
+  rng.set_seed(rng_seed);
+
+  // Output data container
+  OutputData data;
+  data.set_config(Base::Controller::config_);
+
+  // Quantum errors are replaced by their average channel so the noisy
+  // circuit only needs to be simulated once
+  if (noise_model_.has_quantum_errors()) {
+    const auto superop = [](const std::vector<Operations::Op> &ops, uint_t num_qubits) {
+      return DensityMatrix::State<>::superoperator(ops, num_qubits);
+    };
+    Circuit noise_circ = noise_model_.channel_circuit(circ, superop);
+    run_circuit_measure_sampler(noise_circ, shots, state, data, rng, true);
+  } else if (!noise_model_.ideal()) {
+    Circuit noise_circ = noise_model_.sample_noise(circ, rng);
+    run_circuit_measure_sampler(noise_circ, shots, state, data, rng, true);
+  } else {
+    run_circuit_measure_sampler(circ, shots, state, data, rng, true);
+  }
+  return data;
+}
+
+QasmController::Method
+QasmController::simulation_method(const Circuit &circ, uint_t shots) const {
+  if (method_ != Method::automatic)
+    return method_;
+  // Clifford circuits are simulated in polynomial time on a stabilizer
+  // tableau, which also allows circuits on hundreds of qubits. Small
+  // circuits are cheap on the statevector so keep using it below the
+  // threshold.
+  if (circ.num_qubits > stabilizer_qubit_threshold_ && !distributed() &&
+      initial_state_.empty() && validate_stabilizer(circ))
+    return Method::stabilizer;
+  // Sampling a noisy statevector costs O(2^n) per shot while the average
+  // noisy channel costs O(4^n) once, so the density matrix is used for
+  // noisy circuits with more shots than statevector amplitudes
+  if (distributed() || !noise_model_.has_quantum_errors())
+    return Method::statevector;
+  if (circ.num_qubits > density_matrix_max_qubits_ ||
+      shots <= (1ULL << circ.num_qubits))
+    return Method::statevector;
+  // Without measure sampling every shot would evolve the density matrix
+  std::vector<Operations::Op> ops, meas_ops;
+  if (check_measure_sampling_opt(circ, ops, meas_ops, true) == false)
+    return Method::statevector;
+  if (DensityMatrix::State<>().validate_circuit(circ) == false)
+    return Method::statevector;
+  return Method::density_matrix;
+}
+
+
+bool QasmController::validate_stabilizer(const Circuit &circ) const {
+  Stabilizer::State<> state;
+  if (state.validate_circuit(circ) == false)
+    return false;
+  return noise_model_.ideal() ||
+         state.validate_circuit(noise_model_.noise_ops_circuit(circ));
+}
+
 
 //-------------------------------------------------------------------------
 // Run circuit helpers
@@ -237,18 +511,19 @@ void QasmController::run_circuit_measure_sampler(const Circuit &circ,
                                                  uint_t shots,
                                                  State_t &state,
                                                  OutputData &data,
-                                                 RngEngine &rng) const {
+                                                 RngEngine &rng,
+                                                 bool channels_deterministic) const {
   // Check if optimization is valid
-  auto check = check_measure_sampling_opt(circ);
+  std::vector<Operations::Op> ops, meas_ops;
+  bool check = check_measure_sampling_opt(circ, ops, meas_ops,
+                                          channels_deterministic);
   // Perform standard execution if we cannot apply the optimization
   // or the execution is only for a single shot
-  if (shots == 1 || check.first == false) {
+  if (shots == 1 || check == false) {
     run_circuit_default(circ, shots, state, data, rng);
     return;
-  } 
-  auto pos = check.second; // Position of first measurement op
-  // Run circuit instructions before first measure
-  std::vector<Operations::Op> ops(circ.ops.begin(), circ.ops.begin() + pos);
+  }
+  // Run circuit instructions that are not sampled
   if (initial_state_.empty())
     state.initialize_qreg(circ.num_qubits);
   else
@@ -256,9 +531,8 @@ void QasmController::run_circuit_measure_sampler(const Circuit &circ,
   state.initialize_creg(circ.num_memory, circ.num_registers);
   state.apply_ops(ops, data, rng);
 
-  // Get measurement operations and set of measured qubits
-  ops = std::vector<Operations::Op>(circ.ops.begin() + pos, circ.ops.end());
-  measure_sampler(ops, shots, state, data, rng);
+  // Sample the measurement operations
+  measure_sampler(meas_ops, shots, state, data, rng);
 }
 
 
@@ -266,34 +540,68 @@ void QasmController::run_circuit_measure_sampler(const Circuit &circ,
 // Measure sampling optimization
 //-------------------------------------------------------------------------
 
-std::pair<bool, size_t> 
-QasmController::check_measure_sampling_opt(const Circuit &circ) const {
-  // Find first instance of a measurement and check there
-  // are no reset operations before the measurement
-  auto start = circ.ops.begin();
-  while (start != circ.ops.end()) {
-    const auto type = start->type;
-    if (type == Operations::OpType::reset ||
-        type == Operations::OpType::kraus ||
-        type == Operations::OpType::roerror) {
-      return std::make_pair(false, 0);
-    }
-    if (type == Operations::OpType::measure)
-      break;
-    ++start;
-  }
-  // Record position for if optimization passes
-  auto start_meas = start;
-  // Check all remaining operations are measurements
-  while (start != circ.ops.end()) {
-    if (start->type != Operations::OpType::measure) {
-      return std::make_pair(false, 0);
+bool QasmController::check_measure_sampling_opt(const Circuit &circ,
+                                                std::vector<Operations::Op> &state_ops,
+                                                std::vector<Operations::Op> &meas_ops,
+                                                bool channels_deterministic) const {
+  state_ops.clear();
+  meas_ops.clear();
+  // Qubits that have been measured. Later ops commute with the
+  // measurements if they do not act on these qubits.
+  std::unordered_set<uint_t> meas_qubits;
+  for (const auto &op : circ.ops) {
+    switch (op.type) {
+      case Operations::OpType::measure:
+        meas_ops.push_back(op);
+        meas_qubits.insert(op.qubits.begin(), op.qubits.end());
+        break;
+      // Readout errors are applied to the sampled measurement outcomes
+      case Operations::OpType::roerror:
+        if (meas_ops.empty())
+          return false;
+        meas_ops.push_back(op);
+        break;
+      // Barriers have no effect once measurements are moved to the end
+      case Operations::OpType::barrier:
+        if (meas_ops.empty())
+          state_ops.push_back(op);
+        break;
+      // Snapshots after a measurement depend on the measurement outcome of
+      // each shot, and classical functions on the sampled classical bits
+      case Operations::OpType::snapshot:
+      case Operations::OpType::bfunc:
+        if (!meas_ops.empty())
+          return false;
+        state_ops.push_back(op);
+        break;
+      // Resets and Kraus errors prevent sampling unless they are applied
+      // deterministically, in which case they are treated as any other op
+      case Operations::OpType::reset:
+      case Operations::OpType::kraus:
+        if (!channels_deterministic)
+          return false;
+        // fall through
+      default:
+        // Ops after a measurement must not be conditional or act on any
+        // measured qubits
+        if (!meas_ops.empty()) {
+          if (op.conditional || op.old_conditional)
+            return false;
+          for (const auto &qubit : op.qubits) {
+            if (meas_qubits.find(qubit) != meas_qubits.end())
+              return false;
+          }
+        }
+        state_ops.push_back(op);
+        break;
     }
-    ++start;
   }
+  // Sampled outcomes are stored as integers so at most 64 qubits can
+  // be measured
+  if (meas_qubits.size() > 64)
+    return false;
   // If we made it this far we can apply the optimization
-  size_t meas_pos = start_meas - circ.ops.begin();
-  return std::make_pair(true, meas_pos);
+  return true;
 }
 
 
@@ -327,16 +635,21 @@ void QasmController::measure_sampler(const std::vector<Operations::Op> &meas_ops
       qubit_map[meas_qubits[j]] = j;
   }
 
-  // Maps of memory and register to qubit position
-  std::unordered_map<uint_t, uint_t> memory_map;
-  std::unordered_map<uint_t, uint_t> register_map;
-  for (const auto &op : meas_ops) {
+  // Position of the sampled bit for each memory and register bit written
+  // by the measure ops, in op order so that readout errors are applied
+  // to the bits measured before them
+  std::vector<std::vector<std::pair<uint_t, uint_t>>> memory_pos(meas_ops.size());
+  std::vector<std::vector<std::pair<uint_t, uint_t>>> register_pos(meas_ops.size());
+  for (size_t i=0; i < meas_ops.size(); ++i) {
+    const auto &op = meas_ops[i];
+    if (op.type != Operations::OpType::measure)
+      continue;
     for (size_t j=0; j < op.qubits.size(); ++j) {
       auto pos = qubit_map[op.qubits[j]];
       if (!op.memory.empty())
-        memory_map[op.memory[j]] = pos;
+        memory_pos[i].push_back({op.memory[j], pos});
       if (!op.registers.empty())
-        register_map[op.registers[j]] = pos;
+        register_pos[i].push_back({op.registers[j], pos});
     }
   }
 
@@ -349,19 +662,23 @@ void QasmController::measure_sampler(const std::vector<Operations::Op> &meas_ops
     auto sample = all_samples.back();
     creg.initialize(meas_circ.num_memory, meas_circ.num_registers);
 
-    // process memory bit measurements
-    for (const auto &pair : memory_map) {
-      creg.store_measure(reg_t({sample[pair.second]}), reg_t({pair.first}), reg_t());
-    }
-    auto memory = creg.memory_hex();
-    data.add_memory_count(memory);
-    data.add_memory_singleshot(memory);
-
-    // process register bit measurements
-    for (const auto &pair : register_map) {
-      creg.store_measure(reg_t({sample[pair.second]}), reg_t(), reg_t({pair.first}));
+    for (size_t i=0; i < meas_ops.size(); ++i) {
+      if (meas_ops[i].type == Operations::OpType::roerror) {
+        // apply readout error to the sampled classical bits
+        creg.apply_roerror(meas_ops[i], rng);
+        continue;
+      }
+      // process memory bit measurements
+      for (const auto &pair : memory_pos[i]) {
+        creg.set_memory_bit(pair.first, (sample >> pair.second) & 1ULL);
+      }
+      // process register bit measurements
+      for (const auto &pair : register_pos[i]) {
+        creg.set_register_bit(pair.first, (sample >> pair.second) & 1ULL);
+      }
     }
-    data.add_register_singleshot(creg.register_hex());
+    data.add_memory(creg);
+    data.add_register(creg);
 
     // pop off processed sample
     all_samples.pop_back();
@@ -0,0 +1,510 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _qv_chunk_transport_hpp_
+#define _qv_chunk_transport_hpp_
+
+#include <algorithm>
+#include <chrono>
+#include <climits>
+#include <complex>
+#include <condition_variable>
+#include <cstring>
+#include <memory>
+#include <mutex>
+#include <sstream>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+#ifndef _WIN32
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <netinet/tcp.h>
+#include <sys/socket.h>
+#include <unistd.h>
+#include <cerrno>
+#endif
+
+#ifdef AER_MPI
+#include <mpi.h>
+#endif
+
+#include "indexing.hpp"
+
+namespace QV {
+
+using complex_t = std::complex<double>;
+
+//============================================================================
+// ChunkTransport class
+//============================================================================
+
+// Abstract interface for exchanging statevector chunks between the
+// processes of a distributed QubitVector.
+// All methods are collective: every rank must call them in the same order.
+
+class ChunkTransport {
+public:
+  virtual ~ChunkTransport() = default;
+
+  // Return the rank of the current process
+  virtual int rank() const = 0;
+
+  // Return the total number of ranks. This must be a power of 2.
+  virtual int num_ranks() const = 0;
+
+  // Send count amplitudes to the partner rank and receive count amplitudes
+  // from the partner rank.
+  virtual void exchange(int partner, const complex_t *send, complex_t *recv,
+                        Indexing::uint_t count) = 0;
+
+  // Replace data with its elementwise sum over all ranks
+  virtual void allreduce_sum(std::vector<double> &data) = 0;
+
+  // Gather count amplitudes from each rank into recv on rank 0 ordered by
+  // rank. On rank 0 recv must have space for count * num_ranks() amplitudes.
+  // On other ranks recv is not used.
+  virtual void gather(const complex_t *send, Indexing::uint_t count,
+                      complex_t *recv) = 0;
+};
+
+//============================================================================
+// ThreadTransport class
+//============================================================================
+
+// In-process transport where each rank is a thread of the same process.
+// This is intended for testing distributed execution on a single machine.
+// The ranks are created together by the static `create` method.
+
+class ThreadTransport : public ChunkTransport {
+public:
+
+  // Return a transport object for each of the num_ranks ranks
+  static std::vector<std::shared_ptr<ChunkTransport>> create(int num_ranks);
+
+  virtual int rank() const override {return rank_;}
+  virtual int num_ranks() const override {return shared_->num_ranks;}
+
+  virtual void exchange(int partner, const complex_t *send, complex_t *recv,
+                        Indexing::uint_t count) override;
+
+  virtual void allreduce_sum(std::vector<double> &data) override;
+
+  virtual void gather(const complex_t *send, Indexing::uint_t count,
+                      complex_t *recv) override;
+
+protected:
+
+  // State shared between all ranks
+  struct Shared {
+    int num_ranks;
+    std::vector<const void*> buffers;  // posted buffer for each rank
+    std::mutex mutex;
+    std::condition_variable cv;
+    int waiting = 0;
+    Indexing::uint_t generation = 0;
+  };
+
+  ThreadTransport(int rank, std::shared_ptr<Shared> shared)
+    : rank_(rank), shared_(shared) {}
+
+  // Block until all ranks have reached the barrier
+  void barrier();
+
+  int rank_;
+  std::shared_ptr<Shared> shared_;
+};
+
+//============================================================================
+// MPITransport class
+//============================================================================
+
+#ifdef AER_MPI
+
+// Transport using MPI point-to-point and collective communication.
+// MPI must be initialized before the transport is used.
+
+class MPITransport : public ChunkTransport {
+public:
+  MPITransport(MPI_Comm comm = MPI_COMM_WORLD);
+
+  virtual int rank() const override {return rank_;}
+  virtual int num_ranks() const override {return num_ranks_;}
+
+  virtual void exchange(int partner, const complex_t *send, complex_t *recv,
+                        Indexing::uint_t count) override;
+
+  virtual void allreduce_sum(std::vector<double> &data) override;
+
+  virtual void gather(const complex_t *send, Indexing::uint_t count,
+                      complex_t *recv) override;
+
+protected:
+  MPI_Comm comm_;
+  int rank_;
+  int num_ranks_;
+};
+
+#endif
+
+//============================================================================
+// SocketTransport class
+//============================================================================
+
+#ifndef _WIN32
+
+// Transport where each rank is a separate process on the same machine.
+// Every pair of ranks is connected by a TCP socket on localhost, where
+// rank r listens on port base_port + r. This allows distributed execution
+// on a single machine without MPI.
+
+class SocketTransport : public ChunkTransport {
+public:
+
+  // Connect to all other ranks. This blocks until every rank has
+  // constructed its transport, or throws after timeout seconds.
+  SocketTransport(int rank, int num_ranks, int base_port, double timeout = 60.);
+  ~SocketTransport();
+  SocketTransport(const SocketTransport& obj) = delete;
+  SocketTransport &operator=(const SocketTransport& obj) = delete;
+
+  virtual int rank() const override {return rank_;}
+  virtual int num_ranks() const override {return num_ranks_;}
+
+  virtual void exchange(int partner, const complex_t *send, complex_t *recv,
+                        Indexing::uint_t count) override;
+
+  virtual void allreduce_sum(std::vector<double> &data) override;
+
+  virtual void gather(const complex_t *send, Indexing::uint_t count,
+                      complex_t *recv) override;
+
+protected:
+
+  // Blocking send and receive of a buffer to and from another rank
+  void send_all(int partner, const void *data, size_t bytes);
+  void recv_all(int partner, void *data, size_t bytes);
+
+  // Close all sockets
+  void close_all();
+
+  int rank_;
+  int num_ranks_;
+  std::vector<int> sockets_; // socket connected to each rank (-1 for this rank)
+};
+
+#endif
+
+/*******************************************************************************
+ *
+ * Implementations
+ *
+ ******************************************************************************/
+
+//------------------------------------------------------------------------------
+// ThreadTransport
+//------------------------------------------------------------------------------
+
+inline std::vector<std::shared_ptr<ChunkTransport>>
+ThreadTransport::create(int num_ranks) {
+  if (num_ranks < 1 || (num_ranks & (num_ranks - 1)) != 0)
+    throw std::invalid_argument("ThreadTransport: number of ranks must be a power of 2");
+  auto shared = std::make_shared<Shared>();
+  shared->num_ranks = num_ranks;
+  shared->buffers.resize(num_ranks, nullptr);
+  std::vector<std::shared_ptr<ChunkTransport>> ranks;
+  for (int j = 0; j < num_ranks; j++)
+    ranks.push_back(std::shared_ptr<ChunkTransport>(new ThreadTransport(j, shared)));
+  return ranks;
+}
+
+inline void ThreadTransport::barrier() {
+  std::unique_lock<std::mutex> lock(shared_->mutex);
+  const auto generation = shared_->generation;
+  if (++shared_->waiting == shared_->num_ranks) {
+    shared_->waiting = 0;
+    shared_->generation++;
+    shared_->cv.notify_all();
+  } else {
+    shared_->cv.wait(lock, [&]() {return shared_->generation != generation;});
+  }
+}
+
+inline void ThreadTransport::exchange(int partner, const complex_t *send,
+                                      complex_t *recv, Indexing::uint_t count) {
+  // Post send buffer, copy from partner's buffer, and wait until all
+  // ranks have finished reading before buffers may be reused
+  shared_->buffers[rank_] = send;
+  barrier();
+  const auto src = static_cast<const complex_t*>(shared_->buffers[partner]);
+  std::copy(src, src + count, recv);
+  barrier();
+}
+
+inline void ThreadTransport::allreduce_sum(std::vector<double> &data) {
+  const std::vector<double> local = data;
+  shared_->buffers[rank_] = &local;
+  barrier();
+  std::fill(data.begin(), data.end(), 0.);
+  for (int j = 0; j < shared_->num_ranks; j++) {
+    const auto &other = *static_cast<const std::vector<double>*>(shared_->buffers[j]);
+    for (size_t i = 0; i < data.size(); i++)
+      data[i] += other[i];
+  }
+  barrier();
+}
+
+inline void ThreadTransport::gather(const complex_t *send,
+                                    Indexing::uint_t count,
+                                    complex_t *recv) {
+  shared_->buffers[rank_] = send;
+  barrier();
+  if (rank_ == 0) {
+    for (int j = 0; j < shared_->num_ranks; j++) {
+      const auto src = static_cast<const complex_t*>(shared_->buffers[j]);
+      std::copy(src, src + count, recv + j * count);
+    }
+  }
+  barrier();
+}
+
+//------------------------------------------------------------------------------
+// MPITransport
+//------------------------------------------------------------------------------
+
+#ifdef AER_MPI
+
+inline MPITransport::MPITransport(MPI_Comm comm) : comm_(comm) {
+  int initialized;
+  MPI_Initialized(&initialized);
+  if (!initialized)
+    throw std::runtime_error("MPITransport: MPI has not been initialized");
+  MPI_Comm_rank(comm_, &rank_);
+  MPI_Comm_size(comm_, &num_ranks_);
+  if ((num_ranks_ & (num_ranks_ - 1)) != 0)
+    throw std::invalid_argument("MPITransport: number of MPI ranks must be a power of 2");
+}
+
+inline void MPITransport::exchange(int partner, const complex_t *send,
+                                   complex_t *recv, Indexing::uint_t count) {
+  // MPI counts are int so large chunks are sent in pieces
+  const Indexing::uint_t max_count = INT_MAX;
+  for (Indexing::uint_t pos = 0; pos < count; pos += max_count) {
+    const int n = static_cast<int>(std::min(max_count, count - pos));
+    MPI_Sendrecv(send + pos, n, MPI_C_DOUBLE_COMPLEX, partner, 0,
+                 recv + pos, n, MPI_C_DOUBLE_COMPLEX, partner, 0,
+                 comm_, MPI_STATUS_IGNORE);
+  }
+}
+
+inline void MPITransport::allreduce_sum(std::vector<double> &data) {
+  MPI_Allreduce(MPI_IN_PLACE, data.data(), static_cast<int>(data.size()),
+                MPI_DOUBLE, MPI_SUM, comm_);
+}
+
+inline void MPITransport::gather(const complex_t *send,
+                                 Indexing::uint_t count,
+                                 complex_t *recv) {
+  if (count > INT_MAX)
+    throw std::runtime_error("MPITransport: gather chunk is too large");
+  MPI_Gather(send, static_cast<int>(count), MPI_C_DOUBLE_COMPLEX,
+             recv, static_cast<int>(count), MPI_C_DOUBLE_COMPLEX, 0, comm_);
+}
+
+#endif
+
+//------------------------------------------------------------------------------
+// SocketTransport
+//------------------------------------------------------------------------------
+
+#ifndef _WIN32
+
+inline SocketTransport::SocketTransport(int rank, int num_ranks, int base_port,
+                                        double timeout)
+  : rank_(rank), num_ranks_(num_ranks), sockets_(num_ranks, -1) {
+  if (num_ranks < 1 || (num_ranks & (num_ranks - 1)) != 0)
+    throw std::invalid_argument("SocketTransport: number of ranks must be a power of 2");
+  if (rank < 0 || rank >= num_ranks)
+    throw std::invalid_argument("SocketTransport: invalid rank");
+
+  auto address = [](int port) {
+    sockaddr_in addr;
+    std::memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_port = htons(static_cast<uint16_t>(port));
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    return addr;
+  };
+  auto error = [](const std::string &msg, int port) {
+    std::stringstream ss;
+    ss << "SocketTransport: " << msg << " (port " << port << ": "
+       << std::strerror(errno) << ")";
+    return std::runtime_error(ss.str());
+  };
+
+  int listener = -1;
+  try {
+    // Higher ranks connect to this rank's listening socket
+    if (rank_ < num_ranks_ - 1) {
+      listener = socket(AF_INET, SOCK_STREAM, 0);
+      const int on = 1;
+      setsockopt(listener, SOL_SOCKET, SO_REUSEADDR, &on, sizeof(on));
+      const auto addr = address(base_port + rank_);
+      if (listener < 0 ||
+          bind(listener, reinterpret_cast<const sockaddr*>(&addr), sizeof(addr)) != 0 ||
+          listen(listener, num_ranks_) != 0)
+        throw error("unable to listen", base_port + rank_);
+    }
+    // Connect to lower ranks, retrying until they are listening
+    const auto deadline = std::chrono::steady_clock::now() +
+                          std::chrono::duration<double>(timeout);
+    for (int j = 0; j < rank_; j++) {
+      const auto addr = address(base_port + j);
+      while (true) {
+        sockets_[j] = socket(AF_INET, SOCK_STREAM, 0);
+        if (sockets_[j] < 0)
+          throw error("unable to create socket", base_port + j);
+        if (connect(sockets_[j], reinterpret_cast<const sockaddr*>(&addr), sizeof(addr)) == 0)
+          break;
+        close(sockets_[j]);
+        sockets_[j] = -1;
+        if (std::chrono::steady_clock::now() > deadline)
+          throw error("unable to connect", base_port + j);
+        std::this_thread::sleep_for(std::chrono::milliseconds(10));
+      }
+      const int32_t id = rank_;
+      send_all(j, &id, sizeof(id));
+    }
+    // Accept connections from higher ranks
+    for (int j = rank_ + 1; j < num_ranks_; j++) {
+      const int sock = accept(listener, nullptr, nullptr);
+      if (sock < 0)
+        throw error("unable to accept connection", base_port + rank_);
+      int32_t id = -1;
+      size_t pos = 0;
+      while (pos < sizeof(id)) {
+        const auto n = recv(sock, reinterpret_cast<char*>(&id) + pos, sizeof(id) - pos, 0);
+        if (n <= 0) {
+          close(sock);
+          throw error("connection closed during setup", base_port + rank_);
+        }
+        pos += n;
+      }
+      if (id <= rank_ || id >= num_ranks_ || sockets_[id] >= 0) {
+        close(sock);
+        throw std::runtime_error("SocketTransport: invalid rank in connection");
+      }
+      sockets_[id] = sock;
+    }
+  } catch (...) {
+    if (listener >= 0)
+      close(listener);
+    close_all();
+    throw;
+  }
+  if (listener >= 0)
+    close(listener);
+  // Chunks are exchanged in blocks so disable Nagle's algorithm
+  for (const auto &sock : sockets_) {
+    if (sock >= 0) {
+      const int on = 1;
+      setsockopt(sock, IPPROTO_TCP, TCP_NODELAY, &on, sizeof(on));
+    }
+  }
+}
+
+inline SocketTransport::~SocketTransport() {
+  close_all();
+}
+
+inline void SocketTransport::close_all() {
+  for (auto &sock : sockets_) {
+    if (sock >= 0)
+      close(sock);
+    sock = -1;
+  }
+}
+
+inline void SocketTransport::send_all(int partner, const void *data, size_t bytes) {
+  const char *ptr = static_cast<const char*>(data);
+  while (bytes > 0) {
+    const auto n = send(sockets_[partner], ptr, bytes, MSG_NOSIGNAL);
+    if (n < 0 && errno == EINTR)
+      continue;
+    if (n <= 0)
+      throw std::runtime_error("SocketTransport: send to rank " +
+                               std::to_string(partner) + " failed");
+    ptr += n;
+    bytes -= n;
+  }
+}
+
+inline void SocketTransport::recv_all(int partner, void *data, size_t bytes) {
+  char *ptr = static_cast<char*>(data);
+  while (bytes > 0) {
+    const auto n = recv(sockets_[partner], ptr, bytes, 0);
+    if (n < 0 && errno == EINTR)
+      continue;
+    if (n <= 0)
+      throw std::runtime_error("SocketTransport: receive from rank " +
+                               std::to_string(partner) + " failed");
+    ptr += n;
+    bytes -= n;
+  }
+}
+
+inline void SocketTransport::exchange(int partner, const complex_t *send,
+                                      complex_t *recv, Indexing::uint_t count) {
+  // The lower rank sends first so that the blocking calls do not deadlock
+  const size_t bytes = sizeof(complex_t) * count;
+  if (rank_ < partner) {
+    send_all(partner, send, bytes);
+    recv_all(partner, recv, bytes);
+  } else {
+    recv_all(partner, recv, bytes);
+    send_all(partner, send, bytes);
+  }
+}
+
+inline void SocketTransport::allreduce_sum(std::vector<double> &data) {
+  // Sum on rank 0 and send the result back to all ranks
+  const size_t bytes = sizeof(double) * data.size();
+  if (rank_ == 0) {
+    std::vector<double> other(data.size());
+    for (int j = 1; j < num_ranks_; j++) {
+      recv_all(j, other.data(), bytes);
+      for (size_t i = 0; i < data.size(); i++)
+        data[i] += other[i];
+    }
+    for (int j = 1; j < num_ranks_; j++)
+      send_all(j, data.data(), bytes);
+  } else {
+    send_all(0, data.data(), bytes);
+    recv_all(0, data.data(), bytes);
+  }
+}
+
+inline void SocketTransport::gather(const complex_t *send,
+                                    Indexing::uint_t count,
+                                    complex_t *recv) {
+  const size_t bytes = sizeof(complex_t) * count;
+  if (rank_ == 0) {
+    std::copy(send, send + count, recv);
+    for (int j = 1; j < num_ranks_; j++)
+      recv_all(j, recv + j * count, bytes);
+  } else {
+    send_all(0, send, bytes);
+  }
+}
+
+#endif
+
+//------------------------------------------------------------------------------
+} // end namespace QV
+//------------------------------------------------------------------------------
+#endif
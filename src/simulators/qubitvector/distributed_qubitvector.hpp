@@ -0,0 +1,724 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _distributed_qubit_vector_hpp_
+#define _distributed_qubit_vector_hpp_
+
+#include <memory>
+
+#include "qubitvector.hpp"
+#include "chunk_transport.hpp"
+
+namespace QV {
+
+//============================================================================
+// Distributed storage
+//============================================================================
+
+// Storage type for a QubitVector distributed over the ranks of a
+// ChunkTransport. For an n-qubit vector on 2^k ranks, rank r stores the
+// 2^(n-k) amplitudes whose k highest index bits are equal to r.
+// Qubits [0, n-k) are "local" qubits and qubits [n-k, n) are "global" qubits.
+struct DistributedChunk {
+  complex_t *data = nullptr; // local chunk amplitudes
+  uint_t size = 0;           // number of local amplitudes
+};
+
+//============================================================================
+// Distributed QubitVector class
+//============================================================================
+
+// Specialization of QubitVector for a statevector distributed over several
+// processes. Each process stores its chunk in a standard QubitVector.
+// Operations on local qubits are applied to the local chunk directly.
+// Operations on global qubits are applied by swapping the global qubits with
+// unused local qubits by pairwise chunk exchange with the partner rank,
+// applying the operation locally, and swapping back.
+// Diagonal operations and controls on global qubits are applied without
+// any exchange.
+//
+// All methods that change or reduce over the vector are collective and
+// must be called by all ranks in the same order.
+
+template <>
+class QubitVector<DistributedChunk> {
+
+public:
+
+  //-----------------------------------------------------------------------
+  // Constructors and Destructor
+  //-----------------------------------------------------------------------
+
+  QubitVector() = default;
+  ~QubitVector() = default;
+  QubitVector(const QubitVector& obj) = delete;
+  QubitVector &operator=(const QubitVector& obj) = delete;
+
+  //-----------------------------------------------------------------------
+  // Utility functions
+  //-----------------------------------------------------------------------
+
+  // Set the transport used for exchanging chunks. This must be set before
+  // set_num_qubits.
+  void set_transport(const std::shared_ptr<ChunkTransport> &transport);
+
+  // Return the transport used for exchanging chunks
+  inline const std::shared_ptr<ChunkTransport> &transport() const {return transport_;}
+
+  // Set the size of the vector in terms of qubit number
+  void set_num_qubits(size_t num_qubits);
+
+  // Returns the size of the full n-qubit vector
+  inline uint_t size() const {return num_states_;}
+
+  // Returns the number of qubits for the full vector
+  inline uint_t num_qubits() const {return num_qubits_;}
+
+  // Returns the number of qubits stored in the local chunk
+  inline uint_t num_local_qubits() const {return local_.num_qubits();}
+
+  // Returns a reference to the local chunk QubitVector
+  inline QubitVector<> &local() {return local_;}
+
+  // Returns the local chunk storage
+  inline DistributedChunk data() const {
+    DistributedChunk chunk;
+    chunk.data = local_.data();
+    chunk.size = local_.size();
+    return chunk;
+  }
+
+  // Returns a copy of the full vector gathered on rank 0.
+  // Other ranks return an empty vector.
+  cvector_t vector() const;
+
+  // Return JSON serialization of the full vector gathered on rank 0.
+  // Other ranks return null.
+  json_t json() const;
+
+  // Create a checkpoint to calculate inner_product
+  void checkpoint() {local_.checkpoint();}
+
+  // Compute the inner product with checkpoint and returns the value
+  complex_t inner_product() const;
+
+  // Revert to the checkpoint
+  void revert(bool keep) {local_.revert(keep);}
+
+  // Returns the norm of the current vector
+  double norm() const;
+
+  // Initializes the current vector so that all qubits are in the |0> state.
+  void initialize();
+
+  // Initializes the vector to a custom initial state given as the full vector.
+  void initialize(const cvector_t &statevec);
+
+  // Initializes the vector from the local chunk of another distributed vector
+  // with the same number of qubits and ranks.
+  void initialize(const DistributedChunk &chunk, const size_t num_states);
+
+  //-----------------------------------------------------------------------
+  // Configuration settings
+  //-----------------------------------------------------------------------
+
+  void set_json_chop_threshold(double threshold) {
+    json_chop_threshold_ = threshold;
+    local_.set_json_chop_threshold(threshold);
+  }
+  double get_json_chop_threshold() {return json_chop_threshold_;}
+  void set_omp_threads(int n) {local_.set_omp_threads(n);}
+  uint_t get_omp_threads() {return local_.get_omp_threads();}
+  void set_omp_threshold(int n) {local_.set_omp_threshold(n);}
+  uint_t get_omp_threshold() {return local_.get_omp_threshold();}
+  void enable_gate_opt() {local_.enable_gate_opt();}
+  void disable_gate_opt() {local_.disable_gate_opt();}
+  void set_sample_measure_index_size(int n) {local_.set_sample_measure_index_size(n);}
+  int get_sample_measure_index_size() {return local_.get_sample_measure_index_size();}
+  void set_blas_threshold(int n) {local_.set_blas_threshold(n);}
+  void set_blas_tile_kb(int n) {local_.set_blas_tile_kb(n);}
+  void set_storage_directory(const std::string &dir) {local_.set_storage_directory(dir);}
+  bool out_of_core() const {return local_.out_of_core();}
+  void set_chunk_qubits(int n) {local_.set_chunk_qubits(n);}
+  uint_t get_chunk_qubits() const {return std::min(local_.get_chunk_qubits(), local_.num_qubits());}
+
+  // Set the maximum number of amplitudes sent in a single exchange
+  void set_exchange_size(uint_t n) {if (n > 0) exchange_size_ = n;}
+
+  //-----------------------------------------------------------------------
+  // Chunked application
+  //-----------------------------------------------------------------------
+
+  // Apply func to each memory chunk of the local QubitVector.
+  // See QubitVector::apply_chunked
+  template <typename Lambda>
+  void apply_chunked(Lambda &&func) {local_.apply_chunked(std::forward<Lambda>(func));}
+
+  //-----------------------------------------------------------------------
+  // Z-measurement outcome probabilities
+  //-----------------------------------------------------------------------
+
+  // Return the Z-basis measurement outcome probabilities [P(0), ..., P(2^N-1)]
+  // for measurement of N-qubits.
+  rvector_t probabilities(const std::vector<uint_t> &qubits) const;
+
+  // Return the Z-basis measurement outcome probability P(outcome) for
+  // measurement of N-qubits.
+  double probability(const std::vector<uint_t> &qubits,
+                     const uint_t outcome) const;
+
+  // Return M sampled outcomes for Z-basis measurement of all qubits
+  // The input is a length M list of random reals between [0, 1) used for
+  // generating samples. The same rnds must be passed on all ranks.
+  std::vector<uint_t> sample_measure(const std::vector<double> &rnds) const;
+
+  //-----------------------------------------------------------------------
+  // Norms
+  //-----------------------------------------------------------------------
+
+  // Return the norm for of the vector obtained after apply the N-qubit
+  // matrix mat to the vector.
+  double norm(const std::vector<uint_t> &qubits, const cvector_t &mat);
+
+  // Return the norm for of the vector obtained after apply the N-qubit
+  // diagonal matrix mat to the vector.
+  double norm_diagonal(const std::vector<uint_t> &qubits, const cvector_t &mat) const;
+
+  // Return the norms of the vectors obtained after applying each of the
+  // N-qubit matrices mats to the vector.
+  rvector_t norms(const std::vector<uint_t> &qubits,
+                  const std::vector<cvector_t> &mats);
+
+  //-----------------------------------------------------------------------
+  // Apply Matrices
+  //-----------------------------------------------------------------------
+
+  // Apply a N-qubit matrix to the state vector.
+  void apply_matrix(const std::vector<uint_t> &qubits, const cvector_t &mat);
+
+  // Apply a N-qubit diagonal matrix to the state vector.
+  void apply_diagonal_matrix(const std::vector<uint_t> &qubits,
+                             const cvector_t &mat);
+
+  //-----------------------------------------------------------------------
+  // Apply Specialized Gates
+  //-----------------------------------------------------------------------
+
+  void apply_cnot(const uint_t qctrl, const uint_t qtrgt);
+  void apply_cz(const uint_t q0, const uint_t q1);
+  void apply_swap(const uint_t q0, const uint_t q1);
+  void apply_x(const uint_t qubit);
+  void apply_y(const uint_t qubit);
+  void apply_z(const uint_t qubit);
+  void apply_toffoli(const uint_t qctrl0, const uint_t qctrl1, const uint_t qtrgt);
+
+  //-----------------------------------------------------------------------
+  // Reset
+  //-----------------------------------------------------------------------
+
+  // Reset N-qubits to the |0> state given the outcome of a Z-basis
+  // measurement of the qubits. See QubitVector::apply_reset
+  void apply_reset(const std::vector<uint_t> &qubits, const uint_t outcome,
+                   const double scale);
+
+protected:
+
+  //-----------------------------------------------------------------------
+  // Protected data members
+  //-----------------------------------------------------------------------
+  std::shared_ptr<ChunkTransport> transport_;
+  QubitVector<> local_;
+  size_t num_qubits_ = 0;
+  size_t num_states_ = 1;
+  uint_t exchange_size_ = 1ULL << 20;  // amplitudes per exchange message
+  double json_chop_threshold_ = 0;
+
+  //-----------------------------------------------------------------------
+  // Helper functions
+  //-----------------------------------------------------------------------
+
+  // Return true if qubit is stored in the local chunk
+  inline bool is_local(uint_t qubit) const {return qubit < local_.num_qubits();}
+
+  // Return the value of a global qubit for the current rank
+  inline uint_t global_bit(uint_t qubit) const {
+    return (transport_->rank() >> (qubit - local_.num_qubits())) & 1ULL;
+  }
+
+  // Multiply the local chunk by a phase
+  inline void scale_local(const complex_t &phase) {
+    local_.apply_diagonal_matrix(std::vector<uint_t>({0}), cvector_t({phase, phase}));
+  }
+
+  // Return the partner rank for exchanging a global qubit
+  inline int partner(uint_t qubit) const {
+    return transport_->rank() ^ (1 << (qubit - local_.num_qubits()));
+  }
+
+  // Swap a global qubit with a local qubit by exchanging half of the
+  // local chunk with the partner rank
+  void swap_global_local(uint_t qglobal, uint_t qlocal);
+
+  // Swap any global qubits in qubits with unused local qubits, call
+  // func(local_qubits), and swap back. Returns the qubits used.
+  template <typename Lambda>
+  void apply_local(const std::vector<uint_t> &qubits, Lambda &&func);
+
+  // Restrict a diagonal matrix on qubits to the local qubits using the
+  // values of the global qubits for the current rank.
+  // Returns the pair (local_qubits, local_diag).
+  std::pair<std::vector<uint_t>, cvector_t>
+  local_diagonal(const std::vector<uint_t> &qubits, const cvector_t &diag) const;
+
+  void check_transport() const;
+};
+
+/*******************************************************************************
+ *
+ * Implementations
+ *
+ ******************************************************************************/
+
+//------------------------------------------------------------------------------
+// Utility
+//------------------------------------------------------------------------------
+
+inline void QubitVector<DistributedChunk>::check_transport() const {
+  if (!transport_)
+    throw std::runtime_error("QubitVector: distributed vector has no transport");
+}
+
+inline void QubitVector<DistributedChunk>::set_transport(const std::shared_ptr<ChunkTransport> &transport) {
+  transport_ = transport;
+}
+
+inline void QubitVector<DistributedChunk>::set_num_qubits(size_t num_qubits) {
+  check_transport();
+  const uint_t num_global = std::log2(transport_->num_ranks());
+  if (num_qubits <= num_global) {
+    std::stringstream ss;
+    ss << "QubitVector: " << num_qubits << "-qubit vector is too small to";
+    ss << " distribute over " << transport_->num_ranks() << " ranks";
+    throw std::runtime_error(ss.str());
+  }
+  num_qubits_ = num_qubits;
+  num_states_ = 1ULL << num_qubits;
+  local_.set_num_qubits(num_qubits - num_global);
+}
+
+inline void QubitVector<DistributedChunk>::initialize() {
+  local_.initialize();
+  if (transport_->rank() != 0)
+    local_.data()[0] = 0.;
+}
+
+inline void QubitVector<DistributedChunk>::initialize(const cvector_t &statevec) {
+  if (num_states_ != statevec.size()) {
+    std::stringstream ss;
+    ss << "QubitVector<DistributedChunk>::initialize input vector is incorrect length (";
+    ss << num_states_ << "!=" << statevec.size() << ")";
+    throw std::runtime_error(ss.str());
+  }
+  const auto begin = statevec.begin() + transport_->rank() * local_.size();
+  local_.initialize(cvector_t(begin, begin + local_.size()));
+}
+
+inline void QubitVector<DistributedChunk>::initialize(const DistributedChunk &chunk,
+                                                      const size_t num_states) {
+  if (num_states_ != num_states || chunk.size != local_.size()) {
+    std::stringstream ss;
+    ss << "QubitVector<DistributedChunk>::initialize input vector is incorrect length (";
+    ss << num_states_ << "!=" << num_states << ")";
+    throw std::runtime_error(ss.str());
+  }
+  local_.initialize(chunk.data, chunk.size);
+}
+
+inline cvector_t QubitVector<DistributedChunk>::vector() const {
+  cvector_t ret((transport_->rank() == 0) ? num_states_ : 0);
+  transport_->gather(local_.data(), local_.size(), ret.data());
+  return ret;
+}
+
+inline json_t QubitVector<DistributedChunk>::json() const {
+  // Only rank 0 allocates the full vector
+  if (transport_->rank() != 0) {
+    transport_->gather(local_.data(), local_.size(), nullptr);
+    return json_t();
+  }
+  QubitVector<> full(num_qubits_);
+  full.set_json_chop_threshold(json_chop_threshold_);
+  transport_->gather(local_.data(), local_.size(), full.data());
+  return full.json();
+}
+
+inline double QubitVector<DistributedChunk>::norm() const {
+  std::vector<double> val = {local_.norm()};
+  transport_->allreduce_sum(val);
+  return val[0];
+}
+
+inline complex_t QubitVector<DistributedChunk>::inner_product() const {
+  const complex_t z = local_.inner_product();
+  std::vector<double> val = {std::real(z), std::imag(z)};
+  transport_->allreduce_sum(val);
+  return complex_t(val[0], val[1]);
+}
+
+//------------------------------------------------------------------------------
+// Chunk exchange
+//------------------------------------------------------------------------------
+
+inline void QubitVector<DistributedChunk>::swap_global_local(uint_t qglobal,
+                                                             uint_t qlocal) {
+  // Amplitudes where the local qubit differs from the global qubit value of
+  // this rank are exchanged with the amplitudes of the partner rank where the
+  // local qubit differs from the partner's global qubit value.
+  const int_t half = local_.size() >> 1;
+  const uint_t lbit = (global_bit(qglobal) == 0) ? (1ULL << qlocal) : 0;
+  const uint_t mask = (1ULL << qlocal) - 1;
+  const int part = partner(qglobal);
+  complex_t *data = local_.data();
+  const uint_t block = std::min<uint_t>(exchange_size_, half);
+  std::vector<complex_t> send(block), recv(block);
+  for (int_t pos = 0; pos < half; pos += block) {
+    const int_t n = std::min<int_t>(block, half - pos);
+    for (int_t k = 0; k < n; k++) {
+      const uint_t j = pos + k;
+      send[k] = data[((j >> qlocal) << (qlocal + 1)) | (j & mask) | lbit];
+    }
+    transport_->exchange(part, send.data(), recv.data(), n);
+    for (int_t k = 0; k < n; k++) {
+      const uint_t j = pos + k;
+      data[((j >> qlocal) << (qlocal + 1)) | (j & mask) | lbit] = recv[k];
+    }
+  }
+}
+
+template <typename Lambda>
+void QubitVector<DistributedChunk>::apply_local(const std::vector<uint_t> &qubits,
+                                                Lambda &&func) {
+  std::vector<uint_t> local_qubits = qubits;
+  std::vector<std::pair<uint_t, uint_t>> swaps;
+  // Find unused local qubits, starting from the highest
+  int_t free_qubit = local_.num_qubits() - 1;
+  for (size_t i = 0; i < qubits.size(); i++) {
+    if (is_local(qubits[i]))
+      continue;
+    while (free_qubit >= 0 &&
+           std::find(qubits.begin(), qubits.end(), free_qubit) != qubits.end())
+      free_qubit--;
+    if (free_qubit < 0) {
+      throw std::runtime_error("QubitVector: not enough local qubits to apply"
+                               " operation to distributed vector");
+    }
+    swap_global_local(qubits[i], free_qubit);
+    swaps.push_back(std::make_pair(qubits[i], free_qubit));
+    local_qubits[i] = free_qubit;
+    free_qubit--;
+  }
+  std::forward<Lambda>(func)(local_qubits);
+  for (auto it = swaps.rbegin(); it != swaps.rend(); ++it)
+    swap_global_local(it->first, it->second);
+}
+
+inline std::pair<std::vector<uint_t>, cvector_t>
+QubitVector<DistributedChunk>::local_diagonal(const std::vector<uint_t> &qubits,
+                                              const cvector_t &diag) const {
+  std::vector<uint_t> local_qubits;
+  std::vector<uint_t> local_pos;
+  uint_t global_bits = 0;
+  for (size_t i = 0; i < qubits.size(); i++) {
+    if (is_local(qubits[i])) {
+      local_qubits.push_back(qubits[i]);
+      local_pos.push_back(i);
+    } else if (global_bit(qubits[i])) {
+      global_bits |= 1ULL << i;
+    }
+  }
+  cvector_t local_diag(1ULL << local_qubits.size());
+  for (uint_t j = 0; j < local_diag.size(); j++) {
+    uint_t idx = global_bits;
+    for (size_t b = 0; b < local_pos.size(); b++) {
+      if ((j >> b) & 1ULL)
+        idx |= 1ULL << local_pos[b];
+    }
+    local_diag[j] = diag[idx];
+  }
+  return std::make_pair(local_qubits, local_diag);
+}
+
+//------------------------------------------------------------------------------
+// Probabilities
+//------------------------------------------------------------------------------
+
+inline rvector_t QubitVector<DistributedChunk>::probabilities(const std::vector<uint_t> &qubits) const {
+  // Split qubits into local qubits and fixed global qubit values
+  std::vector<uint_t> local_qubits;
+  std::vector<uint_t> local_pos;
+  uint_t global_bits = 0;
+  for (size_t i = 0; i < qubits.size(); i++) {
+    if (is_local(qubits[i])) {
+      local_qubits.push_back(qubits[i]);
+      local_pos.push_back(i);
+    } else if (global_bit(qubits[i])) {
+      global_bits |= 1ULL << i;
+    }
+  }
+  const rvector_t local_probs = (local_qubits.empty())
+    ? rvector_t({local_.norm()})
+    : local_.probabilities(local_qubits);
+  std::vector<double> probs(1ULL << qubits.size(), 0.);
+  for (uint_t j = 0; j < local_probs.size(); j++) {
+    uint_t idx = global_bits;
+    for (size_t b = 0; b < local_pos.size(); b++) {
+      if ((j >> b) & 1ULL)
+        idx |= 1ULL << local_pos[b];
+    }
+    probs[idx] += local_probs[j];
+  }
+  transport_->allreduce_sum(probs);
+  return probs;
+}
+
+inline double QubitVector<DistributedChunk>::probability(const std::vector<uint_t> &qubits,
+                                                         const uint_t outcome) const {
+  // Only ranks whose global qubit values agree with the outcome contribute
+  std::vector<uint_t> local_qubits;
+  uint_t local_outcome = 0;
+  bool agrees = true;
+  for (size_t i = 0; i < qubits.size(); i++) {
+    const uint_t bit = (outcome >> i) & 1ULL;
+    if (is_local(qubits[i])) {
+      local_outcome |= bit << local_qubits.size();
+      local_qubits.push_back(qubits[i]);
+    } else if (global_bit(qubits[i]) != bit) {
+      agrees = false;
+    }
+  }
+  std::vector<double> vals = {0.};
+  if (agrees) {
+    vals[0] = (local_qubits.empty())
+      ? local_.norm()
+      : local_.probability(local_qubits, local_outcome);
+  }
+  transport_->allreduce_sum(vals);
+  return vals[0];
+}
+
+inline std::vector<uint_t>
+QubitVector<DistributedChunk>::sample_measure(const std::vector<double> &rnds) const {
+  // Total probability of each rank's chunk
+  const int rank = transport_->rank();
+  std::vector<double> totals(transport_->num_ranks(), 0.);
+  totals[rank] = local_.norm();
+  transport_->allreduce_sum(totals);
+  double offset = 0.;
+  for (int r = 0; r < rank; r++)
+    offset += totals[r];
+  const double upper = offset + totals[rank];
+  const bool last = (rank + 1 == transport_->num_ranks());
+
+  // Sample the outcomes that fall in this rank's chunk
+  std::vector<size_t> pos;
+  std::vector<double> local_rnds;
+  for (size_t i = 0; i < rnds.size(); i++) {
+    if (rnds[i] >= offset && (rnds[i] < upper || last)) {
+      pos.push_back(i);
+      local_rnds.push_back(rnds[i] - offset);
+    }
+  }
+  std::vector<double> samples(rnds.size(), 0.);
+  if (!local_rnds.empty()) {
+    const auto local_samples = local_.sample_measure(local_rnds);
+    const uint_t shift = rank * local_.size();
+    for (size_t i = 0; i < pos.size(); i++)
+      samples[pos[i]] = static_cast<double>(shift + local_samples[i]);
+  }
+  // Combine samples from all ranks
+  transport_->allreduce_sum(samples);
+  return std::vector<uint_t>(samples.begin(), samples.end());
+}
+
+//------------------------------------------------------------------------------
+// Norms
+//------------------------------------------------------------------------------
+
+inline double QubitVector<DistributedChunk>::norm(const std::vector<uint_t> &qubits,
+                                                  const cvector_t &mat) {
+  double val = 0.;
+  apply_local(qubits, [&](const std::vector<uint_t> &local_qubits) {
+    val = local_.norm(local_qubits, mat);
+  });
+  std::vector<double> vals = {val};
+  transport_->allreduce_sum(vals);
+  return vals[0];
+}
+
+inline rvector_t QubitVector<DistributedChunk>::norms(const std::vector<uint_t> &qubits,
+                                                      const std::vector<cvector_t> &mats) {
+  rvector_t vals;
+  apply_local(qubits, [&](const std::vector<uint_t> &local_qubits) {
+    vals = local_.norms(local_qubits, mats);
+  });
+  transport_->allreduce_sum(vals);
+  return vals;
+}
+
+inline double QubitVector<DistributedChunk>::norm_diagonal(const std::vector<uint_t> &qubits,
+                                                           const cvector_t &mat) const {
+  const auto local = local_diagonal(qubits, mat);
+  std::vector<double> vals(1);
+  if (local.first.empty())
+    vals[0] = std::norm(local.second[0]) * local_.norm();
+  else
+    vals[0] = local_.norm_diagonal(local.first, local.second);
+  transport_->allreduce_sum(vals);
+  return vals[0];
+}
+
+//------------------------------------------------------------------------------
+// Matrices
+//------------------------------------------------------------------------------
+
+inline void QubitVector<DistributedChunk>::apply_matrix(const std::vector<uint_t> &qubits,
+                                                        const cvector_t &mat) {
+  apply_local(qubits, [&](const std::vector<uint_t> &local_qubits) {
+    local_.apply_matrix(local_qubits, mat);
+  });
+}
+
+inline void QubitVector<DistributedChunk>::apply_diagonal_matrix(const std::vector<uint_t> &qubits,
+                                                                 const cvector_t &diag) {
+  const auto local = local_diagonal(qubits, diag);
+  if (local.first.empty()) {
+    // Only a global phase on this chunk
+    if (local.second[0] != complex_t(1., 0.))
+      scale_local(local.second[0]);
+  } else {
+    local_.apply_diagonal_matrix(local.first, local.second);
+  }
+}
+
+//------------------------------------------------------------------------------
+// Reset
+//------------------------------------------------------------------------------
+
+inline void QubitVector<DistributedChunk>::apply_reset(const std::vector<uint_t> &qubits,
+                                                       const uint_t outcome,
+                                                       const double scale) {
+  apply_local(qubits, [&](const std::vector<uint_t> &local_qubits) {
+    local_.apply_reset(local_qubits, outcome, scale);
+  });
+}
+
+//------------------------------------------------------------------------------
+// Gates
+//------------------------------------------------------------------------------
+
+inline void QubitVector<DistributedChunk>::apply_x(const uint_t qubit) {
+  if (is_local(qubit)) {
+    local_.apply_x(qubit);
+    return;
+  }
+  // Exchange the full chunk with the partner rank
+  const int_t end = local_.size();
+  const uint_t block = std::min<uint_t>(exchange_size_, end);
+  complex_t *data = local_.data();
+  std::vector<complex_t> recv(block);
+  for (int_t pos = 0; pos < end; pos += block) {
+    const int_t n = std::min<int_t>(block, end - pos);
+    transport_->exchange(partner(qubit), data + pos, recv.data(), n);
+    std::copy(recv.begin(), recv.begin() + n, data + pos);
+  }
+}
+
+inline void QubitVector<DistributedChunk>::apply_y(const uint_t qubit) {
+  if (is_local(qubit)) {
+    local_.apply_y(qubit);
+    return;
+  }
+  // Y = i * X.Z up to the phase of the global qubit value
+  const complex_t phase = (global_bit(qubit)) ? complex_t(0., 1.) : complex_t(0., -1.);
+  apply_x(qubit);
+  scale_local(phase);
+}
+
+inline void QubitVector<DistributedChunk>::apply_z(const uint_t qubit) {
+  if (is_local(qubit))
+    local_.apply_z(qubit);
+  else if (global_bit(qubit))
+    scale_local(-1.);
+}
+
+inline void QubitVector<DistributedChunk>::apply_cz(const uint_t q0, const uint_t q1) {
+  if (is_local(q0) && is_local(q1))
+    local_.apply_cz(q0, q1);
+  else
+    apply_diagonal_matrix({q0, q1}, {1., 1., 1., -1.});
+}
+
+inline void QubitVector<DistributedChunk>::apply_cnot(const uint_t qctrl,
+                                                      const uint_t qtrgt) {
+  if (is_local(qctrl) && is_local(qtrgt)) {
+    local_.apply_cnot(qctrl, qtrgt);
+  } else if (!is_local(qctrl)) {
+    // Global control: all ranks must take part in any exchange
+    if (is_local(qtrgt)) {
+      if (global_bit(qctrl))
+        local_.apply_x(qtrgt);
+    } else {
+      apply_local({qctrl, qtrgt}, [&](const std::vector<uint_t> &qs) {
+        local_.apply_cnot(qs[0], qs[1]);
+      });
+    }
+  } else {
+    apply_local({qctrl, qtrgt}, [&](const std::vector<uint_t> &qs) {
+      local_.apply_cnot(qs[0], qs[1]);
+    });
+  }
+}
+
+inline void QubitVector<DistributedChunk>::apply_swap(const uint_t q0, const uint_t q1) {
+  if (is_local(q0) && is_local(q1)) {
+    local_.apply_swap(q0, q1);
+  } else if (is_local(q0)) {
+    swap_global_local(q1, q0);
+  } else if (is_local(q1)) {
+    swap_global_local(q0, q1);
+  } else {
+    apply_local({q0, q1}, [&](const std::vector<uint_t> &qs) {
+      local_.apply_swap(qs[0], qs[1]);
+    });
+  }
+}
+
+inline void QubitVector<DistributedChunk>::apply_toffoli(const uint_t qctrl0,
+                                                         const uint_t qctrl1,
+                                                         const uint_t qtrgt) {
+  if (is_local(qtrgt) && !is_local(qctrl0) && !global_bit(qctrl0))
+    return;
+  if (is_local(qtrgt) && !is_local(qctrl1) && !global_bit(qctrl1))
+    return;
+  // Controls that are global and set reduce the gate to CNOT or X
+  if (is_local(qtrgt) && !is_local(qctrl0) && !is_local(qctrl1)) {
+    local_.apply_x(qtrgt);
+  } else if (is_local(qtrgt) && !is_local(qctrl0) && is_local(qctrl1)) {
+    local_.apply_cnot(qctrl1, qtrgt);
+  } else if (is_local(qtrgt) && is_local(qctrl0) && !is_local(qctrl1)) {
+    local_.apply_cnot(qctrl0, qtrgt);
+  } else {
+    apply_local({qctrl0, qctrl1, qtrgt}, [&](const std::vector<uint_t> &qs) {
+      local_.apply_toffoli(qs[0], qs[1], qs[2]);
+    });
+  }
+}
+
+//------------------------------------------------------------------------------
+} // end namespace QV
+//------------------------------------------------------------------------------
+#endif
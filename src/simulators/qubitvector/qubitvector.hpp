@@ -17,9 +17,16 @@
 #include <string>
 #include <vector>
 #include <iostream>
+#include <numeric>
 #include <sstream>
 #include <stdexcept>
 
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
+
 #include "framework/json.hpp"
 #include "indexing.hpp" // multipartite qubit indexing
 
@@ -30,6 +37,7 @@ using Indexing::uint_t;
 using Indexing::int_t;
 using Indexing::Qubit::indexes;
 using Indexing::Qubit::indexes_dynamic;
+using Indexing::Qubit::index0_dynamic;
 
 // Data types
 using complex_t = std::complex<double>;
@@ -140,7 +148,7 @@ public:
   inline void enable_gate_opt() {gate_opt_ = true;}
 
   // Disable sorted qubit matrix gate optimization
-  inline void disable_gate_opt() {gate_opt_ = true;}
+  inline void disable_gate_opt() {gate_opt_ = false;}
 
   // Set the sample_measure index size
   inline void set_sample_measure_index_size(int n) {sample_measure_index_size_ = n;}
@@ -148,6 +156,47 @@ public:
   // Get the sample_measure index size
   inline int get_sample_measure_index_size() {return sample_measure_index_size_;}
 
+  // Set the qubit threshold for applying dense matrices using BLAS.
+  // Matrices on at least this many qubits are applied as a tiled ZGEMM.
+  // If set to 0 the BLAS path is disabled.
+  inline void set_blas_threshold(int n) {blas_threshold_ = (n > 0) ? n : 0;}
+
+  // Get the qubit threshold for applying dense matrices using BLAS.
+  inline uint_t get_blas_threshold() {return blas_threshold_;}
+
+  // Set the size in KB of the amplitude tile gathered for each ZGEMM call.
+  inline void set_blas_tile_kb(int n) {if (n > 0) blas_tile_kb_ = n;}
+
+  // Get the size in KB of the amplitude tile gathered for each ZGEMM call.
+  inline uint_t get_blas_tile_kb() {return blas_tile_kb_;}
+
+  // Set a directory for storing the vector in a memory-mapped file instead
+  // of main memory. If empty main memory is used (Default).
+  // This must be set before set_num_qubits to take effect. Buffers that
+  // are already allocated keep their storage until they are freed.
+  inline void set_storage_directory(const std::string &dir) {storage_dir_ = dir;}
+
+  // Return true if the vector is stored in a memory-mapped file
+  inline bool out_of_core() const {return !storage_dir_.empty();}
+
+  // Set the number of qubits for the chunks used by apply_chunked
+  inline void set_chunk_qubits(int n) {if (n > 0) chunk_qubits_ = n;}
+
+  // Get the number of qubits for the chunks used by apply_chunked
+  inline uint_t get_chunk_qubits() const {return chunk_qubits_;}
+
+  //-----------------------------------------------------------------------
+  // Chunked application
+  //-----------------------------------------------------------------------
+
+  // Call func once for each chunk of 2^chunk_qubits contiguous amplitudes.
+  // During each call the QubitVector acts as a chunk_qubits vector for the
+  // current chunk, so func may only apply operations on qubits less than
+  // chunk_qubits. This allows a sequence of operations to be applied while
+  // each chunk is resident in memory.
+  template <typename Lambda>
+  void apply_chunked(Lambda &&func);
+
   //-----------------------------------------------------------------------
   // Z-measurement outcome probabilities
   //-----------------------------------------------------------------------
@@ -165,9 +214,15 @@ public:
   // for measurement of N-qubits.
   rvector_t probabilities(const std::vector<uint_t> &qubits) const;
 
+  // Return the Z-basis measurement outcome probability P(outcome) for
+  // measurement of N-qubits. Only the amplitudes for the outcome are read.
+  double probability(const std::vector<uint_t> &qubits,
+                     const uint_t outcome) const;
+
   // Return M sampled outcomes for Z-basis measurement of all qubits
   // The input is a length M list of random reals between [0, 1) used for
-  // generating samples.
+  // generating samples. The random numbers are sorted and merged with the
+  // cumulative distribution in a single pass over the vector.
   std::vector<uint_t> sample_measure(const std::vector<double> &rnds) const;
 
   //-----------------------------------------------------------------------
@@ -188,6 +243,14 @@ public:
   // The matrix is input as vector of the matrix diagonal.
   double norm_diagonal(const std::vector<uint_t> &qubits, const cvector_t &mat) const;
 
+  // Return the norms of the vectors obtained after applying each of the
+  // N-qubit matrices mats to the vector, computed in a single pass over
+  // the vector.
+  // The matrices are input as vectors of the column-major vectorized
+  // N-qubit matrices.
+  rvector_t norms(const std::vector<uint_t> &qubits,
+                  const std::vector<cvector_t> &mats) const;
+
   //-----------------------------------------------------------------------
   // Apply Matrices
   //-----------------------------------------------------------------------
@@ -226,6 +289,17 @@ public:
   // Apply a 3-qubit toffoli gate
   void apply_toffoli(const uint_t qctrl0, const uint_t qctrl1, const uint_t qtrgt);
 
+  //-----------------------------------------------------------------------
+  // Reset
+  //-----------------------------------------------------------------------
+
+  // Reset N-qubits to the |0> state given the outcome of a Z-basis
+  // measurement of the qubits. The amplitudes for the measurement outcome
+  // are multiplied by scale and moved to the |0> state of the qubits, and
+  // all other amplitudes are set to zero, in a single pass over the vector.
+  void apply_reset(const std::vector<uint_t> &qubits, const uint_t outcome,
+                   const double scale);
+
   //-----------------------------------------------------------------------
   // Vector Operators
   //-----------------------------------------------------------------------
@@ -243,6 +317,8 @@ protected:
   size_t num_states_;
   statevector_t statevector_;
   statevector_t checkpoint_;
+  bool statevector_mapped_ = false; // statevector_ is a memory-mapped file
+  bool checkpoint_mapped_ = false;  // checkpoint_ is a memory-mapped file
 
  //-----------------------------------------------------------------------
   // Config settings
@@ -251,6 +327,23 @@ protected:
   uint_t omp_threshold_ = 13;  // Qubit threshold for multithreading when enabled
   int sample_measure_index_size_ = 10; // Sample measure indexing qubit size
   bool gate_opt_ = false;      // enable large-qubit optimized gates
+  uint_t blas_threshold_ = 6;  // Qubit threshold for BLAS matrix multiplication
+  uint_t blas_tile_kb_ = 1024; // Tile size for BLAS matrix multiplication
+  std::string storage_dir_;    // Directory for memory-mapped storage
+  uint_t chunk_qubits_ = 22;   // Qubit size of chunks for chunked application
+
+  //-----------------------------------------------------------------------
+  // Memory allocation
+  //-----------------------------------------------------------------------
+
+  // Allocate storage for num_states amplitudes either in main memory
+  // or in a memory-mapped file in storage_dir_. On return mapped is true
+  // if the storage is memory-mapped.
+  complex_t* allocate_states(uint_t num_states, bool &mapped) const;
+
+  // Free storage allocated by allocate_states. The mapped flag must be
+  // the value returned by allocate_states for this storage.
+  void free_states(complex_t* data, uint_t num_states, bool mapped) const;
   double json_chop_threshold_ = 0;  // Threshold for choping small values
                                     // in JSON serialization
   //-----------------------------------------------------------------------
@@ -301,6 +394,13 @@ protected:
   void apply_matrix(const std::array<uint_t, 4> &qubits, const cvector_t &mat);
   void apply_matrix(const std::array<uint_t, 5> &qubits, const cvector_t &mat);
 
+  // Apply a N-qubit matrix to the state vector using BLAS ZGEMM.
+  // Groups of 2^N amplitudes are gathered into contiguous column-major
+  // tiles of approximately blas_tile_kb_ size, multiplied by the matrix,
+  // and scattered back to the state vector.
+  // The matrix is input as vector of the column-major vectorized N-qubit matrix.
+  void apply_matrix_blas(const std::vector<uint_t> &qubits, const cvector_t &mat);
+
   // Apply a N-qubit diagonal matrix to the state vector.
   // The matrix is input as vector of the matrix diagonal.
   template <size_t N>
@@ -465,10 +565,62 @@ QubitVector<statevector_t>::QubitVector() : QubitVector(0) {}
 template <class statevector_t>
 QubitVector<statevector_t>::~QubitVector() {
   if (statevector_)
-    free(statevector_);
+    free_states(statevector_, num_states_, statevector_mapped_);
 
   if (checkpoint_)
-    free(checkpoint_);
+    free_states(checkpoint_, num_states_, checkpoint_mapped_);
+}
+
+//------------------------------------------------------------------------------
+// Memory allocation
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+complex_t* QubitVector<statevector_t>::allocate_states(uint_t num_states,
+                                                      bool &mapped) const {
+  const size_t bytes = sizeof(complex_t) * num_states;
+  mapped = false;
+  if (storage_dir_.empty())
+    return reinterpret_cast<complex_t*>(malloc(bytes));
+#ifdef _WIN32
+  throw std::runtime_error("QubitVector: memory-mapped storage is not supported on Windows");
+#else
+  // Create an unlinked temporary file so that it is removed when unmapped
+  std::string path = storage_dir_ + "/qubitvector_XXXXXX";
+  const int fd = mkstemp(&path[0]);
+  if (fd < 0) {
+    std::stringstream ss;
+    ss << "QubitVector: unable to create storage file in \"" << storage_dir_ << "\"";
+    throw std::runtime_error(ss.str());
+  }
+  unlink(path.c_str());
+  if (ftruncate(fd, bytes) != 0) {
+    close(fd);
+    std::stringstream ss;
+    ss << "QubitVector: unable to allocate " << bytes << " bytes in \"" << storage_dir_ << "\"";
+    throw std::runtime_error(ss.str());
+  }
+  void* data = mmap(nullptr, bytes, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+  close(fd);
+  if (data == MAP_FAILED)
+    throw std::runtime_error("QubitVector: unable to memory-map storage file");
+  mapped = true;
+  return reinterpret_cast<complex_t*>(data);
+#endif
+}
+
+template <class statevector_t>
+void QubitVector<statevector_t>::free_states(complex_t* data, uint_t num_states,
+                                             bool mapped) const {
+#ifndef _WIN32
+  if (mapped) {
+    munmap(data, sizeof(complex_t) * num_states);
+    return;
+  }
+#endif
+  (void)num_states;
+  (void)mapped;
+  free(data);
 }
 
 //------------------------------------------------------------------------------
@@ -561,20 +713,21 @@ void QubitVector<statevector_t>::initialize(const statevector_t &statevec, const
 
 template <class statevector_t>
 void QubitVector<statevector_t>::set_num_qubits(size_t num_qubits) {
-  num_qubits_ = num_qubits;
-  num_states_ = 1ULL << num_qubits;
 
   // Free any currently assigned memory
   if (statevector_)
-    free(statevector_);
+    free_states(statevector_, num_states_, statevector_mapped_);
 
   if (checkpoint_) {
-    free(checkpoint_);
+    free_states(checkpoint_, num_states_, checkpoint_mapped_);
     checkpoint_ = 0;
   }
 
+  num_qubits_ = num_qubits;
+  num_states_ = 1ULL << num_qubits;
+
   // Allocate memory for new vector
-  statevector_ = reinterpret_cast<complex_t*>(malloc(sizeof(complex_t) * num_states_));
+  statevector_ = allocate_states(num_states_, statevector_mapped_);
 }
 
 template <class statevector_t>
@@ -593,7 +746,7 @@ double QubitVector<statevector_t>::norm() const {
 template <class statevector_t>
 void QubitVector<statevector_t>::checkpoint() {
   if (!checkpoint_)
-    checkpoint_ = reinterpret_cast<complex_t*>(malloc(sizeof(complex_t) * num_states_));
+    checkpoint_ = allocate_states(num_states_, checkpoint_mapped_);
 
   const int_t end = num_states_;    // end for k loop
 #pragma omp parallel for if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
@@ -635,7 +788,7 @@ void QubitVector<statevector_t>::revert(bool keep) {
     statevector_[k] = checkpoint_[k];
 
   if (!keep) {
-    free(checkpoint_);
+    free_states(checkpoint_, num_states_, checkpoint_mapped_);
     checkpoint_ = 0;
   }
 }
@@ -665,6 +818,51 @@ void QubitVector<statevector_t>::set_omp_threshold(int n) {
     omp_threshold_ = n;
 }
 
+/*******************************************************************************
+ *
+ * CHUNKED APPLICATION
+ *
+ ******************************************************************************/
+
+template <class statevector_t>
+template <typename Lambda>
+void QubitVector<statevector_t>::apply_chunked(Lambda &&func) {
+  // Vector fits in a single chunk
+  if (chunk_qubits_ >= num_qubits_) {
+    std::forward<Lambda>(func)();
+    return;
+  }
+  // Save full vector settings
+  const auto num_qubits = num_qubits_;
+  const auto num_states = num_states_;
+  const auto data = statevector_;
+  const uint_t chunk_states = 1ULL << chunk_qubits_;
+
+  num_qubits_ = chunk_qubits_;
+  num_states_ = chunk_states;
+  try {
+    for (uint_t offset = 0; offset < num_states; offset += chunk_states) {
+      #ifndef _WIN32
+      // Prefetch the next chunk while the current one is processed
+      if (statevector_mapped_ && offset + chunk_states < num_states)
+        madvise(data + offset + chunk_states, sizeof(complex_t) * chunk_states,
+                MADV_WILLNEED);
+      #endif
+      statevector_ = data + offset;
+      std::forward<Lambda>(func)();
+    }
+  } catch (...) {
+    num_qubits_ = num_qubits;
+    num_states_ = num_states;
+    statevector_ = data;
+    throw;
+  }
+  // Restore full vector settings
+  num_qubits_ = num_qubits;
+  num_states_ = num_states;
+  statevector_ = data;
+}
+
 /*******************************************************************************
  *
  * LAMBDA FUNCTION TEMPLATES
@@ -1315,6 +1513,74 @@ cvector_t QubitVector<statevector_t>::sort_matrix(const std::array<uint_t, N> &s
 }
 
 
+//------------------------------------------------------------------------------
+// BLAS
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+void QubitVector<statevector_t>::apply_matrix_blas(const std::vector<uint_t> &qubits,
+                                                   const cvector_t &mat) {
+  const size_t N = qubits.size();
+  // Error checking
+  #ifdef DEBUG
+  for (const auto &qubit : qubits)
+    check_qubit(qubit);
+  check_vector(mat, 2 * N);
+  #endif
+
+  const uint_t dim = 1ULL << N;
+  const int_t end = num_states_ >> N;
+  auto qubits_sorted = qubits;
+  std::sort(qubits_sorted.begin(), qubits_sorted.end());
+
+  // Offsets of the 2^N amplitudes of a group from the group's 0-index
+  std::vector<uint_t> offsets(dim, 0);
+  for (size_t i = 0; i < N; i++) {
+    const auto n = 1ULL << i;
+    const auto bit = Indexing::Qubit::BITS[qubits[i]];
+    for (size_t j = 0; j < n; j++)
+      offsets[n + j] = offsets[j] | bit;
+  }
+
+  // Number of groups gathered into a single tile so that the input and
+  // output tiles stay resident in cache during the ZGEMM call
+  const int_t tile_cols = std::min<int_t>(end,
+    std::max<int_t>(1, (blas_tile_kb_ << 10) / (2 * sizeof(complex_t) * dim)));
+  const int_t num_tiles = (end + tile_cols - 1) / tile_cols;
+
+  const char trans = 'N';
+  const complex_t alpha = 1., beta = 0.;
+#pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+  {
+    std::vector<complex_t> tile_in(dim * tile_cols);
+    std::vector<complex_t> tile_out(dim * tile_cols);
+    std::vector<uint_t> inds0(tile_cols);
+#pragma omp for
+    for (int_t t = 0; t < num_tiles; t++) {
+      const int_t k0 = t * tile_cols;
+      const int_t cols = std::min<int_t>(tile_cols, end - k0);
+      // Gather amplitudes into tile columns
+      for (int_t c = 0; c < cols; c++) {
+        inds0[c] = Indexing::Qubit::index0_dynamic(qubits_sorted, N, k0 + c);
+        complex_t *col = tile_in.data() + c * dim;
+        for (size_t i = 0; i < dim; i++)
+          col[i] = statevector_[inds0[c] | offsets[i]];
+      }
+      // tile_out = mat * tile_in
+      size_t m = dim, n = cols, ld = dim;
+      zgemm_(&trans, &trans, &m, &n, &m, &alpha, mat.data(), &ld,
+             tile_in.data(), &ld, &beta, tile_out.data(), &ld);
+      // Scatter tile columns back to the state vector
+      for (int_t c = 0; c < cols; c++) {
+        const complex_t *col = tile_out.data() + c * dim;
+        for (size_t i = 0; i < dim; i++)
+          statevector_[inds0[c] | offsets[i]] = col[i];
+      }
+    }
+  }
+}
+
+
 //------------------------------------------------------------------------------
 // Dynamic N
 //------------------------------------------------------------------------------
@@ -1335,6 +1601,11 @@ print(code)
 template <class statevector_t>
 void QubitVector<statevector_t>::apply_matrix(const std::vector<uint_t> &qubits,
                                               const cvector_t &mat) {
+  // Large dense matrices are applied using BLAS matrix multiplication
+  if (blas_threshold_ > 0 && qubits.size() >= blas_threshold_) {
+    apply_matrix_blas(qubits, mat);
+    return;
+  }
   // Special low N cases using faster static indexing
   switch (qubits.size()) {
   case 1:
@@ -1665,6 +1936,45 @@ void QubitVector<statevector_t>::apply_toffoli(const uint_t qubit_ctrl0,
   apply_matrix_lambda(qubits, {}, lambda);
 }
 
+//------------------------------------------------------------------------------
+// Reset
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+void QubitVector<statevector_t>::apply_reset(const std::vector<uint_t> &qubits,
+                                             const uint_t outcome,
+                                             const double scale) {
+  // Error checking
+  #ifdef DEBUG
+  for (const auto &qubit : qubits)
+    check_qubit(qubit);
+  #endif
+
+  const uint_t N = qubits.size();
+  const uint_t dim = 1ULL << N;
+  const int_t end = num_states_ >> N;
+  auto qubits_sorted = qubits;
+  std::sort(qubits_sorted.begin(), qubits_sorted.end());
+
+  // Offsets of the indexes for each outcome from the index of the |0> outcome
+  std::vector<uint_t> offsets(dim, 0);
+  for (size_t i = 0; i < N; i++) {
+    const auto n = 1ULL << i;
+    for (size_t j = 0; j < n; j++)
+      offsets[n + j] = offsets[j] | Indexing::Qubit::BITS[qubits[i]];
+  }
+  const uint_t outcome_offset = offsets[outcome];
+
+#pragma omp parallel for if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+  for (int_t k = 0; k < end; k++) {
+    const auto i0 = index0_dynamic(qubits_sorted, N, k);
+    const complex_t amp = statevector_[i0 | outcome_offset];
+    for (size_t j = 1; j < dim; j++)
+      statevector_[i0 | offsets[j]] = 0.;
+    statevector_[i0] = scale * amp;
+  }
+}
+
 /*******************************************************************************
  *
  * NORMS
@@ -1998,12 +2308,133 @@ double QubitVector<statevector_t>::norm_diagonal(const std::vector<uint_t> &qubi
   } // end switch
 }
 
+//------------------------------------------------------------------------------
+// Multiple matrix norms
+//------------------------------------------------------------------------------
+
+template <class statevector_t>
+rvector_t QubitVector<statevector_t>::norms(const std::vector<uint_t> &qubits,
+                                            const std::vector<cvector_t> &mats) const {
+
+  const uint_t N = qubits.size();
+  const uint_t dim = 1ULL << N;
+  // Error checking
+  #ifdef DEBUG
+  for (const auto &qubit : qubits)
+    check_qubit(qubit);
+  for (const auto &mat : mats)
+    check_vector(mat, 2 * N);
+  #endif
+
+  // The norm of A|psi> is Tr[A.rho.A^dagger] where rho is the reduced
+  // density matrix of the qubits, so we compute rho in a single pass over
+  // the vector and the norms for all matrices from rho.
+  if (mats.empty())
+    return rvector_t();
+  // rho is stored as a column-major vectorized matrix
+  cvector_t rho(dim * dim, 0.);
+
+  if (N == 1) {
+    const int_t end1 = num_states_;    // end for k1 loop
+    const int_t end2 = 1LL << qubits[0]; // end for k2 loop
+    const int_t step1 = end2 << 1;    // step for k1 loop
+    double rho00 = 0., rho11 = 0., rho10_re = 0., rho10_im = 0.;
+#pragma omp parallel reduction(+:rho00, rho11, rho10_re, rho10_im) if (num_qubits_ > omp_threshold_ && omp_threads_ > 1)         \
+                                               num_threads(omp_threads_)
+    {
+#ifdef _WIN32
+  #pragma omp for
+#else
+  #pragma omp for collapse(2)
+#endif
+      for (int_t k1 = 0; k1 < end1; k1 += step1)
+        for (int_t k2 = 0; k2 < end2; k2++) {
+          const auto k = k1 | k2;
+          const auto cache0 = statevector_[k];
+          const auto cache1 = statevector_[k | end2];
+          rho00 += std::real(cache0 * std::conj(cache0));
+          rho11 += std::real(cache1 * std::conj(cache1));
+          const auto rho10 = cache1 * std::conj(cache0);
+          rho10_re += std::real(rho10);
+          rho10_im += std::imag(rho10);
+        }
+    } // end omp parallel
+    rho[0] = rho00;
+    rho[1] = complex_t(rho10_re, rho10_im);
+    rho[2] = complex_t(rho10_re, -rho10_im);
+    rho[3] = rho11;
+  } else {
+    const int_t end = num_states_ >> N;
+    auto qss = qubits;
+    std::sort(qss.begin(), qss.end());
+    const auto &qubits_sorted = qss;
+#pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+    {
+      cvector_t local_rho(dim * dim, 0.);
+#pragma omp for
+      for (int_t k = 0; k < end; k++) {
+        const auto inds = indexes_dynamic(qubits, qubits_sorted, N, k);
+        for (size_t j = 0; j < dim; j++) {
+          const auto cache_j = std::conj(statevector_[inds[j]]);
+          for (size_t i = 0; i < dim; i++)
+            local_rho[i + dim * j] += statevector_[inds[i]] * cache_j;
+        }
+      }
+#pragma omp critical
+      for (size_t i = 0; i < dim * dim; i++)
+        rho[i] += local_rho[i];
+    } // end omp parallel
+  }
+
+  // Compute Tr[A.rho.A^dagger] = sum_{i,j,l} A[i,j] rho[j,l] conj(A[i,l])
+  rvector_t vals;
+  for (const auto &mat : mats) {
+    double val = 0.;
+    for (size_t i = 0; i < dim; i++)
+      for (size_t l = 0; l < dim; l++) {
+        complex_t v = 0.;
+        for (size_t j = 0; j < dim; j++)
+          v += mat[i + dim * j] * rho[j + dim * l];
+        val += std::real(v * std::conj(mat[i + dim * l]));
+      }
+    vals.push_back(val);
+  }
+  return vals;
+}
+
 /*******************************************************************************
  *
  * Probabilities
  *
  ******************************************************************************/
 
+template <class statevector_t>
+double QubitVector<statevector_t>::probability(const std::vector<uint_t> &qubits,
+                                               const uint_t outcome) const {
+  // Error checking
+  #ifdef DEBUG
+  for (const auto &qubit : qubits)
+    check_qubit(qubit);
+  #endif
+
+  const uint_t N = qubits.size();
+  const int_t end = num_states_ >> N;
+  auto qubits_sorted = qubits;
+  std::sort(qubits_sorted.begin(), qubits_sorted.end());
+  uint_t outcome_offset = 0;
+  for (size_t i = 0; i < N; i++) {
+    if ((outcome >> i) & 1ULL)
+      outcome_offset |= Indexing::Qubit::BITS[qubits[i]];
+  }
+
+  double val = 0.;
+#pragma omp parallel for reduction(+:val) if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) \
+                                          num_threads(omp_threads_)
+  for (int_t k = 0; k < end; k++)
+    val += probability(index0_dynamic(qubits_sorted, N, k) | outcome_offset);
+  return val;
+}
+
 template <class statevector_t>
 double QubitVector<statevector_t>::probability(const uint_t outcome) const {
   const auto v = statevector_[outcome];
@@ -2225,74 +2656,58 @@ std::vector<uint_t> QubitVector<statevector_t>::sample_measure(const std::vector
   const int_t shots = rnds.size();
   std::vector<uint_t> samples;
   samples.assign(shots, 0);
-
-  const int index_size = sample_measure_index_size_;
-  const int_t index_end = 1LL << index_size;
-  // Qubit number is below index size, loop over shots
-  if (end < index_end) {
-    #pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
-    {
-      #pragma omp for
-      for (int_t i = 0; i < shots; ++i) {
-        double rnd = rnds[i];
-        double p = .0;
-        int_t sample;
-        for (sample = 0; sample < end - 1; ++sample) {
-          p += std::real(std::conj(statevector_[sample]) * statevector_[sample]);
-          if (rnd < p)
-            break;
-        }
-        samples[i] = sample;
-      }
-    } // end omp parallel
-  }
-  // Qubit number is above index size, loop over index blocks
-  else {
-    // Initialize indexes
-    std::vector<double> indexes;
-    indexes.assign((1<<index_size), .0);
-    uint_t loop = (end >> index_size);
-
-    #pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
-    {
-      #pragma omp for
-      for (int_t i = 0; i < (1 << index_size); ++i) {
-        uint_t base = loop * i;
-        double total = .0;
-        double p = .0;
-        for (uint_t j = 0; j < loop; ++j) {
-          uint_t k = base | j;
-          p = std::real(std::conj(statevector_[k]) * statevector_[k]);
-          total += p;
-        }
-        indexes[i] = total;
-      }
-    } // end omp parallel
-
-    #pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
-    {
-      #pragma omp for
-      for (int_t i = 0; i < shots; ++i) {
-        double rnd = rnds[i];
-        double p = .0;
-        int_t sample = 0;
-        for (uint_t j = 0; j < indexes.size(); ++j) {
-          if (rnd < (p + indexes[j])) {
-            break;
-          }
-          p += indexes[j];
-          sample += loop;
-        }
-
-        for (; sample < end - 1; ++sample) {
-          p += std::real(std::conj(statevector_[sample]) * statevector_[sample]);
-          if (rnd < p){
-            break;
-          }
-        }
-        samples[i] = sample;
-      }
-    } // end omp parallel
+  if (shots == 0)
+    return samples;
+
+  // Sort the shots by random number so that all samples can be found
+  // in a single pass over the cumulative distribution
+  std::vector<uint_t> order(shots);
+  for (int_t i = 0; i < shots; ++i)
+    order[i] = i;
+  std::sort(order.begin(), order.end(),
+            [&rnds](uint_t i, uint_t j) {return rnds[i] < rnds[j];});
+  std::vector<double> sorted_rnds(shots);
+  for (int_t i = 0; i < shots; ++i)
+    sorted_rnds[i] = rnds[order[i]];
+
+  // Split the vector into index blocks that are processed in parallel
+  const int index_size = (num_qubits_ > static_cast<size_t>(sample_measure_index_size_))
+                         ? sample_measure_index_size_ : 0;
+  const int_t num_blocks = 1LL << index_size;
+  const int_t block_size = end >> index_size;
+
+  // Cumulative probability at the start of each block
+  std::vector<double> offsets(num_blocks + 1, 0.);
+  #pragma omp parallel for if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+  for (int_t i = 0; i < num_blocks; ++i) {
+    const uint_t base = block_size * i;
+    double total = .0;
+    for (int_t j = 0; j < block_size; ++j)
+      total += probability(base + j);
+    offsets[i + 1] = total;
+  }
+  std::partial_sum(offsets.begin(), offsets.end(), offsets.begin());
+
+  // Merge the sorted random numbers with the cumulative distribution of
+  // each block. The last block also takes any random numbers above the
+  // total probability.
+  #pragma omp parallel for if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+  for (int_t i = 0; i < num_blocks; ++i) {
+    auto pos = std::lower_bound(sorted_rnds.begin(), sorted_rnds.end(), offsets[i]) - sorted_rnds.begin();
+    const auto stop = (i == num_blocks - 1) ? shots
+      : std::lower_bound(sorted_rnds.begin(), sorted_rnds.end(), offsets[i + 1]) - sorted_rnds.begin();
+    if (i == 0)
+      pos = 0;
+    const uint_t base = block_size * i;
+    double p = offsets[i];
+    for (int_t j = 0; j < block_size && pos < stop; ++j) {
+      p += probability(base + j);
+      for (; pos < stop && sorted_rnds[pos] < p; ++pos)
+        samples[order[pos]] = base + j;
+    }
+    // Remaining random numbers from rounding of the block sums
+    for (; pos < stop; ++pos)
+      samples[order[pos]] = base + block_size - 1;
   }
   return samples;
 }
@@ -9,6 +9,7 @@
 #define _qubitvector_qv_state_hpp
 
 #include <algorithm>
+#include <numeric>
 #define _USE_MATH_DEFINES
 #include <math.h>
 
@@ -16,6 +17,7 @@
 #include "framework/json.hpp"
 #include "base/state.hpp"
 #include "qubitvector.hpp"
+#include "chunk_transport.hpp"
 
 
 namespace AER {
@@ -105,10 +107,11 @@ public:
   virtual void set_config(const json_t &config) override;
 
   // Sample n-measurement outcomes without applying the measure operation
-  // to the system state
-  virtual std::vector<reg_t> sample_measure(const reg_t& qubits,
-                                            uint_t shots,
-                                            RngEngine &rng) override;
+  // to the system state. If fewer than all qubits are measured the
+  // samples are drawn from the marginal distribution of the measured qubits
+  virtual std::vector<uint_t> sample_measure(const reg_t& qubits,
+                                             uint_t shots,
+                                             RngEngine &rng) override;
 
   //-----------------------------------------------------------------------
   // Additional methods
@@ -120,6 +123,12 @@ public:
   // Initialize OpenMP settings for the underlying QubitVector class
   void initialize_omp();
 
+  // Set the chunk transport of a distributed QubitVector.
+  // This is only valid for State<QV::DistributedChunk>
+  void set_transport(const std::shared_ptr<QV::ChunkTransport> &transport) {
+    BaseState::qreg_.set_transport(transport);
+  }
+
 protected:
 
   //-----------------------------------------------------------------------
@@ -154,9 +163,10 @@ protected:
   // Apply a vectorized matrix to given qubits (identity on all other qubits)
   void apply_matrix(const reg_t &qubits, const cvector_t & vmat);
 
-  // Apply a Kraus error operation
+  // Apply a Kraus error operation given by vectorized Kraus matrices, or
+  // by the diagonals of diagonal Kraus matrices
   void apply_kraus(const reg_t &qubits,
-                   const std::vector<cmatrix_t> &krausops,
+                   const std::vector<cvector_t> &kraus_vmats,
                    RngEngine &rng);
 
   //-----------------------------------------------------------------------
@@ -221,6 +231,42 @@ protected:
   // Optimize phase gate with diagonal [1, phase]
   void apply_gate_phase(const uint_t qubit, const complex_t phase);
 
+  //-----------------------------------------------------------------------
+  // Out-of-core helpers
+  //-----------------------------------------------------------------------
+
+  // Return true if op is a gate or matrix that can be applied chunk-by-chunk
+  bool is_chunk_op(const Operations::Op &op) const;
+
+  // Return true if op is a gate or matrix that only acts on qubits
+  // inside a single chunk of the QubitVector
+  bool is_chunk_local(const Operations::Op &op) const;
+
+  // Return the end of the longest run of gates and matrices starting at
+  // start that acts on at most chunk_qubits distinct qubits. On return
+  // high_qubits are the qubits above the chunk acted on by the run and
+  // high_ops is the number of operations in the run acting on them.
+  size_t chunk_run_end(const std::vector<Operations::Op> &ops, size_t start,
+                       reg_t &high_qubits, size_t &high_ops) const;
+
+  // Apply the operations ops[start, end) to each chunk of the QubitVector
+  // in turn. Each qubit in high_qubits is swapped with a chunk qubit that is
+  // not acted on by the operations for the duration of the run.
+  void apply_chunk_local_ops(const std::vector<Operations::Op> &ops,
+                             size_t start, size_t end,
+                             const reg_t &high_qubits);
+
+  //-----------------------------------------------------------------------
+  // Reset helpers
+  //-----------------------------------------------------------------------
+
+  // Clear the known |0> state of any qubits an operation may change.
+  // Diagonal operations, measurements and resets leave qubits in |0>.
+  void update_zero_qubits(const Operations::Op &op);
+
+  // Qubits known to be in the |0> state. Resets of these qubits are skipped.
+  std::vector<bool> zero_qubits_;
+
   //-----------------------------------------------------------------------
   // Config Settings
   //-----------------------------------------------------------------------
@@ -231,6 +277,10 @@ protected:
   // QubitVector sample measure index size
   int sample_measure_index_size_ = 10;
 
+  // Maximum number of measured qubits for sampling from the marginal
+  // distribution of the measured qubits
+  int sample_measure_marginal_qubits_ = 15;
+
   // Threshold for chopping small values to zero in JSON
   double json_chop_threshold_ = 1e-15;
 
@@ -301,6 +351,7 @@ void State<statevec_t>::initialize_qreg(uint_t num_qubits) {
   initialize_omp();
   BaseState::qreg_.set_num_qubits(num_qubits);
   BaseState::qreg_.initialize();
+  zero_qubits_.assign(num_qubits, true);
 }
 
 template <class statevec_t>
@@ -313,6 +364,7 @@ void State<statevec_t>::initialize_qreg(uint_t num_qubits,
   initialize_omp();
   BaseState::qreg_.set_num_qubits(num_qubits);
   BaseState::qreg_.initialize(state.data(), 1ULL << num_qubits);
+  zero_qubits_.assign(num_qubits, false);
 }
 
 template <class statevec_t>
@@ -324,6 +376,7 @@ void State<statevec_t>::initialize_qreg(uint_t num_qubits,
   initialize_omp();
   BaseState::qreg_.set_num_qubits(num_qubits);
   BaseState::qreg_.initialize(state);
+  zero_qubits_.assign(num_qubits, false);
 }
 
 template <class statevec_t>
@@ -343,6 +396,9 @@ uint_t State<statevec_t>::required_memory_mb(uint_t num_qubits,
   // An n-qubit state vector as 2^n complex doubles
   // where each complex double is 16 bytes
   (void)ops; // avoid unused variable compiler warning
+  // If the vector is stored out-of-core only a chunk must be resident
+  if (BaseState::qreg_.out_of_core())
+    num_qubits = std::min<uint_t>(num_qubits, BaseState::qreg_.get_chunk_qubits());
   uint_t shift_mb = std::max<int_t>(0, num_qubits + 4 - 20);
   uint_t mem_mb = 1ULL << shift_mb;
   return mem_mb;
@@ -363,12 +419,30 @@ void State<statevec_t>::set_config(const json_t &config) {
   if (JSON::get_value(index_size, "statevector_sample_measure_opt", config)) {
     BaseState::qreg_.set_sample_measure_index_size(index_size);
   };
+  JSON::get_value(sample_measure_marginal_qubits_,
+                  "statevector_sample_measure_marginal", config);
 
   // Enable sorted gate optimzations
   bool gate_opt = false;
   JSON::get_value(gate_opt, "statevector_gate_opt", config);
   if (gate_opt)
     BaseState::qreg_.enable_gate_opt();
+
+  // Set the qubit threshold and tile size for BLAS matrix multiplication
+  int blas_threshold;
+  if (JSON::get_value(blas_threshold, "statevector_blas_threshold", config))
+    BaseState::qreg_.set_blas_threshold(blas_threshold);
+  int blas_tile_kb;
+  if (JSON::get_value(blas_tile_kb, "statevector_blas_tile_kb", config))
+    BaseState::qreg_.set_blas_tile_kb(blas_tile_kb);
+
+  // Set out-of-core storage directory and chunk size
+  std::string storage_dir;
+  if (JSON::get_value(storage_dir, "statevector_storage_directory", config))
+    BaseState::qreg_.set_storage_directory(storage_dir);
+  int chunk_qubits;
+  if (JSON::get_value(chunk_qubits, "statevector_chunk_qubits", config))
+    BaseState::qreg_.set_chunk_qubits(chunk_qubits);
 }
 
 
@@ -381,13 +455,47 @@ void State<statevec_t>::apply_ops(const std::vector<Operations::Op> &ops,
                                  OutputData &data,
                                  RngEngine &rng) {
   // Simple loop over vector of input operations
-  for (const auto op: ops) {
+  for (size_t pos = 0; pos < ops.size(); ++pos) {
+    const auto &op = ops[pos];
+    // For out-of-core vectors apply runs of gates chunk-by-chunk so each
+    // chunk is only loaded once per run
+    if (BaseState::qreg_.out_of_core() && is_chunk_op(op)) {
+      reg_t high_qubits;
+      size_t high_ops;
+      size_t end = chunk_run_end(ops, pos, high_qubits, high_ops);
+      // Swapping a high qubit into the chunk and back streams the whole
+      // vector twice, while each gate on a high qubit streams it once.
+      // If remapping does not pay off only use the leading run of gates
+      // on chunk qubits.
+      if (high_ops <= 2 * high_qubits.size()) {
+        high_qubits.clear();
+        end = pos;
+        while (end < ops.size() && is_chunk_local(ops[end]))
+          ++end;
+      }
+      if (end - pos > 1) {
+        for (size_t j = pos; j < end; ++j)
+          update_zero_qubits(ops[j]);
+        apply_chunk_local_ops(ops, pos, end, high_qubits);
+        pos = end - 1;
+        continue;
+      }
+    }
+    update_zero_qubits(op);
     switch (op.type) {
       case Operations::OpType::barrier:
         break;
-      case Operations::OpType::reset:
-        apply_reset(op.qubits, rng);
-        break;
+      case Operations::OpType::reset: {
+        // Batch consecutive resets into a single multi-qubit reset
+        reg_t qubits = op.qubits;
+        while (pos + 1 < ops.size() && ops[pos + 1].type == Operations::OpType::reset) {
+          ++pos;
+          qubits.insert(qubits.end(), ops[pos].qubits.begin(), ops[pos].qubits.end());
+        }
+        std::sort(qubits.begin(), qubits.end());
+        qubits.erase(std::unique(qubits.begin(), qubits.end()), qubits.end());
+        apply_reset(qubits, rng);
+      } break;
       case Operations::OpType::measure:
         apply_measure(op.qubits, op.memory, op.registers, rng);
         break;
@@ -408,7 +516,14 @@ void State<statevec_t>::apply_ops(const std::vector<Operations::Op> &ops,
         apply_matrix(op.qubits, op.mats[0]);
         break;
       case Operations::OpType::kraus:
-        apply_kraus(op.qubits, op.mats, rng);
+        if (op.vmats.size() == op.mats.size()) {
+          apply_kraus(op.qubits, op.vmats, rng);
+        } else {
+          std::vector<cvector_t> vmats;
+          for (const auto &mat : op.mats)
+            vmats.push_back(Utils::vectorize_matrix(mat));
+          apply_kraus(op.qubits, vmats, rng);
+        }
         break;
       default:
         throw std::invalid_argument("QubitVector::State::invalid instruction \'" +
@@ -418,6 +533,156 @@ void State<statevec_t>::apply_ops(const std::vector<Operations::Op> &ops,
 }
 
 
+//=========================================================================
+// Implementation: Out-of-core helpers
+//=========================================================================
+
+template <class statevec_t>
+bool State<statevec_t>::is_chunk_op(const Operations::Op &op) const {
+  return (op.type == Operations::OpType::gate ||
+          op.type == Operations::OpType::matrix);
+}
+
+
+template <class statevec_t>
+bool State<statevec_t>::is_chunk_local(const Operations::Op &op) const {
+  if (!is_chunk_op(op))
+    return false;
+  const auto chunk_qubits = BaseState::qreg_.get_chunk_qubits();
+  for (const auto &qubit : op.qubits) {
+    if (qubit >= chunk_qubits)
+      return false;
+  }
+  return true;
+}
+
+
+template <class statevec_t>
+void State<statevec_t>::update_zero_qubits(const Operations::Op &op) {
+  switch (op.type) {
+    case Operations::OpType::barrier:
+    case Operations::OpType::reset:
+    case Operations::OpType::measure:
+    case Operations::OpType::bfunc:
+    case Operations::OpType::roerror:
+    case Operations::OpType::snapshot:
+      return;
+    case Operations::OpType::gate: {
+      auto it = gateset_.find(op.name);
+      if (it != gateset_.end()) {
+        switch (it->second) {
+          case Gates::id:
+          case Gates::u1:
+          case Gates::z:
+          case Gates::s:
+          case Gates::sdg:
+          case Gates::t:
+          case Gates::tdg:
+          case Gates::cz:
+            return;
+          default:
+            break;
+        }
+      }
+    } break;
+    case Operations::OpType::matrix:
+      if (Utils::is_diagonal(op.mats[0]))
+        return;
+      break;
+    case Operations::OpType::kraus:
+      if (!op.vmats.empty() && op.vmats[0].size() == 1ULL << op.qubits.size())
+        return;
+      break;
+    default:
+      break;
+  }
+  for (const auto &qubit : op.qubits)
+    zero_qubits_[qubit] = false;
+}
+
+
+template <class statevec_t>
+size_t State<statevec_t>::chunk_run_end(const std::vector<Operations::Op> &ops,
+                                        size_t start, reg_t &high_qubits,
+                                        size_t &high_ops) const {
+  const auto chunk_qubits = BaseState::qreg_.get_chunk_qubits();
+  std::set<uint_t> run_qubits;
+  high_ops = 0;
+  size_t end = start;
+  for (; end < ops.size() && is_chunk_op(ops[end]); ++end) {
+    const auto &qubits = ops[end].qubits;
+    size_t new_qubits = 0;
+    for (const auto &qubit : qubits)
+      new_qubits += run_qubits.count(qubit) ? 0 : 1;
+    // Every high qubit needs a free chunk qubit to be swapped with
+    if (run_qubits.size() + new_qubits > chunk_qubits)
+      break;
+    run_qubits.insert(qubits.begin(), qubits.end());
+    if (!is_chunk_local(ops[end]))
+      ++high_ops;
+  }
+  high_qubits.assign(run_qubits.lower_bound(chunk_qubits), run_qubits.end());
+  return end;
+}
+
+
+template <class statevec_t>
+void State<statevec_t>::apply_chunk_local_ops(const std::vector<Operations::Op> &ops,
+                                              size_t start, size_t end,
+                                              const reg_t &high_qubits) {
+  // Gates do not change the classical register so conditionals
+  // can be evaluated once for all chunks
+  std::vector<bool> apply(end - start);
+  for (size_t pos = start; pos < end; ++pos)
+    apply[pos - start] = (ops[pos].type == Operations::OpType::matrix ||
+                          BaseState::creg_.check_conditional(ops[pos]));
+
+  // Pair each high qubit with a chunk qubit not acted on by the run
+  // and relabel the qubits of a copy of the run
+  std::vector<std::pair<uint_t, uint_t>> swaps;
+  std::vector<Operations::Op> remapped_ops;
+  if (!high_qubits.empty()) {
+    std::set<uint_t> used;
+    for (size_t pos = start; pos < end; ++pos)
+      used.insert(ops[pos].qubits.begin(), ops[pos].qubits.end());
+    uint_t free_qubit = 0;
+    for (const auto &qubit : high_qubits) {
+      while (used.count(free_qubit))
+        ++free_qubit;
+      swaps.push_back(std::make_pair(qubit, free_qubit++));
+    }
+    remapped_ops.assign(ops.begin() + start, ops.begin() + end);
+    for (auto &op : remapped_ops) {
+      for (auto &qubit : op.qubits) {
+        for (const auto &swap : swaps) {
+          if (qubit == swap.first) {
+            qubit = swap.second;
+            break;
+          }
+        }
+      }
+    }
+  }
+  const Operations::Op *run = (swaps.empty()) ? &ops[start] : remapped_ops.data();
+
+  for (const auto &swap : swaps)
+    BaseState::qreg_.apply_swap(swap.first, swap.second);
+  BaseState::qreg_.apply_chunked([&]() {
+    for (size_t j = 0; j < end - start; ++j) {
+      if (!apply[j])
+        continue;
+      if (run[j].type == Operations::OpType::matrix)
+        apply_matrix(run[j].qubits, run[j].mats[0]);
+      else
+        apply_gate(run[j]);
+    }
+  });
+  // Swap the high qubits back so the qubit order is unchanged
+  for (const auto &swap : swaps)
+    BaseState::qreg_.apply_swap(swap.first, swap.second);
+}
+
+
 //=========================================================================
 // Implementation: Snapshots
 //=========================================================================
@@ -715,41 +980,85 @@ rvector_t State<statevec_t>::measure_probs(const reg_t &qubits) const {
 }
 
 template <class statevec_t>
-std::vector<reg_t> State<statevec_t>::sample_measure(const reg_t &qubits,
-                                                     uint_t shots,
-                                                     RngEngine &rng) {
+std::vector<uint_t> State<statevec_t>::sample_measure(const reg_t &qubits,
+                                                      uint_t shots,
+                                                      RngEngine &rng) {
   // Generate flat register for storing 
   std::vector<double> rnds;
   rnds.reserve(shots);
   for (uint_t i = 0; i < shots; ++i)
     rnds.push_back(rng.rand(0, 1));
 
-  auto allbit_samples = BaseState::qreg_.sample_measure(rnds);
-
-  // Convert to reg_t format
-  std::vector<reg_t> all_samples;
-  all_samples.reserve(shots);
-  for (int_t val : allbit_samples) {
-    reg_t allbit_sample = Utils::int2reg(val, 2, BaseState::qreg_.num_qubits());
-    reg_t sample;
-    sample.reserve(qubits.size());
-    for (uint_t qubit : qubits) {
-      sample.push_back(allbit_sample[qubit]);
+  std::vector<uint_t> samples;
+  samples.reserve(shots);
+  const uint_t num_qubits = BaseState::qreg_.num_qubits();
+  if (qubits.size() < num_qubits &&
+      qubits.size() <= static_cast<uint_t>(sample_measure_marginal_qubits_)) {
+    // Sample directly from the marginal distribution of the measured qubits
+    auto cdf = BaseState::qreg_.probabilities(qubits);
+    std::partial_sum(cdf.begin(), cdf.end(), cdf.begin());
+    const uint_t last = cdf.size() - 1;
+    for (const auto &rnd : rnds) {
+      const uint_t outcome = std::upper_bound(cdf.begin(), cdf.end(), rnd) - cdf.begin();
+      samples.push_back(std::min(outcome, last));
     }
-    all_samples.push_back(sample);
+    return samples;
+  }
+
+  // Sample all qubits and pack the bits of the measured qubits
+  const auto allbit_samples = BaseState::qreg_.sample_measure(rnds);
+  for (const uint_t val : allbit_samples) {
+    uint_t sample = 0;
+    for (size_t j = 0; j < qubits.size(); ++j)
+      sample |= ((val >> qubits[j]) & 1ULL) << j;
+    samples.push_back(sample);
   }
-  return all_samples;
+  return samples;
 }
 
 
 template <class statevec_t>
 void State<statevec_t>::apply_reset(const reg_t &qubits,
                                     RngEngine &rng) {
-
-  // Simulate unobserved measurement
-  const auto meas = sample_measure_with_prob(qubits, rng);
-  // Apply update tp reset state
-  measure_reset_update(qubits, 0, meas.first, meas.second);
+  // Skip qubits that are known to already be in the |0> state
+  reg_t reset_qubits;
+  for (const auto &qubit : qubits) {
+    if (!zero_qubits_[qubit])
+      reset_qubits.push_back(qubit);
+  }
+  if (reset_qubits.empty())
+    return;
+
+  // Simulate unobserved measurement. The |0> outcome is checked first
+  // since it only requires reading the amplitudes for that outcome.
+  const double r = rng.rand(0., 1.);
+  uint_t outcome = 0;
+  double prob = BaseState::qreg_.probability(reset_qubits, 0);
+  if (r >= prob) {
+    if (reset_qubits.size() == 1) {
+      const double prob1 = BaseState::qreg_.probability(reset_qubits, 1);
+      if (prob1 > 0.) {
+        outcome = 1;
+        prob = prob1;
+      }
+    } else {
+      const auto probs = BaseState::qreg_.probabilities(reset_qubits);
+      double accum = probs[0];
+      for (uint_t j = 1; j < probs.size(); j++) {
+        if (probs[j] > 0.) {
+          outcome = j;
+          accum += probs[j];
+          if (accum > r)
+            break;
+        }
+      }
+      prob = probs[outcome];
+    }
+  }
+  // Collapse to the outcome and move it to the |0> state
+  BaseState::qreg_.apply_reset(reset_qubits, outcome, 1. / std::sqrt(prob));
+  for (const auto &qubit : reset_qubits)
+    zero_qubits_[qubit] = true;
 }
 
 template <class statevec_t>
@@ -813,49 +1122,49 @@ void State<statevec_t>::measure_reset_update(const std::vector<uint_t> &qubits,
 //=========================================================================
 template <class statevec_t>
 void State<statevec_t>::apply_kraus(const reg_t &qubits,
-                                    const std::vector<cmatrix_t> &kmats,
+                                    const std::vector<cvector_t> &kraus_vmats,
                                     RngEngine &rng) {
   
   // Check edge case for empty Kraus set (this shouldn't happen)
-  if (kmats.empty())
+  if (kraus_vmats.empty())
     return; // end function early
 
+  // A single Kraus operator must be unitary
+  if (kraus_vmats.size() == 1) {
+    apply_matrix(qubits, kraus_vmats[0]);
+    return;
+  }
 
-  // Choose a real in [0, 1) to choose the applied kraus operator once
-  // the accumulated probability is greater than r.
-  // We know that the Kraus noise must be normalized
-  // So we only compute probabilities for the first N-1 kraus operators
-  // and infer the probability of the last one from 1 - sum of the previous
-
-  double r = rng.rand(0., 1.);
+  // Compute the probabilities of all Kraus operators in a single pass over
+  // the statevector, then choose a real in [0, 1) to choose the applied
+  // kraus operator once the accumulated probability is greater than r.
+  // Diagonal Kraus operators only depend on the measurement probabilities
+  // of the qubits.
+  rvector_t probs;
+  const size_t dim = 1ULL << qubits.size();
+  if (kraus_vmats[0].size() == dim) {
+    const auto qubit_probs = BaseState::qreg_.probabilities(qubits);
+    probs.assign(kraus_vmats.size(), 0.);
+    for (size_t k=0; k < kraus_vmats.size(); k++)
+      for (size_t i=0; i < dim; i++)
+        probs[k] += std::norm(kraus_vmats[k][i]) * qubit_probs[i];
+  } else {
+    probs = BaseState::qreg_.norms(qubits, kraus_vmats);
+  }
+  const double r = rng.rand(0., 1.);
   double accum = 0.;
-  bool complete = false;
-
-  // Loop through N-1 kraus operators
-  for (size_t j=0; j < kmats.size() - 1; j++) {
-    
-    // Calculate probability
-    cvector_t vmat = Utils::vectorize_matrix(kmats[j]);
-    double p = BaseState::qreg_.norm(qubits, vmat);
-    accum += p;
-    
-    // check if we need to apply this operator
-    if (accum > r) {
-      // rescale vmat so projection is normalized
-      Utils::scalar_multiply_inplace(vmat, 1 / std::sqrt(p));
-      // apply Kraus projection operator
-      apply_matrix(qubits, vmat);
-      complete = true;
+  size_t j = 0;
+  for (; j < kraus_vmats.size() - 1; j++) {
+    accum += probs[j];
+    if (accum > r)
       break;
-    }
   }
 
-  // check if we haven't applied a kraus operator yet
-  if (complete == false) {
-    // Compute probability from accumulated
-    complex_t renorm = 1 / std::sqrt(1. - accum);
-    apply_matrix(qubits, Utils::vectorize_matrix(renorm * kmats.back()));
-  }
+  // rescale vmat so projection is normalized
+  cvector_t vmat = kraus_vmats[j];
+  Utils::scalar_multiply_inplace(vmat, 1 / std::sqrt(probs[j]));
+  // apply Kraus projection operator
+  apply_matrix(qubits, vmat);
 }
 
 //-------------------------------------------------------------------------
@@ -0,0 +1,375 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _clifford_hpp_
+#define _clifford_hpp_
+
+#include <algorithm>
+#include <bitset>
+#include <cstdint>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include "framework/json.hpp"
+
+namespace Clifford {
+
+// Data types
+using uint_t = uint64_t;
+using int_t = int64_t;
+
+//============================================================================
+// Clifford class
+//============================================================================
+
+// Stabilizer tableau for an N-qubit stabilizer state using the
+// Aaronson-Gottesman representation (Phys. Rev. A 70, 052328 (2004)).
+//
+// The tableau has 2N rows of N-qubit Pauli operators: rows [0, N) are the
+// destabilizers and rows [N, 2N) are the stabilizers of the state. Each
+// row is stored as bit-packed X and Z vectors and a phase bit, where a set
+// X and Z bit for a qubit represents a Y Pauli. Gates update each row in
+// O(N) and measurements in O(N^2) time.
+
+class Clifford {
+
+public:
+
+  //-----------------------------------------------------------------------
+  // Constructors and Destructor
+  //-----------------------------------------------------------------------
+
+  Clifford() = default;
+  explicit Clifford(uint_t num_qubits);
+
+  //-----------------------------------------------------------------------
+  // Utility functions
+  //-----------------------------------------------------------------------
+
+  // Returns the number of qubits of the stabilizer state
+  inline uint_t num_qubits() const {return num_qubits_;}
+
+  // Initializes the tableau to the N-qubit all |0> state
+  void initialize(uint_t num_qubits);
+
+  // Return JSON serialization of the Clifford as lists of the
+  // stabilizer and destabilizer Pauli strings
+  json_t json() const;
+
+  //-----------------------------------------------------------------------
+  // Apply Clifford gates
+  //-----------------------------------------------------------------------
+
+  // Apply a 2-qubit Controlled-NOT gate
+  void apply_cx(const uint_t qctrl, const uint_t qtrgt);
+
+  // Apply a 2-qubit Controlled-Z gate
+  void apply_cz(const uint_t q0, const uint_t q1);
+
+  // Apply a 2-qubit SWAP gate
+  void apply_swap(const uint_t q0, const uint_t q1);
+
+  // Apply a single-qubit Hadamard gate
+  void apply_h(const uint_t qubit);
+
+  // Apply a single-qubit Phase gate
+  void apply_s(const uint_t qubit);
+
+  // Apply a single-qubit conjugate Phase gate
+  void apply_sdg(const uint_t qubit);
+
+  // Apply a single-qubit Pauli-X gate
+  void apply_x(const uint_t qubit);
+
+  // Apply a single-qubit Pauli-Y gate
+  void apply_y(const uint_t qubit);
+
+  // Apply a single-qubit Pauli-Z gate
+  void apply_z(const uint_t qubit);
+
+  //-----------------------------------------------------------------------
+  // Z-measurement
+  //-----------------------------------------------------------------------
+
+  // Return true if a Z-measurement of the qubit has a deterministic outcome
+  bool is_deterministic_outcome(const uint_t qubit) const;
+
+  // Measure a qubit in the Z-basis and update the tableau to the post
+  // measurement state. If the outcome is not deterministic randbit is
+  // used as the outcome. Returns the measurement outcome.
+  bool measure_and_update(const uint_t qubit, const bool randbit);
+
+protected:
+
+  //-----------------------------------------------------------------------
+  // Protected data members
+  //-----------------------------------------------------------------------
+
+  uint_t num_qubits_ = 0;
+  uint_t num_words_ = 0;          // number of 64-bit words per row
+  std::vector<uint64_t> x_;       // X bits of each row
+  std::vector<uint64_t> z_;       // Z bits of each row
+  std::vector<uint8_t> phases_;   // phase bit of each row (1 for -1)
+
+  //-----------------------------------------------------------------------
+  // Helper functions
+  //-----------------------------------------------------------------------
+
+  inline bool x(uint_t row, uint_t qubit) const {
+    return (x_[row * num_words_ + (qubit >> 6)] >> (qubit & 63)) & 1ULL;
+  }
+  inline bool z(uint_t row, uint_t qubit) const {
+    return (z_[row * num_words_ + (qubit >> 6)] >> (qubit & 63)) & 1ULL;
+  }
+
+  // Multiply the Pauli (xh, zh, rh) by the Pauli (xi, zi, ri) in place
+  void rowsum(uint64_t *xh, uint64_t *zh, uint8_t &rh,
+              const uint64_t *xi, const uint64_t *zi, const uint8_t ri) const;
+
+  // Multiply row h by row i in place
+  void rowsum(uint_t h, uint_t i);
+
+  // Return a Pauli string label for a row
+  std::string row_string(uint_t row) const;
+
+  // Check the qubit is in range
+  void check_qubit(const uint_t qubit) const;
+};
+
+//------------------------------------------------------------------------------
+// JSON Serialization
+//------------------------------------------------------------------------------
+
+inline void to_json(json_t &js, const Clifford &clifford) {
+  js = clifford.json();
+}
+
+/*******************************************************************************
+ *
+ * Implementations
+ *
+ ******************************************************************************/
+
+//------------------------------------------------------------------------------
+// Utility
+//------------------------------------------------------------------------------
+
+inline Clifford::Clifford(uint_t num_qubits) {
+  initialize(num_qubits);
+}
+
+inline void Clifford::initialize(uint_t num_qubits) {
+  num_qubits_ = num_qubits;
+  num_words_ = (num_qubits + 63) >> 6;
+  x_.assign(2 * num_qubits * num_words_, 0ULL);
+  z_.assign(2 * num_qubits * num_words_, 0ULL);
+  phases_.assign(2 * num_qubits, 0);
+  // Destabilizers X_j and stabilizers Z_j
+  for (uint_t j = 0; j < num_qubits; j++) {
+    x_[j * num_words_ + (j >> 6)] |= 1ULL << (j & 63);
+    z_[(j + num_qubits) * num_words_ + (j >> 6)] |= 1ULL << (j & 63);
+  }
+}
+
+inline std::string Clifford::row_string(uint_t row) const {
+  // Pauli string labels are little-endian so the last character is the
+  // Pauli for qubit-0
+  std::string label = (phases_[row]) ? "-" : "+";
+  for (uint_t j = num_qubits_; j-- > 0;) {
+    const bool xj = x(row, j), zj = z(row, j);
+    label.push_back((xj) ? ((zj) ? 'Y' : 'X') : ((zj) ? 'Z' : 'I'));
+  }
+  return label;
+}
+
+inline json_t Clifford::json() const {
+  json_t js;
+  js["stabilizers"] = json_t::array();
+  js["destabilizers"] = json_t::array();
+  for (uint_t j = 0; j < num_qubits_; j++) {
+    js["destabilizers"].push_back(row_string(j));
+    js["stabilizers"].push_back(row_string(j + num_qubits_));
+  }
+  return js;
+}
+
+inline void Clifford::check_qubit(const uint_t qubit) const {
+  if (qubit >= num_qubits_) {
+    std::stringstream msg;
+    msg << "Clifford: qubit index " << qubit << " > " << num_qubits_;
+    throw std::invalid_argument(msg.str());
+  }
+}
+
+//------------------------------------------------------------------------------
+// Apply gates
+//------------------------------------------------------------------------------
+
+inline void Clifford::apply_cx(const uint_t qctrl, const uint_t qtrgt) {
+  const uint_t wc = qctrl >> 6, wt = qtrgt >> 6;
+  const uint_t bc = qctrl & 63, bt = qtrgt & 63;
+  for (uint_t row = 0; row < 2 * num_qubits_; row++) {
+    uint64_t *xr = &x_[row * num_words_];
+    uint64_t *zr = &z_[row * num_words_];
+    const uint64_t xc = (xr[wc] >> bc) & 1ULL, zc = (zr[wc] >> bc) & 1ULL;
+    const uint64_t xt = (xr[wt] >> bt) & 1ULL, zt = (zr[wt] >> bt) & 1ULL;
+    phases_[row] ^= xc & zt & (xt ^ zc ^ 1ULL);
+    xr[wt] ^= xc << bt;
+    zr[wc] ^= zt << bc;
+  }
+}
+
+inline void Clifford::apply_cz(const uint_t q0, const uint_t q1) {
+  apply_h(q1);
+  apply_cx(q0, q1);
+  apply_h(q1);
+}
+
+inline void Clifford::apply_swap(const uint_t q0, const uint_t q1) {
+  apply_cx(q0, q1);
+  apply_cx(q1, q0);
+  apply_cx(q0, q1);
+}
+
+inline void Clifford::apply_h(const uint_t qubit) {
+  const uint_t w = qubit >> 6, b = qubit & 63;
+  for (uint_t row = 0; row < 2 * num_qubits_; row++) {
+    uint64_t &xw = x_[row * num_words_ + w];
+    uint64_t &zw = z_[row * num_words_ + w];
+    const uint64_t xq = (xw >> b) & 1ULL, zq = (zw >> b) & 1ULL;
+    phases_[row] ^= xq & zq;
+    // swap the X and Z bits
+    xw ^= (xq ^ zq) << b;
+    zw ^= (xq ^ zq) << b;
+  }
+}
+
+inline void Clifford::apply_s(const uint_t qubit) {
+  const uint_t w = qubit >> 6, b = qubit & 63;
+  for (uint_t row = 0; row < 2 * num_qubits_; row++) {
+    const uint64_t xq = (x_[row * num_words_ + w] >> b) & 1ULL;
+    uint64_t &zw = z_[row * num_words_ + w];
+    phases_[row] ^= xq & (zw >> b) & 1ULL;
+    zw ^= xq << b;
+  }
+}
+
+inline void Clifford::apply_sdg(const uint_t qubit) {
+  // Sdg = S.Z
+  apply_z(qubit);
+  apply_s(qubit);
+}
+
+inline void Clifford::apply_x(const uint_t qubit) {
+  for (uint_t row = 0; row < 2 * num_qubits_; row++)
+    phases_[row] ^= z(row, qubit);
+}
+
+inline void Clifford::apply_y(const uint_t qubit) {
+  for (uint_t row = 0; row < 2 * num_qubits_; row++)
+    phases_[row] ^= x(row, qubit) ^ z(row, qubit);
+}
+
+inline void Clifford::apply_z(const uint_t qubit) {
+  for (uint_t row = 0; row < 2 * num_qubits_; row++)
+    phases_[row] ^= x(row, qubit);
+}
+
+//------------------------------------------------------------------------------
+// Measurement
+//------------------------------------------------------------------------------
+
+inline void Clifford::rowsum(uint64_t *xh, uint64_t *zh, uint8_t &rh,
+                             const uint64_t *xi, const uint64_t *zi,
+                             const uint8_t ri) const {
+  // The phase of the product is i^sum where each qubit contributes
+  // g(xi, zi, xh, zh) in {-1, 0, 1}. The qubits contributing +1 and -1 are
+  // computed for 64 qubits at a time from the bit-packed rows.
+  int_t sum = 2 * rh + 2 * ri;
+  for (uint_t w = 0; w < num_words_; w++) {
+    const uint64_t y1 = xi[w] & zi[w];
+    const uint64_t x1 = xi[w] & ~zi[w];
+    const uint64_t z1 = ~xi[w] & zi[w];
+    const uint64_t plus = (y1 & zh[w] & ~xh[w]) | (x1 & zh[w] & xh[w])
+                          | (z1 & xh[w] & ~zh[w]);
+    const uint64_t minus = (y1 & xh[w] & ~zh[w]) | (x1 & zh[w] & ~xh[w])
+                           | (z1 & xh[w] & zh[w]);
+    sum += std::bitset<64>(plus).count();
+    sum -= std::bitset<64>(minus).count();
+    xh[w] ^= xi[w];
+    zh[w] ^= zi[w];
+  }
+  rh = (((sum % 4) + 4) % 4 == 2) ? 1 : 0;
+}
+
+inline void Clifford::rowsum(uint_t h, uint_t i) {
+  rowsum(&x_[h * num_words_], &z_[h * num_words_], phases_[h],
+         &x_[i * num_words_], &z_[i * num_words_], phases_[i]);
+}
+
+inline bool Clifford::is_deterministic_outcome(const uint_t qubit) const {
+  check_qubit(qubit);
+  // The outcome is random if any stabilizer anticommutes with Z_qubit
+  for (uint_t row = num_qubits_; row < 2 * num_qubits_; row++) {
+    if (x(row, qubit))
+      return false;
+  }
+  return true;
+}
+
+inline bool Clifford::measure_and_update(const uint_t qubit, const bool randbit) {
+  check_qubit(qubit);
+  // Find the first stabilizer that anticommutes with Z_qubit
+  uint_t p = 2 * num_qubits_;
+  for (uint_t row = num_qubits_; row < 2 * num_qubits_; row++) {
+    if (x(row, qubit)) {
+      p = row;
+      break;
+    }
+  }
+
+  // Deterministic outcome: Z_qubit is a product of stabilizers given by
+  // the destabilizers that anticommute with it
+  if (p == 2 * num_qubits_) {
+    std::vector<uint64_t> xs(num_words_, 0ULL), zs(num_words_, 0ULL);
+    uint8_t rs = 0;
+    for (uint_t row = 0; row < num_qubits_; row++) {
+      if (x(row, qubit)) {
+        const uint_t stab = row + num_qubits_;
+        rowsum(xs.data(), zs.data(), rs,
+               &x_[stab * num_words_], &z_[stab * num_words_], phases_[stab]);
+      }
+    }
+    return rs;
+  }
+
+  // Random outcome: update all other rows that anticommute with Z_qubit
+  for (uint_t row = 0; row < 2 * num_qubits_; row++) {
+    if (row != p && x(row, qubit))
+      rowsum(row, p);
+  }
+  // Replace the destabilizer with the old stabilizer, and the stabilizer
+  // with +/- Z_qubit for the outcome
+  const uint_t d = p - num_qubits_;
+  std::copy(x_.begin() + p * num_words_, x_.begin() + (p + 1) * num_words_,
+            x_.begin() + d * num_words_);
+  std::copy(z_.begin() + p * num_words_, z_.begin() + (p + 1) * num_words_,
+            z_.begin() + d * num_words_);
+  phases_[d] = phases_[p];
+  std::fill(x_.begin() + p * num_words_, x_.begin() + (p + 1) * num_words_, 0ULL);
+  std::fill(z_.begin() + p * num_words_, z_.begin() + (p + 1) * num_words_, 0ULL);
+  z_[p * num_words_ + (qubit >> 6)] |= 1ULL << (qubit & 63);
+  phases_[p] = randbit;
+  return randbit;
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Clifford
+//------------------------------------------------------------------------------
+#endif
@@ -0,0 +1,520 @@
+/**
+ * Copyright 2018, IBM.
+ *
+ * This source code is licensed under the Apache License, Version 2.0 found in
+ * the LICENSE.txt file in the root directory of this source tree.
+ */
+
+#ifndef _stabilizer_state_hpp
+#define _stabilizer_state_hpp
+
+#include "framework/utils.hpp"
+#include "framework/json.hpp"
+#include "base/state.hpp"
+#include "clifford.hpp"
+
+
+namespace AER {
+namespace Stabilizer {
+
+// Allowed gates enum class
+enum class Gates {
+  id, x, y, z, h, s, sdg, // single qubit
+  cx, cz, swap // two qubit
+};
+
+// Allowed snapshots enum class
+enum class Snapshots {
+  stabilizer, cmemory, cregister
+};
+
+//=========================================================================
+// Stabilizer State subclass
+//=========================================================================
+
+// A State for simulating Clifford circuits on a stabilizer tableau.
+// Gates take O(n) and measurements O(n^2) time in the number of qubits
+// so circuits on hundreds of qubits can be simulated.
+
+template <class clifford_t = Clifford::Clifford>
+class State : public Base::State<clifford_t> {
+public:
+  using BaseState = Base::State<clifford_t>;
+
+  State() = default;
+  virtual ~State() = default;
+
+  //-----------------------------------------------------------------------
+  // Base class overrides
+  //-----------------------------------------------------------------------
+
+  // Return the set of qobj instruction types supported by the State
+  inline virtual std::unordered_set<Operations::OpType> allowed_ops() const override {
+    return std::unordered_set<Operations::OpType>({
+      Operations::OpType::gate,
+      Operations::OpType::matrix,
+      Operations::OpType::measure,
+      Operations::OpType::reset,
+      Operations::OpType::snapshot,
+      Operations::OpType::barrier,
+      Operations::OpType::bfunc,
+      Operations::OpType::roerror
+    });
+  }
+
+  // Return the set of qobj gate instruction names supported by the State
+  inline virtual stringset_t allowed_gates() const override {
+    return {"CX", "cx", "cz", "swap", "id", "x", "y", "z", "h", "s", "sdg"};
+  }
+
+  // Return the set of qobj snapshot types supported by the State
+  inline virtual stringset_t allowed_snapshots() const override {
+    return {"stabilizer", "memory", "register"};
+  }
+
+  // Apply a sequence of operations by looping over list
+  // If the input is not in allowed_ops an exeption will be raised.
+  virtual void apply_ops(const std::vector<Operations::Op> &ops,
+                         OutputData &data,
+                         RngEngine &rng) override;
+
+  // Return false if circuit contains an unsupported instruction, or a
+  // matrix instruction that is not a Pauli matrix. Otherwise return true.
+  virtual bool validate_circuit(const Circuit &circ) const override;
+
+  // Raise an exeption if the circuit contains unsupported instructions
+  virtual void validate_circuit_except(const Circuit &circ) const override;
+
+  // Initializes an n-qubit state to the all |0> state
+  virtual void initialize_qreg(uint_t num_qubits) override;
+
+  // Initializes to a specific n-qubit state
+  virtual void initialize_qreg(uint_t num_qubits,
+                               const clifford_t &state) override;
+
+  // Returns the required memory for storing an n-qubit state in megabytes.
+  // For this state the memory is indepdentent of the number of ops
+  // and is approximately n^2 / 2 bytes
+  virtual uint_t required_memory_mb(uint_t num_qubits,
+                                    const std::vector<Operations::Op> &ops) override;
+
+  // Sample n-measurement outcomes without applying the measure operation
+  // to the system state. The outcome distribution is computed once from
+  // copies of the tableau and each shot is sampled in O(n).
+  virtual std::vector<uint_t> sample_measure(const reg_t& qubits,
+                                             uint_t shots,
+                                             RngEngine &rng) override;
+
+  //-----------------------------------------------------------------------
+  // Additional methods
+  //-----------------------------------------------------------------------
+
+  // Initializing from a statevector is not supported and raises an exception
+  virtual void initialize_qreg(uint_t num_qubits, const cvector_t &state);
+
+protected:
+
+  //-----------------------------------------------------------------------
+  // Apply instructions
+  //-----------------------------------------------------------------------
+
+  // Applies a sypported Gate operation to the state class.
+  // If the input is not in allowed_gates an exeption will be raised.
+  void apply_gate(const Operations::Op &op);
+
+  // Apply a matrix instruction that is a multi-qubit Pauli matrix up to a
+  // global phase. Pauli errors in noise models are given as matrices.
+  void apply_pauli_matrix(const reg_t &qubits, const cmatrix_t &mat);
+
+  // Return true if the matrix is a multi-qubit Pauli matrix X^x Z^z up to
+  // a global phase and set the bits of x and z for each matrix qubit
+  static bool pauli_matrix(const cmatrix_t &mat, uint_t &x, uint_t &z);
+
+  // Measure qubits and return a list of outcomes [q0, q1, ...]
+  virtual void apply_measure(const reg_t &qubits,
+                             const reg_t &cmemory,
+                             const reg_t &cregister,
+                             RngEngine &rng);
+
+  // Reset the specified qubits to the |0> state by measuring and applying
+  // an x-gate if the outcome is 1
+  void apply_reset(const reg_t &qubits, RngEngine &rng);
+
+  // Apply a supported snapshot instruction
+  // If the input is not in allowed_snapshots an exeption will be raised.
+  virtual void apply_snapshot(const Operations::Op &op, OutputData &data);
+
+  // Measure the qubits of a tableau and return the outcome as an integer
+  // where the bit at position j is the outcome of qubits[j]
+  uint_t measure_qubits(clifford_t &clifford, const reg_t &qubits,
+                        RngEngine &rng) const;
+
+  //-----------------------------------------------------------------------
+  // Config Settings
+  //-----------------------------------------------------------------------
+
+  // Table of allowed gate names to gate enum class members
+  const static stringmap_t<Gates> gateset_;
+
+  // Table of allowed snapshot types to enum class members
+  const static stringmap_t<Snapshots> snapshotset_;
+
+};
+
+
+//=========================================================================
+// Implementation: Allowed ops and gateset
+//=========================================================================
+
+template <class clifford_t>
+const stringmap_t<Gates> State<clifford_t>::gateset_({
+  // Single qubit gates
+  {"id", Gates::id},     // Pauli-Identity gate
+  {"x", Gates::x},       // Pauli-X gate
+  {"y", Gates::y},       // Pauli-Y gate
+  {"z", Gates::z},       // Pauli-Z gate
+  {"s", Gates::s},       // Phase gate (aka sqrt(Z) gate)
+  {"sdg", Gates::sdg},   // Conjugate-transpose of Phase gate
+  {"h", Gates::h},       // Hadamard gate (X + Z / sqrt(2))
+  // Two-qubit gates
+  {"CX", Gates::cx},     // Controlled-X gate (CNOT)
+  {"cx", Gates::cx},     // Controlled-X gate (CNOT)
+  {"cz", Gates::cz},     // Controlled-Z gate
+  {"swap", Gates::swap}  // SWAP gate
+});
+
+template <class clifford_t>
+const stringmap_t<Snapshots> State<clifford_t>::snapshotset_({
+  {"stabilizer", Snapshots::stabilizer},
+  {"memory", Snapshots::cmemory},
+  {"register", Snapshots::cregister}
+});
+
+
+//=========================================================================
+// Implementation: Base class method overrides
+//=========================================================================
+
+//-------------------------------------------------------------------------
+// Initialization
+//-------------------------------------------------------------------------
+
+template <class clifford_t>
+void State<clifford_t>::initialize_qreg(uint_t num_qubits) {
+  BaseState::qreg_.initialize(num_qubits);
+}
+
+template <class clifford_t>
+void State<clifford_t>::initialize_qreg(uint_t num_qubits,
+                                        const clifford_t &state) {
+  // Check dimension of state
+  if (state.num_qubits() != num_qubits) {
+    throw std::invalid_argument("Stabilizer::State::initialize: initial state does not match qubit number");
+  }
+  BaseState::qreg_ = state;
+}
+
+template <class clifford_t>
+void State<clifford_t>::initialize_qreg(uint_t num_qubits, const cvector_t &state) {
+  (void)num_qubits;
+  (void)state;
+  throw std::invalid_argument("Stabilizer::State::initialize: initial statevector is not supported");
+}
+
+//-------------------------------------------------------------------------
+// Validation
+//-------------------------------------------------------------------------
+
+template <class clifford_t>
+bool State<clifford_t>::validate_circuit(const Circuit &circ) const {
+  if (BaseState::validate_circuit(circ) == false)
+    return false;
+  uint_t x, z;
+  for (const auto &op : circ.ops) {
+    if (op.type == Operations::OpType::matrix && !pauli_matrix(op.mats[0], x, z))
+      return false;
+  }
+  return true;
+}
+
+template <class clifford_t>
+void State<clifford_t>::validate_circuit_except(const Circuit &circ) const {
+  BaseState::validate_circuit_except(circ);
+  uint_t x, z;
+  for (const auto &op : circ.ops) {
+    if (op.type == Operations::OpType::matrix && !pauli_matrix(op.mats[0], x, z))
+      throw std::invalid_argument("Circuit contains invalid instructions: non-Pauli matrix");
+  }
+}
+
+//-------------------------------------------------------------------------
+// Utility
+//-------------------------------------------------------------------------
+
+template <class clifford_t>
+uint_t State<clifford_t>::required_memory_mb(uint_t num_qubits,
+                                 const std::vector<Operations::Op> &ops) {
+  // The tableau stores 2n rows of 2n bits
+  (void)ops; // avoid unused variable compiler warning
+  const uint_t mem_mb = (num_qubits * num_qubits / 2) >> 20;
+  return std::max<uint_t>(mem_mb, 1);
+}
+
+
+//=========================================================================
+// Implementation: apply operations
+//=========================================================================
+
+template <class clifford_t>
+void State<clifford_t>::apply_ops(const std::vector<Operations::Op> &ops,
+                      OutputData &data,
+                      RngEngine &rng) {
+  // Simple loop over vector of input operations
+  for (const auto &op : ops) {
+    switch (op.type) {
+      case Operations::OpType::barrier:
+        break;
+      case Operations::OpType::reset:
+        apply_reset(op.qubits, rng);
+        break;
+      case Operations::OpType::measure:
+        apply_measure(op.qubits, op.memory, op.registers, rng);
+        break;
+      case Operations::OpType::bfunc:
+        BaseState::creg_.apply_bfunc(op);
+        break;
+      case Operations::OpType::roerror:
+        BaseState::creg_.apply_roerror(op, rng);
+        break;
+      case Operations::OpType::gate:
+        if (BaseState::creg_.check_conditional(op))
+          apply_gate(op);
+        break;
+      case Operations::OpType::matrix:
+        if (BaseState::creg_.check_conditional(op))
+          apply_pauli_matrix(op.qubits, op.mats[0]);
+        break;
+      case Operations::OpType::snapshot:
+        apply_snapshot(op, data);
+        break;
+      default:
+        throw std::invalid_argument("Stabilizer::State::invalid instruction \'" +
+                                    op.name + "\'.");
+    }
+  }
+}
+
+template <class clifford_t>
+void State<clifford_t>::apply_gate(const Operations::Op &op) {
+  // Look for gate name in gateset
+  auto it = gateset_.find(op.name);
+  if (it == gateset_.end())
+    throw std::invalid_argument("Stabilizer::State::invalid gate instruction \'" +
+                                op.name + "\'.");
+  switch (it -> second) {
+    case Gates::id:
+      break;
+    case Gates::x:
+      BaseState::qreg_.apply_x(op.qubits[0]);
+      break;
+    case Gates::y:
+      BaseState::qreg_.apply_y(op.qubits[0]);
+      break;
+    case Gates::z:
+      BaseState::qreg_.apply_z(op.qubits[0]);
+      break;
+    case Gates::h:
+      BaseState::qreg_.apply_h(op.qubits[0]);
+      break;
+    case Gates::s:
+      BaseState::qreg_.apply_s(op.qubits[0]);
+      break;
+    case Gates::sdg:
+      BaseState::qreg_.apply_sdg(op.qubits[0]);
+      break;
+    case Gates::cx:
+      BaseState::qreg_.apply_cx(op.qubits[0], op.qubits[1]);
+      break;
+    case Gates::cz:
+      BaseState::qreg_.apply_cz(op.qubits[0], op.qubits[1]);
+      break;
+    case Gates::swap:
+      BaseState::qreg_.apply_swap(op.qubits[0], op.qubits[1]);
+      break;
+    default:
+      // We shouldn't reach here unless there is a bug in gateset
+      throw std::invalid_argument("Stabilizer::State::invalid gate instruction \'" +
+                                  op.name + "\'.");
+  }
+}
+
+template <class clifford_t>
+bool State<clifford_t>::pauli_matrix(const cmatrix_t &mat, uint_t &x, uint_t &z) {
+  // A Pauli matrix X^x Z^z maps |j> to (-1)^{z.j} |j ^ x> so each column
+  // has a single non-zero entry. The entry of column 0 gives x and the
+  // global phase, and the signs of columns 2^k give the bits of z.
+  const double threshold = 1e-10;
+  const uint_t dim = mat.GetRows();
+  if (dim != mat.GetColumns() || dim == 0 || (dim & (dim - 1)) != 0)
+    return false;
+  x = 0;
+  while (x < dim && std::abs(mat(x, 0)) < threshold)
+    x++;
+  if (x == dim)
+    return false;
+  const complex_t phase = mat(x, 0);
+  z = 0;
+  for (uint_t k = 1; k < dim; k <<= 1) {
+    if (std::abs(mat(k ^ x, k) + phase) < threshold)
+      z |= k;
+  }
+  // Check all entries match the Pauli matrix
+  for (uint_t col = 0; col < dim; col++) {
+    const bool odd = std::bitset<64>(col & z).count() & 1;
+    for (uint_t row = 0; row < dim; row++) {
+      const complex_t val = (row != (col ^ x)) ? 0. : ((odd) ? -phase : phase);
+      if (std::abs(mat(row, col) - val) > threshold)
+        return false;
+    }
+  }
+  return true;
+}
+
+template <class clifford_t>
+void State<clifford_t>::apply_pauli_matrix(const reg_t &qubits,
+                                           const cmatrix_t &mat) {
+  uint_t x, z;
+  if (!pauli_matrix(mat, x, z))
+    throw std::invalid_argument("Stabilizer::State::invalid matrix instruction:"
+                                " matrix is not a Pauli matrix.");
+  // The global phase of the matrix has no effect on the state
+  for (size_t k = 0; k < qubits.size(); k++) {
+    const bool xk = (x >> k) & 1ULL, zk = (z >> k) & 1ULL;
+    if (xk && zk)
+      BaseState::qreg_.apply_y(qubits[k]);
+    else if (xk)
+      BaseState::qreg_.apply_x(qubits[k]);
+    else if (zk)
+      BaseState::qreg_.apply_z(qubits[k]);
+  }
+}
+
+template <class clifford_t>
+void State<clifford_t>::apply_snapshot(const Operations::Op &op, OutputData &data) {
+  // Look for snapshot type in snapshotset
+  auto it = snapshotset_.find(op.name);
+  if (it == snapshotset_.end())
+    throw std::invalid_argument("Stabilizer::State::invalid snapshot instruction \'" +
+                                op.name + "\'.");
+  switch (it -> second) {
+    case Snapshots::stabilizer:
+      BaseState::snapshot_state(op, data, "stabilizer");
+      break;
+    case Snapshots::cmemory:
+      BaseState::snapshot_creg_memory(op, data);
+      break;
+    case Snapshots::cregister:
+      BaseState::snapshot_creg_register(op, data);
+      break;
+    default:
+      // We shouldn't get here unless there is a bug in the snapshotset
+      throw std::invalid_argument("Stabilizer::State::invalid snapshot instruction \'" +
+                                  op.name + "\'.");
+  }
+}
+
+
+//=========================================================================
+// Implementation: Reset and Measurement Sampling
+//=========================================================================
+
+template <class clifford_t>
+uint_t State<clifford_t>::measure_qubits(clifford_t &clifford,
+                                         const reg_t &qubits,
+                                         RngEngine &rng) const {
+  uint_t outcome = 0;
+  for (size_t j = 0; j < qubits.size(); ++j) {
+    // Only draw a random bit if the outcome is not deterministic
+    bool randbit = false;
+    if (!clifford.is_deterministic_outcome(qubits[j]))
+      randbit = (rng.rand(0., 1.) < 0.5);
+    if (clifford.measure_and_update(qubits[j], randbit))
+      outcome |= 1ULL << j;
+  }
+  return outcome;
+}
+
+template <class clifford_t>
+void State<clifford_t>::apply_measure(const reg_t &qubits,
+                          const reg_t &cmemory,
+                          const reg_t &cregister,
+                          RngEngine &rng) {
+  const uint_t outcome = measure_qubits(BaseState::qreg_, qubits, rng);
+  BaseState::creg_.store_measure(Utils::int2reg(outcome, 2, qubits.size()),
+                                 cmemory, cregister);
+}
+
+template <class clifford_t>
+void State<clifford_t>::apply_reset(const reg_t &qubits, RngEngine &rng) {
+  for (const auto &qubit : qubits) {
+    if (measure_qubits(BaseState::qreg_, {qubit}, rng))
+      BaseState::qreg_.apply_x(qubit);
+  }
+}
+
+template <class clifford_t>
+std::vector<uint_t> State<clifford_t>::sample_measure(const reg_t &qubits,
+                                          uint_t shots,
+                                          RngEngine &rng) {
+  // The outcomes of measuring a stabilizer state are uniformly distributed
+  // over an affine subspace: each outcome is a fixed offset XOR the
+  // generators of the random bits that are set, where there is one random
+  // bit for each non-deterministic measurement. The subspace is found by
+  // measuring one copy of the tableau with all random bits 0, and one copy
+  // with each random bit set in turn. Each shot is then sampled in O(r) for
+  // r random bits, drawing the random bits in the same order as
+  // measure_qubits.
+  reg_t random_meas;
+  uint_t offset = 0;
+  {
+    clifford_t clifford = BaseState::qreg_;
+    for (size_t j = 0; j < qubits.size(); ++j) {
+      if (!clifford.is_deterministic_outcome(qubits[j]))
+        random_meas.push_back(j);
+      if (clifford.measure_and_update(qubits[j], false))
+        offset |= 1ULL << j;
+    }
+  }
+  // Which measurements are random does not depend on the outcomes, and the
+  // outcomes are linear in the random bits
+  std::vector<uint_t> generators;
+  generators.reserve(random_meas.size());
+  for (const auto k : random_meas) {
+    clifford_t clifford = BaseState::qreg_;
+    uint_t outcome = 0;
+    for (size_t j = 0; j < qubits.size(); ++j) {
+      if (clifford.measure_and_update(qubits[j], j == k))
+        outcome |= 1ULL << j;
+    }
+    generators.push_back(outcome ^ offset);
+  }
+
+  std::vector<uint_t> samples;
+  samples.reserve(shots);
+  while (shots-- > 0) {
+    uint_t outcome = offset;
+    for (const auto gen : generators) {
+      if (rng.rand(0., 1.) < 0.5)
+        outcome ^= gen;
+    }
+    samples.push_back(outcome);
+  }
+  return samples;
+}
+
+//-------------------------------------------------------------------------
+} // end namespace Stabilizer
+//-------------------------------------------------------------------------
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
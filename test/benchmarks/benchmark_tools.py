@@ -5,14 +5,15 @@ Benchmarking utility functions.
 import time
 from multiprocessing import cpu_count
 
+import numpy as np
 import qiskit
 from qiskit import QiskitError
-from qiskit import ClassicalRegister, QuantumCircuit
-from qiskit_aer.backends.qasm_simulator import QasmSimulator
-from qiskit_aer.noise import NoiseModel
-from qiskit_aer.noise.errors import depolarizing_error
-from qiskit_aer.noise.errors import amplitude_damping_error
-from qiskit_aer.noise.errors import thermal_relaxation_error
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.providers.aer import QasmSimulator
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.errors import depolarizing_error
+from qiskit.providers.aer.noise.errors import amplitude_damping_error
+from qiskit.providers.aer.noise.errors import thermal_relaxation_error
 
 
 def benchmark_circuits_qasm_simulator(circuits,
@@ -45,20 +46,26 @@ def benchmark_circuits_qasm_simulator(circuits,
               " is greater than cpu_count ({1}).".format(cpu_count()))
         threads = cpu_count()
 
-    # Generate backend
-    backend = aer_benchmark_backend(max_threads=threads, parallel_mode=parallel_mode,
-                                    noise_model=noise_model, config=config)
+    # Generate backend options
+    backend_options = aer_benchmark_options(max_threads=threads,
+                                            parallel_mode=parallel_mode,
+                                            config=config)
     # time circuits
-    return benchmark_circuits(backend, circuits, shots=shots)
+    return benchmark_circuits(QasmSimulator(), circuits, shots=shots,
+                              backend_options=backend_options,
+                              noise_model=noise_model)
 
 
-def benchmark_circuits(backend, circuits, shots=1):
+def benchmark_circuits(backend, circuits, shots=1, backend_options=None,
+                       noise_model=None):
     """Return average execution time for a list of circuits.
 
     Args:
         backend (Backend): A qiskit backend object.
         circuits list(QuantumCircuit): a list of quantum circuits.
         shots (int): Number of shots for each circuit.
+        backend_options (dict): Backend options for execution.
+        noise_model (NoiseModel): Noise model for execution.
 
     Returns
         float: The total execution time for all circuits divided by the
@@ -69,54 +76,71 @@ def benchmark_circuits(backend, circuits, shots=1):
     """
     qobj = qiskit.compile(circuits, backend, shots=shots)
     start_time = time.time()
-    result = backend.run(qobj).result()
+    run_qobj(backend, qobj, backend_options=backend_options,
+             noise_model=noise_model)
     end_time = time.time()
     if isinstance(circuits, QuantumCircuit):
         average_time = end_time - start_time
     else:
         average_time = (end_time - start_time) / len(circuits)
-    if result.status != 'COMPLETED':
-        raise QiskitError("Simulation failed. Status: " + result.status)
     return average_time
 
 
-def aer_benchmark_backend(max_threads=-1,
+def run_qobj(backend, qobj, backend_options=None, noise_model=None):
+    """Execute a qobj on a backend and return the result.
+
+    Args:
+        backend (Backend): A qiskit backend object.
+        qobj (Qobj): the qobj to execute.
+        backend_options (dict): Backend options for execution.
+        noise_model (NoiseModel): Noise model for execution.
+
+    Returns:
+        Result: the result of the execution.
+
+    Raises:
+        QiskitError: If the simulation execution fails.
+    """
+    # The statevector and unitary simulators do not accept a noise model
+    if noise_model is None:
+        job = backend.run(qobj, backend_options=backend_options)
+    else:
+        job = backend.run(qobj, backend_options=backend_options,
+                          noise_model=noise_model)
+    result = job.result()
+    if result.status != 'COMPLETED':
+        raise QiskitError("Simulation failed. Status: " + str(result.status))
+    return result
+
+
+def aer_benchmark_options(max_threads=None,
                           parallel_mode='state',
-                          noise_model=None,
                           config=None):
-    """Return an Aer simulator backend for benchmarking.
+    """Return Aer simulator backend options for benchmarking.
 
     Args:
         max_threads (int): The maximum number of threads to use for
-                           OpenMP parallelization.
+                           OpenMP parallelization. If None the simulator
+                           default is used.
         parallel_mode (str): The method of parallelization to use.
                             options are 'state', 'circuit', 'shot'.
-        noise_model (dict): Noise dictionary.
-        config (dict): Backend configuration dictionary.
+        config (dict): Additional backend options.
 
     Returns:
-        AerQvSimulator: backend object with parallelization options set
+        dict: backend options with parallelization options set.
     """
-
-    # Set max threads for parallelization mode
-    max_threads_state = max_threads
-    max_threads_circuit = 1
-    max_threads_shot = 1
-    if parallel_mode == 'circuit':
-        max_threads_circuit = max_threads
-    elif parallel_mode == 'shot':
-        max_threads_shot = max_threads
-
-    # Set threads
-    backend = QasmSimulator()
-    backend.set_max_threads_state(max_threads_state)
-    backend.set_max_threads_circuit(max_threads_circuit)
-    backend.set_max_threads_shot(max_threads_shot)
-    # Load config
-    backend.set_config(config)
-    # Load noise model
-    backend.set_noise_model(noise_model)
-    return backend
+    backend_options = {}
+    if max_threads is not None:
+        backend_options['max_parallel_threads'] = max_threads
+        backend_options['max_parallel_experiments'] = 1
+        backend_options['max_parallel_shots'] = 1
+        if parallel_mode == 'circuit':
+            backend_options['max_parallel_experiments'] = max_threads
+        elif parallel_mode == 'shot':
+            backend_options['max_parallel_shots'] = max_threads
+    if config is not None:
+        backend_options.update(config)
+    return backend_options
 
 
 def add_measurement(circuit, measure_opt=True):
@@ -130,7 +154,7 @@ def add_measurement(circuit, measure_opt=True):
         QuantumCircuit: The input quantum circuit with classical registers
         and measure operations added.
     """
-    qregs = list(circuit.get_qregs().values())
+    qregs = list(circuit.qregs)
     cregs = []
     for qreg in qregs:
         cregs.append(ClassicalRegister(qreg.size))
@@ -175,3 +199,84 @@ def reset_noise_model():
     error2 = error1.kron(error1)
     noise_model.add_all_qubit_quantum_error(error2, ['cx'])
     return noise_model
+
+
+def device_noise_model(num_qubits, seed=None):
+    """Return test noise model with different errors on each qubit.
+
+    The noise model has thermal relaxation errors on single-qubit gates
+    and on CX gates between neighbouring qubits, and readout errors on
+    each qubit, with relaxation times and readout probabilities drawn
+    at random.
+    """
+    rng = np.random.RandomState(seed)
+    t1s = rng.uniform(40, 80, size=num_qubits)
+    t2s = np.minimum(rng.uniform(20, 100, size=num_qubits), 2 * t1s)
+    noise_model = NoiseModel()
+    for qubit in range(num_qubits):
+        error = thermal_relaxation_error(t1s[qubit], t2s[qubit], 0.1)
+        noise_model.add_quantum_error(error, ['u2', 'u3'], [qubit])
+        p0, p1 = rng.uniform(0, 0.05, size=2)
+        noise_model.add_readout_error([[1 - p0, p0], [p1, 1 - p1]], [qubit])
+    for qubit in range(num_qubits - 1):
+        error = thermal_relaxation_error(t1s[qubit], t2s[qubit], 0.3).kron(
+            thermal_relaxation_error(t1s[qubit + 1], t2s[qubit + 1], 0.3))
+        noise_model.add_quantum_error(error, 'cx', [qubit, qubit + 1])
+    return noise_model
+
+
+def clifford_circuit(num_qubits, num_gates, measure=True, seed=None):
+    """Return a random circuit of Clifford gates.
+
+    Args:
+        num_qubits (int): number of qubits.
+        num_gates (int): number of gates in the circuit.
+        measure (bool): include measurement in circuit.
+        seed (int): seed for the random gate choice.
+
+    Returns:
+        QuantumCircuit: A random Clifford circuit.
+    """
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(num_qubits)
+    circuit = QuantumCircuit(qr)
+    single_gates = [circuit.h, circuit.s, circuit.sdg,
+                    circuit.x, circuit.y, circuit.z]
+    for _ in range(num_gates):
+        if num_qubits > 1 and rng.rand() < 0.3:
+            q0, q1 = rng.choice(num_qubits, size=2, replace=False)
+            circuit.cx(qr[int(q0)], qr[int(q1)])
+        else:
+            gate = single_gates[rng.randint(len(single_gates))]
+            gate(qr[rng.randint(num_qubits)])
+    if measure is True:
+        circuit = add_measurement(circuit)
+    return circuit
+
+
+def layered_circuit(num_qubits, depth, seed=None):
+    """Return a random circuit of layers separated by barriers.
+
+    Each layer applies a random u3 gate to every qubit followed by CX
+    gates between neighbouring qubits. A barrier is added after every
+    layer so that snapshots may be inserted between layers.
+
+    Args:
+        num_qubits (int): number of qubits.
+        depth (int): number of layers.
+        seed (int): seed for the random gate parameters.
+
+    Returns:
+        QuantumCircuit: A layered random circuit.
+    """
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(num_qubits)
+    circuit = QuantumCircuit(qr)
+    for layer in range(depth):
+        for qubit in range(num_qubits):
+            theta, phi, lam = 2 * np.pi * rng.rand(3)
+            circuit.u3(theta, phi, lam, qr[qubit])
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            circuit.cx(qr[qubit], qr[qubit + 1])
+        circuit.barrier(qr)
+    return circuit
@@ -0,0 +1,298 @@
+"""
+Run the Aer benchmark suite and check for performance regressions.
+
+Each benchmark configuration (benchmark method and combination of
+parameters) is run in a separate process so that the peak memory usage
+of each configuration can be recorded. For each configuration the
+minimum wall time over several repeats, the peak resident set size of the
+process and the throughput are stored in a JSON results file.
+
+If a baseline results file is given the results are compared against it
+and the script exits with a non-zero status if the wall time or peak
+memory of any configuration increased by more than the allowed
+threshold.
+
+Example:
+    python run_benchmarks.py --output baseline.json
+    python run_benchmarks.py --output results.json --compare baseline.json \\
+        --time-threshold 0.2 --memory-threshold 0.1
+"""
+
+import argparse
+import datetime
+import inspect
+import itertools
+import json
+import multiprocessing
+import platform
+import queue as queue_module
+import re
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+RESULTS_VERSION = 1
+
+
+def benchmark_configurations(suite, pattern=None):
+    """Return the list of benchmark configurations in a suite module.
+
+    Args:
+        suite (module): the module containing benchmark classes.
+        pattern (str): only return configurations whose name matches this
+                       regular expression (optional).
+
+    Returns:
+        list: a list of (name, class_name, method_name, params) tuples.
+    """
+    configurations = []
+    for class_name, cls in inspect.getmembers(suite, inspect.isclass):
+        if cls.__module__ != suite.__name__:
+            continue
+        methods = sorted(name for name, _ in inspect.getmembers(cls, callable)
+                         if name.startswith('time_'))
+        if not methods:
+            continue
+        param_names = list(cls.param_names)
+        params = cls.params
+        # Like asv a single parameter may be given as a flat list
+        if len(param_names) == 1 and not isinstance(params[0], (list, tuple)):
+            params = [params]
+        for method in methods:
+            for values in itertools.product(*params):
+                name = '{}.{}({})'.format(
+                    class_name, method,
+                    ', '.join('{}={!r}'.format(key, val)
+                              for key, val in zip(param_names, values)))
+                if pattern is None or re.search(pattern, name):
+                    configurations.append((name, class_name, method,
+                                           dict(zip(param_names, values))))
+    return configurations
+
+
+def _maxrss_mb(who):
+    """Return the ru_maxrss of a getrusage target in MB."""
+    rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    if sys.platform == 'darwin':
+        return rss / 2 ** 20
+    return rss / 2 ** 10
+
+
+def peak_rss_mb():
+    """Return the peak resident set size in MB of the current process and
+    of its terminated child processes."""
+    # On Linux ru_maxrss is inherited across fork and exec so it includes
+    # the peak of the parent process. The high water mark of the process
+    # memory map (VmHWM) is reset by exec.
+    peak = None
+    try:
+        with open('/proc/self/status', 'r') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    peak = int(line.split()[1]) / 2 ** 10
+    except (IOError, OSError, ValueError):
+        pass
+    if resource is None:
+        return peak
+    if peak is None:
+        peak = _maxrss_mb(resource.RUSAGE_SELF)
+    # Simulations run in the child processes of the AerJob executor. Their
+    # inherited ru_maxrss is at most the peak of this process.
+    return max(peak, _maxrss_mb(resource.RUSAGE_CHILDREN))
+
+
+def _run_configuration(suite_name, class_name, method, params, repeat,
+                       backend_options, queue):
+    """Run a benchmark configuration and put the result in a queue."""
+    from qiskit.providers.aer.aerjob import AerJob
+    try:
+        suite = __import__(suite_name)
+        bench = getattr(suite, class_name)()
+        bench.backend_options = backend_options
+        values = list(params.values())
+        if hasattr(bench, 'setup'):
+            bench.setup(*values)
+        func = getattr(bench, method)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*values)
+            times.append(time.perf_counter() - start)
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*values)
+        # On Linux AerJob runs simulations in a process pool. Its workers
+        # must exit before their peak memory can be read, and this process
+        # would otherwise wait for them forever when exiting since the
+        # pool is only shut down after child processes are joined.
+        AerJob._executor.shutdown(wait=True)  # pylint: disable=protected-access
+        wall_time = min(times)
+        queue.put({
+            'wall_time': wall_time,
+            'wall_times': times,
+            'peak_rss_mb': peak_rss_mb(),
+            'throughput': bench.work(*values) / wall_time,
+            'throughput_unit': '{}/s'.format(bench.unit)})
+    except Exception as error:  # pylint: disable=broad-except
+        AerJob._executor.shutdown(wait=True)  # pylint: disable=protected-access
+        queue.put({'error': '{}: {}'.format(type(error).__name__, error)})
+
+
+def run_configuration(suite_name, class_name, method, params, repeat=3,
+                      backend_options=None):
+    """Run a benchmark configuration in a new process and return the result."""
+    # A forked process inherits the peak memory usage of the parent, which
+    # has imported the suite, so spawn a fresh interpreter instead
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    proc = context.Process(target=_run_configuration,
+                           args=(suite_name, class_name, method,
+                                 params, repeat, backend_options,
+                                 queue))
+    proc.start()
+    # Get the result before joining so the queue cannot block the process
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=1)
+        except queue_module.Empty:
+            if not proc.is_alive():
+                # The process may have put its result before exiting
+                try:
+                    result = queue.get(timeout=1)
+                except queue_module.Empty:
+                    result = {'error': 'process exited with code {}'.format(
+                        proc.exitcode)}
+    proc.join()
+    return result
+
+
+def machine_info():
+    """Return information about the machine running the benchmarks."""
+    info = {'platform': platform.platform(),
+            'processor': platform.processor(),
+            'python': platform.python_version(),
+            'cpu_count': multiprocessing.cpu_count()}
+    try:
+        from qiskit.providers.aer import __version__
+        info['aer_version'] = __version__
+    except ImportError:
+        pass
+    return info
+
+
+def compare_results(results, baseline, time_threshold=0.2,
+                    memory_threshold=None):
+    """Return the regressions of a set of results compared to a baseline.
+
+    Args:
+        results (dict): the benchmark results.
+        baseline (dict): the baseline benchmark results.
+        time_threshold (float): maximum allowed relative increase of the
+                                wall time (Default: 0.2).
+        memory_threshold (float): maximum allowed relative increase of the
+                                  peak memory. If None memory is not
+                                  compared (Default: None).
+
+    Returns:
+        list: a list of (name, metric, baseline_value, value) tuples for
+        each regression.
+    """
+    regressions = []
+    for name, result in sorted(results['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None or 'error' in base or 'error' in result:
+            continue
+        checks = [('wall_time', time_threshold)]
+        if memory_threshold is not None:
+            checks.append(('peak_rss_mb', memory_threshold))
+        for metric, threshold in checks:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > (1 + threshold) * old:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--suite', default='suite',
+                        help='module containing the benchmarks (default: suite)')
+    parser.add_argument('--bench', default=None,
+                        help='regular expression for benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timed repeats of each benchmark')
+    parser.add_argument('--threads', type=int, default=None,
+                        help='maximum number of OpenMP threads for simulation')
+    parser.add_argument('--output', default=None,
+                        help='file to write JSON benchmark results to')
+    parser.add_argument('--compare', default=None,
+                        help='JSON baseline results file to check for regressions')
+    parser.add_argument('--time-threshold', type=float, default=0.2,
+                        help='allowed relative increase in wall time (default: 0.2)')
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help='allowed relative increase in peak memory '
+                             '(default: memory is not compared)')
+    parser.add_argument('--list', action='store_true',
+                        help='list benchmark configurations and exit')
+    args = parser.parse_args(argv)
+
+    suite = __import__(args.suite)
+    configurations = benchmark_configurations(suite, args.bench)
+    if args.list:
+        for config in configurations:
+            print(config[0])
+        return 0
+
+    backend_options = None
+    if args.threads is not None:
+        backend_options = {'max_parallel_threads': args.threads}
+    results = {'version': RESULTS_VERSION,
+               'date': datetime.datetime.now().isoformat(),
+               'machine': machine_info(),
+               'backend_options': backend_options,
+               'results': {}}
+    failed = False
+    for name, class_name, method, params in configurations:
+        result = run_configuration(args.suite, class_name, method, params,
+                                   repeat=args.repeat,
+                                   backend_options=backend_options)
+        result.update({'benchmark': '{}.{}'.format(class_name, method),
+                       'params': params})
+        results['results'][name] = result
+        if 'error' in result:
+            failed = True
+            print('{}: FAILED ({})'.format(name, result['error']))
+        else:
+            print('{}: {:.4g} s, {:.4g} {}, {} MB peak'.format(
+                name, result['wall_time'], result['throughput'],
+                result['throughput_unit'],
+                'n/a' if result['peak_rss_mb'] is None
+                else '{:.1f}'.format(result['peak_rss_mb'])))
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.compare is not None:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        regressions = compare_results(results, baseline,
+                                      time_threshold=args.time_threshold,
+                                      memory_threshold=args.memory_threshold)
+        for name, metric, old, new in regressions:
+            print('REGRESSION {} {}: {:.4g} -> {:.4g} ({:+.1%})'.format(
+                name, metric, old, new, new / old - 1))
+        if regressions:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
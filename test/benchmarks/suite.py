@@ -0,0 +1,223 @@
+"""
+Benchmark suite for the Aer simulators.
+
+The benchmarks follow the conventions of airspeed velocity (asv). Each
+benchmark class may define `params` and `param_names` for a grid of
+parameters, a `setup` method that is called with each combination of
+parameters before timing, and `time_*` methods that are timed. Each class
+additionally defines a `unit` and a `work` method returning the number of
+units processed by one call of a timed method, which is used to report the
+throughput of each benchmark.
+
+The suite is run by `run_benchmarks.py`, which sets the `backend_options`
+attribute of each benchmark before calling `setup`.
+"""
+
+import json
+
+from qiskit import compile  # pylint: disable=redefined-builtin
+from qiskit.providers.aer import QasmSimulator
+from qiskit.providers.aer import StatevectorSimulator
+from qiskit.providers.aer import UnitarySimulator
+from qiskit.providers.aer.backends.aerbackend import AerJSONEncoder
+from qiskit.providers.aer.utils import qobj_utils
+
+from quantumvolume import quantum_volume_circuit
+from benchmark_tools import run_qobj
+from benchmark_tools import mixed_unitary_noise_model
+from benchmark_tools import reset_noise_model
+from benchmark_tools import kraus_noise_model
+from benchmark_tools import device_noise_model
+from benchmark_tools import clifford_circuit
+from benchmark_tools import layered_circuit
+
+# Seed for random benchmark circuits so that each run of the suite
+# benchmarks the same circuits
+CIRCUIT_SEED = 42
+
+NOISE_MODELS = {
+    'ideal': lambda: None,
+    'mixed_unitary': mixed_unitary_noise_model,
+    'reset': reset_noise_model,
+    'kraus': kraus_noise_model
+}
+
+
+class Benchmark:
+    """Base class for benchmarks."""
+    params = ()
+    param_names = ()
+    unit = 'circuits'
+    backend_options = None
+
+    def work(self, *params):
+        """Return the number of units processed by a timed method."""
+        # pylint: disable=unused-argument
+        return 1
+
+
+class QuantumVolumeQasm(Benchmark):
+    """Ideal and noisy quantum volume circuits on the QasmSimulator."""
+    params = ([8, 12], ['ideal', 'mixed_unitary', 'reset', 'kraus'])
+    param_names = ['qubits', 'noise']
+    unit = 'shots'
+    shots = 100
+    depth = 10
+
+    def setup(self, qubits, noise):
+        self.backend = QasmSimulator()
+        circuit = quantum_volume_circuit(qubits, self.depth, measure=True,
+                                         seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend, shots=self.shots)
+        self.noise_model = NOISE_MODELS[noise]()
+
+    def time_qasm_simulator(self, qubits, noise):
+        run_qobj(self.backend, self.qobj,
+                 backend_options=self.backend_options,
+                 noise_model=self.noise_model)
+
+    def work(self, qubits, noise):
+        return self.shots
+
+
+class MeasurementSampling(Benchmark):
+    """Measurement sampling of an ideal circuit at large shot numbers."""
+    params = ([14], [1000, 100000, 1000000])
+    param_names = ['qubits', 'shots']
+    unit = 'shots'
+    depth = 10
+
+    def setup(self, qubits, shots):
+        self.backend = QasmSimulator()
+        circuit = quantum_volume_circuit(qubits, self.depth, measure=True,
+                                         seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend, shots=shots)
+
+    def time_measure_sampling(self, qubits, shots):
+        run_qobj(self.backend, self.qobj,
+                 backend_options=self.backend_options)
+
+    def work(self, qubits, shots):
+        return shots
+
+
+class CliffordCircuits(Benchmark):
+    """Random Clifford circuits with the stabilizer and statevector methods."""
+    params = ([12, 20], ['stabilizer', 'statevector'])
+    param_names = ['qubits', 'method']
+    unit = 'shots'
+    shots = 1000
+    gates_per_qubit = 20
+
+    def setup(self, qubits, method):
+        self.backend = QasmSimulator()
+        circuit = clifford_circuit(qubits, self.gates_per_qubit * qubits,
+                                   measure=True, seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend, shots=self.shots)
+        self.options = dict(self.backend_options or {}, method=method)
+
+    def time_clifford_circuit(self, qubits, method):
+        run_qobj(self.backend, self.qobj, backend_options=self.options)
+
+    def work(self, qubits, method):
+        return self.shots
+
+
+class SnapshotCircuits(Benchmark):
+    """Circuits with a snapshot after every layer of gates."""
+    params = ([10, 14], ['statevector', 'probabilities', 'expval_pauli'])
+    param_names = ['qubits', 'snapshot_type']
+    unit = 'snapshots'
+    shots = 10
+    depth = 20
+
+    def setup(self, qubits, snapshot_type):
+        self.backend = QasmSimulator()
+        circuit = layered_circuit(qubits, self.depth, seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend, shots=self.shots)
+        if snapshot_type == 'statevector':
+            snapshot = qobj_utils.snapshot_instr('statevector', 'snap')
+        elif snapshot_type == 'probabilities':
+            snapshot = qobj_utils.snapshot_instr('probabilities', 'snap',
+                                                 qubits=[0, 1, 2])
+        else:
+            snapshot = qobj_utils.snapshot_instr('expectation_value_pauli',
+                                                 'snap',
+                                                 qubits=[0, 1],
+                                                 params=[[1, 'ZZ'], [0.5, 'XY']])
+        qobj_utils.insert_snapshots_after_barriers(self.qobj, snapshot)
+
+    def time_snapshots(self, qubits, snapshot_type):
+        run_qobj(self.backend, self.qobj,
+                 backend_options=self.backend_options)
+
+    def work(self, qubits, snapshot_type):
+        return self.shots * self.depth
+
+
+class QuantumVolumeStatevector(Benchmark):
+    """Quantum volume circuits on the StatevectorSimulator."""
+    params = [10, 14, 18]
+    param_names = ['qubits']
+    depth = 10
+
+    def setup(self, qubits):
+        self.backend = StatevectorSimulator()
+        circuit = quantum_volume_circuit(qubits, self.depth, measure=False,
+                                         seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend)
+
+    def time_statevector_simulator(self, qubits):
+        run_qobj(self.backend, self.qobj,
+                 backend_options=self.backend_options)
+
+
+class QuantumVolumeUnitary(Benchmark):
+    """Quantum volume circuits on the UnitarySimulator."""
+    params = [4, 6, 8]
+    param_names = ['qubits']
+    depth = 10
+
+    def setup(self, qubits):
+        self.backend = UnitarySimulator()
+        circuit = quantum_volume_circuit(qubits, self.depth, measure=False,
+                                         seed=CIRCUIT_SEED)
+        self.qobj = compile(circuit, self.backend)
+
+    def time_unitary_simulator(self, qubits):
+        run_qobj(self.backend, self.qobj,
+                 backend_options=self.backend_options)
+
+
+class QobjSerialization(Benchmark):
+    """Python side JSON serialization of a qobj for execution."""
+    params = [10, 20]
+    param_names = ['qubits']
+    num_circuits = 10
+    depth = 10
+
+    def setup(self, qubits):
+        backend = QasmSimulator()
+        circuits = [quantum_volume_circuit(qubits, self.depth, measure=True,
+                                           seed=CIRCUIT_SEED + j)
+                    for j in range(self.num_circuits)]
+        self.qobj = compile(circuits, backend, shots=100)
+
+    def time_qobj_to_json(self, qubits):
+        json.dumps(self.qobj, cls=AerJSONEncoder)
+
+    def work(self, qubits):
+        return self.num_circuits
+
+
+class NoiseModelSerialization(Benchmark):
+    """Python side JSON serialization of a device noise model for execution."""
+    params = [5, 20]
+    param_names = ['qubits']
+    unit = 'noise_models'
+
+    def setup(self, qubits):
+        self.noise_model = device_noise_model(qubits, seed=CIRCUIT_SEED)
+
+    def time_noise_model_to_json(self, qubits):
+        json.dumps(self.noise_model, cls=AerJSONEncoder)
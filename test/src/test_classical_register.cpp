@@ -0,0 +1,126 @@
+#define CATCH_CONFIG_MAIN
+#include <algorithm>
+#include <string>
+#include <catch.hpp>
+
+#include <framework/creg.hpp>
+#include <framework/data.hpp>
+#include <framework/operations.hpp>
+
+namespace AER{
+namespace Test{
+
+Operations::Op bfunc_op(const std::string &mask, const std::string &relation,
+                        const std::string &val) {
+    json_t js = {{"name", "bfunc"}, {"mask", mask}, {"relation", relation},
+                 {"val", val}, {"register", {0}}, {"memory", {1}}};
+    return Operations::json_to_op(js);
+}
+
+// Return the outcome of each relation in the order ==, !=, <, <=, >, >=
+std::vector<bool> bfunc_outcomes(ClassicalRegister &creg, const std::string &mask,
+                                 const std::string &val) {
+    std::vector<bool> outcomes;
+    for (const auto relation : {"==", "!=", "<", "<=", ">", ">="}) {
+        const bool outcome = creg.apply_bfunc(bfunc_op(mask, relation, val));
+        // The outcome is stored in register bit 0 and memory bit 1
+        REQUIRE(creg.register_bit(0) == outcome);
+        REQUIRE(creg.memory_bit(1) == outcome);
+        outcomes.push_back(outcome);
+    }
+    return outcomes;
+}
+
+const std::vector<bool> equal = {true, false, false, true, false, true};
+const std::vector<bool> less = {false, true, true, true, false, false};
+const std::vector<bool> greater = {false, true, false, false, true, true};
+
+TEST_CASE( "ClassicalRegister store_measure", "[creg]" ) {
+    ClassicalRegister creg;
+    creg.initialize(130, 130);
+    creg.store_measure({1, 0, 1}, {0, 64, 129}, {5, 69, 128});
+    REQUIRE(creg.memory_bit(0) == 1);
+    REQUIRE(creg.memory_bit(64) == 0);
+    REQUIRE(creg.memory_bit(129) == 1);
+    REQUIRE(creg.memory_hex() == "0x200000000000000000000000000000001");
+    REQUIRE(creg.register_hex() == "0x100000000000000000000000000000020");
+
+    // Overwrite bits and store only in the memory
+    creg.store_measure({0, 1}, {0, 64}, {});
+    REQUIRE(creg.memory_hex() == "0x200000000000000010000000000000000");
+    REQUIRE(creg.register_hex() == "0x100000000000000000000000000000020");
+
+    ClassicalRegister small;
+    small.initialize(4, 0);
+    small.store_measure({1, 1, 0}, {3, 0, 1}, {});
+    REQUIRE(small.memory_int() == 9);
+    REQUIRE(small.memory_bin() == "0b1001");
+    REQUIRE(small.register_hex() == "");
+}
+
+TEST_CASE( "ClassicalRegister bfunc", "[creg]" ) {
+    SECTION( "Register of less than 64 bits" ) {
+        ClassicalRegister creg;
+        creg.initialize(2, 6);
+        // Register bits 5 to 2 are 1010
+        creg.store_measure({0, 1, 0, 1}, {}, {2, 3, 4, 5});
+        REQUIRE(bfunc_outcomes(creg, "0x3C", "0x28") == equal);
+        REQUIRE(bfunc_outcomes(creg, "0x3C", "0x2C") == less);
+        REQUIRE(bfunc_outcomes(creg, "0x3C", "0x24") == greater);
+        // Only the masked bits are compared
+        REQUIRE(bfunc_outcomes(creg, "0x0C", "0x08") == equal);
+        REQUIRE(bfunc_outcomes(creg, "0x0C", "0x0C") == less);
+        // Values larger than the register
+        REQUIRE(bfunc_outcomes(creg, "0x3C", "0x128") == less);
+    }
+    SECTION( "Register of more than 64 bits" ) {
+        ClassicalRegister creg;
+        creg.initialize(2, 100);
+        creg.store_measure({1, 1}, {}, {70, 2});
+        const std::string mask = "0xFFFFFFFFFFFFFFFFFFFFFFFFC";
+        REQUIRE(bfunc_outcomes(creg, mask, "0x400000000000000004") == equal);
+        REQUIRE(bfunc_outcomes(creg, mask, "0x800000000000000004") == less);
+        REQUIRE(bfunc_outcomes(creg, mask, "0x400000000000000008") == less);
+        REQUIRE(bfunc_outcomes(creg, mask, "0x400000000000000000") == greater);
+        REQUIRE(bfunc_outcomes(creg, mask, "0x4") == greater);
+        // Mask excluding the upper word
+        REQUIRE(bfunc_outcomes(creg, "0xFC", "0x4") == equal);
+    }
+}
+
+TEST_CASE( "OutputData counts", "[data]" ) {
+    ClassicalRegister creg;
+    creg.initialize(3, 0);
+    creg.store_measure({1, 0, 1}, {0, 1, 2}, {});
+    ClassicalRegister large;
+    large.initialize(65, 0);
+    large.store_measure({1, 1}, {0, 64}, {});
+
+    OutputData data;
+    data.set_config(json_t({{"memory", true}}));
+    data.add_memory(creg);
+    data.add_memory(creg);
+    data.add_memory(large);
+    // Outcomes added as strings are merged with integer outcomes
+    data.add_memory_count("0x5");
+    data.add_memory_count("0x2");
+
+    OutputData other;
+    other.add_memory(creg);
+    other.add_memory(large);
+    data.combine(other);
+
+    const json_t result = data.json();
+    const json_t counts = {{"0x5", 4}, {"0x2", 1}, {"0x10000000000000001", 2}};
+    REQUIRE(result["counts"] == counts);
+    const std::vector<std::string> memory = result["memory"];
+    REQUIRE(memory.size() == 3);
+    REQUIRE(std::count(memory.begin(), memory.end(), "0x5") == 2);
+    REQUIRE(std::count(memory.begin(), memory.end(), "0x10000000000000001") == 1);
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
+//------------------------------------------------------------------------------
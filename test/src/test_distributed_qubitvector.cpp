@@ -0,0 +1,270 @@
+#define CATCH_CONFIG_MAIN
+#include <random>
+#include <thread>
+#include <catch.hpp>
+
+#ifndef _WIN32
+#include <sys/wait.h>
+#include <unistd.h>
+#endif
+
+#include <simulators/qubitvector/distributed_qubitvector.hpp>
+
+namespace AER{
+namespace Test{
+
+using QV::uint_t;
+using QV::complex_t;
+using QV::cvector_t;
+
+const uint_t num_qubits = 7;
+
+cvector_t random_unitary_1q(std::mt19937_64 &rng) {
+    std::uniform_real_distribution<double> dist(0, 2 * M_PI);
+    const double theta = dist(rng), phi = dist(rng), lam = dist(rng);
+    return {std::cos(theta / 2),
+            std::exp(complex_t(0, phi)) * std::sin(theta / 2),
+            -std::exp(complex_t(0, lam)) * std::sin(theta / 2),
+            std::exp(complex_t(0, phi + lam)) * std::cos(theta / 2)};
+}
+
+// Apply the same random sequence of gates to a QubitVector
+template <class qubitvector_t>
+void apply_random_circuit(qubitvector_t &qv, uint_t seed) {
+    std::mt19937_64 rng(seed);
+    std::uniform_int_distribution<uint_t> qdist(0, num_qubits - 1);
+    for (uint_t q = 0; q < num_qubits; q++)
+        qv.apply_matrix(std::vector<uint_t>({q}), random_unitary_1q(rng));
+    for (int j = 0; j < 60; j++) {
+        const uint_t q0 = qdist(rng);
+        uint_t q1 = qdist(rng), q2 = qdist(rng);
+        while (q1 == q0)
+            q1 = qdist(rng);
+        while (q2 == q0 || q2 == q1)
+            q2 = qdist(rng);
+        switch (j % 10) {
+            case 0: qv.apply_x(q0); break;
+            case 1: qv.apply_y(q0); break;
+            case 2: qv.apply_z(q0); break;
+            case 3: qv.apply_cnot(q0, q1); break;
+            case 4: qv.apply_cz(q0, q1); break;
+            case 5: qv.apply_swap(q0, q1); break;
+            case 6: qv.apply_toffoli(q0, q1, q2); break;
+            case 7: qv.apply_matrix(std::vector<uint_t>({q0}), random_unitary_1q(rng)); break;
+            case 8: qv.apply_diagonal_matrix(std::vector<uint_t>({q0, q1}),
+                                             cvector_t({1., complex_t(0, 1), -1., complex_t(0, -1)}));
+                    break;
+            case 9: {
+                auto u0 = random_unitary_1q(rng), u1 = random_unitary_1q(rng);
+                cvector_t mat(16);
+                for (uint_t r = 0; r < 4; r++)
+                    for (uint_t c = 0; c < 4; c++)
+                        mat[r + 4 * c] = u0[(r & 1) + 2 * (c & 1)] * u1[(r >> 1) + 2 * (c >> 1)];
+                qv.apply_matrix(std::vector<uint_t>({q0, q1}), mat);
+                break;
+            }
+        }
+    }
+}
+
+TEST_CASE( "Distributed QubitVector", "[distributed]" ) {
+    QV::QubitVector<> ref(num_qubits);
+    ref.initialize();
+    apply_random_circuit(ref, 1234);
+    const cvector_t ref_vec = ref.vector();
+    const auto ref_probs = ref.probabilities(std::vector<uint_t>({0, 4, 6}));
+    std::vector<double> rnds;
+    for (int j = 0; j < 20; j++)
+        rnds.push_back((j + 0.5) / 20);
+    const auto ref_samples = ref.sample_measure(rnds);
+
+    for (int num_ranks : {1, 2, 4}) {
+        const auto transports = QV::ThreadTransport::create(num_ranks);
+        std::vector<cvector_t> vecs(num_ranks);
+        std::vector<std::vector<double>> probs(num_ranks);
+        std::vector<std::vector<uint_t>> samples(num_ranks);
+        std::vector<double> norms(num_ranks);
+        std::vector<std::thread> threads;
+        for (int r = 0; r < num_ranks; r++) {
+            threads.emplace_back([&, r]() {
+                QV::QubitVector<QV::DistributedChunk> qv;
+                qv.set_transport(transports[r]);
+                qv.set_exchange_size(8);
+                qv.set_num_qubits(num_qubits);
+                qv.initialize();
+                apply_random_circuit(qv, 1234);
+                vecs[r] = qv.vector();
+                probs[r] = qv.probabilities(std::vector<uint_t>({0, 4, 6}));
+                samples[r] = qv.sample_measure(rnds);
+                norms[r] = qv.norm();
+            });
+        }
+        for (auto &thread : threads)
+            thread.join();
+
+        // The full vector is only gathered on rank 0
+        REQUIRE(vecs[0].size() == ref_vec.size());
+        for (uint_t k = 0; k < ref_vec.size(); k++) {
+            REQUIRE(std::real(vecs[0][k]) == Approx(std::real(ref_vec[k])).margin(1e-12));
+            REQUIRE(std::imag(vecs[0][k]) == Approx(std::imag(ref_vec[k])).margin(1e-12));
+        }
+        for (int r = 0; r < num_ranks; r++) {
+            REQUIRE(norms[r] == Approx(1.));
+            if (r > 0)
+                REQUIRE(vecs[r].empty());
+            for (uint_t k = 0; k < ref_probs.size(); k++)
+                REQUIRE(probs[r][k] == Approx(ref_probs[k]).margin(1e-12));
+            REQUIRE(samples[r] == ref_samples);
+        }
+    }
+}
+
+// Random N-qubit matrices as column-major vectorized matrices
+std::vector<cvector_t> random_matrices(uint_t num_mats, uint_t N, std::mt19937_64 &rng) {
+    std::normal_distribution<double> dist(0, 1);
+    std::vector<cvector_t> mats(num_mats, cvector_t(1ULL << (2 * N)));
+    for (auto &mat : mats)
+        for (auto &val : mat)
+            val = complex_t(dist(rng), dist(rng));
+    return mats;
+}
+
+TEST_CASE( "QubitVector Kraus norms", "[distributed]" ) {
+    std::mt19937_64 rng(42);
+    const std::vector<std::vector<uint_t>> qubit_sets = {{3}, {0, 5}, {6, 2, 4}};
+    std::vector<std::vector<cvector_t>> mat_sets;
+    for (const auto &qubits : qubit_sets)
+        mat_sets.push_back(random_matrices(3, qubits.size(), rng));
+
+    // The fused norms equal the norm of each matrix
+    QV::QubitVector<> ref(num_qubits);
+    ref.initialize();
+    apply_random_circuit(ref, 1234);
+    std::vector<std::vector<double>> ref_norms;
+    for (size_t i = 0; i < qubit_sets.size(); i++) {
+        const auto norms = ref.norms(qubit_sets[i], mat_sets[i]);
+        REQUIRE(norms.size() == mat_sets[i].size());
+        for (size_t j = 0; j < mat_sets[i].size(); j++)
+            REQUIRE(norms[j] == Approx(ref.norm(qubit_sets[i], mat_sets[i][j])).epsilon(1e-10));
+        ref_norms.push_back(norms);
+    }
+
+    for (int num_ranks : {2, 4}) {
+        const auto transports = QV::ThreadTransport::create(num_ranks);
+        std::vector<std::vector<std::vector<double>>> norms(num_ranks);
+        std::vector<std::vector<std::vector<double>>> single_norms(num_ranks);
+        std::vector<std::thread> threads;
+        for (int r = 0; r < num_ranks; r++) {
+            threads.emplace_back([&, r]() {
+                QV::QubitVector<QV::DistributedChunk> qv;
+                qv.set_transport(transports[r]);
+                qv.set_exchange_size(8);
+                qv.set_num_qubits(num_qubits);
+                qv.initialize();
+                apply_random_circuit(qv, 1234);
+                for (size_t i = 0; i < qubit_sets.size(); i++) {
+                    norms[r].push_back(qv.norms(qubit_sets[i], mat_sets[i]));
+                    std::vector<double> vals;
+                    for (const auto &mat : mat_sets[i])
+                        vals.push_back(qv.norm(qubit_sets[i], mat));
+                    single_norms[r].push_back(vals);
+                }
+            });
+        }
+        for (auto &thread : threads)
+            thread.join();
+
+        for (int r = 0; r < num_ranks; r++) {
+            for (size_t i = 0; i < qubit_sets.size(); i++) {
+                REQUIRE(norms[r][i].size() == ref_norms[i].size());
+                for (size_t j = 0; j < ref_norms[i].size(); j++) {
+                    REQUIRE(norms[r][i][j] == Approx(ref_norms[i][j]).epsilon(1e-10));
+                    REQUIRE(single_norms[r][i][j] == Approx(ref_norms[i][j]).epsilon(1e-10));
+                }
+            }
+        }
+    }
+}
+
+#ifndef _WIN32
+TEST_CASE( "Distributed QubitVector over sockets", "[distributed]" ) {
+    QV::QubitVector<> ref(num_qubits);
+    ref.initialize();
+    apply_random_circuit(ref, 1234);
+    const cvector_t ref_vec = ref.vector();
+    const auto ref_probs = ref.probabilities(std::vector<uint_t>({0, 4, 6}));
+
+    // Each rank runs in a separate process
+    const int num_ranks = 4;
+    const int base_port = 20000 + getpid() % 20000;
+    std::vector<pid_t> children;
+    for (int r = 1; r < num_ranks; r++) {
+        const pid_t pid = fork();
+        REQUIRE(pid >= 0);
+        if (pid == 0) {
+            // Child processes report a mismatch through their exit status
+            int status = 0;
+            try {
+                auto transport = std::make_shared<QV::SocketTransport>(r, num_ranks, base_port);
+                QV::QubitVector<QV::DistributedChunk> qv;
+                qv.set_transport(transport);
+                qv.set_exchange_size(8);
+                qv.set_num_qubits(num_qubits);
+                qv.initialize();
+                apply_random_circuit(qv, 1234);
+                if (!qv.vector().empty() || !qv.json().is_null())
+                    status = 1;
+                const auto probs = qv.probabilities(std::vector<uint_t>({0, 4, 6}));
+                for (uint_t k = 0; k < ref_probs.size(); k++)
+                    if (std::abs(probs[k] - ref_probs[k]) > 1e-12)
+                        status = 1;
+                if (std::abs(qv.norm() - 1.) > 1e-12)
+                    status = 1;
+            } catch (...) {
+                status = 2;
+            }
+            _exit(status);
+        }
+        children.push_back(pid);
+    }
+
+    cvector_t vec;
+    json_t js;
+    std::vector<double> probs;
+    double norm = 0;
+    {
+        auto transport = std::make_shared<QV::SocketTransport>(0, num_ranks, base_port);
+        QV::QubitVector<QV::DistributedChunk> qv;
+        qv.set_transport(transport);
+        qv.set_exchange_size(8);
+        qv.set_num_qubits(num_qubits);
+        qv.initialize();
+        apply_random_circuit(qv, 1234);
+        vec = qv.vector();
+        js = qv.json();
+        probs = qv.probabilities(std::vector<uint_t>({0, 4, 6}));
+        norm = qv.norm();
+    }
+    for (const auto &pid : children) {
+        int status = -1;
+        waitpid(pid, &status, 0);
+        REQUIRE(WIFEXITED(status));
+        REQUIRE(WEXITSTATUS(status) == 0);
+    }
+
+    REQUIRE(norm == Approx(1.));
+    REQUIRE(vec.size() == ref_vec.size());
+    for (uint_t k = 0; k < ref_vec.size(); k++) {
+        REQUIRE(std::real(vec[k]) == Approx(std::real(ref_vec[k])).margin(1e-12));
+        REQUIRE(std::imag(vec[k]) == Approx(std::imag(ref_vec[k])).margin(1e-12));
+    }
+    REQUIRE(js.size() == ref_vec.size());
+    for (uint_t k = 0; k < ref_probs.size(); k++)
+        REQUIRE(probs[k] == Approx(ref_probs[k]).margin(1e-12));
+}
+#endif
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
@@ -0,0 +1,115 @@
+#define CATCH_CONFIG_MAIN
+#include <cstdlib>
+#include <random>
+#include <catch.hpp>
+
+#include <simulators/qubitvector/qv_state.hpp>
+
+namespace AER{
+namespace Test{
+
+const uint_t num_qubits = 6;
+const uint_t chunk_qubits = 3;
+
+std::string storage_directory() {
+    const char *dir = std::getenv("TMPDIR");
+    return (dir == nullptr) ? "/tmp" : dir;
+}
+
+Operations::Op gate_op(const std::string &name, const reg_t &qubits,
+                       const std::vector<double> &params = {}) {
+    json_t js = {{"name", name}, {"qubits", qubits}};
+    if (!params.empty())
+        js["params"] = params;
+    return Operations::json_to_op(js);
+}
+
+// A circuit mixing gates on random qubits with long runs of gates on
+// qubits above the chunk
+std::vector<Operations::Op> random_circuit(uint_t seed) {
+    std::mt19937_64 rng(seed);
+    std::uniform_int_distribution<uint_t> qdist(0, num_qubits - 1);
+    std::uniform_real_distribution<double> adist(0, 2 * M_PI);
+    std::vector<Operations::Op> ops;
+    for (uint_t q = 0; q < num_qubits; q++)
+        ops.push_back(gate_op("u3", {q}, {adist(rng), adist(rng), adist(rng)}));
+    for (int j = 0; j < 40; j++) {
+        const uint_t q0 = qdist(rng);
+        uint_t q1 = qdist(rng);
+        while (q1 == q0)
+            q1 = qdist(rng);
+        switch (j % 4) {
+            case 0: ops.push_back(gate_op("cx", {q0, q1})); break;
+            case 1: ops.push_back(gate_op("u3", {q0}, {adist(rng), adist(rng), adist(rng)})); break;
+            case 2: ops.push_back(gate_op("swap", {q0, q1})); break;
+            case 3: ops.push_back(gate_op("h", {q0})); break;
+        }
+    }
+    ops.push_back(gate_op("barrier", {0}));
+    // Runs on qubits 4 and 5 that are swapped into the chunk
+    for (int j = 0; j < 4; j++) {
+        ops.push_back(gate_op("u3", {4}, {adist(rng), adist(rng), adist(rng)}));
+        ops.push_back(gate_op("cx", {4, 5}));
+        ops.push_back(gate_op("cx", {0, 4}));
+        ops.push_back(gate_op("u3", {5}, {adist(rng), adist(rng), adist(rng)}));
+        ops.push_back(gate_op("cz", {5, 1}));
+        ops.push_back(gate_op("ccx", {0, 5, 4}));
+    }
+    return ops;
+}
+
+cvector_t run_circuit(const std::vector<Operations::Op> &ops, const json_t &config) {
+    QubitVector::State<> state;
+    state.set_config(config);
+    state.initialize_qreg(num_qubits);
+    state.initialize_creg(0, 0);
+    OutputData data;
+    RngEngine rng;
+    rng.set_seed(42);
+    state.apply_ops(ops, data, rng);
+    return state.qreg().vector();
+}
+
+TEST_CASE( "Out-of-core statevector storage", "[statevector]" ) {
+    QV::QubitVector<> qv;
+    qv.set_storage_directory(storage_directory());
+    qv.set_num_qubits(4);
+    qv.initialize();
+    qv.checkpoint();
+    REQUIRE(qv.out_of_core());
+
+    // Changing the directory does not change how existing buffers are freed
+    qv.set_storage_directory("");
+    qv.set_num_qubits(3);
+    REQUIRE_FALSE(qv.out_of_core());
+    qv.initialize();
+    qv.checkpoint();
+    qv.set_storage_directory(storage_directory());
+    qv.revert(false);
+    qv.checkpoint();
+    qv.set_num_qubits(2);
+    qv.initialize();
+    REQUIRE(qv.norm() == Approx(1.));
+}
+
+TEST_CASE( "Out-of-core statevector chunked gates", "[statevector]" ) {
+    const json_t in_core = json_t::object();
+    const json_t out_of_core = {{"statevector_storage_directory", storage_directory()},
+                                {"statevector_chunk_qubits", chunk_qubits}};
+    for (uint_t seed = 0; seed < 5; seed++) {
+        const auto ops = random_circuit(seed);
+        const auto expected = run_circuit(ops, in_core);
+        const auto result = run_circuit(ops, out_of_core);
+        REQUIRE(result.size() == expected.size());
+        for (size_t k = 0; k < expected.size(); k++) {
+            REQUIRE(std::real(result[k]) == Approx(std::real(expected[k])).margin(1e-10));
+            REQUIRE(std::imag(result[k]) == Approx(std::imag(expected[k])).margin(1e-10));
+        }
+    }
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
+//------------------------------------------------------------------------------
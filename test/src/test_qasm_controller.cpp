@@ -0,0 +1,63 @@
+#define CATCH_CONFIG_MAIN
+#include <catch.hpp>
+
+#include <simulators/qasm/qasm_controller.hpp>
+
+namespace AER{
+namespace Test{
+
+using Method = Simulator::QasmController::Method;
+
+// A 10% bit-flip error after each X gate
+const json_t noise_model = R"({
+    "errors": [{"type": "qerror",
+                "operations": ["x"],
+                "probabilities": [0.9, 0.1],
+                "instructions": [[{"name": "id", "qubits": [0]}],
+                                 [{"name": "x", "qubits": [0]}]]}]
+})"_json;
+
+Method simulation_method(const json_t &instructions, uint_t shots) {
+    Simulator::QasmController controller;
+    controller.set_config(json_t({{"noise_model", noise_model}}));
+    const Circuit circ(json_t({{"instructions", instructions},
+                               {"config", {{"memory_slots", 2}}}}));
+    return controller.simulation_method(circ, shots);
+}
+
+TEST_CASE( "QasmController automatic method for noisy circuits", "[qasm]" ) {
+    const json_t x0 = {{"name", "x"}, {"qubits", {0}}};
+    const json_t measure0 = {{"name", "measure"}, {"qubits", {0}}, {"memory", {0}}};
+    const json_t measure1 = {{"name", "measure"}, {"qubits", {1}}, {"memory", {1}}};
+
+    SECTION( "Measurements at the end of the circuit" ) {
+        const json_t instructions = {x0, {{"name", "x"}, {"qubits", {1}}},
+                                     measure0, measure1};
+        REQUIRE(simulation_method(instructions, 1000) == Method::density_matrix);
+        // Fewer shots than statevector amplitudes
+        REQUIRE(simulation_method(instructions, 4) == Method::statevector);
+    }
+    SECTION( "Conditional on a mid-circuit measurement" ) {
+        const json_t conditional = {{"name", "x"}, {"qubits", {1}},
+                                    {"conditional", {{"mask", "0x1"}, {"val", "0x1"}}}};
+        const json_t instructions = {x0, measure0, conditional, measure1};
+        REQUIRE(simulation_method(instructions, 1000) == Method::statevector);
+    }
+    SECTION( "Reset of a measured qubit" ) {
+        const json_t reset0 = {{"name", "reset"}, {"qubits", {0}}};
+        const json_t instructions = {x0, measure0, reset0, x0, measure1};
+        REQUIRE(simulation_method(instructions, 1000) == Method::statevector);
+    }
+    SECTION( "Classical function after a measurement" ) {
+        const json_t bfunc = {{"name", "bfunc"}, {"mask", "0x1"}, {"relation", "=="},
+                              {"val", "0x1"}, {"register", {0}}};
+        const json_t instructions = {x0, measure0, bfunc, measure1};
+        REQUIRE(simulation_method(instructions, 1000) == Method::statevector);
+    }
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
+//------------------------------------------------------------------------------
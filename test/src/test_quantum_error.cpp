@@ -0,0 +1,95 @@
+#define CATCH_CONFIG_MAIN
+#include <catch.hpp>
+
+#include <noise/quantum_error.hpp>
+
+namespace AER{
+namespace Test{
+
+cmatrix_t diagonal_matrix(const cvector_t &diag) {
+    cmatrix_t mat(diag.size(), diag.size());
+    for (size_t i = 0; i < diag.size(); i++)
+        mat(i, i) = diag[i];
+    return mat;
+}
+
+// Return a quantum error for a single Kraus op
+Noise::QuantumError kraus_error(const reg_t &qubits, const std::vector<cvector_t> &diags) {
+    std::vector<cmatrix_t> mats;
+    for (const auto &diag : diags)
+        mats.push_back(diagonal_matrix(diag));
+    Noise::QuantumError error;
+    error.set_circuits({{Operations::make_kraus(qubits, mats)}}, {1.});
+    return error;
+}
+
+// Return the names and qubits of the gates in a noise circuit
+std::vector<std::pair<std::string, reg_t>> circuit_gates(const std::vector<Operations::Op> &circuit) {
+    std::vector<std::pair<std::string, reg_t>> gates;
+    for (const auto &op : circuit) {
+        REQUIRE(op.type == Operations::OpType::gate);
+        gates.emplace_back(op.name, op.qubits);
+    }
+    return gates;
+}
+
+// Check an error is a single diagonal Kraus op with the given diagonals
+void require_diagonal_kraus(const Noise::QuantumError &error,
+                            const std::vector<cvector_t> &diags) {
+    REQUIRE(error.num_circuits() == 1);
+    REQUIRE(error.probability(0) == Approx(1.));
+    const auto &circuit = error.circuit(0);
+    REQUIRE(circuit.size() == 1);
+    REQUIRE(circuit[0].type == Operations::OpType::kraus);
+    REQUIRE(circuit[0].vmats == diags);
+}
+
+TEST_CASE( "QuantumError Z-mixture conversion", "[noise]" ) {
+    SECTION( "Phase damping" ) {
+        const double lambda = 0.3;
+        const auto error = kraus_error({2}, {{1., std::sqrt(1 - lambda)},
+                                             {0., std::sqrt(lambda)}});
+        const double p_z = 0.5 * (1 - std::sqrt(1 - lambda));
+        REQUIRE(error.num_circuits() == 2);
+        REQUIRE(circuit_gates(error.circuit(0)) ==
+                std::vector<std::pair<std::string, reg_t>>({{"id", {2}}}));
+        REQUIRE(error.probability(0) == Approx(1 - p_z));
+        REQUIRE(circuit_gates(error.circuit(1)) ==
+                std::vector<std::pair<std::string, reg_t>>({{"z", {2}}}));
+        REQUIRE(error.probability(1) == Approx(p_z));
+    }
+    SECTION( "Two-qubit correlated dephasing" ) {
+        const double p = 0.2;
+        const double a = std::sqrt(1 - p), b = std::sqrt(p);
+        const auto error = kraus_error({0, 3}, {{a, a, a, a}, {b, -b, -b, b}});
+        REQUIRE(error.num_circuits() == 2);
+        REQUIRE(circuit_gates(error.circuit(0)) ==
+                std::vector<std::pair<std::string, reg_t>>({{"id", {0}}}));
+        REQUIRE(error.probability(0) == Approx(1 - p));
+        REQUIRE(circuit_gates(error.circuit(1)) ==
+                std::vector<std::pair<std::string, reg_t>>({{"z", {0}}, {"z", {3}}}));
+        REQUIRE(error.probability(1) == Approx(p));
+    }
+    SECTION( "Complex phase diagonal channel" ) {
+        // The off-diagonal factor of the channel is complex so it is not
+        // a mixture of Z errors
+        const double p = 0.4;
+        const complex_t phase = std::exp(complex_t(0, 0.7));
+        const std::vector<cvector_t> diags = {{std::sqrt(p), std::sqrt(p) * phase},
+                                              {std::sqrt(1 - p), std::sqrt(1 - p)}};
+        require_diagonal_kraus(kraus_error({1}, diags), diags);
+    }
+    SECTION( "Two-qubit channel without XOR structure" ) {
+        // Phase damping of the |11> state only
+        const double lambda = 0.3;
+        const std::vector<cvector_t> diags = {{1., 1., 1., std::sqrt(1 - lambda)},
+                                              {0., 0., 0., std::sqrt(lambda)}};
+        require_diagonal_kraus(kraus_error({0, 1}, diags), diags);
+    }
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
+//------------------------------------------------------------------------------
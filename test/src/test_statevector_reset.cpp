@@ -0,0 +1,208 @@
+#define CATCH_CONFIG_MAIN
+#include <random>
+#include <set>
+#include <thread>
+#include <catch.hpp>
+
+#include <simulators/qubitvector/distributed_qubitvector.hpp>
+#include <simulators/qubitvector/qv_state.hpp>
+
+namespace AER{
+namespace Test{
+
+const uint_t num_qubits = 5;
+
+cvector_t random_unitary_1q(std::mt19937_64 &rng) {
+    std::uniform_real_distribution<double> dist(0, 2 * M_PI);
+    const double theta = dist(rng), phi = dist(rng), lam = dist(rng);
+    return {std::cos(theta / 2),
+            std::exp(complex_t(0, phi)) * std::sin(theta / 2),
+            -std::exp(complex_t(0, lam)) * std::sin(theta / 2),
+            std::exp(complex_t(0, phi + lam)) * std::cos(theta / 2)};
+}
+
+// Prepare the same random entangled state on a QubitVector
+template <class qubitvector_t>
+void prepare_random_state(qubitvector_t &qv, uint_t seed) {
+    std::mt19937_64 rng(seed);
+    for (int j = 0; j < 3; j++) {
+        for (uint_t q = 0; q < num_qubits; q++)
+            qv.apply_matrix(std::vector<uint_t>({q}), random_unitary_1q(rng));
+        for (uint_t q = 0; q + 1 < num_qubits; q++)
+            qv.apply_cnot(q, q + 1);
+    }
+}
+
+// Reference reset: the amplitudes of the outcome are scaled and moved to
+// the |0> state of the qubits
+cvector_t reset_vector(const cvector_t &vec, const std::vector<uint_t> &qubits,
+                       uint_t outcome, double scale) {
+    uint_t mask = 0, offset = 0;
+    for (size_t i = 0; i < qubits.size(); i++) {
+        mask |= 1ULL << qubits[i];
+        if ((outcome >> i) & 1ULL)
+            offset |= 1ULL << qubits[i];
+    }
+    cvector_t result(vec.size(), 0.);
+    for (uint_t k = 0; k < vec.size(); k++) {
+        if ((k & mask) == 0)
+            result[k] = scale * vec[k | offset];
+    }
+    return result;
+}
+
+void require_vector_equal(const cvector_t &vec, const cvector_t &target) {
+    REQUIRE(vec.size() == target.size());
+    for (uint_t k = 0; k < target.size(); k++) {
+        REQUIRE(std::real(vec[k]) == Approx(std::real(target[k])).margin(1e-12));
+        REQUIRE(std::imag(vec[k]) == Approx(std::imag(target[k])).margin(1e-12));
+    }
+}
+
+Operations::Op gate_op(const std::string &name, const reg_t &qubits,
+                       const std::vector<double> &params = {}) {
+    json_t js = {{"name", name}, {"qubits", qubits}};
+    if (!params.empty())
+        js["params"] = params;
+    return Operations::json_to_op(js);
+}
+
+Operations::Op reset_op(const reg_t &qubits) {
+    return Operations::json_to_op(json_t({{"name", "reset"}, {"qubits", qubits}}));
+}
+
+// Run a circuit and return the index of the final computational basis
+// state, or -1 if the final state is not a basis state.
+int_t run_circuit(const std::vector<Operations::Op> &ops, uint_t nqubits,
+                  uint_t seed, const cvector_t &initial_state = {}) {
+    QubitVector::State<> state;
+    if (initial_state.empty())
+        state.initialize_qreg(nqubits);
+    else
+        state.initialize_qreg(nqubits, initial_state);
+    state.initialize_creg(0, 0);
+    OutputData data;
+    RngEngine rng;
+    rng.set_seed(seed);
+    state.apply_ops(ops, data, rng);
+    const auto vec = state.qreg().vector();
+    for (uint_t k = 0; k < vec.size(); k++) {
+        if (std::norm(vec[k]) == Approx(1.))
+            return k;
+    }
+    return -1;
+}
+
+// Return the final basis states of a circuit over several seeds
+std::set<int_t> final_states(const std::vector<Operations::Op> &ops, uint_t nqubits,
+                             const cvector_t &initial_state = {}) {
+    std::set<int_t> outcomes;
+    for (uint_t seed = 0; seed < 20; seed++)
+        outcomes.insert(run_circuit(ops, nqubits, seed, initial_state));
+    return outcomes;
+}
+
+TEST_CASE( "QubitVector reset kernels", "[reset]" ) {
+    QV::QubitVector<> qv(num_qubits);
+    qv.initialize();
+    prepare_random_state(qv, 1234);
+    const cvector_t vec = qv.vector();
+
+    for (const auto &qubits : std::vector<std::vector<uint_t>>({{2}, {0, 3}, {4, 1, 2}})) {
+        const auto probs = qv.probabilities(qubits);
+        for (uint_t outcome = 0; outcome < probs.size(); outcome++) {
+            REQUIRE(qv.probability(qubits, outcome) == Approx(probs[outcome]).margin(1e-12));
+
+            const double scale = 1. / std::sqrt(probs[outcome]);
+            QV::QubitVector<> reset(num_qubits);
+            reset.initialize(vec);
+            reset.apply_reset(qubits, outcome, scale);
+            require_vector_equal(reset.vector(), reset_vector(vec, qubits, outcome, scale));
+            REQUIRE(reset.norm() == Approx(1.));
+        }
+    }
+}
+
+TEST_CASE( "Distributed QubitVector reset kernels", "[reset][distributed]" ) {
+    const std::vector<uint_t> qubits = {4, 1};
+    const uint_t outcome = 2;
+    QV::QubitVector<> ref(num_qubits);
+    ref.initialize();
+    prepare_random_state(ref, 1234);
+    const double prob = ref.probability(qubits, outcome);
+    const double scale = 1. / std::sqrt(prob);
+    const cvector_t target = reset_vector(ref.vector(), qubits, outcome, scale);
+
+    for (int num_ranks : {2, 4}) {
+        const auto transports = QV::ThreadTransport::create(num_ranks);
+        std::vector<double> probs(num_ranks);
+        cvector_t vec;
+        std::vector<std::thread> threads;
+        for (int r = 0; r < num_ranks; r++) {
+            threads.emplace_back([&, r]() {
+                QV::QubitVector<QV::DistributedChunk> qv;
+                qv.set_transport(transports[r]);
+                qv.set_exchange_size(8);
+                qv.set_num_qubits(num_qubits);
+                qv.initialize();
+                prepare_random_state(qv, 1234);
+                probs[r] = qv.probability(qubits, outcome);
+                qv.apply_reset(qubits, outcome, scale);
+                if (r == 0)
+                    vec = qv.vector();
+                else
+                    qv.vector();
+            });
+        }
+        for (auto &thread : threads)
+            thread.join();
+
+        for (int r = 0; r < num_ranks; r++)
+            REQUIRE(probs[r] == Approx(prob).margin(1e-12));
+        require_vector_equal(vec, target);
+    }
+}
+
+TEST_CASE( "Statevector reset", "[reset]" ) {
+    SECTION( "Reset after an entangling gate" ) {
+        // Qubit 1 is no longer in |0> after the CX
+        const std::vector<Operations::Op> ops = {gate_op("h", {0}),
+                                                 gate_op("cx", {0, 1}),
+                                                 reset_op({1})};
+        REQUIRE(final_states(ops, 2) == std::set<int_t>({0, 1}));
+    }
+    SECTION( "Reset after a non-diagonal gate" ) {
+        const std::vector<Operations::Op> ops = {gate_op("x", {0}), reset_op({0})};
+        REQUIRE(final_states(ops, 2) == std::set<int_t>({0}));
+    }
+    SECTION( "Reset after a diagonal gate on a superposed qubit" ) {
+        const std::vector<Operations::Op> ops = {gate_op("h", {0}),
+                                                 gate_op("u1", {0}, {0.3}),
+                                                 gate_op("z", {0}),
+                                                 reset_op({0})};
+        REQUIRE(final_states(ops, 2) == std::set<int_t>({0}));
+    }
+    SECTION( "Consecutive resets with duplicate qubits" ) {
+        // Resetting qubit 1 collapses the entangled qubit 2
+        const std::vector<Operations::Op> ops = {gate_op("h", {0}),
+                                                 gate_op("h", {1}),
+                                                 gate_op("cx", {1, 2}),
+                                                 reset_op({0}),
+                                                 reset_op({1, 0}),
+                                                 reset_op({1})};
+        REQUIRE(final_states(ops, 3) == std::set<int_t>({0, 4}));
+    }
+    SECTION( "Reset with an initial statevector" ) {
+        // The initial state is not assumed to be |0>
+        const std::vector<Operations::Op> ops = {reset_op({0})};
+        REQUIRE(final_states(ops, 2, cvector_t({0., 0., 0., 1.})) == std::set<int_t>({2}));
+        const double amp = 1. / std::sqrt(2.);
+        REQUIRE(final_states(ops, 2, cvector_t({amp, amp, 0., 0.})) == std::set<int_t>({0}));
+    }
+}
+
+//------------------------------------------------------------------------------
+} // end namespace Test
+//------------------------------------------------------------------------------
+} // end namespace AER
+//------------------------------------------------------------------------------
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Device noise model tests
+"""
+
+import datetime
+import unittest
+from unittest import mock
+from test.terra.utils import common
+import numpy as np
+
+from qiskit.providers.models.backendproperties import BackendProperties
+from qiskit.providers.models.backendproperties import Gate, Nduv
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.noiseerror import NoiseError
+from qiskit.providers.aer.noise.device import models
+from qiskit.providers.aer.noise.device.models import basic_device_gate_errors
+from qiskit.providers.aer.noise.device.models import basic_device_noise_model
+from qiskit.providers.aer.noise.errors.standard_errors import depolarizing_error
+from qiskit.providers.aer.noise.errors.standard_errors import thermal_relaxation_error
+from qiskit.providers.aer.noise.utils.noise_transformation import _pauli_chi_matrix
+
+
+def device_properties(t1s, t2s, readout_errors, gates):
+    """Return backend properties for a test device.
+
+    Args:
+        t1s (list): T1 value of each qubit in microseconds.
+        t2s (list): T2 value of each qubit in microseconds.
+        readout_errors (list): readout error of each qubit.
+        gates (list): tuples (name, qubits, gate_error, gate_time) for
+                      each gate where gate_time is in nanoseconds.
+
+    Returns:
+        BackendProperties: the device properties.
+    """
+    date = datetime.datetime(2019, 1, 1)
+    qubits = [[Nduv(date=date, name='T1', unit='µs', value=float(t1)),
+               Nduv(date=date, name='T2', unit='µs', value=float(t2)),
+               Nduv(date=date, name='frequency', unit='GHz', value=5.0),
+               Nduv(date=date, name='readout_error', unit='',
+                    value=float(readout))]
+              for t1, t2, readout in zip(t1s, t2s, readout_errors)]
+    gates = [Gate(qubits=qubits, gate=name,
+                  parameters=[Nduv(date=date, name='gate_error', unit='',
+                                   value=float(gate_error)),
+                              Nduv(date=date, name='gate_time', unit='ns',
+                                   value=float(gate_time))])
+             for name, qubits, gate_error, gate_time in gates]
+    return BackendProperties(backend_name='test_device',
+                             backend_version='0.0.0',
+                             last_update_date=date,
+                             qubits=qubits,
+                             gates=gates,
+                             general=[])
+
+
+class TestDeviceModels(common.QiskitAerTestCase):
+    """Testing device noise models"""
+
+    # Gates of the test devices as (name, qubits, gate_error, gate_time)
+    GATES = [('u1', [0], 0, 0),
+             ('u2', [0], 0.01, 1),
+             ('u3', [1], 0.04, 2),
+             ('cx', [0, 1], 0.05, 4)]
+
+    def setUp(self):
+        # Errors are cached between calls so start each test with
+        # an empty cache
+        models._ERROR_CACHE.clear()
+
+    def assertErrorEqual(self, error, target):
+        """Assert two quantum errors implement the same channel"""
+        self.assertEqual(error.number_of_qubits, target.number_of_qubits)
+        np.testing.assert_allclose(_pauli_chi_matrix(error),
+                                   _pauli_chi_matrix(target), atol=1e-10)
+
+    def relaxation_targets(self, t1s, t2s, temperature):
+        """Return the expected errors for GATES with thermal relaxation"""
+        population = models._excited_population(5.0, temperature)
+        targets = {}
+        for name, qubits, gate_error, gate_time in self.GATES:
+            if gate_error == 0:
+                continue
+            # Relaxation errors use the gate time in microseconds while
+            # the depolarizing parameter uses the device gate time
+            time = gate_time / 1000
+            relax = [thermal_relaxation_error(t1s[q], t2s[q], time, population)
+                     for q in qubits]
+            if len(qubits) == 1:
+                p_depol = models._depol_error_value_one_qubit(
+                    gate_error, gate_time, t1=t1s[qubits[0]], t2=t2s[qubits[0]])
+                relax_error = relax[0]
+            else:
+                p_depol = models._depol_error_value_two_qubit(
+                    gate_error, gate_time,
+                    qubit0_t1=t1s[qubits[0]], qubit0_t2=t2s[qubits[0]],
+                    qubit1_t1=t1s[qubits[1]], qubit1_t2=t2s[qubits[1]])
+                # The relaxation of the first gate qubit acts on error qubit 0
+                relax_error = relax[1].kron(relax[0])
+            self.assertGreater(p_depol, 0)
+            target = depolarizing_error(p_depol, len(qubits)).compose(relax_error)
+            targets[(name, tuple(qubits))] = target
+        return targets
+
+    def test_gate_errors_t2_greater_than_t1(self):
+        """Test device gate errors with T2 > T1 (Kraus relaxation)"""
+        t1s, t2s = [50, 60], [80, 100]
+        properties = device_properties(t1s, t2s, [0.01, 0.02], self.GATES)
+        errors = basic_device_gate_errors(properties, temperature=20)
+        targets = self.relaxation_targets(t1s, t2s, 20)
+        self.assertEqual(len(errors), len(targets))
+        for name, qubits, error in errors:
+            self.assertErrorEqual(error, targets[(name, tuple(qubits))])
+
+    def test_gate_errors_t2_less_equal_t1(self):
+        """Test device gate errors with T2 <= T1 (reset relaxation)"""
+        t1s, t2s = [50, 60], [50, 30]
+        properties = device_properties(t1s, t2s, [0.01, 0.02], self.GATES)
+        errors = basic_device_gate_errors(properties, temperature=20)
+        targets = self.relaxation_targets(t1s, t2s, 20)
+        self.assertEqual(len(errors), len(targets))
+        for name, qubits, error in errors:
+            self.assertErrorEqual(error, targets[(name, tuple(qubits))])
+
+    def test_gate_errors_no_thermal_relaxation(self):
+        """Test device gate errors without thermal relaxation"""
+        properties = device_properties([50, 60], [80, 30], [0.01, 0.02],
+                                       self.GATES)
+        errors = basic_device_gate_errors(properties, thermal_relaxation=False)
+        targets = {('u2', (0,)): depolarizing_error(2 * 0.01, 1),
+                   ('u3', (1,)): depolarizing_error(2 * 0.04, 1),
+                   # The gate error of multi-qubit gates is also converted
+                   # with the single-qubit formula
+                   ('cx', (0, 1)): depolarizing_error(2 * 0.05, 2)}
+        self.assertEqual(len(errors), len(targets))
+        for name, qubits, error in errors:
+            self.assertErrorEqual(error, targets[(name, tuple(qubits))])
+
+    def test_gate_errors_cached(self):
+        """Test device gate errors are served from the cache"""
+        properties = device_properties([50, 60], [80, 30], [0.01, 0.02],
+                                       self.GATES)
+        first = basic_device_gate_errors(properties)
+        with mock.patch.object(models, '_thermal_relaxation_errors',
+                               wraps=models._thermal_relaxation_errors) as construct:
+            second = basic_device_gate_errors(properties)
+            self.assertEqual(construct.call_count, 0)
+            for (_, _, error1), (_, _, error2) in zip(first, second):
+                self.assertIs(error1, error2)
+
+            # Changing the T1 of qubit 1 only constructs its relaxation errors
+            properties = device_properties([50, 70], [80, 30], [0.01, 0.02],
+                                           self.GATES)
+            basic_device_gate_errors(properties)
+            self.assertEqual(construct.call_count, 1)
+            keys = construct.call_args[0][0]
+            self.assertEqual(sorted(key[1] for key in keys), [70, 70])
+
+    def test_update_from_properties(self):
+        """Test updating a device noise model from new properties"""
+        gates = [('u2', [0], 0.01, 1),
+                 ('u3', [1], 0.04, 2),
+                 ('u2', [2], 0.02, 1),
+                 ('cx', [0, 1], 0.05, 20)]
+        properties = device_properties([50, 60, 70], [50, 30, 40],
+                                       [0.01, 0.02, 0.03], gates)
+        noise_model = basic_device_noise_model(properties)
+
+        # Change the T1 of qubit 2 and the readout error of qubit 0,
+        # remove the CX on qubits [0, 1] and add a CX on qubits [1, 2]
+        gates = gates[:3] + [('cx', [1, 2], 0.05, 20)]
+        properties = device_properties([50, 60, 80], [50, 30, 40],
+                                       [0.05, 0.02, 0.03], gates)
+        updated = noise_model.update_from_properties(properties)
+        self.assertEqual(sorted(updated), sorted([('measure', [0]),
+                                                  ('u2', [2]),
+                                                  ('cx', [0, 1]),
+                                                  ('cx', [1, 2])]))
+
+        # The updated model matches a model built from the new properties
+        def sort_errors(noise_dict):
+            return sorted(noise_dict['errors'],
+                          key=lambda error: (error['operations'],
+                                             error['gate_qubits'],
+                                             error['type']))
+        target = basic_device_noise_model(properties)
+        self.assertEqual(sort_errors(noise_model.as_dict()),
+                         sort_errors(target.as_dict()))
+
+        # Updating again from the same properties changes nothing
+        self.assertEqual(noise_model.update_from_properties(properties), [])
+        self.assertEqual(sort_errors(noise_model.as_dict()),
+                         sort_errors(target.as_dict()))
+
+    def test_update_from_properties_not_device_model(self):
+        """Test updating a noise model not built from device properties"""
+        properties = device_properties([50, 60], [50, 30], [0.01, 0.02],
+                                       self.GATES)
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(depolarizing_error(0.1, 1), ['u3'])
+        self.assertRaises(NoiseError, noise_model.update_from_properties, properties)
+
+
+if __name__ == '__main__':
+    unittest.main()
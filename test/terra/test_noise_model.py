@@ -9,6 +9,7 @@
 NoiseModel class integration tests
 """
 
+import pickle
 import unittest
 from test.terra.utils import common
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
@@ -517,6 +518,127 @@ class TestNoise(common.QiskitAerTestCase):
         self.is_completed(result)
         self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
 
+    def test_amplitude_damping_error_density_matrix(self):
+        """Test amplitude damping error with the density matrix method"""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr)  # prepare + state
+        for _ in range(30):
+            # Add noisy identities
+            circuit.barrier(qr)
+            circuit.iden(qr)
+        circuit.barrier(qr)
+        circuit.measure(qr, cr)
+        shots = 1000
+        backend = QasmSimulator()
+        # test noise model
+        error = amplitude_damping_error(0.75, 0.25)
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(error, 'id')
+        # Execute
+        target = {'0x0': 3 * shots / 4, '0x1': shots / 4}
+        qobj = compile([circuit], backend, shots=shots,
+                       basis_gates=noise_model.basis_gates)
+        result = backend.run(qobj, noise_model=noise_model,
+                             backend_options={"method": "density_matrix"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_nonlocal_pauli_error_gate_25percent_density_matrix(self):
+        """Test 25% non-local Pauli error with the density matrix method"""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.cx(qr[0], qr[1])
+        circuit.barrier(qr)
+        circuit.cx(qr[1], qr[0])
+        circuit.barrier(qr)
+        circuit.measure(qr, cr)
+        backend = QasmSimulator()
+        shots = 2000
+        # test noise model
+        error = pauli_error([('XII', 0.25), ('III', 0.75)])
+        noise_model = NoiseModel()
+        noise_model.add_nonlocal_quantum_error(error, 'cx', [0, 1], [0, 1, 2])
+        # Execute
+        target = {'0x0': 3 * shots / 4, '0x4': shots / 4}
+        qobj = compile([circuit], backend, shots=shots,
+                       basis_gates=noise_model.basis_gates)
+        result = backend.run(qobj, noise_model=noise_model,
+                             backend_options={"method": "density_matrix"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_nonlocal_pauli_error_gate_25percent_stabilizer(self):
+        """Test 25% non-local Pauli error with the stabilizer method"""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.cx(qr[0], qr[1])
+        circuit.barrier(qr)
+        circuit.cx(qr[1], qr[0])
+        circuit.barrier(qr)
+        circuit.measure(qr, cr)
+        backend = QasmSimulator()
+        shots = 2000
+        # test noise model
+        error = pauli_error([('XII', 0.25), ('III', 0.75)])
+        noise_model = NoiseModel()
+        noise_model.add_nonlocal_quantum_error(error, 'cx', [0, 1], [0, 1, 2])
+        # Execute
+        target = {'0x0': 3 * shots / 4, '0x4': shots / 4}
+        qobj = compile([circuit], backend, shots=shots,
+                       basis_gates=noise_model.basis_gates)
+        result = backend.run(qobj, noise_model=noise_model,
+                             backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_noise_model_modified_after_run(self):
+        """Test cached noise model is updated when modified between runs"""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr)
+        circuit.measure(qr, cr)
+        backend = QasmSimulator()
+        shots = 100
+        error = pauli_error([('X', 1)])
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(error, 'x')
+        qobj = compile([circuit], backend, shots=shots,
+                       basis_gates=noise_model.basis_gates)
+        # Run twice with the same noise model
+        for _ in range(2):
+            result = backend.run(qobj, noise_model=noise_model).result()
+            self.is_completed(result)
+            self.compare_counts(result, [circuit], [{'0x0': shots}], delta=0)
+        # Add a second X error to the noise model
+        noise_model.add_all_qubit_quantum_error(error, 'x')
+        result = backend.run(qobj, noise_model=noise_model).result()
+        self.is_completed(result)
+        self.compare_counts(result, [circuit], [{'0x1': shots}], delta=0)
+
+    def test_backend_pickle_after_noise_model_run(self):
+        """Test backend can be pickled after running with a cached noise model"""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr)
+        circuit.measure(qr, cr)
+        backend = QasmSimulator()
+        shots = 100
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(pauli_error([('X', 1)]), 'x')
+        qobj = compile([circuit], backend, shots=shots,
+                       basis_gates=noise_model.basis_gates)
+        backend.run(qobj, noise_model=noise_model).result()
+        backend = pickle.loads(pickle.dumps(backend))
+        result = backend.run(qobj, noise_model=noise_model).result()
+        self.is_completed(result)
+        self.compare_counts(result, [circuit], [{'0x0': shots}], delta=0)
+
 
 if __name__ == '__main__':
     unittest.main()
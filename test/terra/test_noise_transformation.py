@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Noise transformation tests
+"""
+
+import unittest
+from test.terra.utils import common
+import numpy as np
+
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.noiseerror import NoiseError
+from qiskit.providers.aer.noise.errors.quantum_error import QuantumError
+from qiskit.providers.aer.noise.errors.standard_errors import pauli_error
+from qiskit.providers.aer.noise.errors.standard_errors import amplitude_damping_error
+from qiskit.providers.aer.noise.errors.standard_errors import thermal_relaxation_error
+from qiskit.providers.aer.noise.utils import pauli_approximate_error
+from qiskit.providers.aer.noise.utils import pauli_approximate_noise_model
+
+
+class TestNoiseTransformation(common.QiskitAerTestCase):
+    """Testing Pauli approximation of noise"""
+
+    def test_approximate_amplitude_damping(self):
+        """Test Pauli approximation of amplitude damping error"""
+        gamma = 0.2
+        error, distance = pauli_approximate_error(amplitude_damping_error(gamma))
+        targets = {'x': gamma / 4,
+                   'y': gamma / 4,
+                   'z': (1 - np.sqrt(1 - gamma)) ** 2 / 4,
+                   'id': (1 + np.sqrt(1 - gamma)) ** 2 / 4}
+        self.assertEqual(error.size, 4)
+        for circuit, prob in zip(error.circuits, error.probabilities):
+            self.assertEqual(len(circuit), 1)
+            self.assertEqual(circuit[0]['qubits'], [0])
+            self.assertAlmostEqual(prob, targets[circuit[0]['name']])
+        self.assertAlmostEqual(distance, gamma / 2)
+
+    def test_approximate_pauli_error(self):
+        """Test Pauli approximation of a Pauli error is exact"""
+        error = pauli_error([('XY', 0.1), ('ZI', 0.2), ('II', 0.7)],
+                            standard_gates=True)
+        approx_error, distance = pauli_approximate_error(error)
+        self.assertAlmostEqual(distance, 0)
+        self.assertEqual(approx_error.size, 3)
+        targets = {'XY': 0.1, 'ZI': 0.2, 'II': 0.7}
+        for circuit, prob in zip(approx_error.circuits, approx_error.probabilities):
+            label = ['I', 'I']
+            for op in circuit:
+                if op['name'] != 'id':
+                    label[1 - op['qubits'][0]] = op['name'].upper()
+            self.assertAlmostEqual(prob, targets[''.join(label)])
+
+    def test_approximate_reset_error(self):
+        """Test Pauli approximation of reset error"""
+        error = QuantumError([([{'name': 'reset', 'qubits': [0]}], 1)])
+        approx_error, distance = pauli_approximate_error(error)
+        # Twirled reset is the completely depolarizing channel
+        self.assertEqual(approx_error.size, 4)
+        for prob in approx_error.probabilities:
+            self.assertAlmostEqual(prob, 0.25)
+        self.assertGreater(distance, 0)
+
+    def test_approximate_invalid_instruction(self):
+        """Test Pauli approximation of error with measure raises exception"""
+        error = QuantumError([([{'name': 'measure', 'qubits': [0]}], 1)])
+        self.assertRaises(NoiseError, lambda: pauli_approximate_error(error))
+
+    def test_approximate_noise_model(self):
+        """Test Pauli approximation of noise model"""
+        error1 = amplitude_damping_error(0.1)
+        error2 = thermal_relaxation_error(50, 70, 0.3).kron(
+            thermal_relaxation_error(60, 40, 0.3))
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(error1, ['u2', 'u3'])
+        noise_model.add_quantum_error(error2, 'cx', [0, 1])
+        noise_model.add_nonlocal_quantum_error(error1, 'cx', [1, 2], [0])
+        noise_model.add_readout_error([[0.9, 0.1], [0.2, 0.8]], [0])
+        approx_model, distance = pauli_approximate_noise_model(noise_model)
+        self.assertAlmostEqual(distance, 0.05)
+        self.assertEqual(approx_model.noise_instructions,
+                         noise_model.noise_instructions)
+        errors = noise_model.as_dict()['errors']
+        approx_errors = approx_model.as_dict()['errors']
+        self.assertEqual(len(approx_errors), len(errors))
+        for error, approx_error in zip(errors, approx_errors):
+            self.assertEqual(error.get('operations'), approx_error.get('operations'))
+            self.assertEqual(error.get('gate_qubits'), approx_error.get('gate_qubits'))
+            self.assertEqual(error.get('noise_qubits'), approx_error.get('noise_qubits'))
+            if error['type'] == 'qerror':
+                for circuit in approx_error['instructions']:
+                    for op in circuit:
+                        self.assertIn(op['name'], ['id', 'x', 'y', 'z'])
+            else:
+                self.assertEqual(error, approx_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,7 +20,7 @@ from test.terra.utils import ref_non_clifford
 from test.terra.utils import ref_algorithms
 from test.terra.utils import ref_unitary_gate
 
-from qiskit import execute
+from qiskit import execute, compile
 from qiskit.providers.aer import QasmSimulator
 
 
@@ -903,6 +903,64 @@ class TestQasmSimulator(common.QiskitAerTestCase):
         self.is_completed(result)
         self.compare_counts(result, circuits, targets, delta=0.05 * shots)
 
+    # ---------------------------------------------------------------------
+    # Test stabilizer method
+    # ---------------------------------------------------------------------
+    def test_reset_nondeterministic_stabilizer(self):
+        """Test reset circuits with the stabilizer method"""
+        shots = 2000
+        circuits = ref_reset.reset_circuits_nondeterministic(final_measure=True)
+        targets = ref_reset.reset_counts_nondeterministic(shots)
+        backend = QasmSimulator()
+        qobj = compile(circuits, backend, shots=shots)
+        result = backend.run(qobj, backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, circuits, targets, delta=0.05 * shots)
+
+    def test_measure_nondeterministic_stabilizer(self):
+        """Test measure circuits with the stabilizer method"""
+        shots = 2000
+        circuits = ref_measure.measure_circuits_nondeterministic(allow_sampling=False)
+        targets = ref_measure.measure_counts_nondeterministic(shots)
+        backend = QasmSimulator()
+        qobj = compile(circuits, backend, shots=shots)
+        result = backend.run(qobj, backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, circuits, targets, delta=0.05 * shots)
+
+    def test_conditional_2bit_stabilizer(self):
+        """Test conditional operations with the stabilizer method"""
+        shots = 100
+        circuits = ref_conditionals.conditional_circuits_2bit(final_measure=True)
+        targets = ref_conditionals.conditional_counts_2bit(shots)
+        backend = QasmSimulator()
+        qobj = compile(circuits, backend, shots=shots)
+        result = backend.run(qobj, backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, circuits, targets, delta=0)
+
+    def test_sdg_gate_nondeterministic_stabilizer(self):
+        """Test sdg-gate circuits with the stabilizer method"""
+        shots = 2000
+        circuits = ref_1q_clifford.sdg_gate_circuits_nondeterministic(final_measure=True)
+        targets = ref_1q_clifford.sdg_gate_counts_nondeterministic(shots)
+        backend = QasmSimulator()
+        qobj = compile(circuits, backend, shots=shots)
+        result = backend.run(qobj, backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, circuits, targets, delta=0.05 * shots)
+
+    def test_cz_gate_nondeterministic_stabilizer(self):
+        """Test cz-gate circuits with the stabilizer method"""
+        shots = 2000
+        circuits = ref_2q_clifford.cz_gate_circuits_nondeterministic(final_measure=True)
+        targets = ref_2q_clifford.cz_gate_counts_nondeterministic(shots)
+        backend = QasmSimulator()
+        qobj = compile(circuits, backend, shots=shots)
+        result = backend.run(qobj, backend_options={"method": "stabilizer"}).result()
+        self.is_completed(result)
+        self.compare_counts(result, circuits, targets, delta=0.05 * shots)
+
     # ---------------------------------------------------------------------
     # Test unitary gate qobj instruction
     # ---------------------------------------------------------------------
@@ -348,6 +348,67 @@ class TestQuantumError(common.QiskitAerTestCase):
         self.assertEqual(target_probs, [], msg="Incorrect compose probabilities")
         self.assertEqual(target_circs, [], msg="Incorrect compose circuits")
 
+    def test_simplify_merge_equal_circuits(self):
+        """Test simplify merges equal error circuits"""
+        error = QuantumError([([{'name': 'x', 'qubits': [0]}], 0.3),
+                              ([{'name': 'id', 'qubits': [0]}], 0.5),
+                              ([{'name': 'x', 'qubits': [0]}], 0.2)])
+        error = error.simplify()
+        self.assertEqual(error.size, 2)
+        target_circs = [[{'name': 'x', 'qubits': [0]}],
+                        [{'name': 'id', 'qubits': [0]}]]
+        target_probs = [0.5, 0.5]
+        for j in range(2):
+            circ, p = error.error_term(j)
+            self.remove_if_found(p, target_probs)
+            self.remove_if_found(circ, target_circs)
+        self.assertEqual(target_probs, [], msg="Incorrect simplify probabilities")
+        self.assertEqual(target_circs, [], msg="Incorrect simplify circuits")
+
+    def test_simplify_fold_paulis(self):
+        """Test simplify folds Pauli gates and unitaries"""
+        error = QuantumError([
+            ([{'name': 'x', 'qubits': [0]}, {'name': 'z', 'qubits': [0]}], 0.2),
+            ([{'name': 'y', 'qubits': [0]}, {'name': 'x', 'qubits': [1]}], 0.1),
+            ([{'name': 'unitary', 'qubits': [1],
+               'params': standard_gate_unitary('x')},
+              {'name': 'z', 'qubits': [0]}, {'name': 'x', 'qubits': [0]}], 0.3),
+            ([{'name': 'z', 'qubits': [1]}, {'name': 'z', 'qubits': [1]}], 0.4)])
+        error = error.simplify()
+        self.assertEqual(error.size, 3)
+        target_circs = [[{'name': 'y', 'qubits': [0]}],
+                        [{'name': 'y', 'qubits': [0]}, {'name': 'x', 'qubits': [1]}],
+                        [{'name': 'id', 'qubits': [0]}]]
+        target_probs = [0.2, 0.4, 0.4]
+        for j in range(3):
+            circ, p = error.error_term(j)
+            self.remove_if_found(p, target_probs)
+            self.remove_if_found(circ, target_circs)
+        self.assertEqual(target_probs, [], msg="Incorrect simplify probabilities")
+        self.assertEqual(target_circs, [], msg="Incorrect simplify circuits")
+
+    def test_simplify_pauli_before_reset(self):
+        """Test simplify removes Paulis before a reset"""
+        error = QuantumError([
+            ([{'name': 'x', 'qubits': [0]}, {'name': 'reset', 'qubits': [0]}], 0.4),
+            ([{'name': 'reset', 'qubits': [0]}], 0.6)])
+        error = error.simplify()
+        self.assertEqual(error.size, 1)
+        circ, p = error.error_term(0)
+        self.assertEqual(circ, [{'name': 'reset', 'qubits': [0]}])
+        self.assertAlmostEqual(p, 1)
+
+    def test_simplify_truncate(self):
+        """Test simplify truncates small probabilities"""
+        error = QuantumError([([{'name': 'id', 'qubits': [0]}], 0.9),
+                              ([{'name': 'x', 'qubits': [0]}], 0.099),
+                              ([{'name': 'y', 'qubits': [0]}], 0.001)])
+        self.assertEqual(error.simplify().size, 3)
+        error = error.simplify(threshold=0.01)
+        self.assertEqual(error.size, 2)
+        self.assertAlmostEqual(error.probabilities[0], 0.9 / 0.999)
+        self.assertAlmostEqual(error.probabilities[1], 0.099 / 0.999)
+
 
 if __name__ == '__main__':
     unittest.main()